@@ -0,0 +1,110 @@
+"""
+Benchmark the native centrality engine against NetworkX.
+
+Builds a random graph, converts it once to a CompactGraph, and times exact
+Brandes betweenness (serial and with a process pool), pivot-sampled
+betweenness, multi-source BFS closeness, eigenvector centrality and PageRank
+against the NetworkX functions. Accuracy is the maximum absolute difference
+from NetworkX and the overlap of the top 1% of nodes; sampled betweenness is
+compared with exact scores.
+
+Usage:
+    python benchmarks/bench_centrality.py --nodes 5000 --degree 6 --jobs 4
+    python benchmarks/bench_centrality.py --nodes 500000 --degree 4 --skip-exact
+"""
+
+import argparse
+import time
+
+import networkx as nx
+import numpy as np
+
+from semantica.kg import CompactGraph
+from semantica.kg import centrality_engine as engine
+
+
+def _timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def _compare(scores: np.ndarray, reference: np.ndarray):
+    top = max(1, len(scores) // 100)
+    overlap = len(
+        set(np.argsort(-scores)[:top].tolist()) & set(np.argsort(-reference)[:top].tolist())
+    )
+    return float(np.abs(scores - reference).max()), overlap / top
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=3000)
+    parser.add_argument("--degree", type=float, default=6.0, help="average degree")
+    parser.add_argument("--pivots", type=int, default=256)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-exact",
+        action="store_true",
+        help="skip exact betweenness and closeness (for very large graphs)",
+    )
+    parser.add_argument("--skip-networkx", action="store_true")
+    args = parser.parse_args()
+
+    edges = int(args.nodes * args.degree / 2)
+    graph = nx.gnm_random_graph(args.nodes, edges, seed=args.seed)
+    compact, convert_s = _timed(lambda: CompactGraph.from_graph(graph))
+    nodes = compact.node_ids
+    print(f"nodes={compact.num_nodes} edges={compact.num_edges} convert={convert_s:.2f}s")
+    print(f"{'measure':<26}{'native s':>10}{'networkx s':>12}{'speedup':>9}{'max err':>11}{'top1%':>7}")
+
+    def report(name, native, native_s, reference=None, reference_s=None):
+        if reference is None:
+            print(f"{name:<26}{native_s:>10.3f}{'-':>12}{'-':>9}{'-':>11}{'-':>7}")
+            return
+        error, overlap = _compare(native, reference)
+        speedup = f"{reference_s / native_s:.1f}" if reference_s else "-"
+        ref_s = f"{reference_s:.3f}" if reference_s else "-"
+        print(f"{name:<26}{native_s:>10.3f}{ref_s:>12}{speedup:>9}{error:>11.2e}{overlap:>7.2f}")
+
+    def networkx_scores(func):
+        if args.skip_networkx:
+            return None, None
+        scores, seconds = _timed(lambda: func(graph))
+        return np.array([scores[node] for node in nodes]), seconds
+
+    exact = None
+    if not args.skip_exact:
+        exact, exact_s = _timed(lambda: engine.betweenness_centrality(compact))
+        reference, reference_s = networkx_scores(nx.betweenness_centrality)
+        report("betweenness (exact)", exact, exact_s, reference, reference_s)
+        parallel, parallel_s = _timed(
+            lambda: engine.betweenness_centrality(compact, n_jobs=args.jobs)
+        )
+        report(f"betweenness ({args.jobs} procs)", parallel, parallel_s, exact, exact_s)
+
+        closeness, closeness_s = _timed(lambda: engine.closeness_centrality(compact))
+        reference, reference_s = networkx_scores(nx.closeness_centrality)
+        report("closeness", closeness, closeness_s, reference, reference_s)
+
+    sampled, sampled_s = _timed(
+        lambda: engine.betweenness_centrality(
+            compact, k=args.pivots, seed=args.seed, n_jobs=args.jobs
+        )
+    )
+    report(f"betweenness (k={args.pivots})", sampled, sampled_s, exact, None)
+
+    scores, seconds = _timed(lambda: engine.eigenvector_centrality(compact))
+    reference, reference_s = networkx_scores(
+        lambda g: nx.eigenvector_centrality(g, max_iter=100, tol=1e-6)
+    )
+    report("eigenvector", scores, seconds, reference, reference_s)
+
+    scores, seconds = _timed(lambda: engine.pagerank(compact))
+    reference, reference_s = networkx_scores(nx.pagerank)
+    report("pagerank", scores, seconds, reference, reference_s)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark ConnectivityAnalyzer on large random graphs.
+
+Builds a random graph, converts it once to a CompactGraph, and times connected
+components, Tarjan bridges and articulation points, a single shortest path,
+sampled path length estimation and the full ``analyze_connectivity`` call.
+Optionally compares components and bridges with NetworkX, and the sampled
+average path length with the exact value on a smaller graph.
+
+Usage:
+    python benchmarks/bench_connectivity.py --nodes 100000 --degree 6
+    python benchmarks/bench_connectivity.py --nodes 2000 --check-exact --jobs 4
+"""
+
+import argparse
+import time
+
+import networkx as nx
+
+from semantica.kg import CompactGraph, ConnectivityAnalyzer
+
+
+def _timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--degree", type=float, default=6.0, help="average degree")
+    parser.add_argument("--sample", type=int, default=256, help="sampled BFS sources")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--check-exact",
+        action="store_true",
+        help="also compute exact path lengths (small graphs only)",
+    )
+    parser.add_argument("--skip-networkx", action="store_true")
+    args = parser.parse_args()
+
+    edges = int(args.nodes * args.degree / 2)
+    graph = nx.gnm_random_graph(args.nodes, edges, seed=args.seed)
+    compact, convert_s = _timed(lambda: CompactGraph.from_graph(graph))
+    print(f"nodes={compact.num_nodes} edges={compact.num_edges} convert={convert_s:.2f}s")
+
+    analyzer = ConnectivityAnalyzer(
+        exact_path_limit=0, path_sample_size=args.sample, n_jobs=args.jobs, seed=args.seed
+    )
+    print(f"{'step':<28}{'seconds':>9}  result")
+
+    components, seconds = _timed(lambda: analyzer.find_connected_components(compact))
+    print(f"{'components':<28}{seconds:>9.3f}  {components['num_components']} components")
+
+    bridges, seconds = _timed(lambda: analyzer.identify_bridges(compact))
+    print(
+        f"{'bridges (Tarjan)':<28}{seconds:>9.3f}  {bridges['num_bridges']} bridges, "
+        f"{bridges['num_articulation_points']} articulation points"
+    )
+
+    source, target = compact.node_ids[0], compact.node_ids[-1]
+    path, seconds = _timed(
+        lambda: analyzer.calculate_shortest_paths(compact, source=source, target=target)
+    )
+    print(f"{'single shortest path':<28}{seconds:>9.3f}  distance {path['distance']}")
+
+    lengths, seconds = _timed(lambda: analyzer.estimate_path_lengths(compact))
+    low, high = lengths["avg_path_length_ci"]
+    print(
+        f"{f'path lengths (k={args.sample})':<28}{seconds:>9.3f}  "
+        f"avg {lengths['avg_path_length']:.3f} [{low:.3f}, {high:.3f}], "
+        f"diameter {lengths['diameter_bounds']}"
+    )
+
+    _, seconds = _timed(lambda: analyzer.analyze_connectivity(compact))
+    print(f"{'analyze_connectivity':<28}{seconds:>9.3f}")
+
+    if args.check_exact:
+        exact, seconds = _timed(
+            lambda: analyzer.estimate_path_lengths(compact, sample_size=compact.num_nodes)
+        )
+        print(
+            f"{'path lengths (exact)':<28}{seconds:>9.3f}  "
+            f"avg {exact['avg_path_length']:.3f}, diameter {exact['diameter']}"
+        )
+
+    if not args.skip_networkx:
+        expected, seconds = _timed(lambda: nx.number_connected_components(graph))
+        print(f"{'networkx components':<28}{seconds:>9.3f}  {expected} components")
+        expected, seconds = _timed(lambda: sum(1 for _ in nx.bridges(graph)))
+        print(f"{'networkx bridges':<28}{seconds:>9.3f}  {expected} bridges")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Benchmark Neo4jStore bulk writes against per-item queries.
+
+Loads a random graph with one query per node/relationship (``create_node`` /
+``create_relationship``) and with the batched UNWIND paths
+(``create_nodes`` / ``create_relationships``), sequentially and with
+parallel write sessions. Without ``--uri`` the writes go to a stub driver
+that records every query and sleeps ``--rtt-ms`` per round trip plus
+``--row-us`` per row, so the numbers show round-trip savings, not Neo4j
+write throughput. With ``--uri`` a live (scratch!) database is used.
+
+Usage:
+    python benchmarks/bench_neo4j_bulk.py --nodes 20000 --edges 50000
+    python benchmarks/bench_neo4j_bulk.py --uri bolt://localhost:7687 --password secret
+"""
+
+import argparse
+import itertools
+import threading
+import time
+
+import numpy as np
+
+from semantica.graph_store import neo4j_store
+from semantica.graph_store.neo4j_store import Neo4jDriver, Neo4jStore
+
+
+class StubResult:
+    def __init__(self, records):
+        self.records = records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def single(self):
+        return self.records[0] if self.records else None
+
+
+class StubSession:
+    """Session of the recording stub driver."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, parameters=None):
+        parameters = parameters or {}
+        rows = parameters.get("rows")
+        with self.driver.lock:
+            self.driver.round_trips += 1
+            self.driver.queries.append(query)
+        time.sleep(self.driver.rtt + self.driver.row_cost * len(rows or [None]))
+        if rows is not None:
+            return StubResult(
+                [{"idx": row["idx"], "id": next(self.driver.ids)} for row in rows]
+            )
+        props = parameters.get("props", {})
+        return StubResult([{"id": next(self.driver.ids), "n": props, "r": props, "type": "T"}])
+
+    def execute_write(self, func, **kwargs):
+        return func(self, **kwargs)
+
+    def close(self):
+        pass
+
+
+class StubDriver:
+    """Neo4j driver stand-in with simulated round-trip latency."""
+
+    def __init__(self, rtt_ms: float, row_us: float):
+        self.rtt = rtt_ms / 1000.0
+        self.row_cost = row_us / 1e6
+        self.lock = threading.Lock()
+        self.ids = itertools.count()
+        self.round_trips = 0
+        self.queries = []
+
+    def session(self, database=None):
+        return StubSession(self)
+
+    def verify_connectivity(self):
+        return True
+
+    def close(self):
+        pass
+
+
+def _graph(n_nodes: int, n_edges: int, rng: np.random.Generator):
+    labels = ["Person", "Organization", "Place", "Concept"]
+    nodes = [
+        {
+            "labels": ["Entity", labels[i % len(labels)]],
+            "properties": {"id": f"n{i}", "name": f"entity {i}", "score": float(rng.random())},
+        }
+        for i in range(n_nodes)
+    ]
+    types = ["WORKS_AT", "LOCATED_IN", "RELATED_TO"]
+    edges = [
+        {
+            "start_node_id": f"n{a}",
+            "end_node_id": f"n{b}",
+            "type": types[int(t)],
+            "properties": {"weight": float(w)},
+        }
+        for a, b, t, w in zip(
+            rng.integers(0, n_nodes, n_edges),
+            rng.integers(0, n_nodes, n_edges),
+            rng.integers(0, len(types), n_edges),
+            rng.random(n_edges),
+        )
+    ]
+    return nodes, edges
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--edges", type=int, default=10000)
+    parser.add_argument("--loop-items", type=int, default=1000, help="Items timed for the per-item path")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    parser.add_argument("--row-us", type=float, default=5.0)
+    parser.add_argument("--uri", default=None)
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    nodes, edges = _graph(args.nodes, args.edges, np.random.default_rng(args.seed))
+    store = Neo4jStore(uri=args.uri, user=args.user, password=args.password, batch_size=args.batch_size)
+    stub = None
+    if args.uri:
+        store.connect()
+        store.execute_query("MATCH (n) DETACH DELETE n")
+        store.execute_query("CREATE INDEX bench_entity_id IF NOT EXISTS FOR (n:Entity) ON (n.id)")
+    else:
+        neo4j_store.NEO4J_AVAILABLE = True
+        stub = StubDriver(args.rtt_ms, args.row_us)
+        store._driver = Neo4jDriver(stub)
+    store.progress_tracker.enabled = False
+
+    def timed(fn):
+        trips = stub.round_trips if stub else 0
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start, (stub.round_trips - trips if stub else None)
+
+    loop_nodes = nodes[: args.loop_items]
+    loop_s, loop_trips = timed(
+        lambda: [store.create_node(n["labels"], n["properties"]) for n in loop_nodes]
+    )
+    per_node = loop_s / len(loop_nodes)
+    per_node_trips = loop_trips / len(loop_nodes) if stub else None
+
+    rows = [("per-node loop (extrapolated)", per_node * len(nodes), per_node_trips * len(nodes) if stub else None)]
+    rows.append(("create_nodes", *timed(lambda: store.create_nodes(nodes))))
+    rows.append(
+        (
+            f"create_nodes x{args.sessions} sessions",
+            *timed(lambda: store.create_nodes(nodes, merge=True, parallel_sessions=args.sessions)),
+        )
+    )
+
+    loop_edges = edges[: args.loop_items]
+    if stub:
+        loop_s, loop_trips = timed(
+            lambda: [
+                store.create_relationship(0, 1, e["type"], e["properties"]) for e in loop_edges
+            ]
+        )
+        per_edge = loop_s / len(loop_edges)
+        rows.append(("per-edge loop (extrapolated)", per_edge * len(edges), loop_trips / len(loop_edges) * len(edges)))
+    rows.append(("create_relationships", *timed(lambda: store.create_relationships(edges, match_on="id", node_label="Entity"))))
+    rows.append(
+        (
+            f"create_relationships x{args.sessions}",
+            *timed(
+                lambda: store.create_relationships(
+                    edges, match_on="id", node_label="Entity", parallel_sessions=args.sessions
+                )
+            ),
+        )
+    )
+
+    target = args.uri or f"stub driver (rtt={args.rtt_ms} ms, row={args.row_us} us)"
+    print(f"nodes={args.nodes} edges={args.edges} batch_size={args.batch_size} target={target}")
+    print(f"{'path':<36}{'seconds':>10}{'round trips':>14}")
+    for name, seconds, trips in rows:
+        print(f"{name:<36}{seconds:>10.3f}{'' if trips is None else int(trips):>14}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark the per-call overhead of the global ProgressTracker.
+
+Times the start_tracking / update_progress / stop_tracking sequence a hot
+function performs, with tracking enabled (default coalescing), enabled
+without coalescing (``update_interval=0``) and disabled. Display output is
+sent to os.devnull so only the tracker's own cost is measured.
+
+Usage:
+    python benchmarks/bench_progress.py --calls 20000 --updates 10
+    python benchmarks/bench_progress.py --eager-messages  # formatted strings
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+from semantica.utils.progress_tracker import ProgressTracker
+
+
+def _run(tracker: ProgressTracker, calls: int, updates: int, eager: bool) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        tracking_id = tracker.start_tracking(
+            module="deduplication",
+            submodule="SimilarityCalculator",
+            message=f"Calculating similarity {i}" if eager else lambda: f"Calculating similarity {i}",
+        )
+        for j in range(updates):
+            tracker.update_progress(
+                tracking_id,
+                j,
+                updates,
+                message=f"Processed {j}/{updates}" if eager else lambda: f"Processed {j}/{updates}",
+            )
+        tracker.stop_tracking(tracking_id, message=f"Done {i}" if eager else lambda: f"Done {i}")
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--updates", type=int, default=10)
+    parser.add_argument(
+        "--eager-messages",
+        action="store_true",
+        help="Pass pre-formatted strings instead of lazy callables",
+    )
+    args = parser.parse_args()
+
+    modes = [
+        ("enabled", dict()),
+        ("enabled, no coalescing", dict(update_interval=0.0)),
+        ("disabled", dict(enabled=False)),
+    ]
+    results = []
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        for name, kwargs in modes:
+            tracker = ProgressTracker(**kwargs)
+            results.append((name, _run(tracker, args.calls, args.updates, args.eager_messages)))
+
+    print(f"calls={args.calls} update_progress calls per call={args.updates}")
+    print(f"{'mode':<26}{'us/call':>10}")
+    for name, micros in results:
+        print(f"{name:<26}{micros:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
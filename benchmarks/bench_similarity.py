@@ -0,0 +1,105 @@
+"""
+Benchmark the vectorized similarity engine against the per-pair path.
+
+Compares ``SimilarityCalculator.calculate_string_similarity`` in a Python loop
+with the one-to-many string kernels, and ``calculate_similarity`` per pair
+with ``BatchSimilarityEngine.score_pairs`` (with and without threshold
+pruning), checking that both paths produce the same scores.
+
+Usage:
+    python benchmarks/bench_similarity.py --entities 2000 --pairs 200000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from semantica.deduplication import BatchSimilarityEngine, SimilarityCalculator
+
+_WORDS = ["apple", "acme", "global", "systems", "holdings", "data", "labs", "north", "blue", "river"]
+
+
+def _entities(n: int, rng: np.random.Generator):
+    entities = []
+    for i in range(n):
+        words = rng.choice(_WORDS, size=rng.integers(1, 4))
+        name = " ".join(words) + f" {rng.integers(0, 50)}"
+        if rng.random() < 0.3:
+            name = name.upper()
+        entities.append(
+            {
+                "id": str(i),
+                "name": name,
+                "properties": {"sector": str(rng.choice(_WORDS)), "size": int(rng.integers(0, 5))},
+                "relationships": [{"type": "located_in", "target": str(rng.choice(_WORDS))}],
+            }
+        )
+    return entities
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, default=2000)
+    parser.add_argument("--pairs", type=int, default=100000)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--method", default="jaro_winkler")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    entities = _entities(args.entities, rng)
+    names = [e["name"] for e in entities]
+    calculator = SimilarityCalculator()
+
+    start = time.perf_counter()
+    loop_scores = [calculator.calculate_string_similarity(names[0], s, method=args.method) for s in names]
+    loop_s = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_scores = calculator.calculate_string_similarity_batch(names[0], names, method=args.method)
+    batch_s = time.perf_counter() - start
+    assert np.array_equal(batch_scores, loop_scores)
+
+    print(f"strings={len(names)} method={args.method}")
+    print(f"{'one-to-many':<22}{'seconds':>10}{'speedup':>10}")
+    print(f"{'per-pair loop':<22}{loop_s:>10.3f}{1.0:>10.1f}")
+    print(f"{'vectorized':<22}{batch_s:>10.3f}{loop_s / batch_s:>10.1f}")
+
+    left = rng.integers(0, args.entities, size=args.pairs)
+    right = rng.integers(0, args.entities, size=args.pairs)
+
+    start = time.perf_counter()
+    expected = np.array(
+        [
+            calculator.calculate_similarity(entities[a], entities[b], track=False).score
+            for a, b in zip(left, right)
+        ]
+    )
+    pair_s = time.perf_counter() - start
+
+    engine = BatchSimilarityEngine(calculator)
+    start = time.perf_counter()
+    cache = engine.build_cache(entities)
+    cache_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = engine.score_pairs(cache, left, cache, right)
+    engine_s = time.perf_counter() - start
+    assert np.allclose(scores, expected, rtol=0, atol=1e-12)
+
+    start = time.perf_counter()
+    pruned = engine.score_pairs(cache, left, cache, right, min_score=args.threshold)
+    pruned_s = time.perf_counter() - start
+    keep = expected >= args.threshold
+    assert np.allclose(pruned[keep], expected[keep], rtol=0, atol=1e-12)
+
+    print(f"\nentities={args.entities} pairs={args.pairs} threshold={args.threshold}")
+    print(f"feature cache build: {cache_s:.3f} s")
+    print(f"{'entity pairs':<22}{'seconds':>10}{'speedup':>10}")
+    print(f"{'calculate_similarity':<22}{pair_s:>10.3f}{1.0:>10.1f}")
+    print(f"{'engine':<22}{engine_s:>10.3f}{pair_s / engine_s:>10.1f}")
+    print(f"{'engine + pruning':<22}{pruned_s:>10.3f}{pair_s / pruned_s:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark indexed temporal queries and delta-encoded version comparison.
+
+Builds a random temporal graph and times index construction, as-of
+(point-in-time) queries, range queries and entity-filtered queries through
+TemporalGraphQuery against a linear scan of every relationship (the string
+comparison the index replaced). Then versions the graph twice with a few
+edits and times compare_versions from stored deltas against a full diff.
+
+Usage:
+    python benchmarks/bench_temporal.py --relationships 200000 --queries 500
+    python benchmarks/bench_temporal.py --relationships 20000 --edits 100
+"""
+
+import argparse
+import random
+import time
+
+from semantica.kg import TemporalGraphQuery, TemporalVersionManager
+
+
+def _timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def _linear_scan(relationships, start, end):
+    found = []
+    for rel in relationships:
+        valid_from, valid_until = rel.get("valid_from"), rel.get("valid_until")
+        if valid_from and end < valid_from:
+            continue
+        if valid_until and start > valid_until:
+            continue
+        found.append(rel)
+    return found
+
+
+def _day(rng, first_year=2000, years=25):
+    return f"{first_year + rng.randrange(years)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--relationships", type=int, default=200000)
+    parser.add_argument("--entities", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--edits", type=int, default=1000, help="changes between versions")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    relationships = []
+    for _ in range(args.relationships):
+        start = _day(rng)
+        rel = {
+            "source": f"e{rng.randrange(args.entities)}",
+            "target": f"e{rng.randrange(args.entities)}",
+            "type": rng.choice(["works_at", "knows", "owns", "located_in"]),
+            "valid_from": start,
+        }
+        if rng.random() < 0.7:
+            rel["valid_until"] = f"{int(start[:4]) + rng.randint(0, 5)}{start[4:]}"
+        relationships.append(rel)
+    graph = {
+        "entities": [{"id": f"e{i}"} for i in range(args.entities)],
+        "relationships": relationships,
+    }
+    times = [_day(rng) for _ in range(args.queries)]
+    print(f"relationships={len(relationships)} queries={args.queries}")
+    print(f"{'step':<30}{'total s':>10}{'ms/query':>10}{'speedup':>9}")
+
+    def report(name, seconds, count, baseline=None):
+        speedup = f"{baseline / seconds:.1f}" if baseline else "-"
+        print(f"{name:<30}{seconds:>10.3f}{seconds / count * 1000:>10.3f}{speedup:>9}")
+
+    engine = TemporalGraphQuery()
+    index, seconds = _timed(lambda: engine.build_index(graph))
+    report("build index", seconds, 1)
+
+    scan_count = min(args.queries, 50)
+    _, scan_s = _timed(
+        lambda: [_linear_scan(relationships, t, t) for t in times[:scan_count]]
+    )
+    scan_s *= args.queries / scan_count
+    report("as-of (linear scan)", scan_s, args.queries)
+    _, seconds = _timed(lambda: [engine.query_at_time(index, "", t) for t in times])
+    report("as-of (indexed)", seconds, args.queries, scan_s)
+    # Plain graphs reuse the engine's cached index after checking it is current
+    _, seconds = _timed(lambda: [engine.query_at_time(graph, "", t) for t in times])
+    report("as-of (graph, cached index)", seconds, args.queries, scan_s)
+
+    ranges = [(t, f"{int(t[:4]) + 1}{t[4:]}") for t in times]
+    _, seconds = _timed(
+        lambda: [engine.query_time_range(index, "", s, e) for s, e in ranges]
+    )
+    report("one-year range (indexed)", seconds, args.queries)
+    _, seconds = _timed(
+        lambda: [
+            engine.query_at_time(index, "", t, entity=f"e{i % args.entities}")
+            for i, t in enumerate(times)
+        ]
+    )
+    report("as-of per entity (indexed)", seconds, args.queries)
+
+    manager = TemporalVersionManager()
+    v1, seconds = _timed(lambda: manager.create_version(graph, version_label="v1"))
+    report("create version (base)", seconds, 1)
+    edited = dict(graph, relationships=list(relationships))
+    for row in rng.sample(range(len(relationships)), args.edits):
+        edited["relationships"][row] = dict(relationships[row], valid_until="2030-01-01")
+    v2, seconds = _timed(lambda: manager.create_version(edited, version_label="v2"))
+    report("create version (delta)", seconds, 1)
+
+    full, full_s = _timed(
+        lambda: manager.compare_versions(dict(v1, sequence=None), v2)
+    )
+    report("compare (full diff)", full_s, 1)
+    delta, seconds = _timed(lambda: manager.compare_versions(v1, v2))
+    report("compare (composed deltas)", seconds, 1, full_s)
+    assert delta == full
+    print(f"modified relationships: {len(delta['relationships_delta']['modified'])}")
+
+
+if __name__ == "__main__":
+    main()
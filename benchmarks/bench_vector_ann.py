@@ -0,0 +1,67 @@
+"""
+Benchmark the built-in IVF index against exact brute-force search.
+
+Reports build time, per-query latency and recall@k for several ``nprobe``
+settings on synthetic clustered data, using only NumPy (no FAISS).
+
+Usage:
+    python benchmarks/bench_vector_ann.py --vectors 200000 --dim 128 --k 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from semantica.vector_store import IVFIndex, VectorMatrix, recall_at_k
+
+
+def _clustered(n: int, dim: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32) * 3
+    labels = rng.integers(0, clusters, size=n)
+    return centers[labels] + rng.normal(size=(n, dim)).astype(np.float32)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vectors", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=None)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    data = _clustered(args.vectors, args.dim, max(10, args.vectors // 1000), rng)
+    queries = data[rng.choice(args.vectors, size=args.queries, replace=False)]
+    queries = queries + 0.1 * rng.normal(size=queries.shape).astype(np.float32)
+
+    matrix = VectorMatrix(dimension=args.dim, initial_capacity=args.vectors)
+    matrix.add_batch([f"vec_{i}" for i in range(args.vectors)], data)
+
+    start = time.perf_counter()
+    exact_rows = np.vstack([matrix.search(q, k=args.k)[0] for q in queries])
+    exact_ms = (time.perf_counter() - start) * 1000 / args.queries
+
+    start = time.perf_counter()
+    index = IVFIndex(nlist=args.nlist).build(matrix)
+    build_s = time.perf_counter() - start
+
+    print(f"vectors={args.vectors} dim={args.dim} k={args.k} nlist={index.nlist}")
+    print(f"IVF build: {build_s:.2f} s")
+    print(f"{'method':<14}{'ms/query':>10}{'recall@k':>10}")
+    print(f"{'exact':<14}{exact_ms:>10.2f}{1.0:>10.3f}")
+    for nprobe in args.nprobe:
+        start = time.perf_counter()
+        approx_rows = np.vstack(
+            [index.search(matrix, q, k=args.k, nprobe=nprobe)[0] for q in queries]
+        )
+        approx_ms = (time.perf_counter() - start) * 1000 / args.queries
+        recall = recall_at_k(approx_rows, exact_rows)
+        print(f"{'ivf/' + str(nprobe):<14}{approx_ms:>10.2f}{recall:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
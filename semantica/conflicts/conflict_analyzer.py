@@ -110,10 +110,8 @@ class ConflictAnalyzer:
         self.logger = get_logger("conflict_analyzer")
         self.config = config or {}
         self.config.update(kwargs)
-        # Initialize progress tracker and ensure it's enabled
+        # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def analyze_conflicts(self, conflicts: List[Conflict]) -> Dict[str, Any]:
         """
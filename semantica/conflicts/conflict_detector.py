@@ -127,9 +127,6 @@ class ConflictDetector:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.detected_conflicts: Dict[str, Conflict] = {}
 
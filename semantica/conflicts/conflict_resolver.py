@@ -130,9 +130,6 @@ class ConflictResolver:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.resolution_history: List[ResolutionResult] = []
 
@@ -26,6 +26,7 @@ Main Classes:
     - LinkedEntity: Linked entity with context
     - ContextRetriever: Retrieves relevant context from multiple sources
     - RetrievedContext: Retrieved context item data structure
+    - GraphEmbeddingIndex: Cached entity/relationship embeddings for graph retrieval
 
 Example Usage:
     >>> from semantica.context import AgentContext
@@ -40,6 +41,7 @@ from .agent_memory import AgentMemory, MemoryItem
 from .context_graph import ContextEdge, ContextGraph, ContextNode
 from .context_retriever import ContextRetriever, RetrievedContext
 from .entity_linker import EntityLink, EntityLinker, LinkedEntity
+from .graph_embedding_index import GraphEmbeddingIndex
 
 __all__ = [
     # High-level interface
@@ -55,6 +57,7 @@ __all__ = [
     "MemoryItem",
     "ContextRetriever",
     "RetrievedContext",
+    "GraphEmbeddingIndex",
 ]
 
 # Backward compatibility alias
@@ -10,19 +10,24 @@ Algorithms Used:
 Memory Storage:
     - Vector Embedding: Embedding generation for memory items using embedding models
     - Vector Indexing: Vector store indexing for efficient similarity search
-    - Memory Indexing: Deque-based memory index for efficient temporal access
+    - Memory Indexing: Secondary indexes on user, conversation, type, entity and
+      relationship type (see memory_index)
+    - Timeline Indexing: Timestamp-ordered timeline for recency, date range and
+      retention queries
     - Knowledge Graph Integration: Entity and relationship updates to knowledge graph
     - Metadata Storage: Dictionary-based metadata storage and retrieval
 
 Memory Retrieval:
     - Vector Similarity Search: Cosine similarity search in vector space
-    - Keyword Search: Fallback keyword-based search using word overlap
+    - Keyword Search: Fallback BM25 search over an inverted keyword index
     - Score Ranking: Relevance score-based result ranking
     - Filter Matching: Metadata-based filtering (type, date range, etc.)
     - Result Deduplication: Content-based deduplication of results
 
 Memory Management:
-    - Retention Policy: Time-based memory retention and cleanup
+    - Retention Policy: Time-based memory retention and cleanup (expires only
+      the oldest timeline entries)
+    - Short-term Pruning: Deque buffer with a running token count
     - Memory Statistics: Counter-based statistics tracking
     - Conversation History: Temporal-based conversation history retrieval
     - Memory Deletion: Cascading deletion from vector store and memory index
@@ -58,6 +63,8 @@ Author: Semantica Contributors
 License: MIT
 """
 
+import itertools
+import uuid
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -68,6 +75,7 @@ import numpy as np
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
 from ..utils.types import EntityDict, RelationshipDict
+from .memory_index import BM25Index, MemoryTimeline, SecondaryIndex
 
 
 @dataclass
@@ -119,17 +127,20 @@ class AgentMemory:
 
         # In-memory storage
         self.memory_items: Dict[str, MemoryItem] = {}
+        # Insertion log of memory IDs (deleted IDs are dropped lazily)
         self.memory_index: deque = deque(maxlen=self.max_memory_size)
 
-        # Hierarchical Memory: Short-term buffer
-        # Note: We use a list for flexible pruning (tokens & count).
-        self.short_term_memory: List[MemoryItem] = []
+        # Indexes keeping per-operation cost independent of memory count
+        self.keyword_index = BM25Index()
+        self.secondary_index = SecondaryIndex()
+        self.timeline = MemoryTimeline()
+
+        # Hierarchical Memory: Short-term buffer (oldest first)
+        self.short_term_memory: deque = deque()
+        self._short_term_tokens = 0
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Statistics
         self.stats = {"total_items": 0, "items_by_type": {}, "last_accessed": None}
@@ -178,11 +189,12 @@ class AgentMemory:
 
         self.memory_items = data.get("memory_items", {})
         self.memory_index = data.get("memory_index", deque(maxlen=self.max_memory_size))
-        self.short_term_memory = data.get("short_term_memory", [])
+        self.short_term_memory = deque(data.get("short_term_memory", []))
         self.stats = data.get(
             "stats",
             {"total_items": 0, "items_by_type": {}, "last_accessed": None},
         )
+        self._rebuild_indexes()
 
         self.logger.info(f"Loaded agent memory from {path}")
 
@@ -234,6 +246,7 @@ class AgentMemory:
 
             # 1. Update Short-Term Memory
             self.short_term_memory.append(memory_item)
+            self._short_term_tokens += self._count_tokens(content)
             self._prune_short_term_memory()
 
             # 2. Update Long-Term Memory (Vector Store)
@@ -262,8 +275,11 @@ class AgentMemory:
                     self.logger.warning(f"Failed to store in vector store: {e}")
 
             # Store in main memory dict (Persistent Layer Abstraction)
+            if memory_id in self.memory_items:
+                self._unindex_memory(memory_id)
             self.memory_items[memory_id] = memory_item
             self.memory_index.append(memory_id)
+            self._index_memory(memory_item)
 
             # 3. Update Knowledge Graph
             if self.knowledge_graph and entities:
@@ -469,13 +485,10 @@ class AgentMemory:
             except Exception as e:
                 self.logger.warning(f"Failed to delete from vector store: {e}")
 
-        # Remove from memory
+        # Remove from memory and indexes
+        self._unindex_memory(memory_id)
         del self.memory_items[memory_id]
 
-        # Remove from index
-        if memory_id in self.memory_index:
-            self.memory_index.remove(memory_id)
-
         self.stats["total_items"] = max(0, self.stats["total_items"] - 1)
 
         self.logger.debug(f"Deleted memory item: {memory_id}")
@@ -492,11 +505,7 @@ class AgentMemory:
             Number of items deleted
         """
         deleted_count = 0
-        memory_ids_to_delete = []
-
-        for memory_id, memory_item in self.memory_items.items():
-            if self._matches_filters(memory_item, filters):
-                memory_ids_to_delete.append(memory_id)
+        memory_ids_to_delete = list(self._filtered_ids(filters))
 
         for memory_id in memory_ids_to_delete:
             if self.delete_memory(memory_id):
@@ -519,28 +528,33 @@ class AgentMemory:
         """
         history = []
 
-        for memory_id in list(self.memory_index)[-max_items:]:
-            memory_item = self.memory_items.get(memory_id)
-            if not memory_item:
-                continue
-
-            # Filter by conversation ID if provided
-            if conversation_id:
-                item_conv_id = memory_item.metadata.get("conversation_id")
-                if item_conv_id != conversation_id:
-                    continue
+        # Walk the smaller posting list backwards (newest first)
+        conversation_items = self.secondary_index.get("type", "conversation")
+        if conversation_id:
+            conversation_ids = self.secondary_index.get("conversation_id", conversation_id)
+            if len(conversation_ids) < len(conversation_items):
+                candidates, other = conversation_ids, conversation_items
+            else:
+                candidates, other = conversation_items, conversation_ids
+        else:
+            candidates, other = conversation_items, None
 
-            # Check if it's a conversation item
-            if memory_item.metadata.get("type") == "conversation":
-                history.append(
-                    {
-                        "memory_id": memory_id,
-                        "content": memory_item.content,
-                        "timestamp": memory_item.timestamp.isoformat(),
-                        "metadata": memory_item.metadata,
-                    }
-                )
+        for memory_id in reversed(candidates):
+            if len(history) >= max_items:
+                break
+            if other is not None and memory_id not in other:
+                continue
+            memory_item = self.memory_items[memory_id]
+            history.append(
+                {
+                    "memory_id": memory_id,
+                    "content": memory_item.content,
+                    "timestamp": memory_item.timestamp.isoformat(),
+                    "metadata": memory_item.metadata,
+                }
+            )
 
+        history.reverse()
         return history
 
     def _search_short_term(
@@ -581,33 +595,88 @@ class AgentMemory:
 
     def _generate_memory_id(self) -> str:
         """Generate unique memory ID."""
-        import hashlib
-        import time
-
-        timestamp = str(time.time())
-        random_str = str(hash(str(self.memory_items)) % 10000)
-        memory_hash = hashlib.md5(f"{timestamp}_{random_str}".encode()).hexdigest()[:12]
-
-        return f"mem_{memory_hash}"
+        memory_id = f"mem_{uuid.uuid4().hex[:12]}"
+        while memory_id in self.memory_items:
+            memory_id = f"mem_{uuid.uuid4().hex[:12]}"
+        return memory_id
 
     def _prune_short_term_memory(self) -> None:
         """
         Prune short-term memory based on count and token limits.
 
-        Removes oldest items until constraints are met.
+        Removes oldest items until constraints are met. The token count is
+        maintained incrementally, so pruning costs O(items removed).
         """
         # 1. Prune by count
         while len(self.short_term_memory) > self.short_term_limit:
-            self.short_term_memory.pop(0)  # Remove oldest
+            removed_item = self.short_term_memory.popleft()  # Remove oldest
+            self._short_term_tokens -= self._count_tokens(removed_item.content)
 
         # 2. Prune by tokens
-        current_tokens = sum(
+        while self._short_term_tokens > self.token_limit and self.short_term_memory:
+            removed_item = self.short_term_memory.popleft()  # Remove oldest
+            self._short_term_tokens -= self._count_tokens(removed_item.content)
+
+    def _index_keys(self, memory_item: MemoryItem) -> List[tuple]:
+        """Secondary index keys for a memory item."""
+        metadata = memory_item.metadata or {}
+        keys = [
+            ("type", metadata.get("type")),
+            ("user_id", metadata.get("user_id")),
+            ("conversation_id", metadata.get("conversation_id")),
+        ]
+        keys.extend(("entity", entity.get("id")) for entity in memory_item.entities)
+        keys.extend(
+            ("relationship_type", rel.get("type")) for rel in memory_item.relationships
+        )
+        return keys
+
+    def _index_memory(self, memory_item: MemoryItem) -> None:
+        """Add a stored memory item to the keyword, secondary and time indexes."""
+        memory_id = memory_item.memory_id
+        self.keyword_index.add(memory_id, memory_item.content)
+        self.secondary_index.add(memory_id, self._index_keys(memory_item))
+        self.timeline.add(memory_id, memory_item.timestamp)
+
+    def _unindex_memory(self, memory_id: str) -> None:
+        """Remove a memory item from all indexes."""
+        self.keyword_index.remove(memory_id)
+        self.secondary_index.remove(memory_id)
+        self.timeline.remove(memory_id)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all indexes and the short-term token count (e.g. after load)."""
+        self.keyword_index.clear()
+        self.secondary_index.clear()
+        self.timeline.clear()
+        for memory_id, memory_item in self.memory_items.items():
+            memory_item.memory_id = memory_item.memory_id or memory_id
+            self._index_memory(memory_item)
+        self._short_term_tokens = sum(
             self._count_tokens(item.content) for item in self.short_term_memory
         )
 
-        while current_tokens > self.token_limit and self.short_term_memory:
-            removed_item = self.short_term_memory.pop(0)  # Remove oldest
-            current_tokens -= self._count_tokens(removed_item.content)
+    def _filtered_ids(self, filters: Dict[str, Any]) -> List[str]:
+        """
+        IDs of memories matching filters.
+
+        Equality filters on indexed fields narrow the candidates through the
+        secondary index before the remaining filters are checked per item.
+        """
+        candidates = None
+        for field_name in ("conversation_id", "user_id", "type"):
+            if field_name in filters:
+                ids = self.secondary_index.get(field_name, filters[field_name])
+                if candidates is None or len(ids) < len(candidates):
+                    candidates = ids
+        if candidates is None:
+            candidates = self.memory_items
+
+        return [
+            memory_id
+            for memory_id in candidates
+            if self._matches_filters(self.memory_items[memory_id], filters)
+        ]
 
     def _count_tokens(self, text: str) -> int:
         """
@@ -705,11 +774,11 @@ class AgentMemory:
         self, memory_item: MemoryItem, filters: Dict[str, Any]
     ) -> bool:
         """Check if memory item matches filters."""
-        # Filter by type
-        if "type" in filters:
-            item_type = memory_item.metadata.get("type")
-            if item_type != filters["type"]:
-                return False
+        # Filter by type, user and conversation
+        for field_name in ("type", "user_id", "conversation_id"):
+            if field_name in filters:
+                if memory_item.metadata.get(field_name) != filters[field_name]:
+                    return False
 
         # Filter by date range
         if "start_date" in filters:
@@ -735,34 +804,29 @@ class AgentMemory:
     def _keyword_search(
         self, query: str, max_results: int, filters: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        """Fallback keyword search."""
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
+        """Fallback keyword search (BM25 over the inverted keyword index)."""
+        accept = None
+        if filters:
+            accept = lambda memory_id: self._matches_filters(  # noqa: E731
+                self.memory_items[memory_id], filters
+            )
 
         results = []
-
-        for memory_id, memory_item in self.memory_items.items():
-            if not self._matches_filters(memory_item, filters):
-                continue
-
-            content_lower = memory_item.content.lower()
-            content_words = set(content_lower.split())
-
-            # Calculate simple word overlap score
-            overlap = len(query_words & content_words)
-            if overlap > 0:
-                score = overlap / len(query_words)
-                results.append(
-                    {
-                        "memory_id": memory_id,
-                        "content": memory_item.content,
-                        "score": score,
-                        "timestamp": memory_item.timestamp.isoformat(),
-                        "metadata": memory_item.metadata,
-                        "entities": memory_item.entities,
-                        "relationships": memory_item.relationships,
-                    }
-                )
+        for memory_id, score in self.keyword_index.search(
+            query, limit=max_results, accept=accept
+        ):
+            memory_item = self.memory_items[memory_id]
+            results.append(
+                {
+                    "memory_id": memory_id,
+                    "content": memory_item.content,
+                    "score": score,
+                    "timestamp": memory_item.timestamp.isoformat(),
+                    "metadata": memory_item.metadata,
+                    "entities": memory_item.entities,
+                    "relationships": memory_item.relationships,
+                }
+            )
 
         return results
 
@@ -782,11 +846,8 @@ class AgentMemory:
 
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        # Delete old items
-        memory_ids_to_delete = []
-        for memory_id, memory_item in self.memory_items.items():
-            if memory_item.timestamp < cutoff_date:
-                memory_ids_to_delete.append(memory_id)
+        # Delete old items (only the expired head of the timeline is visited)
+        memory_ids_to_delete = self.timeline.expire(cutoff_date)
 
         for memory_id in memory_ids_to_delete:
             self.delete_memory(memory_id)
@@ -844,11 +905,7 @@ class AgentMemory:
         if not filters:
             return len(self.memory_items)
 
-        count = 0
-        for memory_id, memory_item in self.memory_items.items():
-            if self._matches_filters(memory_item, filters):
-                count += 1
-        return count
+        return len(self._filtered_ids(filters))
 
     def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -988,17 +1045,7 @@ class AgentMemory:
         Example:
             >>> results = memory.find_by_entity("entity_123")
         """
-        results = []
-        for memory_id, memory_item in self.memory_items.items():
-            for entity in memory_item.entities:
-                if entity.get("id") == entity_id:
-                    mem_dict = self.get_memory(memory_id)
-                    if mem_dict:
-                        results.append(mem_dict)
-                    break
-            if len(results) >= limit:
-                break
-        return results[:limit]
+        return self._get_indexed("entity", entity_id, limit)
 
     def find_by_relationship(
         self, relationship_type: str, limit: int = 10
@@ -1016,17 +1063,7 @@ class AgentMemory:
         Example:
             >>> results = memory.find_by_relationship("related_to")
         """
-        results = []
-        for memory_id, memory_item in self.memory_items.items():
-            for relationship in memory_item.relationships:
-                if relationship.get("type") == relationship_type:
-                    mem_dict = self.get_memory(memory_id)
-                    if mem_dict:
-                        results.append(mem_dict)
-                    break
-            if len(results) >= limit:
-                break
-        return results[:limit]
+        return self._get_indexed("relationship_type", relationship_type, limit)
 
     # List and Filter Methods
     def list(
@@ -1060,7 +1097,7 @@ class AgentMemory:
             all_filters["user_id"] = user_id
 
         results = []
-        for memory_id in list(self.memory_items.keys())[offset : offset + limit]:
+        for memory_id in itertools.islice(self.memory_items, offset, offset + limit):
             memory_item = self.memory_items[memory_id]
             if not all_filters or self._matches_filters(memory_item, all_filters):
                 # Also check user_id and conversation_id in metadata
@@ -1112,15 +1149,7 @@ class AgentMemory:
         Example:
             >>> memories = memory.get_by_user("user123")
         """
-        results = []
-        for memory_id, memory_item in self.memory_items.items():
-            if memory_item.metadata.get("user_id") == user_id:
-                mem_dict = self.get_memory(memory_id)
-                if mem_dict:
-                    results.append(mem_dict)
-                if len(results) >= limit:
-                    break
-        return results
+        return self._get_indexed("user_id", user_id, limit)
 
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -1135,15 +1164,10 @@ class AgentMemory:
         Example:
             >>> recent = memory.get_recent(limit=20)
         """
-        results = []
-        sorted_items = sorted(
-            self.memory_items.items(), key=lambda x: x[1].timestamp, reverse=True
-        )
-        for memory_id, _ in sorted_items[:limit]:
-            mem_dict = self.get_memory(memory_id)
-            if mem_dict:
-                results.append(mem_dict)
-        return results
+        return [
+            self.get_memory(memory_id)
+            for memory_id in itertools.islice(self.timeline.latest(), limit)
+        ]
 
     def get_by_date(
         self,
@@ -1174,15 +1198,12 @@ class AgentMemory:
 
             end_date = parse(end_date)
 
-        results = []
-        for memory_id, memory_item in self.memory_items.items():
-            if start_date <= memory_item.timestamp <= end_date:
-                mem_dict = self.get_memory(memory_id)
-                if mem_dict:
-                    results.append(mem_dict)
-                if len(results) >= limit:
-                    break
-        return results
+        return [
+            self.get_memory(memory_id)
+            for memory_id in itertools.islice(
+                self.timeline.between(start_date, end_date), limit
+            )
+        ]
 
     def get_by_type(self, type: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -1198,15 +1219,16 @@ class AgentMemory:
         Example:
             >>> memories = memory.get_by_type("conversation")
         """
-        results = []
-        for memory_id, memory_item in self.memory_items.items():
-            if memory_item.metadata.get("type") == type:
-                mem_dict = self.get_memory(memory_id)
-                if mem_dict:
-                    results.append(mem_dict)
-                if len(results) >= limit:
-                    break
-        return results
+        return self._get_indexed("type", type, limit)
+
+    def _get_indexed(self, field_name: str, value: Any, limit: int) -> List[Dict[str, Any]]:
+        """Memory dicts indexed under (field, value), in insertion order."""
+        return [
+            self.get_memory(memory_id)
+            for memory_id in itertools.islice(
+                self.secondary_index.get(field_name, value), limit
+            )
+        ]
 
     # Batch Operations
     def batch_store(self, items: List[Union[str, Dict[str, Any]]]) -> List[str]:
@@ -1305,12 +1327,9 @@ class AgentMemory:
         if conversation_id:
             all_filters["conversation_id"] = conversation_id
 
-        memories = []
-        for memory_id, memory_item in self.memory_items.items():
-            if not all_filters or self._matches_filters(memory_item, all_filters):
-                mem_dict = self.get_memory(memory_id)
-                if mem_dict:
-                    memories.append(mem_dict)
+        memories = [
+            self.get_memory(memory_id) for memory_id in self._filtered_ids(all_filters)
+        ]
 
         export_data = {
             "exported_at": datetime.now().isoformat(),
@@ -1397,11 +1416,7 @@ class AgentMemory:
         Example:
             >>> counts = memory.count_by_type()
         """
-        counts = {}
-        for memory_item in self.memory_items.values():
-            mem_type = memory_item.metadata.get("type", "unknown")
-            counts[mem_type] = counts.get(mem_type, 0) + 1
-        return counts
+        return self._count_by_field("type")
 
     def count_by_user(self) -> Dict[str, int]:
         """
@@ -1413,11 +1428,7 @@ class AgentMemory:
         Example:
             >>> counts = memory.count_by_user()
         """
-        counts = {}
-        for memory_item in self.memory_items.values():
-            user_id = memory_item.metadata.get("user_id", "unknown")
-            counts[user_id] = counts.get(user_id, 0) + 1
-        return counts
+        return self._count_by_field("user_id")
 
     def count_by_conversation(self) -> Dict[str, int]:
         """
@@ -1429,8 +1440,12 @@ class AgentMemory:
         Example:
             >>> counts = memory.count_by_conversation()
         """
-        counts = {}
-        for memory_item in self.memory_items.values():
-            conv_id = memory_item.metadata.get("conversation_id", "unknown")
-            counts[conv_id] = counts.get(conv_id, 0) + 1
+        return self._count_by_field("conversation_id")
+
+    def _count_by_field(self, field_name: str) -> Dict[str, int]:
+        """Count memories per indexed field value ("unknown" when unset)."""
+        counts = self.secondary_index.counts(field_name)
+        unknown = len(self.memory_items) - sum(counts.values())
+        if unknown > 0:
+            counts["unknown"] = counts.get("unknown", 0) + unknown
         return counts
@@ -103,9 +103,6 @@ class ContextGraph:
 
         # Progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     # --- GraphStore Protocol Implementation ---
 
@@ -54,6 +54,11 @@ Key Features:
     - Graph Expansion: Multi-hop traversal following semantically relevant paths
     - Result Deduplication: Smart merging of results from multiple sources
     - Configurable Strategies: Adjustable hybrid_alpha, max_hops, similarity thresholds
+    - Graph Embedding Cache: Entity/relationship embeddings computed once per graph
+      version (GraphEmbeddingIndex); each query costs one embedding and two
+      matrix products
+    - Batch Retrieval: One embedding call and one matrix search for many queries,
+      with graph and memory legs fanned out over a bounded thread pool
 
 Main Classes:
     - RetrievedContext: Retrieved context item data structure with content, score,
@@ -76,12 +81,17 @@ Author: Semantica Contributors
 License: MIT
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
+
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from .graph_embedding_index import GraphEmbeddingIndex
 
 
 @dataclass
@@ -122,6 +132,8 @@ class ContextRetriever:
                 - max_expansion_hops: Maximum graph expansion hops (default: 2)
                 - hybrid_alpha: Weight for hybrid retrieval (0=vector only, 1=graph
                   only, default: 0.5)
+                - batch_max_workers: Threads used for the graph and memory legs
+                  of batch retrieval (default: 8)
         """
         self.logger = get_logger("context_retriever")
         self.config = config or {}
@@ -134,12 +146,15 @@ class ContextRetriever:
         self.use_graph_expansion = self.config.get("use_graph_expansion", True)
         self.max_expansion_hops = self.config.get("max_expansion_hops", 2)
         self.hybrid_alpha = self.config.get("hybrid_alpha", 0.5)
+        self.batch_max_workers = self.config.get("batch_max_workers", 8)
+
+        # Entity/relationship embeddings for dict graphs, reused across queries
+        self._graph_index: Optional[GraphEmbeddingIndex] = None
+        self._graph_index_store = None
+        self._graph_index_lock = threading.Lock()
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def retrieve(
         self,
@@ -245,7 +260,6 @@ class ContextRetriever:
             return []
 
         try:
-            # Simulate vector search (actual implementation would use vector_store)
             results = []
 
             # If vector_store has a search method
@@ -253,28 +267,7 @@ class ContextRetriever:
                 search_results = self.vector_store.search(
                     query=query, limit=max_results
                 )
-
-                for result in search_results:
-                    # Handle VectorSearchResult object or dict
-                    if hasattr(result, "content"):
-                        content = result.content
-                        score = result.score
-                        source = f"vector:{result.id}" if hasattr(result, 'id') else "vector:unknown"
-                        metadata = result.metadata or {}
-                    else:
-                        content = result.get("content", "")
-                        score = result.get("score", 0.0)
-                        source = result.get("source") or f"vector:{result.get('id', 'unknown')}"
-                        metadata = result.get("metadata", {})
-
-                    results.append(
-                        RetrievedContext(
-                            content=content,
-                            score=score,
-                            source=source,
-                            metadata=metadata,
-                        )
-                    )
+                results = [self._to_vector_context(r) for r in search_results]
 
             return results
 
@@ -282,8 +275,112 @@ class ContextRetriever:
             self.logger.warning(f"Vector retrieval failed: {e}")
             return []
 
+    def _to_vector_context(self, result: Any) -> RetrievedContext:
+        """Convert a vector search result to a RetrievedContext."""
+        # Handle VectorSearchResult object or dict
+        if hasattr(result, "content"):
+            content = result.content
+            score = result.score
+            source = f"vector:{result.id}" if hasattr(result, 'id') else "vector:unknown"
+            metadata = result.metadata or {}
+        else:
+            content = result.get("content", "")
+            score = result.get("score", 0.0)
+            source = result.get("source") or f"vector:{result.get('id', 'unknown')}"
+            metadata = result.get("metadata", {})
+
+        return RetrievedContext(
+            content=content,
+            score=score,
+            source=source,
+            metadata=metadata,
+        )
+
+    def _retrieve_from_vector_batch(
+        self,
+        queries: List[str],
+        max_results: int,
+        query_embeddings: Optional[np.ndarray] = None,
+    ) -> List[List[RetrievedContext]]:
+        """
+        Retrieve from vector store for several queries at once.
+
+        Uses the store's ``search_vectors_batch`` (one matrix product for all
+        queries) when query embeddings are available, and falls back to
+        per-query search otherwise.
+        """
+        if not self.vector_store:
+            return [[] for _ in queries]
+
+        if query_embeddings is not None and hasattr(
+            self.vector_store, "search_vectors_batch"
+        ):
+            try:
+                batch_results = self.vector_store.search_vectors_batch(
+                    query_embeddings, k=max_results
+                )
+                return [
+                    [self._to_vector_context(r) for r in results]
+                    for results in batch_results
+                ]
+            except Exception as e:
+                self.logger.warning(
+                    f"Batched vector retrieval failed: {e}, falling back to per-query search"
+                )
+
+        return [self._retrieve_from_vector(query, max_results) for query in queries]
+
+    def _embed_texts(self, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Embed texts with the vector store.
+
+        Uses a single ``embed_batch`` call when the store supports it and
+        falls back to one ``embed`` call per text. Texts that cannot be
+        embedded get a zero row.
+
+        Returns:
+            Array of shape (len(texts), D), or None if nothing could be embedded
+        """
+        if not texts or not self.vector_store:
+            return None
+
+        try:
+            if hasattr(self.vector_store, "embed_batch"):
+                embeddings = np.asarray(
+                    self.vector_store.embed_batch(list(texts)), dtype=np.float64
+                )
+                if embeddings.ndim == 2 and len(embeddings) == len(texts):
+                    return embeddings
+
+            if hasattr(self.vector_store, "embed"):
+                rows = []
+                for text in texts:
+                    embedding = self.vector_store.embed(text)
+                    if embedding is not None:
+                        embedding = np.asarray(embedding, dtype=np.float64)
+                        # Handle batch embeddings (take first if 2D)
+                        if embedding.ndim == 2:
+                            embedding = embedding[0]
+                    rows.append(embedding)
+
+                dimension = next((len(r) for r in rows if r is not None), None)
+                if dimension is None:
+                    return None
+                return np.vstack(
+                    [r if r is not None else np.zeros(dimension, dtype=np.float64) for r in rows]
+                )
+        except Exception as e:
+            self.logger.debug(f"Embedding failed: {e}")
+
+        return None
+
     def _retrieve_from_graph(
-        self, query: str, max_results: int, max_hops: int = 2, query_intent: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        max_results: int,
+        max_hops: int = 2,
+        query_intent: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[np.ndarray] = None,
     ) -> List[RetrievedContext]:
         """Retrieve from knowledge graph."""
         if not self.knowledge_graph:
@@ -341,136 +438,27 @@ class ContextRetriever:
 
             # Fallback to dictionary-based graph retrieval
             # Handle GraphBuilder format (entities and relationships)
-            # Get entities and relationships from graph
-            entities = self.knowledge_graph.get("entities", [])
-            relationships = self.knowledge_graph.get("relationships", [])
+            # Lookup maps and embeddings are cached per graph fingerprint
+            index = self._get_graph_index()
+            entities = index.entities
 
             # Use semantic similarity if vector_store is available
             if self.vector_store and hasattr(self.vector_store, 'embed'):
                 try:
-                    import numpy as np
-                    # Generate query embedding
-                    query_embedding = self.vector_store.embed(query)
+                    # Generate query embedding (batch retrieval passes it in)
+                    if query_embedding is None:
+                        query_embedding = self.vector_store.embed(query)
                     if query_embedding is not None:
                         query_embedding = np.array(query_embedding)
                         # Handle batch embeddings (take first if 2D)
                         if len(query_embedding.shape) == 2:
                             query_embedding = query_embedding[0]
                         query_norm = np.linalg.norm(query_embedding)
-                        
-                        if query_norm > 0:
-                            # Calculate semantic similarity for each entity
-                            entity_scores = []
-                            for entity in entities:
-                                entity_name = str(entity.get("name", entity.get("id", "")))
-                                entity_type = str(entity.get("type", ""))
-                                
-                                # Create entity text for embedding (include type for better matching)
-                                entity_text = f"{entity_name} {entity_type}".strip()
-                                entity_embedding = self.vector_store.embed(entity_text)
-                                
-                                if entity_embedding is not None:
-                                    entity_embedding = np.array(entity_embedding)
-                                    # Handle batch embeddings
-                                    if len(entity_embedding.shape) == 2:
-                                        entity_embedding = entity_embedding[0]
-                                    entity_norm = np.linalg.norm(entity_embedding)
-                                    
-                                    # Cosine similarity
-                                    if entity_norm > 0:
-                                        similarity = np.dot(query_embedding, entity_embedding) / (query_norm * entity_norm)
-                                        
-                                        # Boost if entity type is mentioned in query (domain-agnostic)
-                                        if query_intent and query_intent.get("entity_types"):
-                                            # Check if entity type semantically matches query keywords
-                                            entity_type_lower = entity_type.lower()
-                                            query_keywords = query_intent.get("keywords", set())
-                                            if any(kw in entity_type_lower or entity_type_lower in kw for kw in query_keywords if len(kw) > 2):
-                                                similarity *= 1.15  # 15% boost for type-keyword match
-                                        
-                                        entity_scores.append((entity, float(similarity)))
-                            
-                            # Also match relationships semantically
-                            relationship_scores = []
-                            for rel in relationships:
-                                rel_type = str(rel.get("type", ""))
-                                source_id = rel.get("source") or rel.get("source_id", "")
-                                target_id = rel.get("target") or rel.get("target_id", "")
-                                
-                                # Find entity names for better matching
-                                source_name = source_id
-                                target_name = target_id
-                                for e in entities:
-                                    e_id = e.get("id") or e.get("name")
-                                    if e_id == source_id:
-                                        source_name = e.get("name", source_id)
-                                    if e_id == target_id:
-                                        target_name = e.get("name", target_id)
-                                
-                                # Create relationship text for embedding
-                                rel_text = f"{rel_type} {source_name} {target_name}".strip()
-                                rel_embedding = self.vector_store.embed(rel_text)
-                                
-                                if rel_embedding is not None:
-                                    rel_embedding = np.array(rel_embedding)
-                                    if len(rel_embedding.shape) == 2:
-                                        rel_embedding = rel_embedding[0]
-                                    rel_norm = np.linalg.norm(rel_embedding)
-                                    
-                                    if rel_norm > 0:
-                                        similarity = np.dot(query_embedding, rel_embedding) / (query_norm * rel_norm)
-                                        
-                                        # Boost if relationship type semantically matches query (domain-agnostic)
-                                        if query_intent and query_intent.get("relationship_types"):
-                                            rel_type_lower = rel_type.lower()
-                                            # Check if relationship type or its synonyms appear in query
-                                            for rt in query_intent["relationship_types"]:
-                                                if rt.lower() in rel_type_lower or rel_type_lower in rt.lower():
-                                                    similarity *= 1.25  # 25% boost for matching relationship
-                                                    break
-                                        
-                                        relationship_scores.append((rel, similarity, source_id, target_id))
-                            
-                            # Sort by similarity
-                            entity_scores.sort(key=lambda x: x[1], reverse=True)
-                            relationship_scores.sort(key=lambda x: x[1], reverse=True)
-                            
-                            # Combine entity and relationship matches
-                            # Include entities from high-scoring relationships
-                            matched_entity_ids = set()
-                            matched_entities = []
-                            
-                            # Add top entity matches
-                            for entity, score in entity_scores[:max_results * 2]:
-                                if score > 0.3:  # Similarity threshold
-                                    entity_id = entity.get("id") or entity.get("name")
-                                    matched_entity_ids.add(entity_id)
-                                    matched_entities.append((entity, score))
-                            
-                            # Add entities from high-scoring relationships
-                            for rel, score, source_id, target_id in relationship_scores[:max_results]:
-                                if score > 0.3:
-                                    # Add source entity if not already matched
-                                    if source_id not in matched_entity_ids:
-                                        for e in entities:
-                                            e_id = e.get("id") or e.get("name")
-                                            if e_id == source_id:
-                                                matched_entity_ids.add(source_id)
-                                                # Boost score for relationship match
-                                                matched_entities.append((e, score * 0.9))
-                                                break
-                                    # Add target entity if not already matched
-                                    if target_id not in matched_entity_ids:
-                                        for e in entities:
-                                            e_id = e.get("id") or e.get("name")
-                                            if e_id == target_id:
-                                                matched_entity_ids.add(target_id)
-                                                matched_entities.append((e, score * 0.9))
-                                                break
-                            
-                            # Sort all matches by score
-                            matched_entities.sort(key=lambda x: x[1], reverse=True)
-                            matched_entities = matched_entities[:max_results * 2]
+
+                        if query_norm > 0 and index.ensure_embeddings(self._embed_texts):
+                            matched_entities = self._match_graph_embeddings(
+                                index, query_embedding, max_results, query_intent
+                            )
                         else:
                             matched_entities = self._keyword_match_entities(entities, query, max_results * 2)
                     else:
@@ -492,24 +480,18 @@ class ContextRetriever:
                     related_relationships = []
                     
                     # Find relationships involving this entity
-                    for rel in relationships:
-                        if (rel.get("source") == entity_id or 
-                            rel.get("target") == entity_id or
-                            rel.get("source_id") == entity_id or
-                            rel.get("target_id") == entity_id):
-                            related_relationships.append(rel)
-                            
-                            # Get the other entity in the relationship
-                            other_id = rel.get("target") or rel.get("target_id")
-                            if other_id == entity_id:
-                                other_id = rel.get("source") or rel.get("source_id")
-                            
-                            # Find the other entity
-                            for e in entities:
-                                e_id = e.get("id") or e.get("name")
-                                if e_id == other_id:
-                                    related_entities.append(e)
-                                    break
+                    for rel in index.relationships_by_entity.get(entity_id, []):
+                        related_relationships.append(rel)
+
+                        # Get the other entity in the relationship
+                        other_id = rel.get("target") or rel.get("target_id")
+                        if other_id == entity_id:
+                            other_id = rel.get("source") or rel.get("source_id")
+
+                        # Find the other entity
+                        other = index.entity_by_id.get(other_id)
+                        if other is not None:
+                            related_entities.append(other)
                     
                     # Generate comprehensive content from entity and relationships
                     entity_display = entity.get('name', entity_id)
@@ -542,14 +524,12 @@ class ContextRetriever:
                             # Determine direction
                             if source_id == entity_id:
                                 # Entity is source
-                                target_name = target_id
-                                for e in entities:
-                                    e_id = e.get("id") or e.get("name")
-                                    if e_id == target_id:
-                                        target_name = e.get("name", target_id)
-                                        target_type = e.get("type", "")
-                                        break
+                                target = index.entity_by_id.get(target_id)
+                                if target is not None:
+                                    target_name = target.get("name", target_id)
+                                    target_type = target.get("type", "")
                                 else:
+                                    target_name = target_id
                                     target_type = ""
                                 
                                 if rel_type not in rels_by_type:
@@ -557,14 +537,12 @@ class ContextRetriever:
                                 rels_by_type[rel_type].append((target_name, target_type))
                             else:
                                 # Entity is target
-                                source_name = source_id
-                                for e in entities:
-                                    e_id = e.get("id") or e.get("name")
-                                    if e_id == source_id:
-                                        source_name = e.get("name", source_id)
-                                        source_type = e.get("type", "")
-                                        break
+                                source = index.entity_by_id.get(source_id)
+                                if source is not None:
+                                    source_name = source.get("name", source_id)
+                                    source_type = source.get("type", "")
                                 else:
+                                    source_name = source_id
                                     source_type = ""
                                 
                                 # Reverse relationship for readability
@@ -637,6 +615,96 @@ class ContextRetriever:
             self.logger.warning(f"Graph retrieval failed: {e}")
             return []
     
+    def _get_graph_index(self) -> GraphEmbeddingIndex:
+        """Get the embedding index for the current dict knowledge graph."""
+        with self._graph_index_lock:
+            # Cached embeddings belong to the store that produced them
+            store_changed = (
+                self.vector_store is not None
+                and self._graph_index_store is not self.vector_store
+            )
+            if self._graph_index is None or store_changed:
+                self._graph_index = GraphEmbeddingIndex()
+                self._graph_index_store = self.vector_store
+            index = self._graph_index
+        index.refresh(self.knowledge_graph)
+        return index
+
+    def _match_graph_embeddings(
+        self,
+        index: GraphEmbeddingIndex,
+        query_embedding: np.ndarray,
+        max_results: int,
+        query_intent: Optional[Dict[str, Any]] = None,
+    ) -> List[tuple]:
+        """Match entities directly and through relationships using the graph index."""
+        entity_scores = index.score_entities(query_embedding)
+        relationship_scores = index.score_relationships(query_embedding)
+
+        # Boost if entity type is mentioned in query (domain-agnostic)
+        if query_intent and query_intent.get("entity_types") and len(entity_scores):
+            query_keywords = [
+                kw for kw in query_intent.get("keywords", set()) if len(kw) > 2
+            ]
+            type_boost = {}
+            for entity_type in set(index.entity_types):
+                entity_type_lower = entity_type.lower()
+                matches = any(
+                    kw in entity_type_lower or entity_type_lower in kw
+                    for kw in query_keywords
+                )
+                type_boost[entity_type] = 1.15 if matches else 1.0  # 15% boost for type-keyword match
+            entity_scores = entity_scores * np.array(
+                [type_boost[t] for t in index.entity_types]
+            )
+
+        # Boost if relationship type semantically matches query (domain-agnostic)
+        if query_intent and query_intent.get("relationship_types") and len(relationship_scores):
+            intent_types = [rt.lower() for rt in query_intent["relationship_types"]]
+            type_boost = {}
+            for rel_type in set(index.relationship_types):
+                rel_type_lower = rel_type.lower()
+                matches = any(
+                    rt in rel_type_lower or rel_type_lower in rt for rt in intent_types
+                )
+                type_boost[rel_type] = 1.25 if matches else 1.0  # 25% boost for matching relationship
+            relationship_scores = relationship_scores * np.array(
+                [type_boost[t] for t in index.relationship_types]
+            )
+
+        def ranked(scores: np.ndarray, limit: int) -> List[int]:
+            order = np.argsort(-scores, kind="stable")
+            return [int(i) for i in order if not np.isnan(scores[i])][:limit]
+
+        # Combine entity and relationship matches
+        # Include entities from high-scoring relationships
+        matched_entity_ids = set()
+        matched_entities = []
+
+        # Add top entity matches
+        for i in ranked(entity_scores, max_results * 2):
+            score = float(entity_scores[i])
+            if score > 0.3:  # Similarity threshold
+                matched_entity_ids.add(index.entity_ids[i])
+                matched_entities.append((index.entities[i], score))
+
+        # Add entities from high-scoring relationships
+        for i in ranked(relationship_scores, max_results):
+            score = float(relationship_scores[i])
+            if score > 0.3:
+                for endpoint_id in index.relationship_endpoints[i]:
+                    if endpoint_id in matched_entity_ids:
+                        continue
+                    endpoint = index.entity_by_id.get(endpoint_id)
+                    if endpoint is not None:
+                        matched_entity_ids.add(endpoint_id)
+                        # Boost score for relationship match
+                        matched_entities.append((endpoint, score * 0.9))
+
+        # Sort all matches by score
+        matched_entities.sort(key=lambda x: x[1], reverse=True)
+        return matched_entities[:max_results * 2]
+
     def _keyword_match_entities(self, entities, query, max_results):
         """Fallback keyword matching for entities."""
         query_lower = query.lower()
@@ -697,9 +765,28 @@ class ContextRetriever:
             return []
 
     def _rank_and_merge(
-        self, results: List[RetrievedContext], query: str
+        self,
+        results: List[RetrievedContext],
+        query: str,
+        query_embedding: Optional[np.ndarray] = None,
     ) -> List[RetrievedContext]:
         """Rank and merge results from multiple sources with GraphRAG optimization."""
+        merged_results = self._merge_results(results)
+
+        # Re-rank with query relevance boost
+        if query_embedding is None:
+            embeddings = self._embed_texts([query])
+            query_embedding = embeddings[0] if embeddings is not None else None
+        if query_embedding is not None:
+            self._rerank_by_similarity([merged_results], query_embedding[None, :])
+
+        # Final sort by score
+        return sorted(merged_results, key=lambda x: x.score, reverse=True)
+
+    def _merge_results(
+        self, results: List[RetrievedContext]
+    ) -> List[RetrievedContext]:
+        """Normalize, weight and deduplicate results from multiple sources."""
         # Separate results by source (handle None source gracefully)
         vector_results = [r for r in results if r.source and r.source.startswith("vector:")]
         graph_results = [r for r in results if r.source and r.source.startswith("graph:")]
@@ -796,37 +883,50 @@ class ContextRetriever:
             if not (r.source and r.source.startswith("graph:")) or r.metadata.get("node_id") not in seen_entities
         ]
         
-        # Re-rank with query relevance boost
-        if self.vector_store and hasattr(self.vector_store, 'embed'):
-            try:
-                import numpy as np
-                query_embedding = self.vector_store.embed(query)
-                if query_embedding is not None:
-                    query_embedding = np.array(query_embedding)
-                    if len(query_embedding.shape) == 2:
-                        query_embedding = query_embedding[0]
-                    query_norm = np.linalg.norm(query_embedding)
-                    
-                    if query_norm > 0:
-                        for result in merged_results:
-                            # Re-score based on semantic similarity to query
-                            content_embedding = self.vector_store.embed(result.content[:500])
-                            if content_embedding is not None:
-                                content_embedding = np.array(content_embedding)
-                                if len(content_embedding.shape) == 2:
-                                    content_embedding = content_embedding[0]
-                                content_norm = np.linalg.norm(content_embedding)
-                                if content_norm > 0:
-                                    semantic_sim = np.dot(query_embedding, content_embedding) / (query_norm * content_norm)
-                                    # Blend original score with semantic similarity
-                                    result.score = result.score * 0.7 + float(semantic_sim) * 0.3
-            except Exception as e:
-                self.logger.debug(f"Query relevance boost failed: {e}")
-        
-        # Final sort by score
-        ranked = sorted(merged_results, key=lambda x: x.score, reverse=True)
-        
-        return ranked
+        return merged_results
+
+    def _rerank_by_similarity(
+        self,
+        result_lists: List[List[RetrievedContext]],
+        query_embeddings: np.ndarray,
+    ) -> None:
+        """
+        Blend result scores with query-content similarity, in place.
+
+        Content of every result across all lists is embedded in one call and
+        scored with one similarity per result.
+
+        Args:
+            result_lists: Merged results, one list per query
+            query_embeddings: (Q, D) query embeddings aligned with result_lists
+        """
+        flat = [(q, result) for q, results in enumerate(result_lists) for result in results]
+        if not flat:
+            return
+
+        try:
+            content_embeddings = self._embed_texts(
+                [(result.content or "")[:500] for _, result in flat]
+            )
+            if content_embeddings is None:
+                return
+
+            query_embeddings = np.asarray(query_embeddings, dtype=np.float64)
+            owners = np.array([q for q, _ in flat])
+            query_norms = np.linalg.norm(query_embeddings, axis=1)[owners]
+            content_norms = np.linalg.norm(content_embeddings, axis=1)
+            dots = np.einsum("ij,ij->i", content_embeddings, query_embeddings[owners])
+            valid = (query_norms > 0) & (content_norms > 0)
+            similarities = np.where(
+                valid, dots / np.where(valid, query_norms * content_norms, 1.0), 0.0
+            )
+
+            for (_, result), similarity, ok in zip(flat, similarities, valid):
+                if ok:
+                    # Blend original score with semantic similarity
+                    result.score = result.score * 0.7 + float(similarity) * 0.3
+        except Exception as e:
+            self.logger.debug(f"Query relevance boost failed: {e}")
 
     def _extract_query_intent(self, query: str) -> Dict[str, Any]:
         """Extract query intent to guide graph retrieval (domain-agnostic)."""
@@ -1694,6 +1794,140 @@ Answer:"""
         return [r for r in results if r.score >= min_score]
 
     # Batch Operations
+    def batch_retrieve(
+        self,
+        queries: List[str],
+        max_results: int = 5,
+        use_graph_expansion: Optional[bool] = None,
+        min_relevance_score: float = 0.0,
+        **options,
+    ) -> List[List[RetrievedContext]]:
+        """
+        Retrieve context for many queries at once.
+
+        Queries are embedded with a single ``embed_batch`` call and the vector
+        leg is answered with one batched matrix search. The graph and memory
+        legs run per query on a bounded thread pool, and results are ranked
+        and merged per query as in ``retrieve``.
+
+        Args:
+            queries: Queries to retrieve context for
+            max_results: Maximum number of results per query
+            use_graph_expansion: Use graph expansion (overrides config)
+            min_relevance_score: Minimum relevance score
+            **options: Additional options:
+                - max_hops: Maximum expansion hops
+                - max_workers: Threads for graph/memory legs (overrides config)
+
+        Returns:
+            One list of retrieved context items per query, in input order
+        """
+        if not queries:
+            return []
+
+        # Duplicate queries are retrieved once
+        unique_queries = list(dict.fromkeys(queries))
+
+        tracking_id = self.progress_tracker.start_tracking(
+            file=None,
+            module="context",
+            submodule="ContextRetriever",
+            message=f"Retrieving context for {len(unique_queries)} queries",
+        )
+
+        try:
+            use_expansion = (
+                use_graph_expansion
+                if use_graph_expansion is not None
+                else self.use_graph_expansion
+            )
+            use_graph = bool(self.knowledge_graph) and use_expansion
+            max_hops = options.get("max_hops", self.max_expansion_hops)
+
+            self.progress_tracker.update_tracking(
+                tracking_id, message="Embedding queries..."
+            )
+            query_embeddings = self._embed_texts(unique_queries)
+
+            # Vector leg: one batched search for all queries
+            self.progress_tracker.update_tracking(
+                tracking_id, message="Retrieving from vector store..."
+            )
+            vector_results = self._retrieve_from_vector_batch(
+                unique_queries, max_results * 2, query_embeddings
+            )
+
+            # Graph and memory legs: per query, on a bounded thread pool
+            def retrieve_side_legs(position: int) -> List[RetrievedContext]:
+                query = unique_queries[position]
+                results = []
+                if use_graph:
+                    results.extend(
+                        self._retrieve_from_graph(
+                            query,
+                            max_results * 2,
+                            max_hops=max_hops,
+                            query_intent=self._extract_query_intent(query),
+                            query_embedding=(
+                                query_embeddings[position]
+                                if query_embeddings is not None
+                                else None
+                            ),
+                        )
+                    )
+                if self.memory_store:
+                    results.extend(self._retrieve_from_memory(query, max_results * 2))
+                return results
+
+            if use_graph or self.memory_store:
+                self.progress_tracker.update_tracking(
+                    tracking_id, message="Retrieving from knowledge graph and memory..."
+                )
+                max_workers = max(
+                    1,
+                    min(
+                        options.get("max_workers", self.batch_max_workers),
+                        len(unique_queries),
+                    ),
+                )
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    side_results = list(
+                        executor.map(retrieve_side_legs, range(len(unique_queries)))
+                    )
+            else:
+                side_results = [[] for _ in unique_queries]
+
+            # Merge per query, then re-rank every query's results in one pass
+            self.progress_tracker.update_tracking(
+                tracking_id, message="Ranking and merging results..."
+            )
+            merged = [
+                self._merge_results(vector + side)
+                for vector, side in zip(vector_results, side_results)
+            ]
+            if query_embeddings is not None:
+                self._rerank_by_similarity(merged, query_embeddings)
+
+            by_query = {}
+            for query, results in zip(unique_queries, merged):
+                ranked = sorted(results, key=lambda x: x.score, reverse=True)
+                by_query[query] = [
+                    r for r in ranked if r.score >= min_relevance_score
+                ][:max_results]
+
+            self.progress_tracker.stop_tracking(
+                tracking_id,
+                status="completed",
+                message=f"Retrieved context for {len(unique_queries)} queries",
+            )
+            return [list(by_query[query]) for query in queries]
+
+        except Exception as e:
+            self.progress_tracker.stop_tracking(
+                tracking_id, status="failed", message=str(e)
+            )
+            raise
+
     def batch_search(
         self, queries: List[str], **options
     ) -> Dict[str, List[RetrievedContext]]:
@@ -1702,7 +1936,7 @@ Answer:"""
 
         Args:
             queries: List of queries
-            **options: Additional options
+            **options: Additional options (see ``batch_retrieve``)
 
         Returns:
             Dict mapping query to results
@@ -1710,10 +1944,7 @@ Answer:"""
         Example:
             >>> results = retriever.batch_search(["Python", "Java", "C++"])
         """
-        results = {}
-        for query in queries:
-            results[query] = self.retrieve(query, **options)
-        return results
+        return dict(zip(queries, self.batch_retrieve(queries, **options)))
 
     def batch_get_context(
         self,
@@ -1727,7 +1958,7 @@ Answer:"""
         Args:
             queries: List of queries
             max_results: Maximum results per query (default: 5)
-            **options: Additional options
+            **options: Additional options (see ``batch_retrieve``)
 
         Returns:
             Dict mapping query to context results
@@ -1737,7 +1968,6 @@ Answer:"""
             ...     ["Python", "Java"], max_results=5
             ... )
         """
-        results = {}
-        for query in queries:
-            results[query] = self.get_context(query, max_results=max_results, **options)
-        return results
+        return dict(
+            zip(queries, self.batch_retrieve(queries, max_results=max_results, **options))
+        )
@@ -0,0 +1,321 @@
+"""
+Memory Indexes for Agent Memory
+
+This module provides the in-memory index structures behind AgentMemory so that
+storing, deleting and looking up memories does not scale with the total number
+of memories held by a long-lived agent.
+
+Algorithms Used:
+
+Keyword Index:
+    - Inverted Index: Term -> {memory_id: term frequency} postings
+    - BM25 Scoring: Okapi BM25 (k1, b) over the postings of the query terms only,
+      normalized to 0-1 by the query's maximum attainable score
+
+Secondary Indexes:
+    - Value Postings: (field, value) -> insertion-ordered set of memory IDs
+    - Reverse Map: memory_id -> indexed keys for O(keys) removal
+
+Timeline:
+    - Sorted Timeline: (timestamp, sequence, memory_id) entries kept in order,
+      appended in O(1) for monotonic timestamps and bisect-inserted otherwise
+    - Lazy Deletion: Deleted entries are skipped on read and compacted once they
+      outnumber live entries
+    - Range Queries: Bisect-based date range and expiry (retention) scans
+
+Key Features:
+    - Per-operation cost independent of total memory count
+    - Incremental add/remove for every index
+    - Filtered BM25 keyword search with top-k selection
+
+Main Classes:
+    - BM25Index: Inverted keyword index with BM25 scoring
+    - SecondaryIndex: Field/value index over memory attributes
+    - MemoryTimeline: Timestamp-ordered index of memory IDs
+
+Example Usage:
+    >>> from semantica.context.memory_index import BM25Index
+    >>> index = BM25Index()
+    >>> index.add("mem_1", "User asked about Python")
+    >>> index.search("python", limit=5)
+    [('mem_1', 0.46...)]
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import bisect
+import heapq
+import itertools
+import math
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokenization used by the keyword index."""
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class BM25Index:
+    """
+    Inverted keyword index with BM25 scoring.
+
+    Only the postings of the query terms are visited per search, so query
+    cost depends on how common the query terms are, not on the index size.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize BM25 index.
+
+        Args:
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index (or re-index) a document."""
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        self._doc_terms[doc_id] = list(counts)
+        self.doc_lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document; returns False if it was not indexed."""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self.postings[term]
+        self._total_length -= self.doc_lengths.pop(doc_id, 0)
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self.postings.clear()
+        self.doc_lengths.clear()
+        self._doc_terms.clear()
+        self._total_length = 0
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        n = len(self.doc_lengths)
+        df = len(self.postings.get(term, ()))
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Score documents against a query.
+
+        Args:
+            query: Query text
+            limit: Maximum number of results (None = all matches)
+            accept: Optional predicate applied to candidate document IDs
+
+        Returns:
+            (doc_id, score) pairs sorted by descending score. Scores are
+            normalized to 0-1 by the query's maximum attainable BM25 score.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.doc_lengths:
+            return []
+
+        avg_length = self._total_length / len(self.doc_lengths) or 1.0
+        scores: Dict[str, float] = {}
+        max_score = 0.0
+        for term in terms:
+            idf = self.idf(term)
+            max_score += idf * (self.k1 + 1)
+            for doc_id, tf in self.postings.get(term, {}).items():
+                length_norm = 1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                    tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+                )
+
+        candidates: Iterable[Tuple[str, float]] = scores.items()
+        if accept is not None:
+            candidates = ((doc_id, s) for doc_id, s in candidates if accept(doc_id))
+        if limit is None:
+            ranked = sorted(candidates, key=lambda x: x[1], reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, candidates, key=lambda x: x[1])
+
+        if max_score <= 0:
+            return ranked
+        return [(doc_id, s / max_score) for doc_id, s in ranked]
+
+
+class SecondaryIndex:
+    """
+    Field/value index over memory attributes.
+
+    Each (field, value) pair maps to an insertion-ordered set of memory IDs
+    (a dict with None values).
+    """
+
+    def __init__(self):
+        """Initialize empty secondary index."""
+        self._values: Dict[str, Dict[Hashable, Dict[str, None]]] = {}
+        self._doc_keys: Dict[str, List[Tuple[str, Hashable]]] = {}
+
+    def add(self, doc_id: str, keys: Iterable[Tuple[str, Any]]) -> None:
+        """Index a document under (field, value) keys; None/unhashable values are skipped."""
+        if doc_id in self._doc_keys:
+            self.remove(doc_id)
+
+        indexed = []
+        for field_name, value in keys:
+            if value is None:
+                continue
+            try:
+                self._values.setdefault(field_name, {}).setdefault(value, {})[doc_id] = None
+            except TypeError:
+                continue
+            indexed.append((field_name, value))
+        self._doc_keys[doc_id] = indexed
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document from all postings."""
+        keys = self._doc_keys.pop(doc_id, None)
+        if keys is None:
+            return False
+        for field_name, value in keys:
+            values = self._values.get(field_name)
+            if values is None or value not in values:
+                continue
+            values[value].pop(doc_id, None)
+            if not values[value]:
+                del values[value]
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._values.clear()
+        self._doc_keys.clear()
+
+    def get(self, field_name: str, value: Any) -> Dict[str, None]:
+        """Insertion-ordered IDs indexed under (field, value)."""
+        try:
+            return self._values.get(field_name, {}).get(value, {})
+        except TypeError:
+            return {}
+
+    def counts(self, field_name: str) -> Dict[Any, int]:
+        """Number of documents per value of a field."""
+        return {value: len(ids) for value, ids in self._values.get(field_name, {}).items()}
+
+
+class MemoryTimeline:
+    """
+    Timestamp-ordered index of memory IDs with lazy deletion.
+    """
+
+    def __init__(self):
+        """Initialize empty timeline."""
+        self._entries: List[Tuple[datetime, int, str]] = []
+        self._start = 0
+        self._live: Dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def _is_live(self, entry: Tuple[datetime, int, str]) -> bool:
+        return self._live.get(entry[2]) == entry[1]
+
+    def add(self, memory_id: str, timestamp: datetime) -> None:
+        """Add (or move) a memory at the given timestamp."""
+        seq = next(self._sequence)
+        entry = (timestamp, seq, memory_id)
+        if len(self._entries) == self._start or self._entries[-1][0] <= timestamp:
+            self._entries.append(entry)
+        else:
+            bisect.insort(self._entries, entry, lo=self._start)
+        self._live[memory_id] = seq
+
+    def remove(self, memory_id: str) -> bool:
+        """Remove a memory; its entry is dropped lazily."""
+        if self._live.pop(memory_id, None) is None:
+            return False
+        self._maybe_compact()
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries = []
+        self._start = 0
+        self._live.clear()
+
+    def _maybe_compact(self) -> None:
+        """Drop dead entries once they outnumber live ones."""
+        stored = len(self._entries) - self._start
+        if stored - len(self._live) > max(1024, len(self._live)):
+            self._entries = [e for e in self._entries[self._start :] if self._is_live(e)]
+            self._start = 0
+
+    def expire(self, cutoff: datetime) -> List[str]:
+        """
+        Remove and return memories with timestamps strictly before cutoff.
+
+        Cost is proportional to the number of expired entries.
+        """
+        expired = []
+        entries = self._entries
+        while self._start < len(entries) and entries[self._start][0] < cutoff:
+            entry = entries[self._start]
+            if self._is_live(entry):
+                expired.append(entry[2])
+                del self._live[entry[2]]
+            self._start += 1
+
+        if self._start > len(entries) // 2:
+            del entries[: self._start]
+            self._start = 0
+        return expired
+
+    def latest(self) -> Iterator[str]:
+        """Iterate memory IDs from newest to oldest."""
+        for i in range(len(self._entries) - 1, self._start - 1, -1):
+            entry = self._entries[i]
+            if self._is_live(entry):
+                yield entry[2]
+
+    def between(self, start: datetime, end: datetime) -> Iterator[str]:
+        """Iterate memory IDs with start <= timestamp <= end, oldest first."""
+        lo = bisect.bisect_left(self._entries, (start,), lo=self._start)
+        hi = bisect.bisect_right(self._entries, (end, math.inf), lo=lo)
+        for entry in self._entries[lo:hi]:
+            if self._is_live(entry):
+                yield entry[2]
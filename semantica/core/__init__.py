@@ -12,6 +12,7 @@ Key Features:
     - Configuration loading, validation, and management
     - Plugin discovery, loading, and lifecycle management
     - System health monitoring and status tracking
+    - Persistent job queue for background workers
     - Method registry for extensible orchestration methods
 
 Algorithms Used:
@@ -28,6 +29,7 @@ Main Components:
     - LifecycleManager: System lifecycle management with hooks and health monitoring
     - PluginRegistry: Dynamic plugin discovery, loading, and management
     - MethodRegistry: Registry for custom orchestration methods
+    - JobQueue / SQLiteJobQueue: Leased job queue for semantica-worker
     - Orchestration Methods: Reusable functions for common orchestration tasks
 
 Example Usage:
@@ -49,6 +51,14 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from .config_manager import Config, ConfigManager
+from .job_queue import (
+    Job,
+    JobQueue,
+    JobStatus,
+    SQLiteJobQueue,
+    create_job_queue,
+    register_job_queue_backend,
+)
 from .lifecycle import HealthStatus, LifecycleManager, SystemState
 from .methods import (
     build_knowledge_base,
@@ -79,6 +89,13 @@ __all__ = [
     # Registry
     "MethodRegistry",
     "method_registry",
+    # Jobs
+    "Job",
+    "JobQueue",
+    "JobStatus",
+    "SQLiteJobQueue",
+    "create_job_queue",
+    "register_job_queue_backend",
     # Methods
     "build_knowledge_base",
     "run_pipeline",
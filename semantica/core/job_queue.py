@@ -0,0 +1,582 @@
+"""
+Job Queue Module
+
+This module provides the persistent job queue behind the Semantica worker and
+the REST API's job endpoints, so knowledge base builds and pipeline runs can
+be processed by many worker processes on one or more hosts.
+
+Algorithms Used:
+    - Leased Claims: A claimed job is invisible to other workers until its
+      visibility timeout expires; running workers extend the lease, and a
+      crashed worker's job is claimed again once the lease lapses
+    - Atomic Claiming: Claim-and-lease in one SQLite write transaction
+      (BEGIN IMMEDIATE), so concurrent workers never claim the same job
+    - Retry Backoff: Failed jobs are re-queued after retry_delay * 2^(attempt-1)
+      seconds until max_attempts is reached
+    - Concurrency Caps: Optional limit on running jobs per kind across all
+      workers sharing the queue
+
+Key Features:
+    - Pluggable backends behind the JobQueue interface
+    - SQLite backend (default) in a local directory, WAL mode
+    - Job status, results and errors persisted for the API
+    - Cancellation of queued jobs
+    - Picklable queue handles
+
+Main Classes:
+    - JobStatus: Job status enumeration
+    - Job: Job record dataclass
+    - JobQueue: Abstract queue interface
+    - SQLiteJobQueue: SQLite queue backend
+
+Main Functions:
+    - create_job_queue: Create a queue for a backend name
+    - register_job_queue_backend: Register a custom queue backend
+
+Example Usage:
+    >>> from semantica.core.job_queue import create_job_queue
+    >>> queue = create_job_queue("sqlite", path=".semantica/jobs.db")
+    >>> job_id = queue.enqueue("build_knowledge_base", {"sources": ["doc.pdf"]})
+    >>> job = queue.claim("worker-1", visibility_timeout=300)
+    >>> queue.complete(job.id, "worker-1", {"statistics": {}})
+    >>> queue.get(job_id).status
+    <JobStatus.SUCCEEDED: 'succeeded'>
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, Union
+
+from ..utils.exceptions import ValidationError
+from ..utils.logging import get_logger
+
+
+class JobStatus(Enum):
+    """Job status enumeration."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class Job:
+    """Job record."""
+
+    id: str
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    result: Any = None
+    error: Optional[str] = None
+    worker_id: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    available_at: float = 0.0
+    lease_expires_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready representation."""
+        data = asdict(self)
+        data["status"] = self.status.value
+        return data
+
+
+class JobQueue(ABC):
+    """
+    Abstract job queue.
+
+    • Workers claim jobs with a lease (visibility timeout) and extend it
+      while they run
+    • complete/fail/extend only succeed for the worker holding the lease
+    """
+
+    @abstractmethod
+    def enqueue(
+        self,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        max_attempts: int = 3,
+        delay: float = 0.0,
+    ) -> str:
+        """Add a job and return its ID."""
+
+    @abstractmethod
+    def claim(
+        self,
+        worker_id: str,
+        visibility_timeout: float = 300.0,
+        kinds: Optional[List[str]] = None,
+    ) -> Optional[Job]:
+        """Lease the next available job, or return None."""
+
+    @abstractmethod
+    def extend(self, job_id: str, worker_id: str, visibility_timeout: float) -> bool:
+        """Extend the lease of a running job."""
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        """Record a job's result."""
+
+    @abstractmethod
+    def fail(
+        self, job_id: str, worker_id: str, error: str, retry: bool = True
+    ) -> bool:
+        """Record a failed attempt; re-queue the job if attempts remain."""
+
+    @abstractmethod
+    def release(self, job_id: str, worker_id: str) -> bool:
+        """Return a running job to the queue without counting the attempt."""
+
+    @abstractmethod
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """Fetch a job by ID."""
+
+    @abstractmethod
+    def list_jobs(
+        self, status: Optional[JobStatus] = None, limit: int = 100
+    ) -> List[Job]:
+        """List jobs, newest first."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    result TEXT,
+    error TEXT,
+    worker_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, available_at);
+"""
+
+_COLUMNS = (
+    "id, kind, payload, status, attempts, max_attempts, result, error, "
+    "worker_id, created_at, updated_at, available_at, lease_expires_at"
+)
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    SQLite job queue.
+
+    • One database file shared by all workers on a host (or a shared disk)
+    • Claims are atomic write transactions; readers never block them (WAL)
+    • Payloads and results are stored as JSON (non-JSON values as strings)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ".semantica/jobs.db",
+        retry_delay: float = 5.0,
+        max_running: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize SQLite job queue.
+
+        Args:
+            path: Database file (parent directory created if missing)
+            retry_delay: Base delay in seconds before a failed job is retried
+            max_running: Optional cap on running jobs per kind, across all
+                workers using this database
+        """
+        self.logger = get_logger("job_queue")
+        self.path = Path(path)
+        self.retry_delay = retry_delay
+        self.max_running = dict(max_running or {})
+        self.lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes reopen the database themselves
+        return {
+            "path": self.path,
+            "retry_delay": self.retry_delay,
+            "max_running": self.max_running,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection, opened on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=30.0,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _write(self, sql: str, params: tuple) -> int:
+        with self.lock:
+            return self.conn.execute(sql, params).rowcount
+
+    def _row_to_job(self, row: tuple) -> Job:
+        return Job(
+            id=row[0],
+            kind=row[1],
+            payload=json.loads(row[2]),
+            status=JobStatus(row[3]),
+            attempts=row[4],
+            max_attempts=row[5],
+            result=json.loads(row[6]) if row[6] is not None else None,
+            error=row[7],
+            worker_id=row[8],
+            created_at=row[9],
+            updated_at=row[10],
+            available_at=row[11],
+            lease_expires_at=row[12],
+        )
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        max_attempts: int = 3,
+        delay: float = 0.0,
+    ) -> str:
+        """
+        Add a job.
+
+        Args:
+            kind: Job kind, e.g. "build_knowledge_base" or "pipeline"
+            payload: JSON-serializable job arguments
+            max_attempts: Attempts before the job is marked failed
+            delay: Seconds before the job becomes available
+
+        Returns:
+            Job ID
+        """
+        if max_attempts < 1:
+            raise ValidationError("max_attempts must be at least 1")
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._write(
+            f"INSERT INTO jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, 0, ?, NULL, NULL, NULL, ?, ?, ?, NULL)",
+            (
+                job_id,
+                kind,
+                json.dumps(payload or {}, default=str),
+                JobStatus.QUEUED.value,
+                max_attempts,
+                now,
+                now,
+                now + delay,
+            ),
+        )
+        return job_id
+
+    def claim(
+        self,
+        worker_id: str,
+        visibility_timeout: float = 300.0,
+        kinds: Optional[List[str]] = None,
+    ) -> Optional[Job]:
+        """
+        Lease the next available job.
+
+        Queued jobs whose delay has passed and running jobs whose lease has
+        expired are eligible, oldest first. Each claim counts as an attempt;
+        an expired job with no attempts left is marked failed instead.
+
+        Args:
+            worker_id: ID of the claiming worker
+            visibility_timeout: Lease length in seconds
+            kinds: Only claim these job kinds
+
+        Returns:
+            The claimed job, or None if nothing is available
+        """
+        with self.lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                # Jobs whose worker vanished after its last attempt
+                conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, worker_id = NULL, "
+                    "lease_expires_at = NULL, updated_at = ? "
+                    "WHERE status = ? AND lease_expires_at < ? AND attempts >= max_attempts",
+                    (
+                        JobStatus.FAILED.value,
+                        "Visibility timeout expired",
+                        now,
+                        JobStatus.RUNNING.value,
+                        now,
+                    ),
+                )
+                sql = (
+                    f"SELECT {_COLUMNS} FROM jobs WHERE "
+                    "((status = ? AND available_at <= ?) OR (status = ? AND lease_expires_at < ?))"
+                )
+                params: List[Any] = [
+                    JobStatus.QUEUED.value,
+                    now,
+                    JobStatus.RUNNING.value,
+                    now,
+                ]
+                if kinds:
+                    sql += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+                    params.extend(kinds)
+                saturated = [
+                    kind
+                    for kind, limit in self.max_running.items()
+                    if conn.execute(
+                        "SELECT COUNT(*) FROM jobs WHERE kind = ? AND status = ? "
+                        "AND lease_expires_at >= ?",
+                        (kind, JobStatus.RUNNING.value, now),
+                    ).fetchone()[0]
+                    >= limit
+                ]
+                if saturated:
+                    sql += f" AND kind NOT IN ({', '.join('?' for _ in saturated)})"
+                    params.extend(saturated)
+                row = conn.execute(
+                    sql + " ORDER BY available_at, created_at LIMIT 1", params
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, worker_id = ?, "
+                    "lease_expires_at = ?, updated_at = ? WHERE id = ?",
+                    (
+                        JobStatus.RUNNING.value,
+                        worker_id,
+                        now + visibility_timeout,
+                        now,
+                        row[0],
+                    ),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        job = self._row_to_job(row)
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.worker_id = worker_id
+        job.lease_expires_at = now + visibility_timeout
+        return job
+
+    def extend(self, job_id: str, worker_id: str, visibility_timeout: float) -> bool:
+        """Extend the lease of a running job held by ``worker_id``."""
+        now = time.time()
+        return bool(
+            self._write(
+                "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (
+                    now + visibility_timeout,
+                    now,
+                    job_id,
+                    worker_id,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+        )
+
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        """
+        Record a job's result.
+
+        Returns:
+            False if the worker no longer holds the job's lease
+        """
+        return bool(
+            self._write(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (
+                    JobStatus.SUCCEEDED.value,
+                    json.dumps(result, default=str),
+                    time.time(),
+                    job_id,
+                    worker_id,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+        )
+
+    def fail(
+        self, job_id: str, worker_id: str, error: str, retry: bool = True
+    ) -> bool:
+        """
+        Record a failed attempt.
+
+        The job is re-queued with exponential backoff while attempts remain
+        and ``retry`` is True, otherwise marked failed.
+
+        Returns:
+            False if the worker no longer holds the job's lease
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT attempts, max_attempts FROM jobs "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (job_id, worker_id, JobStatus.RUNNING.value),
+            ).fetchone()
+            if row is None:
+                return False
+            attempts, max_attempts = row
+            now = time.time()
+            if retry and attempts < max_attempts:
+                status = JobStatus.QUEUED
+                available_at = now + self.retry_delay * 2 ** (attempts - 1)
+            else:
+                status = JobStatus.FAILED
+                available_at = now
+            return bool(
+                self.conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, worker_id = NULL, "
+                    "lease_expires_at = NULL, available_at = ?, updated_at = ? "
+                    "WHERE id = ? AND worker_id = ? AND status = ?",
+                    (
+                        status.value,
+                        error,
+                        available_at,
+                        now,
+                        job_id,
+                        worker_id,
+                        JobStatus.RUNNING.value,
+                    ),
+                ).rowcount
+            )
+
+    def release(self, job_id: str, worker_id: str) -> bool:
+        """Return a running job to the queue without counting the attempt."""
+        now = time.time()
+        return bool(
+            self._write(
+                "UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), "
+                "worker_id = NULL, lease_expires_at = NULL, available_at = ?, "
+                "updated_at = ? WHERE id = ? AND worker_id = ? AND status = ?",
+                (
+                    JobStatus.QUEUED.value,
+                    now,
+                    now,
+                    job_id,
+                    worker_id,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+        )
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued job.
+
+        Returns:
+            False if the job is not queued (running or finished)
+        """
+        return bool(
+            self._write(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (
+                    JobStatus.CANCELLED.value,
+                    time.time(),
+                    job_id,
+                    JobStatus.QUEUED.value,
+                ),
+            )
+        )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Fetch a job by ID."""
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row is not None else None
+
+    def list_jobs(
+        self, status: Optional[JobStatus] = None, limit: int = 100
+    ) -> List[Job]:
+        """List jobs, newest first, optionally filtered by status."""
+        sql = f"SELECT {_COLUMNS} FROM jobs"
+        params: List[Any] = []
+        if status is not None:
+            sql += " WHERE status = ?"
+            params.append(status.value)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_QUEUE_BACKENDS: Dict[str, Type[JobQueue]] = {"sqlite": SQLiteJobQueue}
+
+
+def register_job_queue_backend(name: str, queue_class: Type[JobQueue]) -> None:
+    """
+    Register a custom queue backend.
+
+    Args:
+        name: Backend name used with create_job_queue
+        queue_class: JobQueue subclass
+    """
+    if not (isinstance(queue_class, type) and issubclass(queue_class, JobQueue)):
+        raise ValidationError(f"Queue backend {name} must subclass JobQueue")
+    _QUEUE_BACKENDS[name] = queue_class
+
+
+def create_job_queue(backend: str = "sqlite", **options) -> JobQueue:
+    """
+    Create a job queue.
+
+    Args:
+        backend: Backend name ("sqlite" or a registered backend)
+        **options: Backend constructor options (e.g. ``path`` for SQLite)
+
+    Returns:
+        JobQueue instance
+    """
+    if backend not in _QUEUE_BACKENDS:
+        raise ValidationError(
+            f"Unknown job queue backend: {backend}. "
+            f"Available: {', '.join(sorted(_QUEUE_BACKENDS))}"
+        )
+    return _QUEUE_BACKENDS[backend](**options)
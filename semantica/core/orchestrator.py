@@ -24,8 +24,17 @@ Author: Semantica Contributors
 License: MIT
 """
 
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from ..utils.exceptions import ConfigurationError, ProcessingError
 from ..utils.logging import get_logger, log_execution_time
@@ -96,9 +105,6 @@ class Semantica:
 
         # Initialize progress tracker (automatic, zero configuration)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.info("Semantica framework initialized")
 
@@ -283,6 +289,22 @@ class Semantica:
                 - embeddings: Whether to generate embeddings
                 - graph: Whether to build knowledge graph
                 - normalize: Whether to normalize data
+                - fail_fast: Raise on the first source that fails
+                - max_workers: Sources processed concurrently (default 1,
+                  sequential)
+                - executor: "thread" (default) or "process"; process workers
+                  need a picklable pipeline
+                - source_timeout: Seconds a source may run before it is
+                  recorded as failed (its worker is not interrupted)
+                - max_pending: Sources submitted but not yet collected
+                  (default 2 * max_workers), which keeps memory flat
+                - keep_results: Return per-source results (default True);
+                  set False for large corpora
+                - checkpoint_dir: Directory for a CheckpointStore; re-runs
+                  skip sources whose content and configuration are unchanged
+                  and resume failed pipeline runs at the first unfinished step
+                - checkpoint_store: CheckpointStore to use instead of
+                  checkpoint_dir
 
         Returns:
             Dictionary containing:
@@ -339,76 +361,105 @@ class Semantica:
                         module_order=module_order
                     )
 
-            # Process sources
-            results = []
-            total_sources = len(validated_sources)
-            update_interval = max(1, total_sources // 20)  # Update every 5%
-            
-            for idx, source in enumerate(validated_sources, 1):
-                try:
-                    # Track file processing
-                    file_str = str(source)
-                    file_tracking_id = self.progress_tracker.start_tracking(
-                        file=file_str,
-                        module="core",
-                        submodule="build_knowledge_base",
-                        message=f"Processing {Path(file_str).name if file_str else 'source'}",
-                        pipeline_id=pipeline_id,
-                    )
-                    try:
-                        result = self.run_pipeline(pipeline, source)
-                        results.append(result)
-                        self.progress_tracker.stop_tracking(
-                            file_tracking_id, status="completed"
-                        )
-                    except Exception as e:
-                        self.progress_tracker.stop_tracking(
-                            file_tracking_id, status="failed", message=str(e)
-                        )
-                        self.logger.error(f"Failed to process source {source}: {e}")
-                        if kwargs.get("fail_fast", False):
-                            raise ProcessingError(
-                                f"Failed to process source {source}: {e}"
-                            )
-                    
-                    # Update overall progress
-                    if idx % update_interval == 0 or idx == total_sources:
-                        self.progress_tracker.update_progress(
-                            overall_tracking_id,
-                            processed=idx,
-                            total=total_sources,
-                            message=f"Processing sources... {idx}/{total_sources}"
-                        )
-                except Exception as e:
-                    self.logger.error(f"Failed to process source {source}: {e}")
+            # Process sources, accumulating graph fragments and embeddings as
+            # each one finishes
+            build_graph = kwargs.get("graph", True)
+            build_embeddings = kwargs.get("embeddings", True)
+            keep_results = kwargs.get("keep_results", True)
+            checkpoint_store = kwargs.get("checkpoint_store")
+            if checkpoint_store is None and kwargs.get("checkpoint_dir"):
+                from ..pipeline.checkpoint_store import CheckpointStore
+
+                checkpoint_store = CheckpointStore(kwargs["checkpoint_dir"])
+            checkpoint = None
+            if checkpoint_store is not None:
+                from ..pipeline.checkpoint_store import hash_config
+
+                # Everything that shapes a per-source result is part of the
+                # key; logging and security settings are not
+                framework_config = {
+                    section: value
+                    for section, value in self.config.to_dict().items()
+                    if section not in ("logging", "security")
+                }
+                checkpoint = (
+                    checkpoint_store,
+                    hash_config(
+                        {
+                            "pipeline": pipeline_config,
+                            "embeddings": build_embeddings,
+                            "config": framework_config,
+                        }
+                    ),
+                )
+            results: Dict[int, Dict[str, Any]] = {}
+            graph_sources: Dict[int, Dict[str, Any]] = {}
+            embedded: Dict[int, Any] = {}
+            embedding_failures = 0
+            processed = succeeded = skipped = 0
+
+            for idx, source, outcome, error in self._iter_source_results(
+                pipeline,
+                validated_sources,
+                pipeline_id,
+                overall_tracking_id,
+                {**kwargs, "checkpoint": checkpoint},
+            ):
+                if error is not None:
+                    self.logger.error(f"Failed to process source {source}: {error}")
                     if kwargs.get("fail_fast", False):
-                        raise ProcessingError(f"Failed to process source {source}: {e}")
+                        raise ProcessingError(
+                            f"Failed to process source {source}: {error}"
+                        )
+                    continue
+
+                result = outcome["result"]
+                processed += 1
+                succeeded += bool(result.get("success"))
+                skipped += bool(outcome.get("cached"))
+                if keep_results:
+                    results[idx] = result
+                if build_graph:
+                    graph_source = self._result_graph_source(result)
+                    if graph_source:
+                        graph_sources[idx] = graph_source
+                if outcome.get("embedding") is not None:
+                    embedded[idx] = outcome["embedding"]
+                elif outcome.get("embedding_error"):
+                    embedding_failures += 1
+
+            results_list = [results[idx] for idx in sorted(results)]
 
             # Build knowledge graph if requested
             knowledge_graph = None
-            if kwargs.get("graph", True):
-                knowledge_graph = self._build_knowledge_graph(results)
+            if build_graph:
+                knowledge_graph = self._build_knowledge_graph(
+                    results_list,
+                    graph_sources=[graph_sources[idx] for idx in sorted(graph_sources)],
+                )
 
-            # Generate embeddings if requested
+            # Collect embeddings if requested
             embeddings = None
-            if kwargs.get("embeddings", True):
-                embeddings = self._generate_embeddings(results)
+            if build_embeddings:
+                embeddings = self._collect_embeddings(
+                    [embedded[idx] for idx in sorted(embedded)],
+                    embedding_failures,
+                    results_list,
+                )
 
             # Compile statistics
             statistics = {
-                "sources_processed": len(results),
+                "sources_processed": processed,
                 "sources_total": len(sources),
-                "success_rate": len([r for r in results if r.get("success")])
-                / len(results)
-                if results
-                else 0.0,
+                "sources_skipped": skipped,
+                "success_rate": succeeded / processed if processed else 0.0,
             }
 
             # Stop overall tracking
             self.progress_tracker.stop_tracking(
                 overall_tracking_id,
                 status="completed",
-                message=f"Processed {len(results)} sources",
+                message=f"Processed {processed} sources",
             )
 
             # Clear pipeline context when complete
@@ -420,7 +471,7 @@ class Semantica:
             return {
                 "knowledge_graph": knowledge_graph,
                 "embeddings": embeddings,
-                "results": results,
+                "results": results_list,
                 "statistics": statistics,
                 "metadata": {
                     "sources": validated_sources,
@@ -440,7 +491,10 @@ class Semantica:
 
     @log_execution_time
     def run_pipeline(
-        self, pipeline: Union[Dict[str, Any], Any], data: Any
+        self,
+        pipeline: Union[Dict[str, Any], Any],
+        data: Any,
+        checkpoint_store: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """
         Execute a processing pipeline.
@@ -448,6 +502,8 @@ class Semantica:
         Args:
             pipeline: Pipeline object or configuration dictionary
             data: Input data for pipeline
+            checkpoint_store: Optional CheckpointStore; Pipeline objects then
+                resume a failed run at the first unfinished step
 
         Returns:
             Dictionary containing:
@@ -479,7 +535,9 @@ class Semantica:
                 from ..pipeline import ExecutionEngine, Pipeline
 
                 if isinstance(pipeline, Pipeline):
-                    execution_engine = ExecutionEngine()
+                    execution_engine = ExecutionEngine(
+                        checkpoint_store=checkpoint_store
+                    )
             except (ImportError, OSError):
                 execution_engine = None
 
@@ -786,7 +844,11 @@ class Semantica:
         """
         return self._create_pipeline(pipeline_dict)
 
-    def _build_knowledge_graph(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _build_knowledge_graph(
+        self,
+        results: List[Dict[str, Any]],
+        graph_sources: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """
         Build knowledge graph from processing results.
 
@@ -795,22 +857,20 @@ class Semantica:
 
         Args:
             results: List of processing results containing entities and relationships
+            graph_sources: Entity/relationship fragments already extracted
+                from the results as they finished (optional)
 
         Returns:
             Dictionary containing knowledge graph structure
         """
         try:
             # Extract entities and relationships from results
-            graph_sources = []
-            for result in results:
-                if isinstance(result, dict):
-                    source_data = {}
-                    if "entities" in result:
-                        source_data["entities"] = result["entities"]
-                    if "relationships" in result:
-                        source_data["relationships"] = result["relationships"]
-                    if source_data:
-                        graph_sources.append(source_data)
+            if graph_sources is None:
+                graph_sources = [
+                    source_data
+                    for source_data in map(self._result_graph_source, results)
+                    if source_data
+                ]
 
             if not graph_sources:
                 self.logger.warning("No entities or relationships found in results")
@@ -838,74 +898,261 @@ class Semantica:
             self.logger.warning("KG module not available, returning placeholder")
             return {"status": "placeholder", "results": results}
 
-    def _generate_embeddings(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _result_graph_source(self, result: Any) -> Optional[Dict[str, Any]]:
+        """Entities and relationships of one processing result, if any."""
+        if not isinstance(result, dict):
+            return None
+        source_data = {}
+        if "entities" in result:
+            source_data["entities"] = result["entities"]
+        if "relationships" in result:
+            source_data["relationships"] = result["relationships"]
+        return source_data or None
+
+    def _result_text(self, result: Any) -> Optional[str]:
+        """Text content of one processing result, if any."""
+        if not isinstance(result, dict):
+            return None
+        # Try to find text content in various possible keys
+        return (
+            result.get("text")
+            or result.get("content")
+            or result.get("output", {}).get("text")
+            if isinstance(result.get("output"), dict)
+            else None
+        )
+
+    def _process_source(
+        self,
+        pipeline: Any,
+        source: Union[str, Path],
+        embed: bool = True,
+        checkpoint: Optional[Tuple[Any, str]] = None,
+    ) -> Dict[str, Any]:
         """
-        Generate embeddings from processing results.
+        Run the pipeline on one source and embed its text.
 
-        This method extracts text content from processing results and generates
-        embeddings using the embeddings module.
+        Runs inside the source workers of build_knowledge_base, so embedding
+        and content hashing happen concurrently with other sources rather
+        than in a final pass.
 
         Args:
-            results: List of processing results containing text content
+            pipeline: Pipeline to run
+            source: Source path or URL
+            embed: Whether to generate the source's embedding
+            checkpoint: Optional ``(CheckpointStore, config_hash)``; a source
+                whose content is unchanged returns its stored outcome
 
         Returns:
-            Dictionary containing generated embeddings
+            Dictionary with the pipeline ``result`` and, when embedding, the
+            ``embedding`` or the ``embedding_error``; ``cached`` is True for
+            outcomes restored from the checkpoint store
         """
-        try:
-            # Extract text content from results
-            texts_to_embed = []
-            for result in results:
-                if isinstance(result, dict):
-                    # Try to find text content in various possible keys
-                    text = (
-                        result.get("text")
-                        or result.get("content")
-                        or result.get("output", {}).get("text")
-                        if isinstance(result.get("output"), dict)
-                        else None
+        store = content_hash = None
+        if checkpoint is not None:
+            from ..pipeline.checkpoint_store import hash_content
+
+            store, config_hash = checkpoint
+            content_hash = hash_content(source)
+            cached = store.get_source(source, config_hash, content_hash)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        result = self.run_pipeline(pipeline, source, checkpoint_store=store)
+        outcome: Dict[str, Any] = {"result": result}
+        if embed:
+            text = self._result_text(result)
+            if text:
+                try:
+                    outcome["embedding"] = self.embedding_generator.generate_embeddings(
+                        text
                     )
-                    if text:
-                        texts_to_embed.append(text)
-
-            if not texts_to_embed:
-                self.logger.warning("No text content found in results for embedding")
-                return {"embeddings": [], "metadata": {}}
-
-            # Track embedding generation
-            embed_tracking_id = self.progress_tracker.start_tracking(
-                module="embeddings",
-                submodule="EmbeddingGenerator",
-                message=f"Generating embeddings for {len(texts_to_embed)} texts",
+                except Exception as e:
+                    outcome["embedding_error"] = str(e)
+        if store is not None and result.get("success") and "embedding_error" not in outcome:
+            store.put_source(source, config_hash, content_hash, outcome)
+        return outcome
+
+    def _iter_source_results(
+        self,
+        pipeline: Any,
+        sources: List[Union[str, Path]],
+        pipeline_id: str,
+        overall_tracking_id: str,
+        options: Dict[str, Any],
+    ) -> Iterator[Tuple[int, Union[str, Path], Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Process sources, yielding ``(index, source, outcome, error)`` as each finishes.
+
+        Sources run one at a time by default. With ``max_workers`` > 1 (or a
+        ``source_timeout``) in ``options`` (the build_knowledge_base options)
+        they run on a thread or process pool with at most ``max_pending``
+        sources submitted ahead of the consumer. Per-source and overall
+        progress are tracked here.
+        """
+        max_workers = max(1, int(options.get("max_workers") or 1))
+        source_timeout = options.get("source_timeout")
+        embed = options.get("embeddings", True)
+        checkpoint = options.get("checkpoint")
+        total_sources = len(sources)
+        update_interval = max(1, total_sources // 20)  # Update every 5%
+        completed = 0
+
+        def start(source: Union[str, Path]) -> str:
+            file_str = str(source)
+            return self.progress_tracker.start_tracking(
+                file=file_str,
+                module="core",
+                submodule="build_knowledge_base",
+                message=f"Processing {Path(file_str).name if file_str else 'source'}",
+                pipeline_id=pipeline_id,
             )
 
-            try:
-                # Generate embeddings using the lazy property
-                embeddings_result = self.embedding_generator.process_batch(texts_to_embed)
+        def finish(tracking_id: str, error: Optional[Exception]) -> None:
+            nonlocal completed
+            completed += 1
+            if error is None:
+                self.progress_tracker.stop_tracking(tracking_id, status="completed")
+            else:
                 self.progress_tracker.stop_tracking(
-                    embed_tracking_id,
-                    status="completed",
-                    message=f"Generated {embeddings_result.get('success_count', 0)} embeddings",
+                    tracking_id, status="failed", message=str(error)
+                )
+            if completed % update_interval == 0 or completed == total_sources:
+                self.progress_tracker.update_progress(
+                    overall_tracking_id,
+                    processed=completed,
+                    total=total_sources,
+                    message=f"Processing sources... {completed}/{total_sources}",
                 )
 
-                return {
-                    "embeddings": embeddings_result["embeddings"],
-                    "metadata": {
-                        "total_texts": len(texts_to_embed),
-                        "successful": embeddings_result["success_count"],
-                        "failed": embeddings_result["failure_count"],
-                    },
-                }
-            except Exception as e:
-                self.progress_tracker.stop_tracking(
-                    embed_tracking_id, status="failed", message=str(e)
+        if max_workers == 1 and source_timeout is None:
+            for idx, source in enumerate(sources):
+                tracking_id = start(source)
+                try:
+                    outcome = self._process_source(pipeline, source, embed, checkpoint)
+                except Exception as e:
+                    finish(tracking_id, e)
+                    yield idx, source, None, e
+                    continue
+                finish(tracking_id, None)
+                yield idx, source, outcome, None
+            return
+
+        if options.get("executor", "thread") == "process":
+            pool: Executor = ProcessPoolExecutor(max_workers=max_workers)
+            config = self.config.to_dict()
+
+            def submit(source):
+                return pool.submit(
+                    _process_source_in_worker, config, pipeline, source, embed, checkpoint
                 )
-                raise
 
-        except (ImportError, OSError, ProcessingError):
-            self.logger.warning(
-                "Embeddings module not available, returning placeholder"
+        else:
+            pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="semantica-kb"
             )
-            return {"status": "placeholder", "results": results}
+
+            def submit(source):
+                return pool.submit(
+                    self._process_source, pipeline, source, embed, checkpoint
+                )
+
+        max_pending = max(max_workers, options.get("max_pending") or 2 * max_workers)
+        pending: Dict[Future, Tuple[int, Union[str, Path], str]] = {}
+        started: Dict[Future, float] = {}
+        abandoned = False
+        next_idx = 0
+        try:
+            while next_idx < total_sources or pending:
+                # Keep the bounded queue full
+                while next_idx < total_sources and len(pending) < max_pending:
+                    source = sources[next_idx]
+                    pending[submit(source)] = (next_idx, source, start(source))
+                    next_idx += 1
+
+                wait_timeout = None
+                if source_timeout is not None:
+                    # Timeouts count from when a source starts running
+                    now = time.monotonic()
+                    for future in pending:
+                        if future not in started and (future.running() or future.done()):
+                            started[future] = now
+                    wait_timeout = min(
+                        [0.1]
+                        + [
+                            max(0.0, started[future] + source_timeout - now)
+                            for future in started
+                        ]
+                    )
+
+                done, _ = wait(
+                    list(pending), timeout=wait_timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    idx, source, tracking_id = pending.pop(future)
+                    started.pop(future, None)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        finish(tracking_id, e)
+                        yield idx, source, None, e
+                        continue
+                    finish(tracking_id, None)
+                    yield idx, source, outcome, None
+
+                if source_timeout is not None:
+                    now = time.monotonic()
+                    expired = [
+                        future
+                        for future, began in started.items()
+                        if now - began >= source_timeout and not future.done()
+                    ]
+                    for future in expired:
+                        idx, source, tracking_id = pending.pop(future)
+                        del started[future]
+                        # A running worker cannot be interrupted; its result is dropped
+                        future.cancel()
+                        abandoned = True
+                        error = TimeoutError(
+                            f"Source exceeded timeout of {source_timeout}s"
+                        )
+                        finish(tracking_id, error)
+                        yield idx, source, None, error
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=not (abandoned or pending))
+
+    def _collect_embeddings(
+        self,
+        embeddings: List[Any],
+        failures: int,
+        results: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Assemble the embeddings generated per source.
+
+        Args:
+            embeddings: Embeddings of the successfully embedded sources, in
+                source order
+            failures: Number of sources whose embedding failed
+            results: Processing results
+
+        Returns:
+            Dictionary containing the embeddings and their metadata
+        """
+        if not embeddings and not failures:
+            self.logger.warning("No text content found in results for embedding")
+            return {"embeddings": [], "metadata": {}}
+
+        return {
+            "embeddings": embeddings,
+            "metadata": {
+                "total_texts": len(embeddings) + failures,
+                "successful": len(embeddings),
+                "failed": failures,
+            },
+        }
 
     def _allocate_resources(self, pipeline: Any) -> Dict[str, Any]:
         """
@@ -1012,3 +1259,20 @@ class Semantica:
             self.logger.debug(f"Error collecting system metrics: {e}")
 
         return metrics
+
+
+_worker_framework: Optional[Semantica] = None
+
+
+def _process_source_in_worker(
+    config: Dict[str, Any],
+    pipeline: Any,
+    source: Union[str, Path],
+    embed: bool,
+    checkpoint: Optional[Tuple[Any, str]] = None,
+) -> Dict[str, Any]:
+    """Process one source in a worker process, reusing a per-process framework."""
+    global _worker_framework
+    if _worker_framework is None:
+        _worker_framework = Semantica(config=config)
+    return _worker_framework._process_source(pipeline, source, embed, checkpoint)
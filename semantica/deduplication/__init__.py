@@ -32,7 +32,18 @@ Duplicate Detection:
     - Batch Processing: Vectorized similarity calculations for efficiency
     - Union-Find Algorithm: Disjoint set union for duplicate group formation
     - Confidence Scoring: Multi-factor confidence calculation (similarity + name match + property matches)
-    - Incremental Processing: O(n×m) efficient new vs existing entity comparison
+    - Incremental Processing: New entities compared only against their blocked candidates
+
+Blocking (Candidate Generation):
+    - MinHash-LSH: Character n-gram MinHash signatures with banded buckets and acronym keys
+    - Sorted Neighbourhood: Multi-pass sorted keys with a sliding window
+    - Embedding ANN: Cosine top-k over entity embeddings (IVF above a size threshold)
+    - Persistent Index: Incrementally updatable CandidateIndex with pickle-free save/load
+
+Batch Similarity:
+    - Vectorized String Kernels: Levenshtein, Jaro-Winkler and bigram Jaccard over arrays of pairs
+    - Upper-Bound Filtering: Length/prefix bounds skip pairs that cannot reach the threshold
+    - Feature Caches: Per-entity names, properties, relationship sets and embeddings computed once
 
 Clustering:
     - Union-Find (Disjoint Set Union): Connected component detection for graph-based clustering
@@ -53,6 +64,10 @@ Main Components:
     - SimilarityCalculator: Calculates multi-factor similarity between entities
     - MergeStrategyManager: Manages merge strategies and conflict resolution
     - ClusterBuilder: Builds clusters for batch deduplication
+    - CandidateIndex: Persistent candidate-generation index combining blockers
+    - MinHashLSHBlocker, SortedNeighborhoodBlocker, EmbeddingBlocker, PrefixBlocker: Blockers
+    - BatchSimilarityEngine: Vectorized entity pair scoring used by batch similarity
+    - EntityFeatureCache: Precomputed per-entity similarity features
     - MethodRegistry: Registry for custom deduplication methods
     - Deduplication Methods: Reusable functions for common deduplication tasks
 
@@ -75,6 +90,14 @@ License: MIT
 
 from typing import Any, Dict, List, Optional, Union
 
+from .blocking import (
+    CandidateGenerator,
+    CandidateIndex,
+    EmbeddingBlocker,
+    MinHashLSHBlocker,
+    PrefixBlocker,
+    SortedNeighborhoodBlocker,
+)
 from .cluster_builder import Cluster, ClusterBuilder, ClusterResult
 from .config import DeduplicationConfig, dedup_config
 from .duplicate_detector import DuplicateCandidate, DuplicateDetector, DuplicateGroup
@@ -95,6 +118,12 @@ from .methods import (
 )
 from .registry import MethodRegistry, method_registry
 from .similarity_calculator import SimilarityCalculator, SimilarityResult
+from .similarity_engine import (
+    BatchSimilarityEngine,
+    EntityFeatureCache,
+    string_similarity_matrix,
+    string_similarity_one_to_many,
+)
 
 __all__ = [
     # Main classes
@@ -112,6 +141,18 @@ __all__ = [
     "ClusterBuilder",
     "Cluster",
     "ClusterResult",
+    # Blocking
+    "CandidateIndex",
+    "CandidateGenerator",
+    "MinHashLSHBlocker",
+    "SortedNeighborhoodBlocker",
+    "EmbeddingBlocker",
+    "PrefixBlocker",
+    # Batch similarity
+    "BatchSimilarityEngine",
+    "EntityFeatureCache",
+    "string_similarity_one_to_many",
+    "string_similarity_matrix",
     # Registry
     "MethodRegistry",
     "method_registry",
@@ -0,0 +1,1148 @@
+"""
+Blocking and Candidate Generation Module
+
+This module provides the candidate-generation layer for duplicate detection in
+the Semantica framework. Instead of comparing every pair of entities, blockers
+propose a small candidate set per entity, and only those pairs are scored by
+the SimilarityCalculator.
+
+Algorithms Used:
+
+MinHash-LSH Blocking:
+    - Character N-grams: Space-padded n-grams of the normalized entity name
+    - MinHash Signatures: Multiply-shift hash family over CRC32 n-gram hashes,
+      computed for many entities at once with ``np.minimum.reduceat``
+    - Locality-Sensitive Hashing: Signatures split into bands; entities sharing
+      any band bucket become candidates (S-curve threshold ~(1/bands)^(1/rows))
+    - Acronym Keys: Initials of multi-word names share a bucket with short
+      single-word names ("IBM" / "International Business Machines")
+
+Sorted-Neighbourhood Blocking:
+    - Multi-pass Sorting: Entities sorted by several keys (normalized name,
+      sorted tokens, reversed name)
+    - Sliding Window: Entities within ``window`` positions of each other in any
+      pass become candidates
+    - Lazy Merging: New entries are appended and merged on the next query
+
+Embedding-ANN Blocking:
+    - Cosine Top-k: Nearest neighbours over a VectorMatrix of entity embeddings
+    - IVF ANN: IVFIndex search once the matrix exceeds ``ann_threshold`` rows
+    - Similarity Floor: Neighbours below ``min_similarity`` are dropped
+
+Prefix Blocking:
+    - First-character blocks (the previous default), kept for compatibility
+
+Key Features:
+    - Pluggable blockers combined by union in a CandidateIndex
+    - Incremental add/remove; no rebuild when entities arrive or leave
+    - Persistent, pickle-free save/load (JSON manifest, JSONL records, .npy/.npz arrays)
+    - Candidate pairs for batch detection, candidate sets for incremental detection
+
+Main Classes:
+    - CandidateGenerator: Base class for blockers
+    - MinHashLSHBlocker: Character n-gram MinHash-LSH blocker
+    - SortedNeighborhoodBlocker: Multi-pass sorted-neighbourhood blocker
+    - EmbeddingBlocker: Embedding nearest-neighbour blocker
+    - PrefixBlocker: Name-prefix blocker
+    - CandidateIndex: Persistent entity index combining blockers
+
+Example Usage:
+    >>> from semantica.deduplication import CandidateIndex
+    >>> index = CandidateIndex(blockers=["minhash", "sorted_neighborhood"])
+    >>> index.add_many(existing_entities)
+    >>> keys = index.candidates({"name": "Apple Corp"})
+    >>> index.save("dedup_index")
+    >>> index = CandidateIndex.load("dedup_index")
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from ..utils.exceptions import ValidationError
+from ..utils.logging import get_logger
+from ..vector_store.ivf_index import IVFIndex
+from ..vector_store.vector_matrix import VectorMatrix
+
+INDEX_FORMAT = "semantica.candidate_index"
+INDEX_FORMAT_VERSION = 1
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Words ignored when building acronym keys
+_ACRONYM_STOPWORDS = frozenset(
+    {"the", "of", "and", "for", "a", "an", "inc", "corp", "co", "ltd", "llc", "plc", "corporation", "company"}
+)
+
+
+def normalize_name(name: Any) -> str:
+    """Lowercase a name and collapse punctuation/whitespace to single spaces."""
+    if not name:
+        return ""
+    return _NON_ALNUM.sub(" ", str(name).lower()).strip()
+
+
+def entity_name(entity: Any) -> str:
+    """Name of a dict or Entity object ("name", falling back to "text")."""
+    if isinstance(entity, dict):
+        name = entity.get("name") or entity.get("text")
+    else:
+        name = getattr(entity, "name", None) or getattr(entity, "text", None)
+    return str(name) if name else ""
+
+
+def entity_embedding(entity: Any) -> Optional[np.ndarray]:
+    """Embedding of a dict or Entity object as a 1-D float32 array, if present."""
+    if isinstance(entity, dict):
+        embedding = entity.get("embedding")
+    else:
+        embedding = getattr(entity, "embedding", None)
+    if embedding is None:
+        return None
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    return vector if vector.size else None
+
+
+class CandidateGenerator:
+    """
+    Base class for blockers.
+
+    A blocker indexes entities under string keys and proposes, for any entity,
+    the keys of indexed entities that are worth comparing with it.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        """Initialize blocker."""
+        self.logger = get_logger(f"blocking.{self.name}")
+
+    def add(self, key: str, entity: Any) -> None:
+        """Index an entity under ``key``."""
+        self.add_many([(key, entity)])
+
+    def add_many(self, items: Sequence[Tuple[str, Any]]) -> None:
+        """Index several (key, entity) pairs."""
+        raise NotImplementedError
+
+    def remove(self, key: str) -> bool:
+        """Remove an entity; returns False if it was not indexed."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entities."""
+        raise NotImplementedError
+
+    def candidates(self, entity: Any, key: Optional[str] = None) -> Set[str]:
+        """
+        Propose candidate keys for an entity.
+
+        Args:
+            entity: Entity to find candidates for
+            key: The entity's own key when it is indexed (excluded from results)
+
+        Returns:
+            Set of candidate keys
+        """
+        raise NotImplementedError
+
+    def candidates_many(self, items: Sequence[Tuple[str, Any]]) -> Dict[str, Set[str]]:
+        """Propose candidates for several indexed (key, entity) pairs."""
+        return {key: self.candidates(entity, key) for key, entity in items}
+
+    def get_config(self) -> Dict[str, Any]:
+        """Constructor parameters, used to recreate the blocker on load."""
+        return {}
+
+    def state_arrays(self) -> Dict[str, np.ndarray]:
+        """Arrays that let ``restore`` skip recomputation (empty by default)."""
+        return {}
+
+    def restore(self, items: Sequence[Tuple[str, Any]], arrays: Dict[str, np.ndarray]) -> None:
+        """Rebuild the blocker from saved entities and ``state_arrays`` output."""
+        self.add_many(items)
+
+
+class MinHashLSHBlocker(CandidateGenerator):
+    """
+    MinHash-LSH blocker over character n-grams of entity names.
+
+    With the defaults (32 bands of 3 rows) a pair with n-gram Jaccard 0.5 is
+    proposed with probability ~0.98 and a pair with Jaccard 0.1 with ~0.03.
+    """
+
+    name = "minhash"
+
+    def __init__(
+        self,
+        ngram_size: int = 3,
+        num_bands: int = 32,
+        rows_per_band: int = 3,
+        max_bucket_size: Optional[int] = 1000,
+        acronyms: bool = True,
+        seed: int = 0,
+        chunk_size: int = 10000,
+    ):
+        """
+        Initialize MinHash-LSH blocker.
+
+        Args:
+            ngram_size: Character n-gram length
+            num_bands: Number of LSH bands
+            rows_per_band: Signature rows per band
+            max_bucket_size: Buckets larger than this are ignored when
+                proposing candidates (None = no limit)
+            acronyms: Whether to add acronym buckets
+            seed: Seed for the hash family
+            chunk_size: Entities hashed per vectorized chunk
+        """
+        super().__init__()
+        self.ngram_size = ngram_size
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.max_bucket_size = max_bucket_size
+        self.acronyms = acronyms
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+        num_perm = num_bands * rows_per_band
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: odd multipliers, high 32 bits of a*x + b
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        # Per-band multipliers folding a band's rows into one 64-bit bucket key
+        self._band_mix = rng.integers(1, 2**63, size=(num_bands, rows_per_band), dtype=np.uint64) | np.uint64(1)
+
+        self._band_keys: Dict[str, List[int]] = {}
+        self._acronym_of: Dict[str, str] = {}
+        # Buckets are lists (most stay singletons); removal is rare
+        self._buckets: Dict[int, List[str]] = {}
+        self._acronym_buckets: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._band_keys)
+
+    def _shingle_hashes(self, name: str) -> np.ndarray:
+        """CRC32 hashes of the space-padded character n-grams of a name."""
+        padded = f" {name} "
+        n = self.ngram_size
+        if len(padded) <= n:
+            shingles = {padded}
+        else:
+            shingles = {padded[i : i + n] for i in range(len(padded) - n + 1)}
+        return np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+
+    def signatures(self, names: Sequence[str]) -> np.ndarray:
+        """
+        MinHash signatures for normalized names.
+
+        Args:
+            names: Normalized names
+
+        Returns:
+            uint64 array of shape (len(names), num_bands * rows_per_band)
+            holding 32-bit hash values
+        """
+        num_perm = len(self._a)
+        result = np.empty((len(names), num_perm), dtype=np.uint64)
+        for start in range(0, len(names), self.chunk_size):
+            chunk = [self._shingle_hashes(name) for name in names[start : start + self.chunk_size]]
+            lengths = np.fromiter((len(h) for h in chunk), dtype=np.int64, count=len(chunk))
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            hashes = np.concatenate(chunk)
+            # (num_perm, total_shingles): reduceat runs along contiguous rows
+            hashed = (self._a[:, None] * hashes + self._b[:, None]) >> np.uint64(32)
+            result[start : start + len(chunk)] = np.minimum.reduceat(hashed, offsets, axis=1).T
+        return result
+
+    def band_keys(self, names: Sequence[str]) -> np.ndarray:
+        """
+        LSH bucket keys for normalized names.
+
+        Each band of the MinHash signature is folded into one 64-bit key with
+        band-specific multipliers, so equal rows in different bands never share
+        a bucket.
+
+        Args:
+            names: Normalized names
+
+        Returns:
+            uint64 array of shape (len(names), num_bands)
+        """
+        signatures = self.signatures(names).reshape(len(names), self.num_bands, self.rows_per_band)
+        return (signatures * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+    @staticmethod
+    def acronym(name: str) -> Optional[str]:
+        """Acronym key: initials of a multi-word name, or a short single word."""
+        tokens = [t for t in name.split() if t not in _ACRONYM_STOPWORDS]
+        if len(tokens) >= 2:
+            return "".join(t[0] for t in tokens)
+        if len(tokens) == 1 and 2 <= len(tokens[0]) <= 6:
+            return tokens[0]
+        return None
+
+    def _insert(self, key: str, name: str, band_keys: List[int]) -> None:
+        if key in self._band_keys:
+            self.remove(key)
+        self._band_keys[key] = band_keys
+        buckets = self._buckets
+        for band_key in band_keys:
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                buckets[band_key] = [key]
+            else:
+                bucket.append(key)
+        if self.acronyms:
+            acronym = self.acronym(name)
+            if acronym:
+                self._acronym_of[key] = acronym
+                self._acronym_buckets.setdefault(acronym, set()).add(key)
+
+    def add_many(self, items: Sequence[Tuple[str, Any]]) -> None:
+        """Index several (key, entity) pairs, hashing them in vectorized chunks."""
+        items = list(items)
+        names = [normalize_name(entity_name(entity)) for _, entity in items]
+        for (key, _), name, band_keys in zip(items, names, self.band_keys(names).tolist()):
+            self._insert(key, name, band_keys)
+
+    def remove(self, key: str) -> bool:
+        """Remove an entity from all buckets."""
+        band_keys = self._band_keys.pop(key, None)
+        if band_keys is None:
+            return False
+        for band_key in band_keys:
+            bucket = self._buckets.get(band_key)
+            if bucket is not None and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band_key]
+        acronym = self._acronym_of.pop(key, None)
+        if acronym is not None:
+            bucket = self._acronym_buckets.get(acronym)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._acronym_buckets[acronym]
+        return True
+
+    def clear(self) -> None:
+        """Remove all entities."""
+        self._band_keys.clear()
+        self._acronym_of.clear()
+        self._buckets.clear()
+        self._acronym_buckets.clear()
+
+    def _collect(self, band_keys: List[int], acronym: Optional[str], key: Optional[str]) -> Set[str]:
+        limit = self.max_bucket_size
+        buckets = [self._buckets.get(band_key) for band_key in band_keys]
+        if acronym is not None:
+            buckets.append(self._acronym_buckets.get(acronym))
+
+        found: Set[str] = set()
+        for bucket in buckets:
+            if bucket and (limit is None or len(bucket) <= limit):
+                found.update(bucket)
+        found.discard(key)
+        return found
+
+    def candidates(self, entity: Any, key: Optional[str] = None) -> Set[str]:
+        """Keys sharing at least one LSH band (or the acronym bucket)."""
+        if key is not None and key in self._band_keys:
+            return self._collect(self._band_keys[key], self._acronym_of.get(key), key)
+        name = normalize_name(entity_name(entity))
+        band_keys = self.band_keys([name])[0].tolist()
+        acronym = self.acronym(name) if self.acronyms else None
+        return self._collect(band_keys, acronym, key)
+
+    def get_config(self) -> Dict[str, Any]:
+        return {
+            "ngram_size": self.ngram_size,
+            "num_bands": self.num_bands,
+            "rows_per_band": self.rows_per_band,
+            "max_bucket_size": self.max_bucket_size,
+            "acronyms": self.acronyms,
+            "seed": self.seed,
+            "chunk_size": self.chunk_size,
+        }
+
+    def state_arrays(self) -> Dict[str, np.ndarray]:
+        if not self._band_keys:
+            return {}
+        return {
+            "keys": np.array(list(self._band_keys), dtype=str),
+            "band_keys": np.array(list(self._band_keys.values()), dtype=np.uint64),
+        }
+
+    def restore(self, items: Sequence[Tuple[str, Any]], arrays: Dict[str, np.ndarray]) -> None:
+        """Rebuild buckets from saved band keys; entities without them are rehashed."""
+        saved: Dict[str, List[int]] = {}
+        if "keys" in arrays and "band_keys" in arrays:
+            saved = dict(zip(arrays["keys"].tolist(), arrays["band_keys"].tolist()))
+        missing = []
+        for key, entity in items:
+            band_keys = saved.get(key)
+            if band_keys is None:
+                missing.append((key, entity))
+            else:
+                self._insert(key, normalize_name(entity_name(entity)), band_keys)
+        if missing:
+            self.add_many(missing)
+
+
+# Sort keys for sorted-neighbourhood passes
+_SORT_KEYS = {
+    "name": lambda name: name,
+    "tokens": lambda name: " ".join(sorted(name.split())),
+    "reversed": lambda name: name[::-1],
+}
+
+
+class SortedNeighborhoodBlocker(CandidateGenerator):
+    """
+    Multi-pass sorted-neighbourhood blocker.
+
+    Each pass keeps the entities sorted by one key; entities within ``window``
+    positions of each other in any pass are candidates.
+    """
+
+    name = "sorted_neighborhood"
+
+    def __init__(self, window: int = 5, passes: Sequence[str] = ("name", "tokens", "reversed")):
+        """
+        Initialize sorted-neighbourhood blocker.
+
+        Args:
+            window: Neighbours taken on each side of an entity per pass
+            passes: Sort keys, any of "name", "tokens" and "reversed"
+        """
+        super().__init__()
+        unknown = [p for p in passes if p not in _SORT_KEYS]
+        if unknown:
+            raise ValidationError(
+                f"Unknown sorted-neighbourhood passes: {unknown}. "
+                f"Supported passes are: {', '.join(_SORT_KEYS)}"
+            )
+        self.window = window
+        self.passes = tuple(passes)
+
+        # Per pass: sorted (sort_key, key) entries, plus unsorted appends
+        self._entries: List[List[Tuple[str, str]]] = [[] for _ in self.passes]
+        self._pending: List[List[Tuple[str, str]]] = [[] for _ in self.passes]
+        self._sort_keys: Dict[str, Tuple[str, ...]] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._sort_keys)
+
+    def _keys_for(self, entity: Any) -> Tuple[str, ...]:
+        name = normalize_name(entity_name(entity))
+        return tuple(_SORT_KEYS[p](name) for p in self.passes)
+
+    def add_many(self, items: Sequence[Tuple[str, Any]]) -> None:
+        """Append entities; they are merged into the sorted runs on the next query."""
+        for key, entity in items:
+            if key in self._sort_keys:
+                self.remove(key)
+            sort_keys = self._keys_for(entity)
+            self._sort_keys[key] = sort_keys
+            for pending, sort_key in zip(self._pending, sort_keys):
+                pending.append((sort_key, key))
+
+    def remove(self, key: str) -> bool:
+        """Remove an entity; its sorted entries are dropped lazily."""
+        if self._sort_keys.pop(key, None) is None:
+            return False
+        self._dead += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove all entities."""
+        self._entries = [[] for _ in self.passes]
+        self._pending = [[] for _ in self.passes]
+        self._sort_keys.clear()
+        self._dead = 0
+
+    def _is_live(self, pass_index: int, entry: Tuple[str, str]) -> bool:
+        sort_keys = self._sort_keys.get(entry[1])
+        return sort_keys is not None and sort_keys[pass_index] == entry[0]
+
+    def _ensure_sorted(self) -> None:
+        """Merge pending entries and drop dead ones when they dominate."""
+        compact = self._dead > max(1024, len(self._sort_keys))
+        for i in range(len(self.passes)):
+            if self._pending[i]:
+                # Timsort merges the sorted run and the new run in linear time
+                self._entries[i].extend(self._pending[i])
+                self._entries[i].sort()
+                self._pending[i] = []
+            if compact:
+                self._entries[i] = [e for e in self._entries[i] if self._is_live(i, e)]
+        if compact:
+            self._dead = 0
+
+    def _neighbours(self, pass_index: int, sort_key: str, key: Optional[str]) -> Iterator[str]:
+        entries = self._entries[pass_index]
+        position = bisect.bisect_left(entries, (sort_key, key or ""))
+        for step in (-1, 1):
+            taken = 0
+            i = position if step == 1 else position - 1
+            while 0 <= i < len(entries) and taken < self.window:
+                entry = entries[i]
+                if entry[1] != key and self._is_live(pass_index, entry):
+                    taken += 1
+                    yield entry[1]
+                i += step
+
+    def candidates(self, entity: Any, key: Optional[str] = None) -> Set[str]:
+        """Keys within ``window`` sorted positions in any pass."""
+        self._ensure_sorted()
+        sort_keys = self._sort_keys.get(key) if key is not None else None
+        if sort_keys is None:
+            sort_keys = self._keys_for(entity)
+        found: Set[str] = set()
+        for i, sort_key in enumerate(sort_keys):
+            found.update(self._neighbours(i, sort_key, key))
+        return found
+
+    def candidates_many(self, items: Sequence[Tuple[str, Any]]) -> Dict[str, Set[str]]:
+        """Candidates for several entities (one merge for the whole batch)."""
+        self._ensure_sorted()
+        return {key: self.candidates(entity, key) for key, entity in items}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"window": self.window, "passes": list(self.passes)}
+
+
+class EmbeddingBlocker(CandidateGenerator):
+    """
+    Nearest-neighbour blocker over entity embeddings.
+
+    Entities without an ``embedding`` are ignored. Search is exact below
+    ``ann_threshold`` indexed vectors and uses an IVFIndex above it.
+    """
+
+    name = "embedding"
+
+    def __init__(
+        self,
+        k: int = 10,
+        min_similarity: float = 0.8,
+        ann_threshold: int = 50000,
+        nprobe: int = 8,
+        batch_size: int = 1024,
+    ):
+        """
+        Initialize embedding blocker.
+
+        Args:
+            k: Neighbours proposed per entity
+            min_similarity: Minimum raw cosine similarity (-1 to 1) of a candidate
+            ann_threshold: Indexed vectors above which IVF search is used
+            nprobe: IVF posting lists visited per query
+            batch_size: Queries scored per matrix product in ``candidates_many``
+        """
+        super().__init__()
+        self.k = k
+        self.min_similarity = min_similarity
+        self.ann_threshold = ann_threshold
+        self.nprobe = nprobe
+        self.batch_size = batch_size
+        self.matrix = VectorMatrix()
+        self.ann_index: Optional[IVFIndex] = None
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def add_many(self, items: Sequence[Tuple[str, Any]]) -> None:
+        """Index the embeddings of entities that carry one."""
+        keys, vectors = [], []
+        for key, entity in items:
+            vector = entity_embedding(entity)
+            if key in self.matrix:
+                self.matrix.remove(key)
+            if vector is None:
+                continue
+            if self.matrix.dimension is not None and vector.shape[0] != self.matrix.dimension:
+                self.logger.warning(
+                    f"Skipping embedding of {key}: dimension {vector.shape[0]} != {self.matrix.dimension}"
+                )
+                continue
+            keys.append(key)
+            vectors.append(vector)
+        if keys:
+            self.matrix.add_batch(keys, np.vstack(vectors))
+
+    def remove(self, key: str) -> bool:
+        """Remove an entity's embedding."""
+        return self.matrix.remove(key)
+
+    def clear(self) -> None:
+        """Remove all embeddings."""
+        self.matrix.clear()
+        self.ann_index = None
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if len(self.matrix) >= self.ann_threshold:
+            if self.ann_index is None:
+                self.ann_index = IVFIndex(nprobe=self.nprobe)
+            return self.ann_index.search(self.matrix, queries, k=k)
+        return self.matrix.search(queries, k=k)
+
+    def _neighbours(self, rows: np.ndarray, scores: np.ndarray, key: Optional[str]) -> Set[str]:
+        row_ids = self.matrix.row_ids
+        return {
+            row_ids[row]
+            for row, score in zip(rows.tolist(), scores.tolist())
+            if row >= 0 and score >= self.min_similarity and row_ids[row] != key
+        }
+
+    def candidates(self, entity: Any, key: Optional[str] = None) -> Set[str]:
+        """Keys of the ``k`` nearest embeddings above ``min_similarity``."""
+        if not len(self.matrix):
+            return set()
+        vector = self.matrix[key] if key is not None and key in self.matrix else entity_embedding(entity)
+        if vector is None or vector.shape[0] != self.matrix.dimension:
+            return set()
+        rows, scores = self._search(vector, self.k + 1)
+        return self._neighbours(rows, scores, key)
+
+    def candidates_many(self, items: Sequence[Tuple[str, Any]]) -> Dict[str, Set[str]]:
+        """Candidates for several indexed entities, scored in query batches."""
+        result: Dict[str, Set[str]] = {key: set() for key, _ in items}
+        keys = [key for key, _ in items if key in self.matrix]
+        for start in range(0, len(keys), self.batch_size):
+            chunk = keys[start : start + self.batch_size]
+            queries = self.matrix.data[self.matrix.rows_of(chunk)]
+            rows, scores = self._search(queries, self.k + 1)
+            for key, key_rows, key_scores in zip(chunk, rows, scores):
+                result[key] = self._neighbours(key_rows, key_scores, key)
+        return result
+
+    def get_config(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "min_similarity": self.min_similarity,
+            "ann_threshold": self.ann_threshold,
+            "nprobe": self.nprobe,
+            "batch_size": self.batch_size,
+        }
+
+
+class PrefixBlocker(CandidateGenerator):
+    """Blocks entities on the first characters of their normalized name."""
+
+    name = "prefix"
+
+    def __init__(self, prefix_length: int = 1):
+        """
+        Initialize prefix blocker.
+
+        Args:
+            prefix_length: Number of leading characters used as the block key
+        """
+        super().__init__()
+        self.prefix_length = prefix_length
+        self._blocks: Dict[str, Dict[str, None]] = {}
+        self._block_of: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._block_of)
+
+    def _block_key(self, entity: Any) -> str:
+        return normalize_name(entity_name(entity))[: self.prefix_length]
+
+    def add_many(self, items: Sequence[Tuple[str, Any]]) -> None:
+        for key, entity in items:
+            if key in self._block_of:
+                self.remove(key)
+            block_key = self._block_key(entity)
+            self._block_of[key] = block_key
+            self._blocks.setdefault(block_key, {})[key] = None
+
+    def remove(self, key: str) -> bool:
+        block_key = self._block_of.pop(key, None)
+        if block_key is None:
+            return False
+        block = self._blocks[block_key]
+        block.pop(key, None)
+        if not block:
+            del self._blocks[block_key]
+        return True
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._block_of.clear()
+
+    def candidates(self, entity: Any, key: Optional[str] = None) -> Set[str]:
+        """All other keys in the same block."""
+        block_key = self._block_of.get(key) if key is not None else None
+        if block_key is None:
+            block_key = self._block_key(entity)
+        found = set(self._blocks.get(block_key, ()))
+        found.discard(key)
+        return found
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"prefix_length": self.prefix_length}
+
+
+BLOCKERS = {
+    MinHashLSHBlocker.name: MinHashLSHBlocker,
+    SortedNeighborhoodBlocker.name: SortedNeighborhoodBlocker,
+    EmbeddingBlocker.name: EmbeddingBlocker,
+    PrefixBlocker.name: PrefixBlocker,
+}
+
+DEFAULT_BLOCKERS = ("minhash", "sorted_neighborhood", "embedding")
+
+BlockerSpec = Union[str, Dict[str, Any], CandidateGenerator]
+
+
+def create_blocker(spec: BlockerSpec) -> CandidateGenerator:
+    """
+    Create a blocker from a name, a ``{"type": name, **params}`` dict or an instance.
+
+    Args:
+        spec: Blocker specification
+
+    Returns:
+        CandidateGenerator instance
+    """
+    if isinstance(spec, CandidateGenerator):
+        return spec
+    if isinstance(spec, str):
+        blocker_type, params = spec, {}
+    elif isinstance(spec, dict):
+        params = dict(spec)
+        blocker_type = params.pop("type", None)
+    else:
+        raise ValidationError(f"Invalid blocker specification: {spec!r}")
+
+    blocker_class = BLOCKERS.get(blocker_type)
+    if blocker_class is None:
+        raise ValidationError(
+            f"Unknown blocker: {blocker_type}. Supported blockers are: {', '.join(BLOCKERS)}"
+        )
+    return blocker_class(**params)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _write_atomic(path: Path, write) -> None:
+    """Write a file through ``write(file)`` under a temporary name, then rename it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    mode = "wb" if path.suffix in (".npy", ".npz") else "w"
+    with open(tmp_path, mode, **({} if mode == "wb" else {"encoding": "utf-8"})) as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+class CandidateIndex:
+    """
+    Persistent entity index that combines blockers.
+
+    Entities are stored under string keys (their ``id`` when present) in
+    insertion order. Candidates from all blockers are united; each blocker can
+    only add recall, never remove it.
+    """
+
+    def __init__(
+        self,
+        blockers: Optional[Sequence[BlockerSpec]] = None,
+        key_field: str = "id",
+    ):
+        """
+        Initialize candidate index.
+
+        Args:
+            blockers: Blocker names, ``{"type": ..., **params}`` dicts or
+                CandidateGenerator instances (default: minhash,
+                sorted_neighborhood and embedding)
+            key_field: Entity field used as the index key
+        """
+        self.logger = get_logger("candidate_index")
+        if blockers is None:
+            blockers = DEFAULT_BLOCKERS
+        elif isinstance(blockers, (str, dict, CandidateGenerator)):
+            blockers = [blockers]
+        self.blockers: List[CandidateGenerator] = [create_blocker(b) for b in blockers]
+        if not self.blockers:
+            raise ValidationError("CandidateIndex requires at least one blocker")
+        self.key_field = key_field
+
+        self.entities: Dict[str, Any] = {}
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+        self._fingerprints: Dict[str, str] = {}
+        # Keys of entities indexed without an id, by object identity
+        self._identity_keys: Dict[int, str] = {}
+        self._auto_key = 0
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.entities
+
+    def get(self, key: str) -> Any:
+        """Indexed entity for a key (None if missing)."""
+        return self.entities.get(key)
+
+    def keys(self) -> List[str]:
+        """Keys in insertion order."""
+        return list(self.entities)
+
+    def key_of(self, entity: Any) -> Optional[str]:
+        """Key an entity is (or would be) indexed under, if it can be derived."""
+        if isinstance(entity, dict):
+            value = entity.get(self.key_field)
+        else:
+            value = getattr(entity, self.key_field, None)
+        if value is not None:
+            return str(value)
+        return self._identity_keys.get(id(entity))
+
+    @staticmethod
+    def _fingerprint(entity: Any) -> str:
+        """Digest of the fields blockers read (name and embedding)."""
+        digest = hashlib.blake2b(entity_name(entity).encode("utf-8"), digest_size=16)
+        embedding = entity_embedding(entity)
+        if embedding is not None:
+            digest.update(embedding.tobytes())
+        return digest.hexdigest()
+
+    def _new_key(self, entity: Any) -> str:
+        while f"entity_{self._auto_key}" in self.entities:
+            self._auto_key += 1
+        key = f"entity_{self._auto_key}"
+        self._auto_key += 1
+        self._identity_keys[id(entity)] = key
+        return key
+
+    def add(self, entity: Any, key: Optional[str] = None) -> str:
+        """Index (or re-index) one entity and return its key."""
+        return self.add_many([entity], None if key is None else [key])[0]
+
+    def add_many(self, entities: Sequence[Any], keys: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Index several entities.
+
+        An entity whose key is already indexed replaces the previous entry;
+        blockers are only updated if its name or embedding changed.
+
+        Args:
+            entities: Entities (dicts or objects)
+            keys: Explicit keys (default: ``key_field`` or an auto-assigned key)
+
+        Returns:
+            Keys in the order of ``entities``
+        """
+        if keys is not None and len(keys) != len(entities):
+            raise ValidationError("keys must be aligned with entities")
+
+        result: List[str] = []
+        changed: List[Tuple[str, Any]] = []
+        for i, entity in enumerate(entities):
+            key = keys[i] if keys is not None else self.key_of(entity)
+            if key is None:
+                key = self._new_key(entity)
+            key = str(key)
+            result.append(key)
+
+            fingerprint = self._fingerprint(entity)
+            if key not in self.entities:
+                self._sequence[key] = self._next_sequence
+                self._next_sequence += 1
+            elif self._fingerprints.get(key) == fingerprint:
+                self.entities[key] = entity
+                continue
+            self.entities[key] = entity
+            self._fingerprints[key] = fingerprint
+            changed.append((key, entity))
+
+        if changed:
+            for blocker in self.blockers:
+                blocker.add_many(changed)
+        return result
+
+    def remove(self, key: str) -> bool:
+        """Remove an entity from the index and all blockers."""
+        entity = self.entities.pop(key, None)
+        if entity is None:
+            return False
+        self._sequence.pop(key, None)
+        self._fingerprints.pop(key, None)
+        if self._identity_keys.get(id(entity)) == key:
+            del self._identity_keys[id(entity)]
+        for blocker in self.blockers:
+            blocker.remove(key)
+        return True
+
+    def clear(self) -> None:
+        """Remove all entities."""
+        self.entities.clear()
+        self._sequence.clear()
+        self._fingerprints.clear()
+        self._identity_keys.clear()
+        for blocker in self.blockers:
+            blocker.clear()
+
+    def sync(self, entities: Sequence[Any]) -> List[str]:
+        """
+        Make the index mirror ``entities``.
+
+        New or changed entities are indexed, unchanged ones only cost a
+        fingerprint check, and indexed keys absent from ``entities`` are
+        removed. Repeated keys within ``entities`` get distinct keys.
+
+        Args:
+            entities: Authoritative entity collection
+
+        Returns:
+            Keys aligned with ``entities``
+        """
+        keys: List[Optional[str]] = []
+        seen: Set[str] = set()
+        for entity in entities:
+            key = self.key_of(entity)
+            if key is not None and key in seen:
+                # Repeated id: reuse this object's own key if it has one
+                key = self._identity_keys.get(id(entity))
+                if key is None or key in seen:
+                    key = self._new_key(entity)
+            keys.append(key)
+            if key is not None:
+                seen.add(key)
+
+        stale = [key for key in self.entities if key not in seen]
+        for key in stale:
+            self.remove(key)
+
+        missing = [i for i, key in enumerate(keys) if key is None]
+        for i in missing:
+            keys[i] = self._new_key(entities[i])
+        return self.add_many(entities, keys)
+
+    def _ordered(self, keys: Iterable[str]) -> List[str]:
+        return sorted(keys, key=self._sequence.__getitem__)
+
+    def candidates(self, entity: Any, key: Optional[str] = None) -> List[str]:
+        """
+        Candidate keys for an entity, in insertion order.
+
+        Args:
+            entity: Entity to find candidates for (indexed or not)
+            key: The entity's own key when it is indexed (excluded from results)
+
+        Returns:
+            List of candidate keys
+        """
+        found: Set[str] = set()
+        for blocker in self.blockers:
+            found.update(blocker.candidates(entity, key))
+        found.discard(key)
+        return self._ordered(k for k in found if k in self._sequence)
+
+    def candidate_pairs(self, chunk_size: int = 10000) -> List[Tuple[str, str]]:
+        """
+        All unordered candidate pairs among indexed entities.
+
+        Blockers are queried in chunks of entities and pairs are collected as
+        packed int64 codes, so de-duplication happens in NumPy rather than in
+        a Python set of tuples.
+
+        Args:
+            chunk_size: Entities queried per blocker call
+
+        Returns:
+            (earlier_key, later_key) pairs sorted by insertion order
+        """
+        items = list(self.entities.items())
+        sequence = self._sequence
+        span = self._next_sequence
+        codes = array("q")
+        for blocker in self.blockers:
+            for start in range(0, len(items), chunk_size):
+                found_by_key = blocker.candidates_many(items[start : start + chunk_size])
+                for key, found in found_by_key.items():
+                    a = sequence[key]
+                    for other in found:
+                        b = sequence.get(other)
+                        if b is not None and b != a:
+                            codes.append(a * span + b if a < b else b * span + a)
+
+        if not codes:
+            return []
+        unique = np.unique(np.frombuffer(codes, dtype=np.int64))
+        keys_by_sequence = {seq: key for key, seq in sequence.items()}
+        return [
+            (keys_by_sequence[a], keys_by_sequence[b])
+            for a, b in zip((unique // span).tolist(), (unique % span).tolist())
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index statistics."""
+        return {
+            "entities": len(self.entities),
+            "blockers": {b.name: len(b) for b in self.blockers},
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the index to a directory.
+
+        Layout:
+            - manifest.json: format, version, blocker configs, key field
+            - entities.jsonl: one {"key", "entity"} record per entity, in
+              insertion order, with embeddings stripped
+            - embeddings.npy / embedding_keys.json: entity embeddings
+            - blocker_<i>.npz: blocker state arrays (e.g. MinHash signatures)
+
+        Entity objects are saved as their attribute dicts; values that are not
+        JSON-serializable are saved as strings.
+
+        Args:
+            path: Directory path
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        embedding_keys: List[str] = []
+        embeddings: List[np.ndarray] = []
+
+        def write_entities(f) -> None:
+            for key, entity in self.entities.items():
+                record = dict(entity) if isinstance(entity, dict) else dict(vars(entity))
+                embedding = entity_embedding(record)
+                record.pop("embedding", None)
+                if embedding is not None:
+                    embedding_keys.append(key)
+                    embeddings.append(embedding)
+                f.write(json.dumps({"key": key, "entity": record}, default=_json_default))
+                f.write("\n")
+
+        _write_atomic(directory / "entities.jsonl", write_entities)
+
+        if embeddings and len({e.shape[0] for e in embeddings}) == 1:
+            _write_atomic(
+                directory / "embeddings.npy",
+                lambda f: np.save(f, np.vstack(embeddings)),
+            )
+        else:
+            embedding_keys = []
+            (directory / "embeddings.npy").unlink(missing_ok=True)
+        _write_atomic(
+            directory / "embedding_keys.json",
+            lambda f: json.dump(embedding_keys, f),
+        )
+
+        blocker_specs = []
+        for i, blocker in enumerate(self.blockers):
+            arrays = blocker.state_arrays()
+            file_name = f"blocker_{i}.npz"
+            if arrays:
+                _write_atomic(directory / file_name, lambda f: np.savez(f, **arrays))
+            blocker_specs.append(
+                {"type": blocker.name, "params": blocker.get_config(), "arrays": file_name if arrays else None}
+            )
+
+        manifest = {
+            "format": INDEX_FORMAT,
+            "version": INDEX_FORMAT_VERSION,
+            "key_field": self.key_field,
+            "count": len(self.entities),
+            "blockers": blocker_specs,
+        }
+        _write_atomic(
+            directory / "manifest.json",
+            lambda f: json.dump(manifest, f, indent=2),
+        )
+        self.logger.info(f"Saved candidate index with {len(self.entities)} entities to {directory}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CandidateIndex":
+        """
+        Load an index saved with ``save``.
+
+        Entities are restored as dicts with their embeddings re-attached;
+        blockers are rebuilt from saved state where available.
+
+        Args:
+            path: Directory path
+
+        Returns:
+            CandidateIndex
+        """
+        directory = Path(path)
+        manifest_path = directory / "manifest.json"
+        if not manifest_path.exists():
+            raise ValidationError(f"No candidate index found at {directory}")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("format") != INDEX_FORMAT:
+            raise ValidationError(f"Unrecognized candidate index format: {manifest.get('format')}")
+        if manifest.get("version", 0) > INDEX_FORMAT_VERSION:
+            raise ValidationError(
+                f"Candidate index version {manifest['version']} is newer than supported "
+                f"version {INDEX_FORMAT_VERSION}"
+            )
+
+        blockers = [
+            BLOCKERS[spec["type"]](**spec.get("params", {})) for spec in manifest["blockers"]
+        ]
+        index = cls(blockers=blockers, key_field=manifest.get("key_field", "id"))
+
+        items: List[Tuple[str, Dict[str, Any]]] = []
+        with open(directory / "entities.jsonl", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    items.append((record["key"], record["entity"]))
+
+        embedding_keys = json.loads(
+            (directory / "embedding_keys.json").read_text(encoding="utf-8")
+        )
+        if embedding_keys:
+            matrix = np.load(directory / "embeddings.npy", allow_pickle=False)
+            by_key = dict(items)
+            for key, row in zip(embedding_keys, matrix):
+                by_key[key]["embedding"] = row.tolist()
+
+        for key, entity in items:
+            index.entities[key] = entity
+            index._sequence[key] = index._next_sequence
+            index._next_sequence += 1
+            index._fingerprints[key] = cls._fingerprint(entity)
+
+        for blocker, spec in zip(index.blockers, manifest["blockers"]):
+            arrays: Dict[str, np.ndarray] = {}
+            if spec.get("arrays"):
+                with np.load(directory / spec["arrays"], allow_pickle=False) as data:
+                    arrays = {name: data[name] for name in data.files}
+            blocker.restore(items, arrays)
+        return index
@@ -138,10 +138,8 @@ class ClusterBuilder:
         self.max_cluster_size = max_cluster_size
         self.use_hierarchical = use_hierarchical
 
-        # Initialize progress tracker and ensure it's enabled
+        # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug(
             f"Cluster builder initialized: threshold={similarity_threshold}, "
@@ -6,18 +6,18 @@ framework, identifying duplicate entities and relationships in knowledge graphs
 similarity thresholds, clustering algorithms, and confidence scoring.
 
 Algorithms Used:
-    - Pairwise Comparison: Optimized all-pairs similarity calculation with blocking support
+    - Pairwise Comparison: Similarity calculation over blocked candidate pairs (MinHash-LSH, sorted-neighbourhood, embedding ANN)
     - Batch Processing: Vectorized similarity calculations for efficiency
     - Union-Find Algorithm: Disjoint set union (DSU) for duplicate group formation
     - Confidence Scoring: Multi-factor confidence calculation combining similarity, name matches, property matches, and type matches
-    - Incremental Processing: O(n×m) efficient comparison with individual tracking disabled for speed
+    - Incremental Processing: New entities compared only against candidates from a persistent CandidateIndex
     - Representative Selection: Most complete entity selection from duplicate groups
 
 Key Features:
     - Entity duplicate detection using multi-factor similarity metrics
     - Relationship duplicate detection with granular progress tracking
     - Duplicate group formation using union-find algorithm for transitive closure
-    - Incremental duplicate detection for new entities (streaming scenarios)
+    - Incremental duplicate detection for new entities against a persistent, blocked candidate index
     - Confidence scoring for duplicate candidates with multiple factors
     - Representative entity selection from duplicate groups (most complete)
     - Batch and pairwise detection methods for different use cases
@@ -46,6 +46,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from ..utils.exceptions import ProcessingError
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from .blocking import CandidateIndex
 from .similarity_calculator import SimilarityCalculator, SimilarityResult
 
 
@@ -117,6 +118,8 @@ class DuplicateDetector:
             config: Configuration dictionary (merged with kwargs)
             **kwargs: Additional configuration options:
                 - similarity: Configuration for SimilarityCalculator
+                - blocking: Blocker specifications for the candidate index
+                - candidate_index: Existing CandidateIndex (e.g. from CandidateIndex.load)
         """
         self.logger = get_logger("duplicate_detector")
 
@@ -128,15 +131,18 @@ class DuplicateDetector:
         similarity_config = self.config.get("similarity", {})
         self.similarity_calculator = SimilarityCalculator(**similarity_config)
 
+        # Persistent candidate index for incremental detection
+        self.candidate_index = self.config.get("candidate_index")
+        if self.candidate_index is None:
+            self.candidate_index = CandidateIndex(blockers=self.config.get("blocking"))
+
         # Detection thresholds
         self.similarity_threshold = similarity_threshold
         self.confidence_threshold = confidence_threshold
         self.use_clustering = use_clustering
 
-        # Initialize progress tracker and ensure it's enabled
+        # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug(
             f"Duplicate detector initialized: similarity_threshold={similarity_threshold}, "
@@ -204,7 +210,9 @@ class DuplicateDetector:
             )
             # Calculate similarity for all entity pairs
             similarities = self.similarity_calculator.batch_calculate_similarity(
-                entities, threshold=detection_threshold
+                entities,
+                threshold=detection_threshold,
+                blocking=self.config.get("blocking"),
             )
 
             self.logger.debug(
@@ -473,22 +481,29 @@ class DuplicateDetector:
     def incremental_detect(
         self,
         new_entities: List[Dict[str, Any]],
-        existing_entities: List[Dict[str, Any]],
+        existing_entities: Optional[List[Dict[str, Any]]] = None,
         threshold: Optional[float] = None,
         **options,
     ) -> List[DuplicateCandidate]:
         """
         Incremental duplicate detection for new entities.
 
-        This method efficiently detects duplicates between new entities and an
-        existing set of entities, avoiding the O(n²) comparison of all pairs.
-        Useful for streaming or incremental data processing scenarios.
+        This method detects duplicates between new entities and an existing set
+        of entities held in the detector's CandidateIndex. Each new entity is
+        only compared against the candidates proposed by the index's blockers,
+        not against every existing entity. Useful for streaming or incremental
+        data processing scenarios.
 
         Args:
             new_entities: List of new entity dictionaries to check for duplicates
-            existing_entities: List of existing entity dictionaries to compare against
+            existing_entities: List of existing entity dictionaries to compare against.
+                When given, the index is synchronized to mirror this list (only
+                new or changed entities are re-indexed). When None, the new
+                entities are compared against everything already indexed.
             threshold: Minimum similarity threshold (overrides instance default)
-            **options: Additional detection options
+            **options: Additional detection options:
+                - update_index: Add the new entities to the index afterwards
+                  (default: True)
 
         Returns:
             List of DuplicateCandidate objects representing duplicates between
@@ -503,23 +518,31 @@ class DuplicateDetector:
         detection_threshold = (
             threshold if threshold is not None else self.similarity_threshold
         )
+        candidate_index = self.candidate_index
+        if existing_entities is not None:
+            candidate_index.sync(existing_entities)
 
         # Track incremental detection
         tracking_id = self.progress_tracker.start_tracking(
             file=None,
             module="deduplication",
             submodule="DuplicateDetector",
-            message=f"Incremental detection: {len(new_entities)} new vs {len(existing_entities)} existing",
+            message=f"Incremental detection: {len(new_entities)} new vs {len(candidate_index)} existing",
         )
 
         try:
             self.logger.info(
                 f"Incremental detection: {len(new_entities)} new entities vs "
-                f"{len(existing_entities)} existing entities"
+                f"{len(candidate_index)} existing entities"
             )
 
+            # Candidate keys per new entity (blocked, not the full existing set)
+            candidate_keys = [
+                candidate_index.candidates(new_entity) for new_entity in new_entities
+            ]
+
             candidates = []
-            total_comparisons = len(new_entities) * len(existing_entities)
+            total_comparisons = sum(len(keys) for keys in candidate_keys)
             processed = 0
             # Update more frequently: every 1% or at least every 10 items, but always update for small datasets
             if total_comparisons <= 10:
@@ -536,9 +559,10 @@ class DuplicateDetector:
                 message=f"Starting incremental detection... 0/{total_comparisons} (remaining: {remaining})"
             )
 
-            # Compare each new entity with all existing entities
-            for new_entity in new_entities:
-                for existing_entity in existing_entities:
+            # Compare each new entity with its candidate existing entities
+            for new_entity, keys in zip(new_entities, candidate_keys):
+                for key in keys:
+                    existing_entity = candidate_index.get(key)
                     # Calculate similarity without individual tracking for speed
                     similarity = self.similarity_calculator.calculate_similarity(
                         new_entity, existing_entity, track=False
@@ -571,6 +595,9 @@ class DuplicateDetector:
                             message=f"Comparing entities... {processed}/{total_comparisons} (remaining: {remaining})"
                         )
 
+            if options.get("update_index", True):
+                candidate_index.add_many(new_entities)
+
             # Sort by confidence (highest first)
             candidates.sort(key=lambda c: c.confidence, reverse=True)
 
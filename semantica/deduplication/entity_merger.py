@@ -122,10 +122,8 @@ class EntityMerger:
         self.merge_history: List[MergeOperation] = []
         self.preserve_provenance = preserve_provenance
 
-        # Initialize progress tracker and ensure it's enabled
+        # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug(
             f"Entity merger initialized (preserve_provenance: {preserve_provenance})"
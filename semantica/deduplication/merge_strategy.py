@@ -144,10 +144,8 @@ class MergeStrategyManager:
         # Custom merge strategies (callable functions)
         self.custom_strategies: Dict[str, Callable] = {}
 
-        # Initialize progress tracker and ensure it's enabled
+        # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug(
             f"Merge strategy manager initialized (default: {self.default_strategy.value})"
@@ -21,7 +21,7 @@ Similarity Calculation:
 Duplicate Detection:
     - "pairwise": O(n²) comparison of all entity pairs
     - "batch": Efficient batch similarity calculation
-    - "incremental": O(n×m) comparison for new vs existing entities
+    - "incremental": New vs existing entities, compared only within blocked candidates
     - "group": Union-find algorithm for duplicate group formation
 
 Entity Merging:
@@ -215,7 +215,7 @@ def detect_duplicates(
         method: Detection method (default: "pairwise")
             - "pairwise": O(n²) comparison of all entity pairs
             - "batch": Efficient batch similarity calculation
-            - "incremental": O(n×m) comparison for new vs existing entities
+            - "incremental": New vs existing entities, compared only within blocked candidates
             - "group": Union-find algorithm for duplicate group formation
         similarity_threshold: Minimum similarity score to consider duplicates (default: 0.7)
         confidence_threshold: Minimum confidence score for duplicate candidates (default: 0.6)
@@ -7,9 +7,12 @@ metrics including string similarity, property similarity, relationship similarit
 and embedding similarity.
 
 Algorithms Used:
-    - Blocking Strategy: Prefix-based entity grouping to reduce O(n²) comparisons
+    - Blocking Strategy: Candidate generation (MinHash-LSH, sorted-neighbourhood,
+      embedding ANN) via CandidateIndex to avoid O(n²) comparisons
     - Pre-processing: Vectorized preparation of lowercase names and relationship sets
     - Short-circuiting: Early exit for dissimilar pairs based on name similarity
+    - Vectorized Batch Scoring: Candidate pairs scored in chunks by BatchSimilarityEngine
+      over per-entity feature caches, with length/prefix upper-bound filtering
     - Levenshtein Distance: Dynamic programming algorithm for edit distance calculation
     - Jaro Similarity: Character-based similarity with match window algorithm
     - Jaro-Winkler Similarity: Jaro with prefix bonus (up to 4 characters, 0.1 weight)
@@ -23,7 +26,8 @@ Key Features:
     - Multi-factor similarity calculation (string, property, relationship, embedding)
     - Multiple string similarity algorithms (Levenshtein, Jaro-Winkler, cosine)
     - Weighted aggregation of similarity components with automatic normalization
-    - Batch similarity calculation for efficiency (O(n²) optimized)
+    - Batch similarity calculation over blocked candidate pairs with vectorized kernels
+    - One-to-many string similarity (calculate_string_similarity_batch)
     - Configurable similarity thresholds and component weights
     - Support for exact matching, fuzzy matching, and semantic matching
 
@@ -51,11 +55,15 @@ License: MIT
 
 import math
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ..utils.exceptions import ProcessingError
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from .blocking import CandidateIndex
+from .similarity_engine import BatchSimilarityEngine, string_similarity_one_to_many
 
 
 @dataclass
@@ -115,7 +123,11 @@ class SimilarityCalculator:
             relationship_weight: Weight for relationship similarity (default: 0.1)
             similarity_threshold: Default similarity threshold for filtering (default: 0.7)
             config: Configuration dictionary (merged with kwargs)
-            **kwargs: Additional configuration options
+            **kwargs: Additional configuration options:
+                - blocking: Blocker specifications for batch calculation
+                  (see CandidateIndex)
+                - batch_chunk_size: Candidate pairs scored per vectorized chunk
+                  (default: 10000)
         """
         self.logger = get_logger("similarity_calculator")
 
@@ -130,6 +142,9 @@ class SimilarityCalculator:
         self.relationship_weight = relationship_weight
         self.similarity_threshold = similarity_threshold
 
+        # Blockers used by batch_calculate_similarity (None = CandidateIndex defaults)
+        self.blocking = self.config.get("blocking")
+
         # Validate weights sum to approximately 1.0
         total_weight = (
             self.embedding_weight
@@ -142,10 +157,8 @@ class SimilarityCalculator:
                 f"Weights sum to {total_weight:.2f}, will be normalized during calculation"
             )
 
-        # Initialize progress tracker and ensure it's enabled
+        # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug("Similarity calculator initialized")
 
@@ -315,6 +328,25 @@ class SimilarityCalculator:
         else:
             return self._levenshtein_similarity(str1_lower, str2_lower)
 
+    def calculate_string_similarity_batch(
+        self, query: str, candidates: Sequence[str], method: str = "jaro_winkler"
+    ) -> np.ndarray:
+        """
+        Calculate string similarity of one string against many candidates.
+
+        Vectorized equivalent of calling ``calculate_string_similarity`` for
+        every candidate.
+
+        Args:
+            query: Query string
+            candidates: Candidate strings
+            method: Similarity method ("levenshtein", "jaro_winkler", "cosine")
+
+        Returns:
+            Array of similarity scores (0-1) aligned with ``candidates``
+        """
+        return string_similarity_one_to_many(query, candidates, method=method)
+
     def calculate_property_similarity(
         self, entity1: Dict[str, Any], entity2: Dict[str, Any]
     ) -> float:
@@ -556,17 +588,23 @@ class SimilarityCalculator:
         return len(intersection) / len(union) if union else 0.0
 
     def batch_calculate_similarity(
-        self, entities: List[Dict[str, Any]], threshold: Optional[float] = None
+        self,
+        entities: List[Dict[str, Any]],
+        threshold: Optional[float] = None,
+        blocking: Optional[List[Any]] = None,
     ) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
         """
         Calculate similarity for all entity pairs in a batch.
 
-        This method optimizes calculation by comparing only pairs that are likely
-        to be similar using a blocking/indexing strategy.
+        This method optimizes calculation by comparing only candidate pairs
+        proposed by a CandidateIndex (MinHash-LSH, sorted-neighbourhood and
+        embedding blockers by default).
 
         Args:
             entities: List of entity dictionaries
             threshold: Similarity threshold for filtering (default: self.similarity_threshold)
+            blocking: Blocker specifications (default: the ``blocking`` config
+                option, or minhash + sorted_neighborhood + embedding)
 
         Returns:
             List of (entity1, entity2, similarity) tuples
@@ -615,66 +653,47 @@ class SimilarityCalculator:
                 
                 processed_entities.append(processed_entity)
 
-            # Blocking strategy: Group entities by first character of name
-            # This significantly reduces the number of pairs to compare while
-            # still catching most duplicates.
-            blocks: Dict[str, List[int]] = {}
-            for idx, entity in enumerate(processed_entities):
-                name = entity["_lower_name"]
-                if not name:
-                    block_key = "___empty___"
-                else:
-                    # Use the first character as the block key
-                    block_key = name[0]
-                
-                if block_key not in blocks:
-                    blocks[block_key] = []
-                blocks[block_key].append(idx)
-
-            # Calculate total potential pairs within blocks for progress tracking
-            total_pairs = 0
-            for block_indices in blocks.values():
-                n = len(block_indices)
-                total_pairs += n * (n - 1) // 2
-
-            processed = 0
-            # Update more frequently: every 1% or at least every 10 items
-            if total_pairs <= 10:
-                update_interval = 1
-            else:
-                update_interval = max(1, min(100, total_pairs // 100))
-            
+            # Candidate generation: only pairs proposed by the blockers are compared
+            candidate_index = CandidateIndex(blockers=blocking or self.blocking)
+            candidate_index.add_many(
+                processed_entities, keys=[str(i) for i in range(len(processed_entities))]
+            )
+            pairs = candidate_index.candidate_pairs()
+            total_pairs = len(pairs)
+            left = np.fromiter((int(a) for a, _ in pairs), dtype=np.int64, count=total_pairs)
+            right = np.fromiter((int(b) for _, b in pairs), dtype=np.int64, count=total_pairs)
+
             self.progress_tracker.update_tracking(
                 tracking_id,
                 status="running",
-                message=f"Comparing {total_pairs} pairs across {len(blocks)} blocks..."
+                message=f"Comparing {total_pairs} candidate pairs..."
             )
-            
-            # Compare entities within each block
-            for block_key, indices in blocks.items():
-                for i_idx in range(len(indices)):
-                    for j_idx in range(i_idx + 1, len(indices)):
-                        i = indices[i_idx]
-                        j = indices[j_idx]
-                        
-                        similarity = self.calculate_similarity(processed_entities[i], processed_entities[j], track=False)
-
-                        if similarity.score >= threshold:
-                            results.append((entities[i], entities[j], similarity.score))
-                        
-                        processed += 1
-                        if processed % update_interval == 0 or processed == total_pairs:
-                            self.progress_tracker.update_progress(
-                                tracking_id,
-                                processed=processed,
-                                total=total_pairs,
-                                message=f"Comparing pairs in block '{block_key}'... {processed}/{total_pairs}"
-                            )
+
+            # Features (names, properties, relationships, embeddings) are
+            # computed once and the pairs are scored in vectorized chunks
+            engine = BatchSimilarityEngine(self)
+            features = engine.build_cache(processed_entities)
+            chunk_size = max(1, self.config.get("batch_chunk_size", 10000))
+            for start in range(0, total_pairs, chunk_size):
+                li = left[start : start + chunk_size]
+                ri = right[start : start + chunk_size]
+                scores = engine.score_pairs(features, li, features, ri, min_score=threshold)
+                for i, j, score in zip(li.tolist(), ri.tolist(), scores.tolist()):
+                    if score >= threshold:
+                        results.append((entities[i], entities[j], score))
+
+                processed = min(start + chunk_size, total_pairs)
+                self.progress_tracker.update_progress(
+                    tracking_id,
+                    processed=processed,
+                    total=total_pairs,
+                    message=f"Comparing candidate pairs... {processed}/{total_pairs}"
+                )
 
             self.progress_tracker.stop_tracking(
                 tracking_id,
                 status="completed",
-                message=f"Found {len(results)} similar pairs across {len(blocks)} blocks",
+                message=f"Found {len(results)} similar pairs among {total_pairs} candidates",
             )
             return results
 
@@ -0,0 +1,745 @@
+"""
+Batch Similarity Engine Module
+
+This module provides the vectorized similarity engine behind
+SimilarityCalculator's batch paths. String kernels score many string pairs at
+once with NumPy, and per-entity features (encoded names, property dicts,
+hashable relationship sets, embeddings) are computed once per run and reused
+for every pair an entity takes part in.
+
+Algorithms Used:
+
+String Kernels (pair-parallel, one NumPy pass per character position):
+    - Levenshtein: Row-by-row edit-distance DP for all pairs at once; the
+      in-row insertion dependency is resolved with a running minimum
+      (``np.minimum.accumulate``)
+    - Jaro-Winkler: Greedy windowed matching for all pairs at once, with
+      transpositions counted on stably-compacted match sequences and a
+      vectorized common-prefix bonus
+    - Bigram Jaccard ("cosine" method): Binary bigram count vectors as a
+      SciPy CSR matrix; intersections from row-wise sparse products
+    - Length Bucketing: Pairs are sorted by string length and processed in
+      chunks so padding stays small
+
+Filtering:
+    - Length/Prefix Upper Bounds: Per-pair bounds on the string score
+      (Levenshtein length difference, Jaro maximum matches plus the exact
+      prefix bonus, bigram count ratio) combined into a bound on the overall
+      score; pairs that cannot reach ``min_score`` skip all kernels
+
+Entity Scoring:
+    - Same aggregation as SimilarityCalculator.calculate_similarity: string
+      short-circuit, property, relationship and embedding components, and
+      weight normalization, evaluated for arrays of pairs
+    - Property strings are scored with one Jaro-Winkler kernel call per batch
+
+Key Features:
+    - One-to-many, many-to-many and aligned-pair string similarity APIs
+    - Scores identical to the per-pair string methods
+    - Per-entity feature caches reused across a whole detection run
+
+Main Classes:
+    - EncodedStrings: Normalized strings as flat code points with lazy bigram CSR
+    - EntityFeatureCache: Precomputed per-entity similarity features
+    - BatchSimilarityEngine: Vectorized entity pair scoring for a SimilarityCalculator
+
+Example Usage:
+    >>> from semantica.deduplication.similarity_engine import string_similarity_one_to_many
+    >>> scores = string_similarity_one_to_many("Apple", ["Apple Inc.", "Microsoft"])
+    >>>
+    >>> from semantica.deduplication import SimilarityCalculator
+    >>> from semantica.deduplication.similarity_engine import BatchSimilarityEngine, EntityFeatureCache
+    >>> engine = BatchSimilarityEngine(SimilarityCalculator())
+    >>> cache = EntityFeatureCache(entities)
+    >>> scores = engine.score_pairs(cache, [0, 0], cache, [1, 2], min_score=0.7)
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+STRING_METHODS = ("levenshtein", "jaro_winkler", "cosine")
+
+# Pairs processed per kernel chunk
+_CHUNK_SIZE = 4096
+_PAD = -1
+
+
+class EncodedStrings:
+    """
+    Normalized strings stored as flat code points.
+
+    Strings are normalized like SimilarityCalculator.calculate_string_similarity
+    (``lower().strip()``). Code points of all strings are concatenated into
+    one array with offsets, so any subset can be gathered into a padded
+    (P, width) block without per-string Python work.
+    """
+
+    def __init__(self, strings: Sequence[Any]):
+        """
+        Encode strings.
+
+        Args:
+            strings: Strings (None is treated as empty)
+        """
+        raw = ["" if s is None else str(s) for s in strings]
+        self.raw_empty = np.fromiter((not s for s in raw), dtype=bool, count=len(raw))
+        self.strings = [s.lower().strip() for s in raw]
+        self.lengths = np.fromiter((len(s) for s in self.strings), dtype=np.int64, count=len(raw))
+        self.offsets = np.zeros(len(raw) + 1, dtype=np.int64)
+        np.cumsum(self.lengths, out=self.offsets[1:])
+        self.codes = np.frombuffer(
+            "".join(self.strings).encode("utf-32-le"), dtype=np.uint32
+        ).astype(np.int64)
+        self._bigrams: Optional[sparse.csr_matrix] = None
+        self._bigram_counts: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def padded(self, indices: np.ndarray, width: Optional[int] = None) -> np.ndarray:
+        """
+        Gather code points of the given strings into a padded block.
+
+        Args:
+            indices: String indices of shape (P,)
+            width: Block width (default: longest selected string)
+
+        Returns:
+            int64 array of shape (P, width), padded with -1
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        lengths = self.lengths[indices]
+        if width is None:
+            width = int(lengths.max()) if len(indices) else 0
+        columns = np.arange(width)
+        valid = columns < lengths[:, None]
+        positions = np.where(valid, self.offsets[indices][:, None] + columns, 0)
+        block = self.codes[positions] if len(self.codes) else np.zeros(positions.shape, dtype=np.int64)
+        return np.where(valid, block, _PAD)
+
+    @property
+    def bigrams(self) -> sparse.csr_matrix:
+        """Binary (N, V) CSR matrix of the character bigrams of each string."""
+        if self._bigrams is None:
+            vocabulary: Dict[str, int] = {}
+            indptr = [0]
+            indices: List[int] = []
+            for text in self.strings:
+                grams = {text[i : i + 2] for i in range(len(text) - 1)}
+                indices.extend(vocabulary.setdefault(g, len(vocabulary)) for g in grams)
+                indptr.append(len(indices))
+            self._bigrams = sparse.csr_matrix(
+                (np.ones(len(indices), dtype=np.int32), indices, indptr),
+                shape=(len(self.strings), max(1, len(vocabulary))),
+            )
+            self._bigram_counts = np.diff(self._bigrams.indptr)
+        return self._bigrams
+
+    @property
+    def bigram_counts(self) -> np.ndarray:
+        """Number of distinct bigrams per string."""
+        if self._bigram_counts is None:
+            _ = self.bigrams
+        return self._bigram_counts
+
+
+# ----------------------------------------------------------------------
+# Pair kernels: codes1/codes2 are (P, W) blocks, len1/len2 are (P,)
+# ----------------------------------------------------------------------
+
+
+def _levenshtein_kernel(codes1, len1, codes2, len2) -> np.ndarray:
+    """Levenshtein similarity ``1 - distance / max_len`` for aligned pairs."""
+    pairs, width2 = codes2.shape
+    columns = np.arange(width2 + 1)
+    previous = np.broadcast_to(columns, (pairs, width2 + 1)).copy()
+    step = np.empty_like(previous)
+    for i in range(codes1.shape[1]):
+        cost = codes2 != codes1[:, i : i + 1]
+        step[:, 0] = i + 1
+        np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost, out=step[:, 1:])
+        # current[j] = min(step[j], current[j - 1] + 1) as a running minimum
+        current = np.minimum.accumulate(step - columns, axis=1) + columns
+        active = (i < len1)[:, None]
+        previous = np.where(active, current, previous)
+
+    distance = previous[np.arange(pairs), len2]
+    max_len = np.maximum(len1, len2)
+    return 1.0 - distance / np.maximum(max_len, 1)
+
+
+def _jaro_winkler_kernel(codes1, len1, codes2, len2) -> np.ndarray:
+    """Jaro-Winkler similarity for aligned pairs (string 1 drives matching)."""
+    pairs, width2 = codes2.shape
+    width1 = codes1.shape[1]
+    window = np.maximum(np.maximum(len1, len2) // 2 - 1, 0)
+    columns = np.arange(width2)
+    matched1 = np.zeros((pairs, width1), dtype=bool)
+    matched2 = np.zeros((pairs, width2), dtype=bool)
+
+    for i in range(width1):
+        low = np.maximum(0, i - window)
+        high = np.minimum(i + window + 1, len2)
+        candidates = (
+            (codes2 == codes1[:, i : i + 1])
+            & ~matched2
+            & (columns >= low[:, None])
+            & (columns < high[:, None])
+        )
+        candidates &= (i < len1)[:, None]
+        rows = np.flatnonzero(candidates.any(axis=1))
+        if len(rows):
+            # First free matching position inside the window
+            first = candidates[rows].argmax(axis=1)
+            matched2[rows, first] = True
+            matched1[rows, i] = True
+
+    matches = matched1.sum(axis=1)
+
+    # Matched characters in order, compacted to the front of each row
+    sequence1 = np.take_along_axis(codes1, np.argsort(~matched1, axis=1, kind="stable"), axis=1)
+    sequence2 = np.take_along_axis(codes2, np.argsort(~matched2, axis=1, kind="stable"), axis=1)
+    common = min(width1, width2)
+    in_match = np.arange(common) < matches[:, None]
+    transpositions = ((sequence1[:, :common] != sequence2[:, :common]) & in_match).sum(axis=1)
+
+    jaro = np.zeros(pairs, dtype=np.float64)
+    found = matches > 0
+    m = matches[found].astype(np.float64)
+    jaro[found] = (
+        m / len1[found] + m / len2[found] + (m - transpositions[found] / 2) / m
+    ) / 3.0
+
+    prefix = _common_prefix(codes1, codes2, np.minimum(len1, len2))
+    return jaro + (prefix * 0.1) * (1 - jaro)
+
+
+def _common_prefix(codes1, codes2, min_len, limit: int = 4) -> np.ndarray:
+    """Common prefix length, capped at ``limit``."""
+    width = min(limit, codes1.shape[1], codes2.shape[1])
+    equal = (codes1[:, :width] == codes2[:, :width]) & (np.arange(width) < min_len[:, None])
+    return np.cumprod(equal, axis=1).sum(axis=1)
+
+
+def _run_chunked(kernel, left: EncodedStrings, left_idx, right: EncodedStrings, right_idx) -> np.ndarray:
+    """Run a pair kernel over length-sorted chunks of pairs."""
+    scores = np.zeros(len(left_idx), dtype=np.float64)
+    if not len(left_idx):
+        return scores
+    order = np.argsort(np.maximum(left.lengths[left_idx], right.lengths[right_idx]), kind="stable")
+    for start in range(0, len(order), _CHUNK_SIZE):
+        chunk = order[start : start + _CHUNK_SIZE]
+        li, ri = left_idx[chunk], right_idx[chunk]
+        scores[chunk] = kernel(left.padded(li), left.lengths[li], right.padded(ri), right.lengths[ri])
+    return scores
+
+
+def _bigram_similarity(left: EncodedStrings, left_idx, right: EncodedStrings, right_idx) -> np.ndarray:
+    """Bigram-set Jaccard similarity for aligned pairs."""
+    if not len(left_idx):
+        return np.zeros(0, dtype=np.float64)
+    if left is right:
+        matrix = left.bigrams
+        a, b = matrix[left_idx], matrix[right_idx]
+    else:
+        # Share one vocabulary so columns line up
+        combined = EncodedStrings([*left.strings, *right.strings])
+        matrix = combined.bigrams
+        a, b = matrix[left_idx], matrix[len(left) + right_idx]
+    intersection = np.asarray(a.multiply(b).sum(axis=1)).ravel()
+    count1 = np.diff(a.indptr)
+    count2 = np.diff(b.indptr)
+    union = count1 + count2 - intersection
+
+    scores = np.ones(len(left_idx), dtype=np.float64)
+    nonempty = union > 0
+    scores[nonempty] = intersection[nonempty] / union[nonempty]
+    return scores
+
+
+def string_similarity_pairs(
+    left: EncodedStrings,
+    left_idx: Sequence[int],
+    right: EncodedStrings,
+    right_idx: Sequence[int],
+    method: str = "jaro_winkler",
+) -> np.ndarray:
+    """
+    Score aligned string pairs ``(left[left_idx[p]], right[right_idx[p]])``.
+
+    Scores match SimilarityCalculator.calculate_string_similarity: 0.0 if
+    either string is empty, 1.0 if the normalized strings are equal, and the
+    chosen method otherwise (unknown methods fall back to Levenshtein).
+
+    Args:
+        left: Encoded left strings
+        left_idx: Left string index per pair
+        right: Encoded right strings
+        right_idx: Right string index per pair
+        method: "levenshtein", "jaro_winkler" or "cosine" (bigram Jaccard)
+
+    Returns:
+        float64 scores of shape (P,)
+    """
+    left_idx = np.asarray(left_idx, dtype=np.int64)
+    right_idx = np.asarray(right_idx, dtype=np.int64)
+    scores = np.zeros(len(left_idx), dtype=np.float64)
+
+    empty = left.raw_empty[left_idx] | right.raw_empty[right_idx]
+    equal = ~empty & (left.lengths[left_idx] == right.lengths[right_idx])
+    if equal.any():
+        candidates = np.flatnonzero(equal)
+        equal[candidates] = [
+            left.strings[a] == right.strings[b]
+            for a, b in zip(left_idx[candidates].tolist(), right_idx[candidates].tolist())
+        ]
+    scores[equal] = 1.0
+
+    todo = np.flatnonzero(~empty & ~equal)
+    if len(todo):
+        li, ri = left_idx[todo], right_idx[todo]
+        if method == "jaro_winkler":
+            scores[todo] = _run_chunked(_jaro_winkler_kernel, left, li, right, ri)
+        elif method == "cosine":
+            scores[todo] = _bigram_similarity(left, li, right, ri)
+        else:
+            scores[todo] = _run_chunked(_levenshtein_kernel, left, li, right, ri)
+    return scores
+
+
+def string_similarity_one_to_many(
+    query: str, candidates: Sequence[str], method: str = "jaro_winkler"
+) -> np.ndarray:
+    """
+    Score one query string against many candidate strings.
+
+    Args:
+        query: Query string
+        candidates: Candidate strings
+        method: "levenshtein", "jaro_winkler" or "cosine"
+
+    Returns:
+        float64 scores aligned with ``candidates``
+    """
+    encoded = EncodedStrings([query, *candidates])
+    count = len(candidates)
+    return string_similarity_pairs(
+        encoded, np.zeros(count, dtype=np.int64), encoded, np.arange(1, count + 1), method
+    )
+
+
+def string_similarity_matrix(
+    queries: Sequence[str], candidates: Sequence[str], method: str = "jaro_winkler"
+) -> np.ndarray:
+    """
+    Score every query against every candidate.
+
+    Args:
+        queries: Query strings
+        candidates: Candidate strings
+        method: "levenshtein", "jaro_winkler" or "cosine"
+
+    Returns:
+        float64 matrix of shape (len(queries), len(candidates))
+    """
+    left = EncodedStrings(queries)
+    right = EncodedStrings(candidates)
+    rows, cols = np.divmod(np.arange(len(queries) * len(candidates)), max(1, len(candidates)))
+    scores = string_similarity_pairs(left, rows, right, cols, method)
+    return scores.reshape(len(queries), len(candidates))
+
+
+def _string_upper_bound(
+    left: EncodedStrings, left_idx, right: EncodedStrings, right_idx, method: str
+) -> np.ndarray:
+    """Upper bound of the string score from lengths (and prefixes for Jaro-Winkler)."""
+    len1 = left.lengths[left_idx]
+    len2 = right.lengths[right_idx]
+    shorter = np.minimum(len1, len2).astype(np.float64)
+    longer = np.maximum(np.maximum(len1, len2), 1).astype(np.float64)
+
+    if method == "jaro_winkler":
+        jaro = np.where(
+            shorter > 0,
+            (shorter / np.maximum(len1, 1) + shorter / np.maximum(len2, 1) + 1.0) / 3.0,
+            0.0,
+        )
+        prefix = _common_prefix(left.padded(left_idx, 4), right.padded(right_idx, 4), np.minimum(len1, len2))
+        bound = jaro + (prefix * 0.1) * (1 - jaro)
+    elif method == "cosine":
+        count1 = left.bigram_counts[left_idx]
+        count2 = right.bigram_counts[right_idx]
+        bound = np.where(
+            np.maximum(count1, count2) > 0,
+            np.minimum(count1, count2) / np.maximum(np.maximum(count1, count2), 1),
+            1.0,
+        )
+    else:
+        bound = 1.0 - (longer - shorter) / longer
+
+    empty = left.raw_empty[left_idx] | right.raw_empty[right_idx]
+    return np.where(empty, 0.0, np.minimum(bound + 1e-12, 1.0))
+
+
+class EntityFeatureCache:
+    """
+    Per-entity similarity features, computed once and shared by all pairs.
+
+    Entities are dictionaries in the form SimilarityCalculator accepts
+    (optionally pre-processed with ``_lower_name`` and ``_hashable_rels``).
+    """
+
+    def __init__(self, entities: Sequence[Dict[str, Any]], calculator: Any = None):
+        """
+        Build feature cache.
+
+        Args:
+            entities: Entity dictionaries
+            calculator: SimilarityCalculator used to make relationships hashable
+        """
+        self.entities = entities
+        names = []
+        self.properties: List[Dict[str, Any]] = []
+        self.relationships: List[frozenset] = []
+        embeddings: List[Optional[np.ndarray]] = []
+        make_hashable = calculator._make_hashable if calculator is not None else _make_hashable
+
+        for entity in entities:
+            name = entity.get("_lower_name")
+            if name is None:
+                name = entity.get("name") or entity.get("text") or ""
+            names.append(name)
+            self.properties.append(entity.get("properties") or {})
+            if "_hashable_rels" in entity:
+                rels = entity["_hashable_rels"]
+            else:
+                rels = set(make_hashable(r) for r in entity.get("relationships", []))
+            self.relationships.append(frozenset(rels))
+            if entity.get("embedding") is not None:
+                embeddings.append(np.asarray(entity["embedding"], dtype=np.float64).ravel())
+            else:
+                embeddings.append(None)
+
+        self.names = EncodedStrings(names)
+        self.has_embedding = np.fromiter((e is not None for e in embeddings), dtype=bool, count=len(embeddings))
+        self.embeddings = embeddings
+        dimensions = {e.shape[0] for e in embeddings if e is not None}
+        # Stacked matrix when all embeddings share one dimension
+        self.embedding_matrix: Optional[np.ndarray] = None
+        self.embedding_dims = np.array([e.shape[0] if e is not None else -1 for e in embeddings], dtype=np.int64)
+        if len(dimensions) == 1:
+            dimension = dimensions.pop()
+            self.embedding_matrix = np.zeros((len(embeddings), dimension), dtype=np.float64)
+            rows = np.flatnonzero(self.has_embedding)
+            if len(rows):
+                self.embedding_matrix[rows] = np.vstack([embeddings[r] for r in rows])
+            self.embedding_norms = np.linalg.norm(self.embedding_matrix, axis=1)
+
+        self._encode_properties()
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def _encode_properties(self) -> None:
+        """
+        Encode properties as per-key columns of interned value IDs.
+
+        For every property key, ``property_rows[key]`` holds the sorted entity
+        indices that have the key and ``property_codes[key]`` the value ID per
+        row (-1 for None). Equal hashable values share an ID; unhashable and
+        NaN values get a fresh ID each and are compared in Python.
+        """
+        value_ids: Dict[Any, int] = {}
+        values: List[Any] = []
+        unhashable: List[bool] = []
+        rows: Dict[Any, List[int]] = {}
+        codes: Dict[Any, List[int]] = {}
+
+        for row, props in enumerate(self.properties):
+            for key, value in props.items():
+                if value is None:
+                    code = -1
+                else:
+                    code = None
+                    try:
+                        if value == value:
+                            code = value_ids.setdefault(value, len(values))
+                    except (TypeError, ValueError):
+                        pass
+                    if code is None or code == len(values):
+                        unhashable.append(code is None)
+                        code = len(values)
+                        values.append(value)
+                rows.setdefault(key, []).append(row)
+                codes.setdefault(key, []).append(code)
+
+        self.property_values = values
+        self.property_value_ids = value_ids
+        self.property_unhashable = np.array(unhashable, dtype=bool)
+        self.property_is_str = np.fromiter(
+            (isinstance(v, str) for v in values), dtype=bool, count=len(values)
+        )
+        self.property_rows = {k: np.array(v, dtype=np.int64) for k, v in rows.items()}
+        self.property_codes = {k: np.array(v, dtype=np.int64) for k, v in codes.items()}
+        self._property_strings: Optional[EncodedStrings] = None
+
+    @property
+    def property_strings(self) -> EncodedStrings:
+        """Encoded string property values, indexed by value ID."""
+        if self._property_strings is None:
+            self._property_strings = EncodedStrings(
+                [v if isinstance(v, str) else "" for v in self.property_values]
+            )
+        return self._property_strings
+
+    def property_lookup(self, key: Any, idx: np.ndarray) -> np.ndarray:
+        """Value IDs of a property for entity indices (-2 = key absent, -1 = None)."""
+        rows = self.property_rows.get(key)
+        if rows is None:
+            return np.full(len(idx), -2, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(rows, idx), len(rows) - 1)
+        return np.where(rows[pos] == idx, self.property_codes[key][pos], -2)
+
+
+def _make_hashable(item: Any) -> Any:
+    if isinstance(item, dict):
+        return tuple(sorted((k, _make_hashable(v)) for k, v in item.items()))
+    if isinstance(item, list):
+        return tuple(_make_hashable(x) for x in item)
+    return item
+
+
+class BatchSimilarityEngine:
+    """
+    Vectorized entity pair scoring with SimilarityCalculator semantics.
+
+    ``score_pairs`` returns, for every pair, the same score
+    ``calculator.calculate_similarity(left, right, track=False).score`` would
+    (up to float rounding in the property and embedding components),
+    except that pairs whose upper bound is below ``min_score`` are returned
+    as 0.0 without being evaluated.
+    """
+
+    def __init__(self, calculator: Any, string_method: str = "jaro_winkler"):
+        """
+        Initialize engine.
+
+        Args:
+            calculator: SimilarityCalculator providing weights and thresholds
+            string_method: Method used for names and string properties
+        """
+        self.calculator = calculator
+        self.string_method = string_method
+
+    def build_cache(self, entities: Sequence[Dict[str, Any]]) -> EntityFeatureCache:
+        """Build a feature cache for entities."""
+        return EntityFeatureCache(entities, self.calculator)
+
+    def _upper_bound(self, string_bound: np.ndarray, has_embedding: np.ndarray) -> np.ndarray:
+        """Upper bound of the overall score given a string-score bound."""
+        calc = self.calculator
+        ws, wp, wr, we = (
+            calc.string_weight,
+            calc.property_weight,
+            calc.relationship_weight,
+            calc.embedding_weight,
+        )
+        base_total = ws + wp + wr
+        without = (string_bound * ws + wp + wr) / base_total if base_total > 0 else string_bound * ws + wp + wr
+        with_total = base_total + we
+        with_embedding = (
+            (string_bound * ws + wp + wr + we) / with_total if with_total > 0 else without
+        )
+        bound = np.where(has_embedding, np.maximum(without, with_embedding), without)
+        # Short-circuit scores are un-normalized string scores
+        return np.maximum(bound, string_bound * ws) + 1e-9
+
+    def score_pairs(
+        self,
+        left: EntityFeatureCache,
+        left_idx: Sequence[int],
+        right: EntityFeatureCache,
+        right_idx: Sequence[int],
+        min_score: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Score aligned entity pairs ``(left[left_idx[p]], right[right_idx[p]])``.
+
+        Args:
+            left: Feature cache of the first entities of each pair
+            left_idx: Index into ``left`` per pair
+            right: Feature cache of the second entities of each pair
+            right_idx: Index into ``right`` per pair
+            min_score: Pairs whose upper bound is below this are scored 0.0
+                without evaluation (None = evaluate every pair)
+
+        Returns:
+            float64 scores of shape (P,)
+        """
+        calc = self.calculator
+        left_idx = np.asarray(left_idx, dtype=np.int64)
+        right_idx = np.asarray(right_idx, dtype=np.int64)
+        scores = np.zeros(len(left_idx), dtype=np.float64)
+        has_embedding = left.has_embedding[left_idx] & right.has_embedding[right_idx]
+
+        todo = np.arange(len(left_idx))
+        if min_score is not None and len(todo):
+            bound = _string_upper_bound(left.names, left_idx, right.names, right_idx, self.string_method)
+            todo = np.flatnonzero(self._upper_bound(bound, has_embedding) >= min_score)
+        if not len(todo):
+            return scores
+
+        li, ri, emb = left_idx[todo], right_idx[todo], has_embedding[todo]
+        string = string_similarity_pairs(left.names, li, right.names, ri, self.string_method)
+
+        # Short-circuit exactly as calculate_similarity does
+        short = np.zeros(len(todo), dtype=bool)
+        if calc.string_weight > 0.5:
+            rough = string * calc.string_weight
+            short = (string < 0.3) & ~emb & (rough < calc.similarity_threshold * 0.5)
+            scores[todo[short]] = rough[short]
+
+        full = np.flatnonzero(~short)
+        if not len(full):
+            return scores
+        li, ri, emb, string = li[full], ri[full], emb[full], string[full]
+
+        prop = self._property_similarity(left, li, right, ri)
+        rel = np.fromiter(
+            (
+                _jaccard(left.relationships[a], right.relationships[b])
+                for a, b in zip(li.tolist(), ri.tolist())
+            ),
+            dtype=np.float64,
+            count=len(li),
+        )
+        embedding = self._embedding_similarity(left, li, right, ri, emb)
+
+        ws, wp, wr = calc.string_weight, calc.property_weight, calc.relationship_weight
+        we = np.where(emb & (embedding > 0), calc.embedding_weight, 0.0)
+        total = np.where(emb, ws + wp + wr + we, ws + wp + wr)
+        normalize = total > 0
+        safe_total = np.where(normalize, total, 1.0)
+        nws = np.where(normalize, ws / safe_total, ws)
+        nwp = np.where(normalize, wp / safe_total, wp)
+        nwr = np.where(normalize, wr / safe_total, wr)
+        nwe = np.where(normalize, we / safe_total, we)
+
+        overall = string * nws + prop * nwp + rel * nwr
+        overall = np.where(emb, overall + embedding * nwe, overall)
+        scores[todo[full]] = overall
+        return scores
+
+    def _property_similarity(self, left, li, right, ri) -> np.ndarray:
+        """
+        Property similarity from the caches' per-key value columns.
+
+        Each key present in either entity contributes 0.5 when a value is
+        missing or None, the string similarity when both values are strings,
+        and 1.0/0.5 for equal/unequal other values; the score is the mean
+        contribution (1.0 when neither entity has properties). String pairs
+        of all keys are deduplicated and scored in one kernel call.
+        """
+        count = len(li)
+        matches = np.zeros(count, dtype=np.float64)
+        totals = np.zeros(count, dtype=np.int64)
+        value_map = self._value_map(left, right)
+        str_pos: List[np.ndarray] = []
+        str_left: List[np.ndarray] = []
+        str_right: List[np.ndarray] = []
+
+        for key in dict.fromkeys([*left.property_rows, *right.property_rows]):
+            c1 = left.property_lookup(key, li)
+            c2 = right.property_lookup(key, ri)
+            present = (c1 != -2) | (c2 != -2)
+            if not present.any():
+                continue
+            totals += present
+            matches += np.where(present & ((c1 < 0) | (c2 < 0)), 0.5, 0.0)
+
+            both = np.flatnonzero((c1 >= 0) & (c2 >= 0))
+            if not len(both):
+                continue
+            v1, v2 = c1[both], c2[both]
+            strings = left.property_is_str[v1] & right.property_is_str[v2]
+            if strings.any():
+                str_pos.append(both[strings])
+                str_left.append(v1[strings])
+                str_right.append(v2[strings])
+
+            other = ~strings
+            pos, v1, v2 = both[other], v1[other], v2[other]
+            equal = value_map[v2] == v1
+            slow = np.flatnonzero(left.property_unhashable[v1] | right.property_unhashable[v2])
+            for p in slow.tolist():
+                equal[p] = bool(left.property_values[v1[p]] == right.property_values[v2[p]])
+            matches[pos] += np.where(equal, 1.0, 0.5)
+
+        if str_pos:
+            pos = np.concatenate(str_pos)
+            v1 = np.concatenate(str_left)
+            v2 = np.concatenate(str_right)
+            pair_codes, inverse = np.unique(
+                v1 * (len(right.property_values) + 1) + v2, return_inverse=True
+            )
+            unique_left, unique_right = np.divmod(pair_codes, len(right.property_values) + 1)
+            scores = string_similarity_pairs(
+                left.property_strings, unique_left, right.property_strings, unique_right
+            )
+            np.add.at(matches, pos, scores[inverse.ravel()])
+
+        return np.where(totals > 0, matches / np.maximum(totals, 1), 1.0)
+
+    @staticmethod
+    def _value_map(left: EntityFeatureCache, right: EntityFeatureCache) -> np.ndarray:
+        """Map right-cache value IDs to equal left-cache value IDs (-1 if none)."""
+        if left is right:
+            return np.arange(len(right.property_values), dtype=np.int64)
+        mapping = np.full(len(right.property_values), -1, dtype=np.int64)
+        for code, value in enumerate(right.property_values):
+            if not right.property_unhashable[code]:
+                mapping[code] = left.property_value_ids.get(value, -1)
+        return mapping
+
+    def _embedding_similarity(self, left, li, right, ri, emb) -> np.ndarray:
+        """Embedding similarity mapped to 0-1, for pairs where both have embeddings."""
+        result = np.zeros(len(li), dtype=np.float64)
+        rows = np.flatnonzero(emb)
+        if not len(rows):
+            return result
+        a, b = li[rows], ri[rows]
+        same_dim = left.embedding_dims[a] == right.embedding_dims[b]
+
+        if (
+            left.embedding_matrix is not None
+            and right.embedding_matrix is not None
+            and left.embedding_matrix.shape[1] == right.embedding_matrix.shape[1]
+        ):
+            ok = rows[same_dim]
+            a, b = li[ok], ri[ok]
+            dots = np.einsum("ij,ij->i", left.embedding_matrix[a], right.embedding_matrix[b])
+            norms = left.embedding_norms[a] * right.embedding_norms[b]
+            nonzero = norms > 0
+            cosine = np.divide(dots, norms, out=np.zeros_like(dots), where=nonzero)
+            result[ok] = np.where(nonzero, (cosine + 1) / 2, 0.0)
+            return result
+
+        for row, x, y in zip(rows[same_dim].tolist(), a[same_dim].tolist(), b[same_dim].tolist()):
+            v1, v2 = left.embeddings[x], right.embeddings[y]
+            norm = np.linalg.norm(v1) * np.linalg.norm(v2)
+            result[row] = (float(v1 @ v2) / norm + 1) / 2 if norm > 0 else 0.0
+        return result
+
+
+def _jaccard(rels1: frozenset, rels2: frozenset) -> float:
+    """Relationship Jaccard with calculate_relationship_similarity's edge cases."""
+    if not rels1 and not rels2:
+        return 0.5
+    if not rels1 or not rels2:
+        return 0.0
+    return len(rels1 & rels2) / len(rels1 | rels2)
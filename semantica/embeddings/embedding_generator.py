@@ -84,9 +84,6 @@ class EmbeddingGenerator:
         from ..utils.progress_tracker import get_progress_tracker
 
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.info("Embedding generator initialized")
 
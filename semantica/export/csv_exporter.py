@@ -91,9 +91,6 @@ class CSVExporter:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug(
             f"CSV exporter initialized: delimiter='{delimiter}', "
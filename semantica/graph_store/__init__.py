@@ -39,7 +39,8 @@ Graph Query Execution:
     - Graph Traversal: BFS/DFS traversal, shortest path algorithms,
       path finding
     - Aggregation: COUNT, SUM, AVG, MIN, MAX operations, GROUP BY support
-    - Query Optimization: Query caching, execution plan analysis,
+    - Query Optimization: Bounded LRU/TTL query caching invalidated by
+      write generations, execution plan analysis,
       index utilization
 
 Graph Analytics:
@@ -58,6 +59,9 @@ Store Backends:
     - FalkorDB Store: Redis-based graph database, sparse matrix
       representation, linear algebra queries, OpenCypher support,
       ultra-fast performance
+    - Embedded Store: Integer node IDs, CSR adjacency grouped by
+      relationship type, label/property hash indexes, vectorized BFS,
+      union-find connected components, memory-mapped .npy persistence
 
 Bulk Operations:
     - Batch Processing: Chunking algorithm (fixed-size batch creation),
@@ -84,6 +88,8 @@ Main Classes:
     - GraphManager: Graph store management and operations
     - Neo4jStore: Neo4j integration store
     - FalkorDBStore: FalkorDB integration store
+    - EmbeddedGraphStore: In-process store with CSR adjacency and
+      memory-mapped persistence
     - NodeManager: Node CRUD operations
     - RelationshipManager: Relationship CRUD operations
     - QueryEngine: Cypher query execution and optimization
@@ -130,6 +136,7 @@ from .amazon_neptune import (
     NeptuneTransaction,
 )
 from .config import GraphStoreConfig, graph_store_config
+from .embedded_store import EmbeddedGraphStore
 from .falkordb_store import FalkorDBClient, FalkorDBGraph, FalkorDBStore
 from .graph_store import (
     GraphAnalytics,
@@ -182,6 +189,8 @@ __all__ = [
     "FalkorDBStore",
     "FalkorDBClient",
     "FalkorDBGraph",
+    # Embedded
+    "EmbeddedGraphStore",
     # Convenience functions
     "create_node",
     "create_nodes",
@@ -542,9 +542,6 @@ class AmazonNeptuneStore:
         self.config = config
         self.progress_tracker = get_progress_tracker()
 
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Check dependencies
         if not NEO4J_AVAILABLE:
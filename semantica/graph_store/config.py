@@ -118,12 +118,17 @@ class GraphStoreConfig:
             "GRAPH_STORE_BATCH_SIZE": "batch_size",
             "GRAPH_STORE_TIMEOUT": "timeout",
             "GRAPH_STORE_MAX_RETRIES": "max_retries",
+            "GRAPH_STORE_QUERY_CACHE_SIZE": "query_cache_size",
+            "GRAPH_STORE_QUERY_CACHE_TTL": "query_cache_ttl",
+            "GRAPH_STORE_QUERY_CACHE_MAX_BYTES": "query_cache_max_bytes",
             # Neo4j settings
             "GRAPH_STORE_NEO4J_URI": "neo4j_uri",
             "GRAPH_STORE_NEO4J_USER": "neo4j_user",
             "GRAPH_STORE_NEO4J_PASSWORD": "neo4j_password",
             "GRAPH_STORE_NEO4J_DATABASE": "neo4j_database",
             "GRAPH_STORE_NEO4J_ENCRYPTED": "neo4j_encrypted",
+            "GRAPH_STORE_NEO4J_WRITE_SESSIONS": "neo4j_write_sessions",
+            "GRAPH_STORE_NEO4J_MAX_CONNECTION_POOL_SIZE": "neo4j_max_connection_pool_size",
             # FalkorDB settings
             "GRAPH_STORE_FALKORDB_HOST": "falkordb_host",
             "GRAPH_STORE_FALKORDB_PORT": "falkordb_port",
@@ -138,6 +143,9 @@ class GraphStoreConfig:
             "AWS_ACCESS_KEY_ID": "neptune_access_key",
             "AWS_SECRET_ACCESS_KEY": "neptune_secret_key",
             "AWS_SESSION_TOKEN": "neptune_session_token",
+            # Embedded store settings
+            "GRAPH_STORE_EMBEDDED_PATH": "embedded_path",
+            "GRAPH_STORE_EMBEDDED_MMAP": "embedded_mmap",
         }
 
         for env_var, config_key in env_mappings.items():
@@ -150,6 +158,10 @@ class GraphStoreConfig:
                     "max_retries",
                     "falkordb_port",
                     "neptune_port",
+                    "neo4j_write_sessions",
+                    "neo4j_max_connection_pool_size",
+                    "query_cache_size",
+                    "query_cache_max_bytes",
                 ]:
                     try:
                         self._config[config_key] = int(value)
@@ -157,10 +169,18 @@ class GraphStoreConfig:
                         self.logger.warning(
                             f"Invalid integer value for {env_var}: {value}"
                         )
+                elif config_key == "query_cache_ttl":
+                    try:
+                        self._config[config_key] = float(value)
+                    except ValueError:
+                        self.logger.warning(
+                            f"Invalid number value for {env_var}: {value}"
+                        )
                 elif config_key in [
                     "neo4j_encrypted",
                     "neptune_iam_auth",
                     "neptune_use_ssl",
+                    "embedded_mmap",
                 ]:
                     self._config[config_key] = value.lower() in [
                         "true",
@@ -179,12 +199,17 @@ class GraphStoreConfig:
             "batch_size": 1000,
             "timeout": 30,
             "max_retries": 3,
+            "query_cache_size": 1000,
+            "query_cache_ttl": None,
+            "query_cache_max_bytes": None,
             # Neo4j defaults
             "neo4j_uri": "bolt://localhost:7687",
             "neo4j_user": "neo4j",
             "neo4j_password": "password",
             "neo4j_database": "neo4j",
             "neo4j_encrypted": False,
+            "neo4j_write_sessions": 1,
+            "neo4j_max_connection_pool_size": None,
             # FalkorDB defaults
             "falkordb_host": "localhost",
             "falkordb_port": 6379,
@@ -199,6 +224,9 @@ class GraphStoreConfig:
             "neptune_access_key": None,
             "neptune_secret_key": None,
             "neptune_session_token": None,
+            # Embedded store defaults
+            "embedded_path": None,
+            "embedded_mmap": True,
         }
 
         for key, default_value in defaults.items():
@@ -281,6 +309,11 @@ class GraphStoreConfig:
             "password": self._config.get("neo4j_password"),
             "database": self._config.get("neo4j_database"),
             "encrypted": self._config.get("neo4j_encrypted"),
+            "batch_size": self._config.get("batch_size"),
+            "write_sessions": self._config.get("neo4j_write_sessions"),
+            "max_connection_pool_size": self._config.get(
+                "neo4j_max_connection_pool_size"
+            ),
         }
 
     def get_falkordb_config(self) -> Dict[str, Any]:
@@ -315,6 +348,18 @@ class GraphStoreConfig:
             "session_token": self._config.get("neptune_session_token"),
         }
 
+    def get_embedded_config(self) -> Dict[str, Any]:
+        """
+        Get embedded store configuration.
+
+        Returns:
+            Embedded store configuration dictionary
+        """
+        return {
+            "path": self._config.get("embedded_path"),
+            "mmap": self._config.get("embedded_mmap"),
+        }
+
     def reset(self) -> None:
         """Reset configuration to defaults."""
         self._config.clear()
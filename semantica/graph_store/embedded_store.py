@@ -0,0 +1,1028 @@
+"""
+Embedded Graph Store Module
+
+This module provides an in-process property graph backend for GraphStore,
+so graphs can be stored, traversed and analysed without an external database
+server. It suits single-node deployments and tests.
+
+Algorithms Used:
+    - Dense Integer IDs: Nodes and relationships are numbered 0..n-1;
+      deletions are tombstones, so IDs are never reused
+    - CSR Adjacency: Outgoing and incoming relationship IDs sorted by
+      (node, relationship type) with an index pointer array, rebuilt lazily
+      after writes; relationship type filters select within a node's row
+    - Hash Indexes: Label -> node set and property value -> node set
+      (``id`` is always indexed; more via create_index)
+    - Level-synchronous BFS: Vectorized frontier expansion over the CSR for
+      get_neighbors and shortest_path
+    - Degree Centrality: np.bincount over the relationship endpoint arrays
+    - Connected Components: Vectorized union-find (min-label hooking with
+      pointer jumping) over the relationship arrays
+    - Persistence: Arrays saved as .npy files and memory-mapped on load;
+      labels and properties as JSON
+
+Key Features:
+    - Same node, relationship and analytics surface as the Neo4j store
+    - Bulk creates with optional upsert by ``id``
+    - No Cypher: use the node, relationship and analytics methods
+    - Thread-safe writes
+
+Main Classes:
+    - EmbeddedGraphStore: In-process graph store backend
+
+Example Usage:
+    >>> from semantica.graph_store import GraphStore
+    >>> store = GraphStore(backend="embedded", path="./graph_data")
+    >>> store.connect()
+    >>> a = store.create_node(["Person"], {"id": "alice", "name": "Alice"})
+    >>> b = store.create_node(["Person"], {"id": "bob", "name": "Bob"})
+    >>> store.create_relationship(a["id"], b["id"], "KNOWS")
+    >>> path = store.shortest_path(a["id"], b["id"])
+    >>> store.close()  # saves to ./graph_data
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import json
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from ..utils.exceptions import ProcessingError, ValidationError
+from ..utils.logging import get_logger
+from ..utils.progress_tracker import get_progress_tracker
+
+_FORMAT_VERSION = 1
+_ARRAYS = (
+    "edge_src",
+    "edge_dst",
+    "edge_type",
+    "deleted_nodes",
+    "deleted_edges",
+    "out_indptr",
+    "out_edges",
+    "in_indptr",
+    "in_edges",
+)
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
+
+
+class EmbeddedGraphStore:
+    """
+    In-process property graph store.
+
+    • Integer node and relationship IDs
+    • CSR adjacency per direction, grouped by relationship type
+    • Label and property hash indexes
+    • Native traversal, degree centrality and connected components
+    • Save/load as memory-mappable arrays
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, **config):
+        """
+        Initialize embedded graph store.
+
+        Args:
+            path: Directory to load from on connect and save to on close
+                (optional; in-memory only when omitted)
+            **config: Additional configuration options:
+                - autosave: Save to ``path`` on close (default True)
+                - mmap: Memory-map arrays when loading (default True)
+                - indexed_properties: Property keys to index besides ``id``
+        """
+        self.logger = get_logger("embedded_graph_store")
+        self.progress_tracker = get_progress_tracker()
+        self.config = config
+        self.path = Path(path or config.get("path")) if (path or config.get("path")) else None
+        self.autosave = config.get("autosave", True)
+        self.mmap = config.get("mmap", True)
+        self.lock = threading.RLock()
+        self._reset()
+        for key in config.get("indexed_properties") or []:
+            self._prop_index.setdefault(key, {})
+        self._loaded = False
+
+    def _reset(self) -> None:
+        self._labels: List[Tuple[str, ...]] = []
+        self._props: List[Dict[str, Any]] = []
+        self._deleted_nodes: Set[int] = set()
+        # Relationship columns: arrays (possibly memory-mapped) + appended tail
+        self._src_base = np.zeros(0, dtype=np.int64)
+        self._dst_base = np.zeros(0, dtype=np.int64)
+        self._type_base = np.zeros(0, dtype=np.int32)
+        self._src_tail = array("q")
+        self._dst_tail = array("q")
+        self._type_tail = array("i")
+        self._rel_props: List[Dict[str, Any]] = []
+        self._deleted_edges: Set[int] = set()
+        self._rel_types: List[str] = []
+        self._rel_type_codes: Dict[str, int] = {}
+        self._label_index: Dict[str, Set[int]] = {}
+        self._prop_index: Dict[str, Dict[Any, Set[int]]] = {"id": {}}
+        self._edge_keys: Optional[Dict[Tuple[int, int, int], int]] = None
+        self._csr: Optional[Dict[str, np.ndarray]] = None
+        self._dirty = False
+
+    # Lifecycle
+
+    def connect(self, **options) -> bool:
+        """Load the saved graph from ``path`` if there is one."""
+        with self.lock:
+            if not self._loaded and self.path is not None and (self.path / "meta.json").exists():
+                self.load(self.path)
+            self._loaded = True
+        return True
+
+    def close(self) -> None:
+        """Save to ``path`` (when set, autosave is on and there are changes)."""
+        with self.lock:
+            if self.path is not None and self.autosave and self._dirty:
+                self.save(self.path)
+
+    # Internal helpers
+
+    @property
+    def node_count(self) -> int:
+        """Number of live nodes."""
+        return len(self._labels) - len(self._deleted_nodes)
+
+    @property
+    def relationship_count(self) -> int:
+        """Number of live relationships."""
+        return len(self._rel_props) - len(self._deleted_edges)
+
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Relationship (src, dst, type) arrays, folding in appended rows."""
+        if len(self._src_tail):
+            self._src_base = np.concatenate(
+                [self._src_base, np.frombuffer(self._src_tail, dtype=np.int64)]
+            )
+            self._dst_base = np.concatenate(
+                [self._dst_base, np.frombuffer(self._dst_tail, dtype=np.int64)]
+            )
+            self._type_base = np.concatenate(
+                [self._type_base, np.frombuffer(self._type_tail, dtype=np.int32)]
+            )
+            self._src_tail = array("q")
+            self._dst_tail = array("q")
+            self._type_tail = array("i")
+        return self._src_base, self._dst_base, self._type_base
+
+    def _edge(self, rel_id: int) -> Tuple[int, int, int]:
+        base = len(self._src_base)
+        if rel_id < base:
+            return (
+                int(self._src_base[rel_id]),
+                int(self._dst_base[rel_id]),
+                int(self._type_base[rel_id]),
+            )
+        i = rel_id - base
+        return self._src_tail[i], self._dst_tail[i], self._type_tail[i]
+
+    def _node_exists(self, node_id: Any) -> bool:
+        return (
+            isinstance(node_id, (int, np.integer))
+            and 0 <= node_id < len(self._labels)
+            and int(node_id) not in self._deleted_nodes
+        )
+
+    def _rel_exists(self, rel_id: Any) -> bool:
+        return (
+            isinstance(rel_id, (int, np.integer))
+            and 0 <= rel_id < len(self._rel_props)
+            and int(rel_id) not in self._deleted_edges
+        )
+
+    def _node_dict(self, node_id: int) -> Dict[str, Any]:
+        return {
+            "id": int(node_id),
+            "labels": list(self._labels[node_id]),
+            "properties": dict(self._props[node_id]),
+        }
+
+    def _rel_dict(self, rel_id: int) -> Dict[str, Any]:
+        src, dst, code = self._edge(rel_id)
+        return {
+            "id": int(rel_id),
+            "type": self._rel_types[code],
+            "start_node_id": src,
+            "end_node_id": dst,
+            "properties": dict(self._rel_props[rel_id]),
+        }
+
+    def _index_node(self, node_id: int, add: bool = True) -> None:
+        for label in self._labels[node_id]:
+            nodes = self._label_index.setdefault(label, set())
+            nodes.add(node_id) if add else nodes.discard(node_id)
+        props = self._props[node_id]
+        for key, index in self._prop_index.items():
+            value = props.get(key)
+            if value is not None and _hashable(value):
+                nodes = index.setdefault(value, set())
+                nodes.add(node_id) if add else nodes.discard(node_id)
+
+    def _type_code(self, rel_type: str) -> int:
+        code = self._rel_type_codes.get(rel_type)
+        if code is None:
+            code = self._rel_type_codes[rel_type] = len(self._rel_types)
+            self._rel_types.append(rel_type)
+        return code
+
+    def _changed(self) -> None:
+        self._csr = None
+        self._dirty = True
+
+    def _adjacency(self) -> Dict[str, np.ndarray]:
+        """CSR arrays over live relationships, rebuilt after writes."""
+        with self.lock:
+            if self._csr is not None:
+                return self._csr
+            src, dst, types = self._columns()
+            n = len(self._labels)
+            live = np.ones(len(src), dtype=bool)
+            if self._deleted_edges:
+                live[np.fromiter(self._deleted_edges, dtype=np.int64)] = False
+            live_ids = np.flatnonzero(live)
+            csr: Dict[str, np.ndarray] = {}
+            for side, key in (("out", src), ("in", dst)):
+                order = live_ids[np.lexsort((types[live_ids], key[live_ids]))]
+                counts = np.bincount(key[order], minlength=n)
+                indptr = np.zeros(n + 1, dtype=np.int64)
+                np.cumsum(counts, out=indptr[1:])
+                csr[f"{side}_indptr"] = indptr
+                csr[f"{side}_edges"] = order
+            self._csr = csr
+            return csr
+
+    def _expand(
+        self,
+        frontier: np.ndarray,
+        direction: str,
+        type_code: Optional[int],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All relationships leaving ``frontier`` nodes.
+
+        Returns:
+            (origin node, neighbor node, relationship ID) arrays
+        """
+        csr = self._adjacency()
+        src, dst, types = self._columns()
+        origins, neighbors, rels = [], [], []
+        sides = {"out": ("out",), "in": ("in",)}.get(direction, ("out", "in"))
+        for side in sides:
+            indptr = csr[f"{side}_indptr"]
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            edge_ids = csr[f"{side}_edges"][positions]
+            origin = np.repeat(frontier, counts)
+            if type_code is not None:
+                keep = types[edge_ids] == type_code
+                edge_ids, origin = edge_ids[keep], origin[keep]
+            origins.append(origin)
+            neighbors.append(dst[edge_ids] if side == "out" else src[edge_ids])
+            rels.append(edge_ids)
+        if not rels:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        return np.concatenate(origins), np.concatenate(neighbors), np.concatenate(rels)
+
+    def _type_filter(self, rel_type: Optional[str]) -> Optional[int]:
+        if rel_type is None:
+            return None
+        # Unknown types match nothing
+        return self._rel_type_codes.get(rel_type, -1)
+
+    def _candidates(
+        self, labels: Optional[List[str]], properties: Optional[Dict[str, Any]]
+    ) -> Iterable[int]:
+        sets: List[Set[int]] = []
+        for label in labels or []:
+            sets.append(self._label_index.get(label, set()))
+        unindexed = {}
+        for key, value in (properties or {}).items():
+            if key in self._prop_index and _hashable(value):
+                sets.append(self._prop_index[key].get(value, set()))
+            else:
+                unindexed[key] = value
+        if sets:
+            sets.sort(key=len)
+            candidates: Iterable[int] = sorted(set.intersection(*sets))
+        else:
+            candidates = (
+                i for i in range(len(self._labels)) if i not in self._deleted_nodes
+            )
+        for node_id in candidates:
+            props = self._props[node_id]
+            if all(props.get(k) == v for k, v in unindexed.items()):
+                yield node_id
+
+    # Nodes
+
+    def create_node(
+        self,
+        labels: List[str],
+        properties: Dict[str, Any],
+        **options,
+    ) -> Dict[str, Any]:
+        """
+        Create a node in the graph.
+
+        Args:
+            labels: Node labels
+            properties: Node properties
+            **options: Additional options
+
+        Returns:
+            Created node information including ID
+        """
+        return self.create_nodes(
+            [{"labels": labels, "properties": properties}], **options
+        )[0]
+
+    def create_nodes(
+        self,
+        nodes: List[Dict[str, Any]],
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create multiple nodes in batch.
+
+        Args:
+            nodes: List of node dictionaries with 'labels' and 'properties'
+            **options: Additional options:
+                - merge: Upsert nodes that have an ``id`` property: an
+                  existing node with the same labels and ``id`` gets the
+                  properties merged in (default False)
+
+        Returns:
+            List of created (or merged) node information, in input order
+        """
+        merge = options.get("merge", False)
+        created = []
+        with self.lock:
+            for node in nodes:
+                labels = tuple(node.get("labels") or ["Node"])
+                properties = dict(node.get("properties") or {})
+                node_id = None
+                if merge and _hashable(properties.get("id")):
+                    node_id = next(
+                        (
+                            i
+                            for i in self._prop_index["id"].get(properties.get("id"), ())
+                            if set(labels) <= set(self._labels[i])
+                        ),
+                        None,
+                    )
+                if node_id is not None:
+                    self._index_node(node_id, add=False)
+                    self._props[node_id].update(properties)
+                else:
+                    node_id = len(self._labels)
+                    self._labels.append(labels)
+                    self._props.append(properties)
+                self._index_node(node_id)
+                created.append(self._node_dict(node_id))
+            self._changed()
+        return created
+
+    def get_node(self, node_id: int, **options) -> Optional[Dict[str, Any]]:
+        """Get a node by ID, or None if not found."""
+        with self.lock:
+            return self._node_dict(int(node_id)) if self._node_exists(node_id) else None
+
+    def get_nodes(
+        self,
+        labels: Optional[List[str]] = None,
+        properties: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get nodes matching labels and property values.
+
+        Indexed properties are looked up in their hash index; other
+        properties are compared on the remaining candidates.
+        """
+        with self.lock:
+            nodes = []
+            for node_id in self._candidates(labels, properties):
+                if len(nodes) >= limit:
+                    break
+                nodes.append(self._node_dict(node_id))
+            return nodes
+
+    def update_node(
+        self,
+        node_id: int,
+        properties: Dict[str, Any],
+        merge: bool = True,
+        **options,
+    ) -> Dict[str, Any]:
+        """Update (merge or replace) a node's properties."""
+        with self.lock:
+            if not self._node_exists(node_id):
+                raise ProcessingError(f"Node with ID {node_id} not found")
+            self._index_node(node_id, add=False)
+            if merge:
+                self._props[node_id].update(properties)
+            else:
+                self._props[node_id] = dict(properties)
+            self._index_node(node_id)
+            self._dirty = True
+            return self._node_dict(node_id)
+
+    def delete_node(self, node_id: int, detach: bool = True, **options) -> bool:
+        """
+        Delete a node.
+
+        Args:
+            node_id: Node ID
+            detach: Also delete its relationships; without detach a node
+                that still has relationships is not deleted
+            **options: Additional options
+
+        Returns:
+            True if deleted
+        """
+        with self.lock:
+            if not self._node_exists(node_id):
+                return False
+            _, _, rels = self._expand(np.array([node_id], dtype=np.int64), "both", None)
+            if len(rels) and not detach:
+                raise ProcessingError(
+                    f"Node {node_id} still has relationships; delete with detach=True"
+                )
+            for rel_id in rels.tolist():
+                self._drop_relationship(rel_id)
+            self._index_node(node_id, add=False)
+            self._deleted_nodes.add(int(node_id))
+            self._changed()
+            return True
+
+    # Relationships
+
+    def create_relationship(
+        self,
+        start_node_id: int,
+        end_node_id: int,
+        rel_type: str,
+        properties: Optional[Dict[str, Any]] = None,
+        **options,
+    ) -> Dict[str, Any]:
+        """Create a relationship between two nodes."""
+        created = self.create_relationships(
+            [
+                {
+                    "start_node_id": start_node_id,
+                    "end_node_id": end_node_id,
+                    "type": rel_type,
+                    "properties": properties,
+                }
+            ],
+            **options,
+        )
+        if not created:
+            raise ProcessingError("Failed to create relationship - nodes not found")
+        return created[0]
+
+    def create_relationships(
+        self,
+        relationships: List[Dict[str, Any]],
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create multiple relationships in batch.
+
+        Args:
+            relationships: List of relationship dictionaries with
+                'start_node_id' / 'end_node_id' (or 'start_id' / 'end_id',
+                'source_id' / 'target_id'), 'type' and optional 'properties'
+            **options: Additional options:
+                - match_on: "internal" (default) to use node IDs, or a
+                  property key such as "id"
+                - node_label: Label of the endpoint nodes when matching on a
+                  property
+                - merge: Update an existing relationship of the same type
+                  between the same nodes instead of adding another
+
+        Returns:
+            List of created relationship information, in input order;
+            relationships whose endpoints do not exist are skipped
+        """
+        match_on = options.get("match_on", "internal")
+        node_label = options.get("node_label")
+        merge = options.get("merge", False)
+        tracking_id = self.progress_tracker.start_tracking(
+            module="graph_store",
+            submodule="EmbeddedGraphStore",
+            message=f"Creating {len(relationships)} relationships",
+        )
+
+        with self.lock:
+            if match_on != "internal":
+                self.create_index(node_label or "", match_on)
+
+            def resolve(value: Any) -> List[int]:
+                if match_on == "internal":
+                    return [int(value)] if self._node_exists(value) else []
+                if not _hashable(value):
+                    return []
+                return sorted(
+                    node_id
+                    for node_id in self._prop_index[match_on].get(value, ())
+                    if node_label is None or node_label in self._labels[node_id]
+                )
+
+            if merge and self._edge_keys is None:
+                src, dst, types = self._columns()
+                self._edge_keys = {
+                    (int(s), int(d), int(t)): rel_id
+                    for rel_id, (s, d, t) in enumerate(zip(src, dst, types))
+                    if rel_id not in self._deleted_edges
+                }
+
+            created = []
+            for rel in relationships:
+                start = next(
+                    (rel[k] for k in ("start_node_id", "start_id", "source_id") if k in rel),
+                    None,
+                )
+                end = next(
+                    (rel[k] for k in ("end_node_id", "end_id", "target_id") if k in rel),
+                    None,
+                )
+                code = self._type_code(rel.get("type") or rel.get("rel_type") or "RELATED_TO")
+                properties = dict(rel.get("properties") or {})
+                for a in resolve(start):
+                    for b in resolve(end):
+                        rel_id = self._edge_keys.get((a, b, code)) if merge else None
+                        if rel_id is not None:
+                            self._rel_props[rel_id].update(properties)
+                        else:
+                            rel_id = len(self._rel_props)
+                            self._src_tail.append(a)
+                            self._dst_tail.append(b)
+                            self._type_tail.append(code)
+                            self._rel_props.append(properties)
+                            if self._edge_keys is not None:
+                                self._edge_keys[(a, b, code)] = rel_id
+                        created.append(self._rel_dict(rel_id))
+            self._changed()
+
+        self.progress_tracker.stop_tracking(
+            tracking_id,
+            status="completed",
+            message=f"Created {len(created)} relationships",
+        )
+        return created
+
+    def get_relationships(
+        self,
+        node_id: Optional[int] = None,
+        rel_type: Optional[str] = None,
+        direction: str = "both",
+        limit: int = 100,
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """Get relationships of a node (or of the whole graph)."""
+        with self.lock:
+            code = self._type_filter(rel_type)
+            if node_id is None:
+                rel_ids: Iterable[int] = (
+                    rel_id
+                    for rel_id in range(len(self._rel_props))
+                    if rel_id not in self._deleted_edges
+                    and (code is None or self._edge(rel_id)[2] == code)
+                )
+            elif not self._node_exists(node_id):
+                return []
+            else:
+                _, _, rels = self._expand(
+                    np.array([node_id], dtype=np.int64), direction, code
+                )
+                # A self-loop appears on both sides
+                rel_ids = dict.fromkeys(rels.tolist())
+            result = []
+            for rel_id in rel_ids:
+                if len(result) >= limit:
+                    break
+                result.append(self._rel_dict(rel_id))
+            return result
+
+    def _drop_relationship(self, rel_id: int) -> None:
+        self._deleted_edges.add(int(rel_id))
+        if self._edge_keys is not None:
+            src, dst, code = self._edge(rel_id)
+            if self._edge_keys.get((src, dst, code)) == rel_id:
+                del self._edge_keys[(src, dst, code)]
+
+    def delete_relationship(self, rel_id: int, **options) -> bool:
+        """Delete a relationship."""
+        with self.lock:
+            if not self._rel_exists(rel_id):
+                return False
+            self._drop_relationship(rel_id)
+            self._changed()
+            return True
+
+    # Queries and analytics
+
+    def execute_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        **options,
+    ) -> Dict[str, Any]:
+        """Cypher is not supported by the embedded backend."""
+        raise ProcessingError(
+            "The embedded graph store does not execute Cypher queries; "
+            "use the node, relationship and analytics methods"
+        )
+
+    def get_neighbors(
+        self,
+        node_id: int,
+        rel_type: Optional[str] = None,
+        direction: str = "both",
+        depth: int = 1,
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get nodes within ``depth`` hops, nearest first.
+
+        Args:
+            node_id: Starting node ID
+            rel_type: Filter by relationship type
+            direction: Direction ("in", "out", "both")
+            depth: Traversal depth
+            **options: Additional options
+
+        Returns:
+            List of neighboring nodes
+        """
+        with self.lock:
+            if not self._node_exists(node_id):
+                return []
+            code = self._type_filter(rel_type)
+            visited = np.zeros(len(self._labels), dtype=bool)
+            visited[node_id] = True
+            frontier = np.array([node_id], dtype=np.int64)
+            found: List[int] = []
+            for _ in range(depth):
+                _, neighbors, _ = self._expand(frontier, direction, code)
+                frontier = np.unique(neighbors[~visited[neighbors]])
+                if not len(frontier):
+                    break
+                visited[frontier] = True
+                found.extend(frontier.tolist())
+            return [self._node_dict(n) for n in found]
+
+    def shortest_path(
+        self,
+        start_node_id: int,
+        end_node_id: int,
+        rel_type: Optional[str] = None,
+        max_depth: int = 10,
+        **options,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Shortest undirected path by breadth-first search.
+
+        Args:
+            start_node_id: Starting node ID
+            end_node_id: Ending node ID
+            rel_type: Filter by relationship type
+            max_depth: Maximum path length
+            **options: ``direction`` ("both" by default, "out" or "in")
+
+        Returns:
+            Path with ``length``, ``nodes`` and ``relationships``, or None
+        """
+        with self.lock:
+            if not (self._node_exists(start_node_id) and self._node_exists(end_node_id)):
+                return None
+            code = self._type_filter(rel_type)
+            n = len(self._labels)
+            parent_node = np.full(n, -1, dtype=np.int64)
+            parent_rel = np.full(n, -1, dtype=np.int64)
+            visited = np.zeros(n, dtype=bool)
+            visited[start_node_id] = True
+            frontier = np.array([start_node_id], dtype=np.int64)
+            depth = 0
+            while not visited[end_node_id] and len(frontier) and depth < max_depth:
+                origins, neighbors, rels = self._expand(
+                    frontier, options.get("direction", "both"), code
+                )
+                fresh = ~visited[neighbors]
+                nodes, first = np.unique(neighbors[fresh], return_index=True)
+                parent_node[nodes] = origins[fresh][first]
+                parent_rel[nodes] = rels[fresh][first]
+                visited[nodes] = True
+                frontier = nodes
+                depth += 1
+            if not visited[end_node_id]:
+                return None
+
+            path_nodes, path_rels = [int(end_node_id)], []
+            while path_nodes[-1] != start_node_id:
+                path_rels.append(int(parent_rel[path_nodes[-1]]))
+                path_nodes.append(int(parent_node[path_nodes[-1]]))
+            path_nodes.reverse()
+            path_rels.reverse()
+            return {
+                "length": len(path_rels),
+                "nodes": [self._node_dict(node) for node in path_nodes],
+                "relationships": [
+                    {
+                        "id": rel_id,
+                        "type": self._rel_types[self._edge(rel_id)[2]],
+                        "properties": dict(self._rel_props[rel_id]),
+                    }
+                    for rel_id in path_rels
+                ],
+            }
+
+    def _live_edges(
+        self, rel_type: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        csr = self._adjacency()
+        src, dst, types = self._columns()
+        edge_ids = csr["out_edges"]
+        code = self._type_filter(rel_type)
+        if code is not None:
+            edge_ids = edge_ids[types[edge_ids] == code]
+        return src[edge_ids], dst[edge_ids]
+
+    def _node_mask(self, labels: Optional[List[str]]) -> np.ndarray:
+        mask = np.zeros(len(self._labels), dtype=bool)
+        if labels:
+            members = set.intersection(
+                *(self._label_index.get(label, set()) for label in labels)
+            )
+            mask[list(members)] = True
+        else:
+            mask[:] = True
+            if self._deleted_nodes:
+                mask[list(self._deleted_nodes)] = False
+        return mask
+
+    def degree_centrality(
+        self,
+        labels: Optional[List[str]] = None,
+        rel_type: Optional[str] = None,
+        direction: str = "both",
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Degree of each node, highest first.
+
+        Args:
+            labels: Filter by node labels
+            rel_type: Filter by relationship type
+            direction: Direction ("in", "out", "both")
+            **options: Additional options
+
+        Returns:
+            Nodes with a ``degree`` entry
+        """
+        with self.lock:
+            n = len(self._labels)
+            src, dst = self._live_edges(rel_type)
+            degree = np.zeros(n, dtype=np.int64)
+            if direction in ("out", "both"):
+                degree += np.bincount(src, minlength=n)
+            if direction in ("in", "both"):
+                degree += np.bincount(dst, minlength=n)
+            nodes = np.flatnonzero(self._node_mask(labels))
+            nodes = nodes[np.argsort(-degree[nodes], kind="stable")]
+            return [
+                {**self._node_dict(node), "degree": int(degree[node])}
+                for node in nodes.tolist()
+            ]
+
+    def connected_components(
+        self,
+        labels: Optional[List[str]] = None,
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Weakly connected components, largest first.
+
+        Args:
+            labels: Restrict to the subgraph of nodes with these labels
+            **options: ``rel_type`` to use only one relationship type
+
+        Returns:
+            List of ``{"component": index, "nodes": [node IDs]}``
+        """
+        with self.lock:
+            mask = self._node_mask(labels)
+            src, dst = self._live_edges(options.get("rel_type"))
+            keep = mask[src] & mask[dst]
+            src, dst = src[keep], dst[keep]
+
+            parent = np.arange(len(self._labels), dtype=np.int64)
+            while True:
+                root_src, root_dst = parent[src], parent[dst]
+                differ = root_src != root_dst
+                if not differ.any():
+                    break
+                low = np.minimum(root_src[differ], root_dst[differ])
+                high = np.maximum(root_src[differ], root_dst[differ])
+                # Hook each root onto its smallest neighbouring root
+                np.minimum.at(parent, high, low)
+                while True:
+                    jumped = parent[parent]
+                    if np.array_equal(jumped, parent):
+                        break
+                    parent = jumped
+
+            nodes = np.flatnonzero(mask)
+            roots = parent[nodes]
+            order = np.argsort(roots, kind="stable")
+            nodes, roots = nodes[order], roots[order]
+            boundaries = np.flatnonzero(np.diff(roots)) + 1
+            groups = sorted(np.split(nodes, boundaries), key=len, reverse=True)
+            return [
+                {"component": i, "nodes": group.tolist()}
+                for i, group in enumerate(groups)
+                if len(group)
+            ]
+
+    def create_index(
+        self,
+        label: str,
+        property_name: str,
+        index_type: str = "btree",
+        **options,
+    ) -> bool:
+        """
+        Index a property for lookups by value.
+
+        Property indexes cover all nodes regardless of ``label``; the label
+        index always exists.
+        """
+        with self.lock:
+            if property_name in self._prop_index:
+                return True
+            index: Dict[Any, Set[int]] = {}
+            for node_id, props in enumerate(self._props):
+                value = props.get(property_name)
+                if (
+                    node_id not in self._deleted_nodes
+                    and value is not None
+                    and _hashable(value)
+                ):
+                    index.setdefault(value, set()).add(node_id)
+            self._prop_index[property_name] = index
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get graph statistics."""
+        with self.lock:
+            src, dst = self._live_edges()
+            _, _, types = self._columns()
+            type_counts = np.bincount(
+                types[self._adjacency()["out_edges"]], minlength=len(self._rel_types)
+            )
+            return {
+                "node_count": self.node_count,
+                "relationship_count": self.relationship_count,
+                "label_counts": {
+                    label: len(nodes) for label, nodes in self._label_index.items() if nodes
+                },
+                "relationship_type_counts": {
+                    rel_type: int(count)
+                    for rel_type, count in zip(self._rel_types, type_counts)
+                    if count
+                },
+                "indexed_properties": sorted(self._prop_index),
+            }
+
+    # Persistence
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Save the graph to a directory.
+
+        Relationship columns, tombstones and CSR arrays are written as .npy
+        files (memory-mapped by load); labels and properties as JSON.
+
+        Args:
+            path: Target directory (default: ``path`` of the store)
+
+        Returns:
+            The directory written
+        """
+        target = Path(path or self.path or "")
+        if not str(target):
+            raise ValidationError("No path given for saving the embedded graph store")
+        with self.lock:
+            target.mkdir(parents=True, exist_ok=True)
+            src, dst, types = self._columns()
+            csr = self._adjacency()
+            arrays = {
+                "edge_src": src,
+                "edge_dst": dst,
+                "edge_type": types,
+                "deleted_nodes": np.array(sorted(self._deleted_nodes), dtype=np.int64),
+                "deleted_edges": np.array(sorted(self._deleted_edges), dtype=np.int64),
+                **csr,
+            }
+            for name in _ARRAYS:
+                # Write then rename, so memory maps of the old file stay valid
+                tmp = target / f"{name}.tmp.npy"
+                np.save(tmp, arrays[name])
+                tmp.replace(target / f"{name}.npy")
+            with open(target / "nodes.json", "w", encoding="utf-8") as f:
+                json.dump(
+                    {"labels": self._labels, "properties": self._props}, f, default=str
+                )
+            with open(target / "relationships.json", "w", encoding="utf-8") as f:
+                json.dump(self._rel_props, f, default=str)
+            with open(target / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": _FORMAT_VERSION,
+                        "relationship_types": self._rel_types,
+                        "indexed_properties": sorted(self._prop_index),
+                    },
+                    f,
+                )
+            self._dirty = False
+        self.logger.info(
+            f"Saved embedded graph ({self.node_count} nodes, "
+            f"{self.relationship_count} relationships) to {target}"
+        )
+        return target
+
+    def load(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Load a graph saved with ``save``, replacing the current contents.
+
+        Arrays are memory-mapped read-only when ``mmap`` is enabled; writes
+        after loading append to in-memory columns.
+
+        Args:
+            path: Source directory (default: ``path`` of the store)
+        """
+        source = Path(path or self.path or "")
+        if not (source / "meta.json").exists():
+            raise ValidationError(f"No embedded graph store found at {source}")
+        with open(source / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != _FORMAT_VERSION:
+            raise ValidationError(
+                f"Unsupported embedded graph format version: {meta.get('version')}"
+            )
+        mmap_mode = "r" if self.mmap else None
+        arrays = {
+            name: np.load(source / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in _ARRAYS
+        }
+        with open(source / "nodes.json", encoding="utf-8") as f:
+            nodes = json.load(f)
+        with open(source / "relationships.json", encoding="utf-8") as f:
+            rel_props = json.load(f)
+
+        with self.lock:
+            self._reset()
+            self._labels = [tuple(labels) for labels in nodes["labels"]]
+            self._props = nodes["properties"]
+            self._rel_props = rel_props
+            self._rel_types = list(meta["relationship_types"])
+            self._rel_type_codes = {t: i for i, t in enumerate(self._rel_types)}
+            self._src_base = arrays["edge_src"]
+            self._dst_base = arrays["edge_dst"]
+            self._type_base = arrays["edge_type"]
+            self._deleted_nodes = set(arrays["deleted_nodes"].tolist())
+            self._deleted_edges = set(arrays["deleted_edges"].tolist())
+            self._csr = {
+                name: arrays[name]
+                for name in ("out_indptr", "out_edges", "in_indptr", "in_edges")
+            }
+            self._prop_index = {key: {} for key in meta["indexed_properties"]}
+            for node_id in range(len(self._labels)):
+                if node_id not in self._deleted_nodes:
+                    self._index_node(node_id)
+            self._loaded = True
+        self.logger.info(
+            f"Loaded embedded graph ({self.node_count} nodes, "
+            f"{self.relationship_count} relationships) from {source}"
+        )
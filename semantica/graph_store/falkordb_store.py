@@ -212,9 +212,6 @@ class FalkorDBStore:
         self.logger = get_logger("falkordb_store")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.host = host or config.get("host", "localhost")
         self.port = port or config.get("port", 6379)
@@ -32,8 +32,10 @@ Author: Semantica Contributors
 License: MIT
 """
 
+import re
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from ..utils.cache import QueryCache, WriteGeneration, make_cache_key
 from ..utils.exceptions import ValidationError
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
@@ -43,14 +45,17 @@ from .config import graph_store_config
 class NodeManager:
     """Manager for node CRUD operations."""
 
-    def __init__(self, backend: Any):
+    def __init__(self, backend: Any, generation: Optional[WriteGeneration] = None):
         """
         Initialize node manager.
 
         Args:
             backend: Graph database backend instance
+            generation: Write generation bumped after every write (shared
+                with the QueryEngine to invalidate cached results)
         """
         self.backend = backend
+        self.generation = generation or WriteGeneration()
         self.logger = get_logger("node_manager")
 
     def create(
@@ -70,7 +75,10 @@ class NodeManager:
         Returns:
             Created node information
         """
-        return self.backend.create_node(labels, properties, **options)
+        try:
+            return self.backend.create_node(labels, properties, **options)
+        finally:
+            self.generation.bump()
 
     def create_batch(
         self,
@@ -87,7 +95,10 @@ class NodeManager:
         Returns:
             List of created node information
         """
-        return self.backend.create_nodes(nodes, **options)
+        try:
+            return self.backend.create_nodes(nodes, **options)
+        finally:
+            self.generation.bump()
 
     def get(
         self,
@@ -133,7 +144,10 @@ class NodeManager:
         Returns:
             Updated node information
         """
-        return self.backend.update_node(node_id, properties, merge, **options)
+        try:
+            return self.backend.update_node(node_id, properties, merge, **options)
+        finally:
+            self.generation.bump()
 
     def delete(
         self,
@@ -152,20 +166,26 @@ class NodeManager:
         Returns:
             True if deleted
         """
-        return self.backend.delete_node(node_id, detach, **options)
+        try:
+            return self.backend.delete_node(node_id, detach, **options)
+        finally:
+            self.generation.bump()
 
 
 class RelationshipManager:
     """Manager for relationship CRUD operations."""
 
-    def __init__(self, backend: Any):
+    def __init__(self, backend: Any, generation: Optional[WriteGeneration] = None):
         """
         Initialize relationship manager.
 
         Args:
             backend: Graph database backend instance
+            generation: Write generation bumped after every write (shared
+                with the QueryEngine to invalidate cached results)
         """
         self.backend = backend
+        self.generation = generation or WriteGeneration()
         self.logger = get_logger("relationship_manager")
 
     def create(
@@ -189,9 +209,47 @@ class RelationshipManager:
         Returns:
             Created relationship information
         """
-        return self.backend.create_relationship(
-            start_node_id, end_node_id, rel_type, properties, **options
-        )
+        try:
+            return self.backend.create_relationship(
+                start_node_id, end_node_id, rel_type, properties, **options
+            )
+        finally:
+            self.generation.bump()
+
+    def create_batch(
+        self,
+        relationships: List[Dict[str, Any]],
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create multiple relationships in batch.
+
+        Uses the backend's bulk ``create_relationships`` when it has one,
+        otherwise creates the relationships one at a time.
+
+        Args:
+            relationships: List of relationship dictionaries with
+                'start_node_id', 'end_node_id', 'type' and optional 'properties'
+            **options: Additional options
+
+        Returns:
+            List of created relationship information
+        """
+        try:
+            if hasattr(self.backend, "create_relationships"):
+                return self.backend.create_relationships(relationships, **options)
+            return [
+                self.backend.create_relationship(
+                    rel["start_node_id"],
+                    rel["end_node_id"],
+                    rel.get("type", "RELATED_TO"),
+                    rel.get("properties"),
+                    **options,
+                )
+                for rel in relationships
+            ]
+        finally:
+            self.generation.bump()
 
     def get(
         self,
@@ -233,22 +291,45 @@ class RelationshipManager:
         Returns:
             True if deleted
         """
-        return self.backend.delete_relationship(rel_id, **options)
+        try:
+            return self.backend.delete_relationship(rel_id, **options)
+        finally:
+            self.generation.bump()
 
 
 class QueryEngine:
     """Engine for query execution and optimization."""
 
-    def __init__(self, backend: Any):
+    # Cypher clauses that modify the graph
+    _WRITE_CLAUSE = re.compile(
+        r"\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP|LOAD\s+CSV)\b", re.IGNORECASE
+    )
+
+    def __init__(
+        self,
+        backend: Any,
+        generation: Optional[WriteGeneration] = None,
+        cache_size: int = 1000,
+        cache_ttl: Optional[float] = None,
+        cache_max_bytes: Optional[int] = None,
+    ):
         """
         Initialize query engine.
 
         Args:
             backend: Graph database backend instance
+            generation: Write generation of the store; cached results from
+                before the latest write are not served
+            cache_size: Maximum number of cached results
+            cache_ttl: Seconds a cached result stays valid (default: no expiry)
+            cache_max_bytes: Maximum estimated size of cached results
         """
         self.backend = backend
         self.logger = get_logger("query_engine")
-        self._cache: Dict[str, Any] = {}
+        self.generation = generation or WriteGeneration()
+        self._cache = QueryCache(
+            max_entries=cache_size, max_bytes=cache_max_bytes, ttl=cache_ttl
+        )
         self._cache_enabled = True
 
     def execute(
@@ -261,27 +342,41 @@ class QueryEngine:
         """
         Execute a Cypher/OpenCypher query.
 
+        Write queries are never cached and invalidate all cached results.
+
         Args:
             query: Query string
             parameters: Query parameters
             use_cache: Whether to use query caching
-            **options: Additional options
+            **options: Additional options (``cache_ttl`` overrides the TTL of
+                this result)
 
         Returns:
             Query results
         """
-        # Check cache
-        if use_cache and self._cache_enabled:
+        cache_ttl = options.pop("cache_ttl", self._cache.ttl)
+        if self._WRITE_CLAUSE.search(query):
+            try:
+                return self.backend.execute_query(query, parameters, **options)
+            finally:
+                self.generation.bump()
+
+        # Check cache; the generation is read before executing, so a write
+        # that lands while the query runs makes its result stale
+        use_cache = use_cache and self._cache_enabled
+        if use_cache:
             cache_key = self._generate_cache_key(query, parameters)
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            generation = int(self.generation)
+            cached = self._cache.get(cache_key, generation=generation)
+            if cached is not None:
+                return cached
 
         # Execute query
         result = self.backend.execute_query(query, parameters, **options)
 
         # Cache result
-        if use_cache and self._cache_enabled:
-            self._cache[cache_key] = result
+        if use_cache:
+            self._cache.put(cache_key, result, generation=generation, ttl=cache_ttl)
 
         return result
 
@@ -291,15 +386,16 @@ class QueryEngine:
         parameters: Optional[Dict[str, Any]],
     ) -> str:
         """Generate cache key for query."""
-        import hashlib
-
-        key_str = f"{query}:{str(parameters)}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return make_cache_key(query, parameters)
 
     def clear_cache(self) -> None:
         """Clear query cache."""
         self._cache.clear()
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get query cache statistics (entries, bytes, hits, misses, ...)."""
+        return self._cache.stats()
+
     def enable_cache(self) -> None:
         """Enable query caching."""
         self._cache_enabled = True
@@ -391,6 +487,12 @@ class GraphAnalytics:
         Returns:
             List of nodes with centrality scores
         """
+        # Backends with native analytics (embedded store) compute it directly
+        if hasattr(self.backend, "degree_centrality"):
+            return self.backend.degree_centrality(
+                labels=labels, rel_type=rel_type, direction=direction, **options
+            )
+
         # Build query based on direction
         if labels:
             label_str = ":".join(labels)
@@ -448,7 +550,10 @@ class GraphAnalytics:
         """
         backend_type = type(self.backend).__name__
 
-        if "Neo4j" in backend_type:
+        if hasattr(self.backend, "connected_components"):
+            return self.backend.connected_components(labels=labels, **options)
+
+        elif "Neo4j" in backend_type:
             query = """
             CALL gds.wcc.stream({
                 nodeProjection: $label,
@@ -481,18 +586,21 @@ class GraphAnalytics:
 class GraphManager:
     """Manager for graph store operations."""
 
-    def __init__(self, backend: Any):
+    def __init__(self, backend: Any, **cache_options):
         """
         Initialize graph manager.
 
         Args:
             backend: Graph database backend instance
+            **cache_options: Query cache options (cache_size, cache_ttl,
+                cache_max_bytes)
         """
         self.backend = backend
         self.logger = get_logger("graph_manager")
-        self.nodes = NodeManager(backend)
-        self.relationships = RelationshipManager(backend)
-        self.query_engine = QueryEngine(backend)
+        self.generation = WriteGeneration()
+        self.nodes = NodeManager(backend, self.generation)
+        self.relationships = RelationshipManager(backend, self.generation)
+        self.query_engine = QueryEngine(backend, self.generation, **cache_options)
         self.analytics = GraphAnalytics(backend)
 
     def get_stats(self) -> Dict[str, Any]:
@@ -526,7 +634,8 @@ class GraphStore:
     Main graph store interface.
 
     Provides a unified interface for working with property graph databases,
-    supporting Neo4j and FalkorDB backends.
+    supporting Neo4j, FalkorDB, Amazon Neptune and the in-process embedded
+    backends.
     """
 
     def __init__(
@@ -538,14 +647,11 @@ class GraphStore:
         Initialize graph store.
 
         Args:
-            backend: Backend type ("neo4j", "falkordb")
+            backend: Backend type ("neo4j", "falkordb", "neptune", "embedded")
             **config: Backend-specific configuration
         """
         self.logger = get_logger("graph_store")
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Determine backend
         self.backend = (
@@ -583,10 +689,28 @@ class GraphStore:
             neptune_config.update(self.config)
             self._store_backend = AmazonNeptuneStore(**neptune_config)
 
+        elif self.backend == "embedded":
+            from .embedded_store import EmbeddedGraphStore
+
+            embedded_config = graph_store_config.get_embedded_config()
+            embedded_config.update(self.config)
+            self._store_backend = EmbeddedGraphStore(**embedded_config)
+
         else:
             raise ValidationError(f"Unknown backend: {self.backend}")
 
-        self._manager = GraphManager(self._store_backend)
+        self._manager = GraphManager(
+            self._store_backend,
+            cache_size=self.config.get(
+                "query_cache_size", graph_store_config.get("query_cache_size", 1000)
+            ),
+            cache_ttl=self.config.get(
+                "query_cache_ttl", graph_store_config.get("query_cache_ttl")
+            ),
+            cache_max_bytes=self.config.get(
+                "query_cache_max_bytes", graph_store_config.get("query_cache_max_bytes")
+            ),
+        )
 
     def connect(self, **options) -> bool:
         """
@@ -685,6 +809,14 @@ class GraphStore:
             start_node_id, end_node_id, rel_type, properties, **options
         )
 
+    def create_relationships(
+        self,
+        relationships: List[Dict[str, Any]],
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """Create multiple relationships."""
+        return self._manager.relationships.create_batch(relationships, **options)
+
     def get_relationships(
         self,
         node_id: Optional[Union[int, str]] = None,
@@ -851,6 +983,12 @@ class GraphStore:
         """
         Add edges (Compatibility method).
 
+        Backends with a bulk ``create_relationships`` (Neo4j) write the edges
+        in batches. Endpoints are matched by internal node ID when every ID
+        is an integer, and otherwise on the ``id`` property set by add_nodes
+        (override with ``match_on``). If a batch fails, edges from batches
+        committed before it are still counted.
+
         Args:
             edges: List of edge dictionaries
             **options: Additional options
@@ -858,6 +996,35 @@ class GraphStore:
         Returns:
             Number of edges created
         """
+        if hasattr(self._store_backend, "create_relationships"):
+            relationships = []
+            for edge in edges:
+                properties = edge.get("properties", {}).copy()
+                if "weight" in edge:
+                    properties["weight"] = edge["weight"]
+                if edge.get("source_id") and edge.get("target_id"):
+                    relationships.append(
+                        {
+                            "start_node_id": edge["source_id"],
+                            "end_node_id": edge["target_id"],
+                            "type": edge.get("type", "RELATED_TO"),
+                            "properties": properties,
+                        }
+                    )
+            if "match_on" not in options and not all(
+                isinstance(rel[key], int) and not isinstance(rel[key], bool)
+                for rel in relationships
+                for key in ("start_node_id", "end_node_id")
+            ):
+                options["match_on"] = "id"
+            try:
+                return len(self.create_relationships(relationships, **options))
+            except Exception as e:
+                written = getattr(e, "output_data", None)
+                count = len(written) if isinstance(written, list) else 0
+                self.logger.warning(f"Failed to add edges ({count} written): {e}")
+                return count
+
         count = 0
         for edge in edges:
             source_id = edge.get("source_id")
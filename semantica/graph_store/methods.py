@@ -287,17 +287,18 @@ def create_relationships(
 
     # Default implementation
     store = _get_store()
-    created = []
-    for rel in relationships:
-        result = store.create_relationship(
-            rel["start_id"],
-            rel["end_id"],
-            rel["type"],
-            rel.get("properties"),
-            **options,
-        )
-        created.append(result)
-    return created
+    return store.create_relationships(
+        [
+            {
+                "start_node_id": rel["start_id"],
+                "end_node_id": rel["end_id"],
+                "type": rel["type"],
+                "properties": rel.get("properties"),
+            }
+            for rel in relationships
+        ],
+        **options,
+    )
 
 
 def get_relationships(
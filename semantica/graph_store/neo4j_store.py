@@ -13,6 +13,8 @@ Key Features:
     - Index and constraint management
     - Graph algorithms via GDS library
     - Batch operations with progress tracking
+    - Bulk writes: UNWIND batches grouped by label set / relationship type,
+      optional MERGE upserts on ``id`` and parallel write sessions
     - Optional dependency handling
 
 Main Classes:
@@ -27,13 +29,16 @@ Example Usage:
     >>> store.connect()
     >>> node_id = store.create_node(labels=["Person"], properties={"name": "Alice"})
     >>> results = store.execute_query("MATCH (p:Person) RETURN p.name")
+    >>> store.create_nodes(nodes, merge=True, batch_size=5000, parallel_sessions=4)
+    >>> store.create_relationships(edges, match_on="id")
     >>> store.close()
 
 Author: Semantica Contributors
 License: MIT
 """
 
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..utils.exceptions import ProcessingError, ValidationError
 from ..utils.logging import get_logger
@@ -59,6 +64,11 @@ except (ImportError, OSError):
     TransactionError = Exception
 
 
+def _cypher_name(name: str) -> str:
+    """Quote a label, relationship type or property key for Cypher."""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
 class Neo4jDriver:
     """Neo4j driver wrapper."""
 
@@ -252,15 +262,15 @@ class Neo4jStore:
         self.logger = get_logger("neo4j_store")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.uri = uri or config.get("uri", "bolt://localhost:7687")
         self.user = user or config.get("user", "neo4j")
         self.password = password or config.get("password", "password")
         self.database = database or config.get("database", "neo4j")
         self.encrypted = config.get("encrypted", False)
+        self.batch_size = int(config.get("batch_size") or 1000)
+        self.write_sessions = int(config.get("write_sessions") or 1)
+        self.max_connection_pool_size = config.get("max_connection_pool_size")
 
         self._driver: Optional[Neo4jDriver] = None
         self._session: Optional[Neo4jSession] = None
@@ -299,6 +309,12 @@ class Neo4jStore:
         user = user or self.user
         password = password or self.password
 
+        if self.max_connection_pool_size:
+            options.setdefault(
+                "max_connection_pool_size",
+                max(int(self.max_connection_pool_size), self.write_sessions),
+            )
+
         try:
             driver = GraphDatabase.driver(uri, auth=(user, password), **options)
             self._driver = Neo4jDriver(driver)
@@ -403,12 +419,25 @@ class Neo4jStore:
         """
         Create multiple nodes in batch.
 
+        Nodes are grouped by label set and written with one
+        ``UNWIND $rows AS row CREATE ...`` query per batch instead of one
+        query per node.
+
         Args:
             nodes: List of node dictionaries with 'labels' and 'properties'
-            **options: Additional options
+            **options: Additional options:
+                - batch_size: Rows per query (default: store ``batch_size``)
+                - merge: Upsert nodes that have an ``id`` property with
+                  ``MERGE (n:Labels {id: ...}) SET n += props`` (default False)
+                - parallel_sessions: Concurrent write sessions (default:
+                  store ``write_sessions``)
 
         Returns:
-            List of created node information
+            List of created node information, in input order
+
+        Raises:
+            ProcessingError: If a write fails; its ``output_data`` lists the
+                nodes that batches committed before the failure created
         """
         tracking_id = self.progress_tracker.start_tracking(
             module="graph_store",
@@ -417,25 +446,33 @@ class Neo4jStore:
         )
 
         try:
-            created_nodes = []
-
-            with self.get_session() as session:
-                for node in nodes:
-                    labels = node.get("labels", [])
-                    properties = node.get("properties", {})
-
-                    label_str = ":".join(labels) if labels else "Node"
-                    query = f"CREATE (n:{label_str} $props) RETURN id(n) as id, n"
+            merge = options.get("merge", False)
+            groups: Dict[Tuple[Tuple[str, ...], bool], List[Dict[str, Any]]] = {}
+            for idx, node in enumerate(nodes):
+                labels = tuple(node.get("labels") or ["Node"])
+                properties = node.get("properties", {})
+                upsert = bool(merge) and properties.get("id") is not None
+                groups.setdefault((labels, upsert), []).append(
+                    {"idx": idx, "props": properties}
+                )
 
-                    result = session.run(query, {"props": properties})
-                    record = result.single()
+            queries = []
+            for (labels, upsert), rows in groups.items():
+                label_str = ":".join(_cypher_name(label) for label in labels)
+                if upsert:
+                    write = f"MERGE (n:{label_str} {{id: row.props.id}}) SET n += row.props"
+                else:
+                    write = f"CREATE (n:{label_str}) SET n = row.props"
+                queries.append(
+                    (
+                        f"UNWIND $rows AS row {write} "
+                        "RETURN row.idx AS idx, id(n) AS id, properties(n) AS props",
+                        rows,
+                    )
+                )
 
-                    if record:
-                        created_nodes.append({
-                            "id": record["id"],
-                            "labels": labels,
-                            "properties": dict(record["n"]),
-                        })
+            written = self._write_batches(queries, tracking_id, len(nodes), **options)
+            created_nodes = self._created_nodes(nodes, written)
 
             self.progress_tracker.stop_tracking(
                 tracking_id,
@@ -448,7 +485,129 @@ class Neo4jStore:
             self.progress_tracker.stop_tracking(
                 tracking_id, status="failed", message=str(e)
             )
-            raise ProcessingError(f"Failed to create nodes: {str(e)}")
+            error = ProcessingError(f"Failed to create nodes: {str(e)}")
+            if isinstance(getattr(e, "output_data", None), dict):
+                # Nodes from batches committed before the failure
+                error.output_data = self._created_nodes(nodes, e.output_data)
+            raise error
+
+    @staticmethod
+    def _created_nodes(
+        nodes: List[Dict[str, Any]], written: Dict[int, Tuple[Any, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Created node information of the written input rows, in input order."""
+        return [
+            {
+                "id": written[idx][0],
+                "labels": node.get("labels", []),
+                "properties": written[idx][1],
+            }
+            for idx, node in enumerate(nodes)
+            if idx in written
+        ]
+
+    def _write_batches(
+        self,
+        queries: List[Tuple[str, List[Dict[str, Any]]]],
+        tracking_id: str,
+        total: int,
+        **options,
+    ) -> Dict[int, Tuple[Any, Dict[str, Any]]]:
+        """
+        Run UNWIND queries over their rows in batches.
+
+        Each batch is one write transaction (retried by the driver on
+        transient errors such as deadlocks). With several parallel sessions
+        the batches are spread over sessions from the driver's connection pool.
+
+        Args:
+            queries: ``(query, rows)`` pairs; each row carries an ``idx`` and
+                the query returns ``idx``, ``id`` and the stored ``props`` per
+                written row
+            tracking_id: Progress tracking ID
+            total: Total rows, for progress
+            **options: ``batch_size`` and ``parallel_sessions``
+
+        Returns:
+            Mapping of row ``idx`` to the written element's ID and stored
+            properties
+
+        Raises:
+            ProcessingError: If a batch fails; batches committed before the
+                failure stay written and their mapping is the error's
+                ``output_data``
+        """
+        batch_size = max(1, int(options.get("batch_size") or self.batch_size))
+        parallel_sessions = max(
+            1, int(options.get("parallel_sessions") or self.write_sessions)
+        )
+        batches = [
+            (query, rows[start : start + batch_size])
+            for query, rows in queries
+            for start in range(0, len(rows), batch_size)
+        ]
+
+        def write(session: Neo4jSession, query: str, rows: List[Dict[str, Any]]):
+            return session.write_transaction(
+                lambda tx: [
+                    (record["idx"], (record["id"], dict(record["props"])))
+                    for record in tx.run(query, {"rows": rows})
+                ]
+            )
+
+        elements: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+        processed = 0
+
+        def collect(rows: List[Dict[str, Any]], written: List[Tuple[int, Any]]) -> None:
+            nonlocal processed
+            elements.update(written)
+            processed += len(rows)
+            self.progress_tracker.update_progress(
+                tracking_id,
+                processed=processed,
+                total=total,
+                message=lambda: f"Wrote {processed}/{total} rows",
+            )
+
+        failure: Optional[Exception] = None
+        if parallel_sessions == 1 or len(batches) == 1:
+            with self.get_session() as session:
+                for query, rows in batches:
+                    try:
+                        collect(rows, write(session, query, rows))
+                    except Exception as e:
+                        failure = e
+                        break
+        else:
+            if self._driver is None:
+                self.connect()
+
+            def write_in_session(batch: Tuple[str, List[Dict[str, Any]]]):
+                with self.get_session() as session:
+                    return write(session, *batch)
+
+            with ThreadPoolExecutor(
+                max_workers=parallel_sessions, thread_name_prefix="neo4j-write"
+            ) as pool:
+                futures = [
+                    (rows, pool.submit(write_in_session, (query, rows)))
+                    for query, rows in batches
+                ]
+                # Batches already running still commit; keep their rows
+                for rows, future in futures:
+                    try:
+                        collect(rows, future.result())
+                    except Exception as e:
+                        failure = failure or e
+
+        if failure is not None:
+            error = ProcessingError(
+                f"Batch write failed: {failure}",
+                processing_context={"rows_written": len(elements)},
+            )
+            error.output_data = elements
+            raise error from failure
+        return elements
 
     def get_node(
         self,
@@ -674,6 +833,140 @@ class Neo4jStore:
             )
             raise ProcessingError(f"Failed to create relationship: {str(e)}")
 
+    def create_relationships(
+        self,
+        relationships: List[Dict[str, Any]],
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create multiple relationships in batch.
+
+        Relationships are grouped by type and written with one
+        ``UNWIND $rows AS row MATCH ... CREATE ...`` query per batch instead
+        of one session round trip per relationship. Relationships whose
+        endpoints do not exist are skipped.
+
+        Args:
+            relationships: List of relationship dictionaries with
+                'start_node_id' / 'end_node_id' (or 'start_id' / 'end_id',
+                'source_id' / 'target_id'), 'type' and optional 'properties'
+            **options: Additional options:
+                - match_on: "internal" (default) to match endpoints by Neo4j
+                  node ID, or a property key such as "id"
+                - node_label: Label of the endpoint nodes when matching on a
+                  property, so the label's index is used
+                - merge: Upsert with ``MERGE (a)-[r:TYPE]->(b) SET r += props``
+                  (default False)
+                - batch_size: Rows per query (default: store ``batch_size``)
+                - parallel_sessions: Concurrent write sessions (default:
+                  store ``write_sessions``)
+
+        Returns:
+            List of created relationship information, in input order
+
+        Raises:
+            ProcessingError: If a write fails; its ``output_data`` lists the
+                relationships that batches committed before the failure created
+        """
+        tracking_id = self.progress_tracker.start_tracking(
+            module="graph_store",
+            submodule="Neo4jStore",
+            message=f"Creating {len(relationships)} relationships in batch",
+        )
+
+        try:
+            match_on = options.get("match_on", "internal")
+            node_label = options.get("node_label")
+            if match_on == "internal":
+                match = (
+                    "MATCH (a) WHERE id(a) = row.start "
+                    "MATCH (b) WHERE id(b) = row.end"
+                )
+            else:
+                label = f":{_cypher_name(node_label)}" if node_label else ""
+                key = _cypher_name(match_on)
+                match = (
+                    f"MATCH (a{label} {{{key}: row.start}}) "
+                    f"MATCH (b{label} {{{key}: row.end}})"
+                )
+
+            endpoints: List[Tuple[Any, Any, str, Dict[str, Any]]] = []
+            groups: Dict[str, List[Dict[str, Any]]] = {}
+            for idx, rel in enumerate(relationships):
+                start = next(
+                    (rel[k] for k in ("start_node_id", "start_id", "source_id") if k in rel),
+                    None,
+                )
+                end = next(
+                    (rel[k] for k in ("end_node_id", "end_id", "target_id") if k in rel),
+                    None,
+                )
+                rel_type = rel.get("type") or rel.get("rel_type") or "RELATED_TO"
+                properties = rel.get("properties") or {}
+                endpoints.append((start, end, rel_type, properties))
+                groups.setdefault(rel_type, []).append(
+                    {"idx": idx, "start": start, "end": end, "props": properties}
+                )
+
+            if options.get("merge", False):
+                write = "MERGE (a)-[r:{type}]->(b) SET r += row.props"
+            else:
+                write = "CREATE (a)-[r:{type}]->(b) SET r = row.props"
+            queries = [
+                (
+                    f"UNWIND $rows AS row {match} "
+                    f"{write.format(type=_cypher_name(rel_type))} "
+                    "RETURN row.idx AS idx, id(r) AS id, properties(r) AS props",
+                    rows,
+                )
+                for rel_type, rows in groups.items()
+            ]
+
+            written = self._write_batches(
+                queries, tracking_id, len(relationships), **options
+            )
+            created = self._created_relationships(endpoints, written)
+            if len(created) < len(relationships):
+                self.logger.warning(
+                    f"Skipped {len(relationships) - len(created)} relationships "
+                    "with missing endpoint nodes"
+                )
+
+            self.progress_tracker.stop_tracking(
+                tracking_id,
+                status="completed",
+                message=f"Created {len(created)} relationships",
+            )
+            return created
+
+        except Exception as e:
+            self.progress_tracker.stop_tracking(
+                tracking_id, status="failed", message=str(e)
+            )
+            error = ProcessingError(f"Failed to create relationships: {str(e)}")
+            if isinstance(getattr(e, "output_data", None), dict):
+                # Relationships from batches committed before the failure
+                error.output_data = self._created_relationships(endpoints, e.output_data)
+            raise error
+
+    @staticmethod
+    def _created_relationships(
+        endpoints: List[Tuple[Any, Any, str, Dict[str, Any]]],
+        written: Dict[int, Tuple[Any, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Created relationship information of the written input rows, in input order."""
+        return [
+            {
+                "id": written[idx][0],
+                "type": rel_type,
+                "start_node_id": start,
+                "end_node_id": end,
+                "properties": written[idx][1],
+            }
+            for idx, (start, end, rel_type, _) in enumerate(endpoints)
+            if idx in written
+        ]
+
     def get_relationships(
         self,
         node_id: Optional[int] = None,
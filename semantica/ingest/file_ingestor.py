@@ -572,7 +572,7 @@ class FileIngestor:
             file=str(file_path),
             module="ingest",
             submodule="FileIngestor",
-            message=f"File: {file_path.name}",
+            message=lambda: f"File: {file_path.name}",
         )
 
         try:
@@ -644,7 +644,7 @@ class FileIngestor:
             self.progress_tracker.stop_tracking(
                 tracking_id,
                 status="completed",
-                message=f"Ingested {file_path.name} ({file_type})",
+                message=lambda: f"Ingested {file_path.name} ({file_type})",
             )
             self.logger.debug(
                 f"Successfully ingested file: {file_path.name} ({file_type})"
@@ -90,9 +90,6 @@ class HuggingFaceIngestor:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug("HuggingFace ingestor initialized")
 
@@ -26,9 +26,10 @@ Graph Analysis:
     - Community Detection: Louvain algorithm (greedy modularity optimization), Leiden algorithm (with refinement step)
     - Overlapping Communities: K-clique community detection, dense subgraph detection
     - Modularity Calculation: Q = (1/2m) * Σ(A_ij - k_i*k_j/2m) * δ(c_i, c_j)
-    - Graph Connectivity: DFS-based connected component detection, component size analysis
-    - Bridge Detection: Edge removal and connectivity change detection
-    - Path Finding: BFS shortest path algorithm, all-pairs shortest paths computation
+    - Graph Connectivity: Vectorized label propagation for connected components, component size analysis
+    - Bridge Detection: Tarjan's linear-time low-link DFS for bridges and articulation points
+    - Path Finding: BFS shortest path trees with lazy path reconstruction, lazy all-pairs shortest paths
+    - Path Length Statistics: Exact or sampled average path length (confidence interval) and diameter bounds
     - Graph Density: E / (n*(n-1)/2) calculation for undirected graphs
     - Structure Classification: Density-based classification (sparse, moderate, dense, disconnected)
 
@@ -41,12 +42,13 @@ Entity Resolution:
 
 
 Temporal Operations:
-    - Time-Point Queries: Temporal filtering using valid_from/valid_until comparison
+    - Temporal Index: valid_from/valid_until parsed once into epoch arrays and centered interval trees (per graph, type and entity)
+    - Time-Point Queries: O(log n + k) interval stabbing queries on the temporal index
     - Time-Range Queries: Interval overlap detection, union/intersection aggregation
     - Temporal Pattern Detection: Sequence detection, cycle detection, trend analysis
     - Graph Evolution Analysis: Time-series relationship counting, diversity metrics, stability measures
     - Temporal Path Finding: BFS with temporal validity constraints
-    - Version Management: Snapshot creation, version comparison, timestamp-based versioning
+    - Version Management: Delta-encoded snapshots, version comparison by composing deltas, timestamp-based versioning
 
 Provenance Tracking:
     - Source Tracking: Multi-source entity tracking, timestamp recording
@@ -76,10 +78,12 @@ Main Classes:
     - TemporalGraphQuery: Time-aware graph querying
     - TemporalPatternDetector: Temporal pattern detection
     - TemporalVersionManager: Temporal versioning and snapshots
+    - TemporalIndex: Interval index over relationship validity times
     - ProvenanceTracker: Provenance tracking and management
     - CentralityCalculator: Centrality measures calculation
     - CommunityDetector: Community detection
     - ConnectivityAnalyzer: Connectivity analysis
+    - CompactGraph: Interned CSR graph shared by the analyzers
     - SeedManager: Seed data management
     - MethodRegistry: Registry for custom KG methods
     - KGConfig: Configuration manager for KG module
@@ -107,6 +111,7 @@ License: MIT
 
 from .centrality_calculator import CentralityCalculator
 from .community_detector import CommunityDetector
+from .compact_graph import CompactGraph
 from .config import KGConfig, kg_config
 from .connectivity_analyzer import ConnectivityAnalyzer
 from .entity_resolver import EntityResolver
@@ -116,6 +121,7 @@ from .graph_validator import GraphValidator
 from .provenance_tracker import ProvenanceTracker
 from .registry import MethodRegistry, method_registry
 from .seed_manager import SeedManager
+from .temporal_index import TemporalIndex
 from .temporal_query import (
     TemporalGraphQuery,
     TemporalPatternDetector,
@@ -131,10 +137,12 @@ __all__ = [
     "TemporalGraphQuery",
     "TemporalPatternDetector",
     "TemporalVersionManager",
+    "TemporalIndex",
     "ProvenanceTracker",
     "CentralityCalculator",
     "CommunityDetector",
     "ConnectivityAnalyzer",
+    "CompactGraph",
     "SeedManager",
     # Registry and Configuration
     "MethodRegistry",
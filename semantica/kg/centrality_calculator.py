@@ -9,23 +9,32 @@ Key Features:
     - Betweenness centrality: Measures node importance as a bridge
     - Closeness centrality: Measures average distance to all other nodes
     - Eigenvector centrality: Measures influence based on connections to important nodes
+    - PageRank: Random-walk importance with damping
     - Centrality ranking and statistics
+    - Native CSR engine (Brandes with path counts, pivot sampling, bit-parallel
+      BFS, sparse power iteration, process fan-out) when NetworkX is missing
+      or the graph is large
+    - Accepts a prebuilt CompactGraph, so several measures share one
+      conversion of the graph
 
 Example Usage:
-    >>> from semantica.kg import CentralityCalculator
+    >>> from semantica.kg import CentralityCalculator, CompactGraph
     >>> calculator = CentralityCalculator()
     >>> centrality = calculator.calculate_degree_centrality(graph)
     >>> all_centrality = calculator.calculate_all_centrality(graph)
+    >>> compact = CompactGraph.from_graph(graph)
+    >>> calculator.calculate_closeness_centrality(compact)
 
 Author: Semantica Contributors
 License: MIT
 """
 
-from collections import defaultdict, deque
 from typing import Any, Dict, List, Optional
 
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from . import centrality_engine
+from .compact_graph import CompactGraph
 
 
 class CentralityCalculator:
@@ -41,6 +50,7 @@ class CentralityCalculator:
         - betweenness: Importance as a bridge between nodes
         - closeness: Average distance to all other nodes
         - eigenvector: Influence based on connections to important nodes
+        - pagerank: Random-walk importance with damping
 
     Example Usage:
         >>> calculator = CentralityCalculator()
@@ -61,6 +71,15 @@ class CentralityCalculator:
         Args:
             **config: Configuration options:
                 - calculation_config: Additional calculation configuration
+                - backend: "auto" (default), "networkx" or "native"
+                - native_threshold: Node count from which "auto" uses the
+                  native engine (default: 1000)
+                - n_jobs: Worker processes for the native BFS fan-out
+                  (default: 1, -1 for all CPUs)
+                - max_exact_betweenness_nodes: Node count above which
+                  betweenness is sampled (default: 50000)
+                - betweenness_k: Source pivots when sampling (default: 512)
+                - seed: Random seed for pivot sampling
         """
         self.logger = get_logger("centrality_calculator")
         self.config = config
@@ -71,9 +90,18 @@ class CentralityCalculator:
             "betweenness",
             "closeness",
             "eigenvector",
+            "pagerank",
         ]
 
         self.calculation_config = config.get("calculation_config", {})
+        self.backend = config.get("backend", "auto")
+        self.native_threshold = config.get("native_threshold", 1000)
+        self.n_jobs = config.get("n_jobs", 1)
+        self.max_exact_betweenness_nodes = config.get(
+            "max_exact_betweenness_nodes", 50000
+        )
+        self.betweenness_k = config.get("betweenness_k", 512)
+        self.seed = config.get("seed")
 
         # Try to use NetworkX for optimized calculations (optional dependency)
         try:
@@ -92,9 +120,6 @@ class CentralityCalculator:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.info("Centrality calculator initialized")
 
@@ -107,7 +132,8 @@ class CentralityCalculator:
         possible degree (n-1 for n nodes).
 
         Args:
-            graph: Input graph (dict with "entities" and "relationships" or NetworkX graph)
+            graph: Input graph (dict with "entities" and "relationships",
+                NetworkX graph or CompactGraph)
 
         Returns:
             Dictionary containing:
@@ -133,73 +159,22 @@ class CentralityCalculator:
             self.logger.info("Calculating degree centrality")
 
             self.progress_tracker.update_tracking(
-                tracking_id, message="Processing graph structure..."
-            )
-            # Use NetworkX if available for faster calculation
-            if self.use_networkx:
-                try:
-                    nx_graph = self._to_networkx(graph)
-                    centrality_dict = self.nx.degree_centrality(nx_graph)
-
-                    # Convert to rankings
-                    ranked = sorted(
-                        centrality_dict.items(), key=lambda x: x[1], reverse=True
-                    )
-
-                    max_degree = (
-                        max(dict(nx_graph.degree()).values())
-                        if nx_graph.number_of_nodes() > 0
-                        else 0
-                    )
-
-                    result = {
-                        "centrality": centrality_dict,
-                        "rankings": [
-                            {"node": node, "score": score} for node, score in ranked
-                        ],
-                        "max_degree": max_degree,
-                        "total_nodes": nx_graph.number_of_nodes(),
-                    }
-                    self.progress_tracker.stop_tracking(
-                        tracking_id,
-                        status="completed",
-                        message=f"Calculated degree centrality for {nx_graph.number_of_nodes()} nodes",
-                    )
-                    return result
-                except Exception as e:
-                    self.logger.warning(
-                        f"NetworkX calculation failed: {e}, using basic implementation"
-                    )
-
-            self.progress_tracker.update_tracking(
-                tracking_id, message="Building adjacency list..."
+                tracking_id, message="Building compact graph..."
             )
-            # Basic implementation using adjacency list
-            adjacency = self._build_adjacency(graph)
-
-            self.progress_tracker.update_tracking(
-                tracking_id, message="Calculating degrees..."
-            )
-            # Calculate raw degrees (number of connections per node)
-            degrees = {}
-            max_degree = 0
-
-            for node in adjacency:
-                degree = len(adjacency[node])
-                degrees[node] = degree
-                max_degree = max(max_degree, degree)
+            compact = CompactGraph.from_graph(graph)
 
             self.progress_tracker.update_tracking(
                 tracking_id, message="Normalizing centrality scores..."
             )
-            # Calculate normalized centrality scores
+            # Degrees come straight from the CSR row lengths
             # Normalization: degree / (n - 1) where n is number of nodes
-            centrality = {}
-            num_nodes = len(adjacency)
+            degrees = compact.degrees
+            num_nodes = compact.num_nodes
+            max_degree = int(degrees.max()) if num_nodes else 0
             normalization = num_nodes - 1 if num_nodes > 1 else 1
-
-            for node, degree in degrees.items():
-                centrality[node] = degree / normalization if normalization > 0 else 0.0
+            centrality = dict(
+                zip(compact.node_ids, (degrees / normalization).tolist())
+            )
 
             # Rank nodes by centrality (highest first)
             ranked = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
@@ -228,74 +203,62 @@ class CentralityCalculator:
             )
             raise
 
-    def calculate_betweenness_centrality(self, graph):
+    def calculate_betweenness_centrality(self, graph, k=None, seed=None):
         """
         Calculate betweenness centrality for all nodes.
 
-        • Find shortest paths between all pairs
-        • Count paths passing through each node
+        • Count shortest paths from every source (Brandes)
+        • Accumulate pair dependencies through each node
         • Normalize by total possible paths
         • Return betweenness centrality scores
 
+        Large graphs (and graphs without NetworkX) use the native engine;
+        above ``max_exact_betweenness_nodes`` nodes the scores are estimated
+        from ``betweenness_k`` sampled source pivots.
+
         Args:
             graph: Input graph for centrality calculation
+            k: Number of sampled source pivots (default: exact, or
+                ``betweenness_k`` for very large graphs)
+            seed: Random seed for pivot sampling
 
         Returns:
-            dict: Node centrality scores and rankings
+            dict: Node centrality scores and rankings, plus "approximate"
+                and "pivots" when sampled
         """
         self.logger.info("Calculating betweenness centrality")
 
-        if self.use_networkx:
+        compact = CompactGraph.from_graph(graph)
+        if k is None and compact.num_nodes > self.max_exact_betweenness_nodes:
+            k = self.betweenness_k
+            self.logger.info(
+                f"{compact.num_nodes} nodes exceed the exact betweenness limit, "
+                f"sampling {k} pivots"
+            )
+        seed = self.seed if seed is None else seed
+        sampled = k is not None and k < compact.num_nodes
+
+        if self._use_networkx_for(compact):
             try:
-                nx_graph = self._to_networkx(graph)
-                centrality = self.nx.betweenness_centrality(nx_graph)
-                ranked = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
-
-                return {
-                    "centrality": centrality,
-                    "rankings": [
-                        {"node": node, "score": score} for node, score in ranked
-                    ],
-                }
+                centrality = self.nx.betweenness_centrality(
+                    compact.to_networkx(), k=k if sampled else None, seed=seed
+                )
+                result = self._ranked(centrality)
+                if sampled:
+                    result.update(approximate=True, pivots=k)
+                return result
             except Exception as e:
                 self.logger.warning(
-                    f"NetworkX calculation failed: {e}, using basic implementation"
+                    f"NetworkX calculation failed: {e}, using native implementation"
                 )
 
-        # Basic implementation using BFS
-        adjacency = self._build_adjacency(graph)
-        nodes = list(adjacency.keys())
-        betweenness = {node: 0.0 for node in nodes}
-
-        # For each pair of nodes, find shortest paths
-        for source in nodes:
-            # BFS to find shortest paths
-            paths = self._bfs_shortest_paths(adjacency, source)
-
-            for target in nodes:
-                if source == target:
-                    continue
-
-                if target in paths:
-                    # Count paths through each node
-                    for path in paths[target]:
-                        for node in path[1:-1]:  # Exclude source and target
-                            if node in betweenness:
-                                betweenness[node] += 1.0
-
-        # Normalize
-        n = len(nodes)
-        if n > 2:
-            normalization = (n - 1) * (n - 2) / 2
-            for node in betweenness:
-                betweenness[node] /= normalization if normalization > 0 else 1
-
-        ranked = sorted(betweenness.items(), key=lambda x: x[1], reverse=True)
-
-        return {
-            "centrality": betweenness,
-            "rankings": [{"node": node, "score": score} for node, score in ranked],
-        }
+        scores = centrality_engine.betweenness_centrality(
+            compact, k=k, seed=seed, n_jobs=self.n_jobs
+        )
+        result = self._ranked(dict(zip(compact.node_ids, scores.tolist())))
+        if sampled:
+            result.update(approximate=True, pivots=k)
+        return result
 
     def calculate_closeness_centrality(self, graph):
         """
@@ -314,54 +277,25 @@ class CentralityCalculator:
         """
         self.logger.info("Calculating closeness centrality")
 
-        if self.use_networkx:
+        compact = CompactGraph.from_graph(graph)
+        if self._use_networkx_for(compact):
             try:
-                nx_graph = self._to_networkx(graph)
-                centrality = self.nx.closeness_centrality(nx_graph)
-                ranked = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
-
-                return {
-                    "centrality": centrality,
-                    "rankings": [
-                        {"node": node, "score": score} for node, score in ranked
-                    ],
-                }
+                return self._ranked(
+                    self.nx.closeness_centrality(compact.to_networkx())
+                )
             except Exception as e:
                 self.logger.warning(
-                    f"NetworkX calculation failed: {e}, using basic implementation"
+                    f"NetworkX calculation failed: {e}, using native implementation"
                 )
 
-        # Basic implementation
-        adjacency = self._build_adjacency(graph)
-        nodes = list(adjacency.keys())
-        closeness = {}
-
-        for node in nodes:
-            # BFS to find distances
-            distances = self._bfs_distances(adjacency, node)
-
-            # Calculate sum of distances
-            total_distance = sum(distances.values())
-            reachable = len(distances) - 1  # Exclude self
-
-            if reachable > 0 and total_distance > 0:
-                # Closeness = (n-1) / sum of distances
-                closeness[node] = reachable / total_distance
-            else:
-                closeness[node] = 0.0
-
-        ranked = sorted(closeness.items(), key=lambda x: x[1], reverse=True)
-
-        return {
-            "centrality": closeness,
-            "rankings": [{"node": node, "score": score} for node, score in ranked],
-        }
+        scores = centrality_engine.closeness_centrality(compact, n_jobs=self.n_jobs)
+        return self._ranked(dict(zip(compact.node_ids, scores.tolist())))
 
     def calculate_eigenvector_centrality(self, graph, max_iter=100, tol=1e-6):
         """
         Calculate eigenvector centrality for all nodes.
 
-        • Compute adjacency matrix eigenvalues
+        • Iterate the adjacency operator (power iteration)
         • Calculate eigenvector centrality
         • Handle convergence and stability
         • Return eigenvector centrality scores
@@ -376,70 +310,61 @@ class CentralityCalculator:
         """
         self.logger.info("Calculating eigenvector centrality")
 
-        if self.use_networkx:
+        compact = CompactGraph.from_graph(graph)
+        if self._use_networkx_for(compact):
             try:
-                nx_graph = self._to_networkx(graph)
-                centrality = self.nx.eigenvector_centrality(
-                    nx_graph, max_iter=max_iter, tol=tol
+                return self._ranked(
+                    self.nx.eigenvector_centrality(
+                        compact.to_networkx(), max_iter=max_iter, tol=tol
+                    )
                 )
-                ranked = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
-
-                return {
-                    "centrality": centrality,
-                    "rankings": [
-                        {"node": node, "score": score} for node, score in ranked
-                    ],
-                }
             except Exception as e:
                 self.logger.warning(
-                    f"NetworkX calculation failed: {e}, using basic implementation"
+                    f"NetworkX calculation failed: {e}, using native implementation"
                 )
 
-        # Basic power iteration method
-        import numpy as np
-
-        adjacency = self._build_adjacency(graph)
-        nodes = sorted(adjacency.keys())
-        n = len(nodes)
-        node_to_index = {node: i for i, node in enumerate(nodes)}
-
-        # Build adjacency matrix
-        A = np.zeros((n, n))
-        for i, node in enumerate(nodes):
-            for neighbor in adjacency[node]:
-                if neighbor in node_to_index:
-                    j = node_to_index[neighbor]
-                    A[i, j] = 1.0
-                    A[j, i] = 1.0
-
-        # Power iteration
-        x = np.ones(n) / np.sqrt(n)
-
-        for _ in range(max_iter):
-            x_new = A @ x
-            norm = np.linalg.norm(x_new)
-            if norm == 0:
-                break
-            x_new = x_new / norm
-
-            if np.linalg.norm(x_new - x) < tol:
-                break
-            x = x_new
-
-        # Normalize
-        centrality = {nodes[i]: float(x[i]) for i in range(n)}
-
-        # Normalize to [0, 1]
-        max_val = max(centrality.values()) if centrality.values() else 1.0
-        if max_val > 0:
-            centrality = {node: score / max_val for node, score in centrality.items()}
+        scores = centrality_engine.eigenvector_centrality(
+            compact, max_iter=max_iter, tol=tol
+        )
+        return self._ranked(dict(zip(compact.node_ids, scores.tolist())))
 
-        ranked = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
+    def calculate_pagerank(self, graph, alpha=0.85, max_iter=100, tol=1e-6):
+        """
+        Calculate PageRank for all nodes.
 
-        return {
-            "centrality": centrality,
-            "rankings": [{"node": node, "score": score} for node, score in ranked],
-        }
+        • Follow every relationship in both directions
+        • Weight transitions by relationship weight
+        • Redistribute rank of isolated nodes
+        • Return PageRank scores
+
+        Args:
+            graph: Input graph for centrality calculation
+            alpha: Damping factor
+            max_iter: Maximum iterations
+            tol: Convergence tolerance
+
+        Returns:
+            dict: Node centrality scores and rankings
+        """
+        self.logger.info("Calculating PageRank")
+
+        compact = CompactGraph.from_graph(graph)
+        if self._use_networkx_for(compact):
+            try:
+                return self._ranked(
+                    self.nx.pagerank(
+                        compact.to_networkx(), alpha=alpha, max_iter=max_iter, tol=tol
+                    )
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"NetworkX calculation failed: {e}, using native implementation"
+                )
+
+        scores = centrality_engine.pagerank(
+            compact, alpha=alpha, max_iter=max_iter, tol=tol
+        )
+        return self._ranked(dict(zip(compact.node_ids, scores.tolist())))
 
     def calculate_all_centrality(self, graph, centrality_types=None):
         """
@@ -461,119 +386,51 @@ class CentralityCalculator:
 
         centrality_types = centrality_types or self.supported_centrality_types
         results = {}
+        # Convert once; every measure below reuses the same compact graph
+        compact = CompactGraph.from_graph(graph)
 
         if "degree" in centrality_types:
-            results["degree"] = self.calculate_degree_centrality(graph)
+            results["degree"] = self.calculate_degree_centrality(compact)
 
         if "betweenness" in centrality_types:
-            results["betweenness"] = self.calculate_betweenness_centrality(graph)
+            results["betweenness"] = self.calculate_betweenness_centrality(compact)
 
         if "closeness" in centrality_types:
-            results["closeness"] = self.calculate_closeness_centrality(graph)
+            results["closeness"] = self.calculate_closeness_centrality(compact)
 
         if "eigenvector" in centrality_types:
-            results["eigenvector"] = self.calculate_eigenvector_centrality(graph)
+            results["eigenvector"] = self.calculate_eigenvector_centrality(compact)
+
+        if "pagerank" in centrality_types:
+            results["pagerank"] = self.calculate_pagerank(compact)
 
         return {
             "centrality_measures": results,
             "types_calculated": list(results.keys()),
-            "total_nodes": len(self._build_adjacency(graph)),
+            "total_nodes": compact.num_nodes,
         }
 
     def _build_adjacency(self, graph) -> Dict[str, List[str]]:
         """Build adjacency list from graph."""
-        adjacency = defaultdict(list)
-
-        # Extract relationships
-        relationships = []
-        if hasattr(graph, "relationships"):
-            relationships = graph.relationships
-        elif hasattr(graph, "get_relationships"):
-            relationships = graph.get_relationships()
-        elif isinstance(graph, dict):
-            relationships = graph.get("relationships", [])
-
-        # Build adjacency
-        for rel in relationships:
-            source = rel.get("source") or rel.get("subject")
-            target = rel.get("target") or rel.get("object")
-
-            # Extract IDs if objects are passed
-            if source and not isinstance(source, (str, int, float)):
-                if isinstance(source, dict):
-                    source = source.get("id") or source.get("entity_id") or source.get("text") or str(source)
-                else:
-                    source = getattr(source, "id", getattr(source, "text", str(source)))
-            
-            if target and not isinstance(target, (str, int, float)):
-                if isinstance(target, dict):
-                    target = target.get("id") or target.get("entity_id") or target.get("text") or str(target)
-                else:
-                    target = getattr(target, "id", getattr(target, "text", str(target)))
-
-            if source and target:
-                if target not in adjacency[source]:
-                    adjacency[source].append(target)
-                if source not in adjacency[target]:
-                    adjacency[target].append(source)
-
-        return dict(adjacency)
+        return CompactGraph.from_graph(graph).adjacency_lists()
 
     def _to_networkx(self, graph):
         """Convert graph to NetworkX format."""
-        adjacency = self._build_adjacency(graph)
-        nx_graph = self.nx.Graph()
-
-        for source, targets in adjacency.items():
-            for target in targets:
-                nx_graph.add_edge(source, target)
-
-        return nx_graph
-
-    def _bfs_distances(
-        self, adjacency: Dict[str, List[str]], start: str
-    ) -> Dict[str, int]:
-        """Calculate distances using BFS."""
-        distances = {start: 0}
-        queue = deque([start])
-
-        while queue:
-            node = queue.popleft()
-            for neighbor in adjacency.get(node, []):
-                if neighbor not in distances:
-                    distances[neighbor] = distances[node] + 1
-                    queue.append(neighbor)
-
-        return distances
-
-    def _bfs_shortest_paths(
-        self, adjacency: Dict[str, List[str]], start: str
-    ) -> Dict[str, List[List[str]]]:
-        """Find all shortest paths using BFS."""
-        paths = {start: [[start]]}
-        queue = deque([start])
-        visited = {start}
-
-        while queue:
-            node = queue.popleft()
-            for neighbor in adjacency.get(node, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    # Find paths to neighbor
-                    neighbor_paths = []
-                    for path in paths[node]:
-                        neighbor_paths.append(path + [neighbor])
-                    paths[neighbor] = neighbor_paths
-                    queue.append(neighbor)
-                elif neighbor in paths:
-                    # Check if this is a shortest path
-                    current_length = len(paths[neighbor][0])
-                    new_length = len(paths[node][0]) + 1
-                    if new_length == current_length:
-                        # Add alternative paths
-                        for path in paths[node]:
-                            new_path = path + [neighbor]
-                            if new_path not in paths[neighbor]:
-                                paths[neighbor].append(new_path)
-
-        return paths
+        return CompactGraph.from_graph(graph).to_networkx()
+
+    def _use_networkx_for(self, compact: CompactGraph) -> bool:
+        """Whether to use NetworkX (backend setting, availability, graph size)."""
+        if not self.use_networkx or self.backend == "native":
+            return False
+        if self.backend == "networkx":
+            return True
+        return compact.num_nodes < self.native_threshold
+
+    @staticmethod
+    def _ranked(centrality: Dict[Any, float]) -> Dict[str, Any]:
+        """Centrality scores with rankings (highest first)."""
+        ranked = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
+        return {
+            "centrality": centrality,
+            "rankings": [{"node": node, "score": score} for node, score in ranked],
+        }
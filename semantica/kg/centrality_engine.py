@@ -0,0 +1,446 @@
+"""
+Centrality Engine Module
+
+This module provides NumPy centrality kernels on the CSR arrays of a
+CompactGraph. They are the native path of CentralityCalculator: used when
+NetworkX is not installed, and for large graphs where NetworkX's
+single-threaded pure Python loops do not finish.
+
+Algorithms Used:
+    - Batched BFS: A batch of sources is searched at once; (source, node)
+      pairs are flattened into ``source * n + node`` keys so every level is a
+      handful of array operations (gather the CSR rows of the frontier, keep
+      undiscovered keys, deduplicate them with a last-writer scratch array)
+      instead of a Python loop per node
+    - Brandes Betweenness: Shortest path counts (sigma) are accumulated with
+      np.add.at along the edges of each BFS level, then dependencies (delta)
+      are propagated back level by level; no path lists are materialized
+    - Pivot Sampling: Approximate betweenness from ``k`` random sources,
+      rescaled like NetworkX's ``betweenness_centrality(k=...)``
+    - Multi-Source BFS (closeness): 64 sources per uint64 word; a level is
+      one np.bitwise_or.reduceat over the CSR rows, masked with the bits
+      already seen, and new bits are counted per source with np.unpackbits
+      (the last level with new bits is the source's eccentricity);
+      Wasserman-Faust scaling for disconnected graphs, as in NetworkX
+    - Eigenvector Centrality: Power iteration of ``x + A x`` with a sparse
+      product (np.bincount over the CSR entries)
+    - PageRank: Power iteration with dangling node redistribution
+    - Parallel Fan-Out: BFS sources split into chunks and run in a process
+      pool; the CSR arrays are sent once per worker through the pool
+      initializer
+
+Key Features:
+    - Same scores as NetworkX (normalization and convergence rules match)
+    - Memory bounded per batch (about ``4M`` flattened keys)
+    - Exact or sampled betweenness, optional process parallelism
+
+Main Functions:
+    - betweenness_centrality: Exact or sampled Brandes betweenness
+    - closeness_centrality: Closeness from multi-source BFS
+    - distance_profile: Distance sum, reachable count and eccentricity per
+      source
+    - eigenvector_centrality: Sparse power iteration
+    - pagerank: Sparse PageRank
+
+Example Usage:
+    >>> from semantica.kg import CompactGraph
+    >>> from semantica.kg.centrality_engine import betweenness_centrality, pagerank
+    >>> compact = CompactGraph.from_graph(kg)
+    >>> scores = betweenness_centrality(compact, k=256, seed=0, n_jobs=4)
+    >>> dict(zip(compact.node_ids, scores.tolist()))
+    >>> ranks = pagerank(compact, alpha=0.85)
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.logging import get_logger
+from .compact_graph import CompactGraph
+
+logger = get_logger("centrality_engine")
+
+# Flattened (source, node) keys per BFS batch
+_BATCH_ENTRIES = 1 << 22
+
+
+def _gather(
+    indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenated CSR rows of ``nodes``: (position in ``nodes``, neighbor)."""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    owner = np.repeat(np.arange(len(nodes)), counts)
+    offsets = np.cumsum(counts) - counts
+    positions = np.arange(int(counts.sum())) - offsets[owner] + starts[owner]
+    return owner, indices[positions]
+
+
+def _bfs(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    sources: np.ndarray,
+    count_paths: bool,
+) -> Tuple[np.ndarray, Optional[np.ndarray], List[Tuple[np.ndarray, np.ndarray]]]:
+    """
+    BFS from a batch of sources at once.
+
+    Returns:
+        Distances (-1 if unreachable) and, with ``count_paths``, shortest path
+        counts and the shortest-path DAG edges per level, all over flattened
+        ``batch_row * n + node`` keys
+    """
+    n = len(indptr) - 1
+    keys = np.arange(len(sources), dtype=np.int64) * n + sources
+    dist = np.full(len(sources) * n, -1, dtype=np.int32)
+    dist[keys] = 0
+    sigma = None
+    levels: List[Tuple[np.ndarray, np.ndarray]] = []
+    if count_paths:
+        sigma = np.zeros(len(sources) * n)
+        sigma[keys] = 1.0
+
+    # Deduplicates discovered keys in linear time: of several writes to the
+    # same slot the last one wins, and only that occurrence is kept
+    last_writer = np.empty(len(sources) * n, dtype=np.int64)
+    depth = 0
+    while keys.size:
+        nodes = keys % n
+        owner, neighbors = _gather(indptr, indices, nodes)
+        parent_keys = keys[owner]
+        child_keys = (keys - nodes)[owner] + neighbors
+        discovered = child_keys[dist[child_keys] < 0]
+        order = np.arange(len(discovered))
+        last_writer[discovered] = order
+        frontier = discovered[last_writer[discovered] == order]
+        dist[frontier] = depth + 1
+        if count_paths:
+            on_path = dist[child_keys] == depth + 1
+            parent_keys, child_keys = parent_keys[on_path], child_keys[on_path]
+            np.add.at(sigma, child_keys, sigma[parent_keys])
+            levels.append((parent_keys, child_keys))
+        keys = frontier
+        depth += 1
+    return dist, sigma, levels
+
+
+def _batches(n: int, sources: np.ndarray, batch_size: Optional[int]):
+    step = batch_size or max(1, _BATCH_ENTRIES // max(n, 1))
+    for start in range(0, len(sources), step):
+        yield sources[start : start + step]
+
+
+def _betweenness_chunk(indptr, indices, sources, batch_size=None) -> np.ndarray:
+    """Brandes dependencies summed over ``sources``."""
+    n = len(indptr) - 1
+    betweenness = np.zeros(n)
+    for batch in _batches(n, sources, batch_size):
+        _, sigma, levels = _bfs(indptr, indices, batch, count_paths=True)
+        delta = np.zeros(len(batch) * n)
+        for parent_keys, child_keys in reversed(levels):
+            np.add.at(
+                delta,
+                parent_keys,
+                sigma[parent_keys] / sigma[child_keys] * (1.0 + delta[child_keys]),
+            )
+        delta[np.arange(len(batch)) * n + batch] = 0.0
+        betweenness += delta.reshape(len(batch), n).sum(axis=0)
+    return betweenness
+
+
+def _distance_chunk(indptr, indices, sources, batch_size=None) -> np.ndarray:
+    """
+    (distance sum, reachable count, eccentricity) per source, by bit-parallel
+    BFS.
+
+    Bit ``j`` of a node's row says whether source ``j`` of the batch has
+    reached the node; one level is an OR over the CSR rows of the frontier
+    rows, masked by the bits already seen.
+    """
+    n = len(indptr) - 1
+    nonempty = np.flatnonzero(np.diff(indptr))
+    row_starts = indptr[nonempty]
+    step = batch_size or 64 * max(1, _BATCH_ENTRIES // max(len(indices), n, 1))
+    parts = []
+    for start in range(0, len(sources), step):
+        batch = sources[start : start + step]
+        words = (len(batch) + 63) // 64
+        columns = np.arange(len(batch))
+        frontier = np.zeros((n, words), dtype="<u8")
+        np.bitwise_or.at(
+            frontier,
+            (batch, columns // 64),
+            np.left_shift(np.uint64(1), (columns % 64).astype(np.uint64)),
+        )
+        seen = frontier.copy()
+        totals = np.zeros(len(batch), dtype=np.int64)
+        reached = np.ones(len(batch), dtype=np.int64)
+        eccentricity = np.zeros(len(batch), dtype=np.int64)
+        depth = 0
+        while len(indices) and frontier.any():
+            depth += 1
+            reached_next = np.zeros_like(frontier)
+            reached_next[nonempty] = np.bitwise_or.reduceat(
+                frontier[indices], row_starts, axis=0
+            )
+            reached_next &= ~seen
+            seen |= reached_next
+            changed = reached_next[reached_next.any(axis=1)]
+            counts = np.unpackbits(
+                changed.view(np.uint8), axis=1, bitorder="little"
+            ).sum(axis=0, dtype=np.int64)[: len(batch)]
+            totals += depth * counts
+            reached += counts
+            eccentricity[counts > 0] = depth
+            frontier = reached_next
+        parts.append(np.column_stack([totals, reached, eccentricity]))
+    return np.concatenate(parts) if parts else np.zeros((0, 3), dtype=np.int64)
+
+
+_CHUNK_FUNCTIONS = {"betweenness": _betweenness_chunk, "distances": _distance_chunk}
+_worker_graph: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+
+def _init_worker(indptr: np.ndarray, indices: np.ndarray) -> None:
+    global _worker_graph
+    _worker_graph = (indptr, indices)
+
+
+def _run_chunk(kind: str, sources: np.ndarray, batch_size: Optional[int]):
+    return _CHUNK_FUNCTIONS[kind](*_worker_graph, sources, batch_size)
+
+
+def _resolve_jobs(n_jobs: Optional[int]) -> int:
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _map_sources(
+    kind: str,
+    compact: CompactGraph,
+    sources: np.ndarray,
+    n_jobs: Optional[int],
+    batch_size: Optional[int],
+) -> List[np.ndarray]:
+    """Run a chunk function over ``sources``, in a process pool if n_jobs > 1."""
+    n_jobs = min(_resolve_jobs(n_jobs), max(len(sources), 1))
+    if n_jobs == 1:
+        return [
+            _CHUNK_FUNCTIONS[kind](compact.indptr, compact.indices, sources, batch_size)
+        ]
+    # Several chunks per worker keep the pool busy when BFS costs differ
+    chunks = [c for c in np.array_split(sources, n_jobs * 4) if len(c)]
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_init_worker,
+        initargs=(compact.indptr, compact.indices),
+    ) as pool:
+        return list(pool.map(_run_chunk, repeat(kind), chunks, repeat(batch_size)))
+
+
+def betweenness_centrality(
+    compact: CompactGraph,
+    k: Optional[int] = None,
+    normalized: bool = True,
+    seed: Optional[int] = None,
+    n_jobs: Optional[int] = 1,
+    batch_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Brandes betweenness centrality (exact, or sampled from ``k`` pivots).
+
+    Args:
+        compact: Graph
+        k: Number of random source pivots (default: all nodes, exact)
+        normalized: Divide by the number of node pairs, as NetworkX does
+        seed: Random seed for pivot sampling
+        n_jobs: Worker processes (-1: all CPUs)
+        batch_size: Sources searched together (default: from a memory budget)
+
+    Returns:
+        Betweenness per node index
+    """
+    n = compact.num_nodes
+    if k is not None and k < n:
+        rng = np.random.default_rng(seed)
+        sources = np.sort(rng.choice(n, size=k, replace=False))
+    else:
+        k = None
+        sources = np.arange(n, dtype=np.int64)
+
+    betweenness = np.zeros(n)
+    for part in _map_sources("betweenness", compact, sources, n_jobs, batch_size):
+        betweenness += part
+
+    # Rescaling of NetworkX (endpoints excluded, undirected)
+    pairs = n - 1
+    if pairs < 2:
+        return betweenness
+    if k is None:
+        scale = 1 / (pairs * (pairs - 1)) if normalized else 0.5
+        return betweenness * scale
+    if normalized:
+        scale_source = 1 / ((k - 1) * (pairs - 1)) if k > 1 else np.nan
+        scale_other = 1 / (k * (pairs - 1))
+    else:
+        scale_source = pairs / ((k - 1) * 2) if k > 1 else np.nan
+        scale_other = pairs / (k * 2)
+    scale = np.full(n, scale_other)
+    scale[sources] = scale_source
+    return betweenness * scale
+
+
+def closeness_centrality(
+    compact: CompactGraph,
+    wf_improved: bool = True,
+    n_jobs: Optional[int] = 1,
+    batch_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Closeness centrality from bit-parallel multi-source BFS distances.
+
+    Args:
+        compact: Graph
+        wf_improved: Scale by the reachable fraction of the graph
+            (Wasserman-Faust, the NetworkX default)
+        n_jobs: Worker processes (-1: all CPUs)
+        batch_size: Sources searched together
+
+    Returns:
+        Closeness per node index
+    """
+    n = compact.num_nodes
+    totals, reached, _ = distance_profile(
+        compact, n_jobs=n_jobs, batch_size=batch_size
+    ).T
+    closeness = np.zeros(n)
+    valid = (totals > 0) & (n > 1)
+    closeness[valid] = (reached[valid] - 1.0) / totals[valid]
+    if wf_improved and n > 1:
+        closeness[valid] *= (reached[valid] - 1.0) / (n - 1)
+    return closeness
+
+
+def distance_profile(
+    compact: CompactGraph,
+    sources: Optional[np.ndarray] = None,
+    n_jobs: Optional[int] = 1,
+    batch_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Unweighted BFS distance summary per source, without storing distances.
+
+    Args:
+        compact: Graph
+        sources: Source node indices (default: all nodes)
+        n_jobs: Worker processes (-1: all CPUs)
+        batch_size: Sources searched together
+
+    Returns:
+        (len(sources), 3) int64 array: sum of distances to reachable nodes,
+        number of reachable nodes (including the source) and eccentricity
+        within the source's component
+    """
+    if sources is None:
+        sources = np.arange(compact.num_nodes, dtype=np.int64)
+    sources = np.asarray(sources, dtype=np.int64)
+    if not len(sources):
+        return np.zeros((0, 3), dtype=np.int64)
+    return np.concatenate(
+        _map_sources("distances", compact, sources, n_jobs, batch_size)
+    )
+
+
+def eigenvector_centrality(
+    compact: CompactGraph,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    weighted: bool = False,
+) -> np.ndarray:
+    """
+    Eigenvector centrality by sparse power iteration.
+
+    Iterates ``x <- x + A x`` (the shift keeps bipartite graphs from
+    oscillating) with L2 normalization until the L1 change is below
+    ``n * tol``, as NetworkX does.
+
+    Args:
+        compact: Graph
+        max_iter: Maximum iterations
+        tol: Convergence tolerance per node
+        weighted: Use relationship weights
+
+    Returns:
+        L2-normalized centrality per node index
+    """
+    n = compact.num_nodes
+    if n == 0:
+        return np.zeros(0)
+    rows = np.repeat(np.arange(n), compact.degrees)
+    weights = compact.weights if weighted else None
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        last = x
+        contributions = last[rows] if weights is None else last[rows] * weights
+        x = last + np.bincount(compact.indices, weights=contributions, minlength=n)
+        norm = np.linalg.norm(x)
+        x = x / norm if norm > 0 else x
+        if np.abs(x - last).sum() < n * tol:
+            return x
+    logger.warning(f"Eigenvector centrality did not converge in {max_iter} iterations")
+    return x
+
+
+def pagerank(
+    compact: CompactGraph,
+    alpha: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    weighted: bool = True,
+) -> np.ndarray:
+    """
+    PageRank by sparse power iteration.
+
+    Each undirected edge is followed in both directions; rank of nodes
+    without edges is spread uniformly. Stops when the L1 change is below
+    ``n * tol``, as NetworkX does.
+
+    Args:
+        compact: Graph
+        alpha: Damping factor
+        max_iter: Maximum iterations
+        tol: Convergence tolerance per node
+        weighted: Use relationship weights
+
+    Returns:
+        PageRank per node index (sums to 1)
+    """
+    n = compact.num_nodes
+    if n == 0:
+        return np.zeros(0)
+    rows = np.repeat(np.arange(n), compact.degrees)
+    weights = compact.weights if weighted else np.ones(len(compact.indices))
+    out_weight = np.bincount(rows, weights=weights, minlength=n)
+    dangling = out_weight == 0
+    transition = weights / np.where(out_weight > 0, out_weight, 1.0)[rows]
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        last = x
+        spread = np.bincount(
+            compact.indices, weights=last[rows] * transition, minlength=n
+        )
+        x = alpha * (spread + last[dangling].sum() / n) + (1.0 - alpha) / n
+        if np.abs(x - last).sum() < n * tol:
+            return x
+    logger.warning(f"PageRank did not converge in {max_iter} iterations")
+    return x
@@ -8,10 +8,14 @@ knowledge graphs using various algorithms.
 Key Features:
     - Louvain community detection algorithm
     - Leiden community detection algorithm (with refinement)
+    - Native Louvain/Leiden on CSR arrays with incremental modularity gains,
+      used for large graphs, without NetworkX, and when updating a previous
+      partition after graph edits
     - Overlapping community detection (k-clique communities)
     - Community quality metrics (modularity, size distribution)
     - Community structure analysis
     - NetworkX integration with fallback implementations
+    - Accepts a prebuilt CompactGraph shared with the other analyzers
 
 Main Classes:
     - CommunityDetector: Main community detection engine
@@ -21,6 +25,9 @@ Example Usage:
     >>> detector = CommunityDetector()
     >>> communities = detector.detect_communities(graph, algorithm="louvain")
     >>> metrics = detector.calculate_community_metrics(graph, communities)
+    >>> updated = detector.detect_communities(
+    ...     edited_graph, algorithm="leiden", initial_partition=communities
+    ... )
 
 Author: Semantica Contributors
 License: MIT
@@ -29,8 +36,12 @@ License: MIT
 from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from . import community_engine
+from .compact_graph import CompactGraph
 
 
 class CommunityDetector:
@@ -67,6 +78,10 @@ class CommunityDetector:
         Args:
             **config: Configuration options:
                 - detection_config: Detection algorithm configuration (optional)
+                - backend: "auto" (default), "networkx" or "native" for Louvain
+                - native_threshold: Node count from which "auto" uses the
+                  native Louvain (default: 1000)
+                - seed: Random seed of the native algorithms
         """
         self.logger = get_logger("community_detector")
         self.supported_algorithms = [
@@ -77,6 +92,9 @@ class CommunityDetector:
         ]
         self.detection_config = config.get("detection_config", {})
         self.config = config
+        self.backend = config.get("backend", "auto")
+        self.native_threshold = config.get("native_threshold", 1000)
+        self.seed = config.get("seed")
 
         # Try to use networkx if available (optional dependency)
         try:
@@ -92,27 +110,36 @@ class CommunityDetector:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def detect_communities_louvain(
-        self, graph: Any, resolution: float = 1.0, max_iter: int = 10, **options
+        self,
+        graph: Any,
+        resolution: float = 1.0,
+        max_iter: int = 10,
+        initial_partition: Any = None,
+        seed: Optional[int] = None,
+        **options,
     ) -> Dict[str, Any]:
         """
         Detect communities using Louvain algorithm.
 
         This method applies the Louvain algorithm for community detection,
         which optimizes modularity through iterative greedy optimization.
-        Uses NetworkX implementation when available, with fallback to basic
-        greedy modularity approach.
+        Uses the NetworkX implementation for small graphs, and the native
+        Louvain (incremental modularity gains, multi-level aggregation) for
+        large graphs, without NetworkX, or when ``initial_partition`` is given.
 
         Args:
             graph: Input graph for community detection (dict, object with
-                  relationships, or NetworkX graph)
+                  relationships, NetworkX graph or CompactGraph)
             resolution: Resolution parameter for modularity optimization
                        (default: 1.0, higher values favor smaller communities)
-            max_iter: Maximum iterations for basic implementation (default: 10)
+            max_iter: Maximum aggregation levels of the native implementation
+                     (default: 10)
+            initial_partition: Previous result, node -> community mapping, or
+                              list of communities to start from (nodes not in
+                              it start alone)
+            seed: Random seed of the native implementation
             **options: Additional detection options (unused)
 
         Returns:
@@ -133,11 +160,12 @@ class CommunityDetector:
         try:
             self.logger.info("Detecting communities using Louvain algorithm")
 
-            if self.use_networkx:
+            compact = CompactGraph.from_graph(graph)
+            if initial_partition is None and self._use_networkx_for(compact):
                 try:
                     import networkx.algorithms.community as nx_comm
 
-                    nx_graph = self._to_networkx(graph)
+                    nx_graph = compact.to_networkx()
                     
                     # Check if graph is empty or has no edges
                     num_nodes = nx_graph.number_of_nodes()
@@ -158,8 +186,6 @@ class CommunityDetector:
                             "algorithm": "louvain",
                         }
 
-                    resolution = options.get("resolution", 1.0)
-
                     self.progress_tracker.update_tracking(
                         tracking_id, message="Detecting communities with NetworkX..."
                     )
@@ -195,13 +221,16 @@ class CommunityDetector:
                     )
 
             self.progress_tracker.update_tracking(
-                tracking_id, message="Using basic community detection..."
+                tracking_id, message="Detecting communities with native Louvain..."
             )
-            # Basic greedy modularity implementation
-            adjacency = self._build_adjacency(graph)
-            result = self._basic_community_detection(
-                adjacency, algorithm="louvain", **options
+            labels = community_engine.louvain(
+                compact,
+                resolution=resolution,
+                seed=self.seed if seed is None else seed,
+                initial_partition=self._partition_map(initial_partition),
+                max_levels=max_iter,
             )
+            result = self._native_result(compact, labels, "louvain")
             self.progress_tracker.stop_tracking(
                 tracking_id,
                 status="completed",
@@ -216,35 +245,67 @@ class CommunityDetector:
             raise
 
     def detect_communities_leiden(
-        self, graph: Any, resolution: float = 1.0, max_iter: int = 10, **options
+        self,
+        graph: Any,
+        resolution: float = 1.0,
+        max_iter: int = 10,
+        initial_partition: Any = None,
+        seed: Optional[int] = None,
+        **options,
     ) -> Dict[str, Any]:
         """
         Detect communities using Leiden algorithm.
 
-        This method applies the Leiden algorithm for community detection,
-        which is similar to Louvain but includes a refinement step for better
-        quality. Currently uses Louvain implementation as Leiden refinement
-        requires additional libraries.
+        This method applies the native Leiden algorithm: fast local moving,
+        refinement of each community into well-connected subcommunities, and
+        aggregation. Unlike Louvain, every detected community is connected.
 
         Args:
             graph: Input graph for community detection
             resolution: Resolution parameter for modularity optimization
                        (default: 1.0)
-            max_iter: Maximum iterations (default: 10)
-            **options: Additional detection options
+            max_iter: Maximum aggregation levels (default: 10)
+            initial_partition: Previous result, node -> community mapping, or
+                              list of communities to start from
+            seed: Random seed
+            **options: Additional detection options:
+                - theta: Randomness of refinement merges (default: 0.01)
 
         Returns:
             dict: Community detection results (same format as Louvain)
         """
-        self.logger.info("Detecting communities using Leiden algorithm")
-
-        # Leiden is similar to Louvain but with refinement
-        # For now, use Louvain-like approach (full Leiden requires igraph)
-        result = self.detect_communities_louvain(
-            graph, resolution=resolution, max_iter=max_iter, **options
+        tracking_id = self.progress_tracker.start_tracking(
+            file=None,
+            module="kg",
+            submodule="CommunityDetector",
+            message="Detecting communities using Leiden algorithm",
         )
-        result["algorithm"] = "leiden"
-        return result
+
+        try:
+            self.logger.info("Detecting communities using Leiden algorithm")
+
+            compact = CompactGraph.from_graph(graph)
+            labels = community_engine.leiden(
+                compact,
+                resolution=resolution,
+                seed=self.seed if seed is None else seed,
+                initial_partition=self._partition_map(initial_partition),
+                max_levels=max_iter,
+                theta=options.get("theta", 0.01),
+            )
+            result = self._native_result(compact, labels, "leiden")
+            self.progress_tracker.stop_tracking(
+                tracking_id,
+                status="completed",
+                message=f"Detected {len(result['communities'])} communities",
+            )
+            return result
+
+        except Exception as e:
+            self.progress_tracker.stop_tracking(
+                tracking_id, status="failed", message=str(e)
+            )
+            raise
 
     def detect_overlapping_communities(
         self, graph: Any, k: int = 3, min_size: int = 3, **options
@@ -330,19 +391,10 @@ class CommunityDetector:
         """
         self.logger.info("Calculating community quality metrics")
 
-        adjacency = self._build_adjacency(graph)
+        compact = CompactGraph.from_graph(graph)
 
         # Extract community structure
-        if isinstance(communities, dict):
-            node_communities = communities
-        elif isinstance(communities, dict) and "node_assignments" in communities:
-            node_communities = communities["node_assignments"]
-        else:
-            # Convert list of communities to node assignments
-            node_communities = {}
-            for i, community in enumerate(communities):
-                for node in community:
-                    node_communities[node] = i
+        node_communities = self._partition_map(communities)
 
         # Calculate metrics
         num_communities = len(set(node_communities.values()))
@@ -350,8 +402,10 @@ class CommunityDetector:
         for comm_id in node_communities.values():
             community_sizes[comm_id] += 1
 
-        # Calculate modularity (simplified)
-        modularity = self._calculate_modularity(adjacency, node_communities)
+        # Calculate modularity (nodes without a community count as singletons)
+        modularity = community_engine.modularity(
+            compact, community_engine.partition_to_labels(compact, node_communities)
+        )
 
         # Calculate statistics
         sizes = list(community_sizes.values())
@@ -388,32 +442,27 @@ class CommunityDetector:
         """
         self.logger.info("Analyzing community structure")
 
-        metrics = self.calculate_community_metrics(graph, communities)
+        compact = CompactGraph.from_graph(graph)
+        metrics = self.calculate_community_metrics(compact, communities)
 
         # Extract node assignments
-        if isinstance(communities, dict) and "node_assignments" in communities:
-            node_communities = communities["node_assignments"]
-        elif isinstance(communities, dict):
-            node_communities = communities
-        else:
-            node_communities = {}
-            for i, community in enumerate(communities):
-                for node in community:
-                    node_communities[node] = i
-
-        # Analyze connectivity between communities
-        adjacency = self._build_adjacency(graph)
-        inter_community_edges = 0
-        intra_community_edges = 0
-
-        for source, targets in adjacency.items():
-            source_comm = node_communities.get(source)
-            for target in targets:
-                target_comm = node_communities.get(target)
-                if source_comm == target_comm:
-                    intra_community_edges += 1
-                else:
-                    inter_community_edges += 1
+        node_communities = self._partition_map(communities)
+
+        # Analyze connectivity between communities: compare the community
+        # codes of both ends of every CSR entry (unassigned nodes share one code)
+        codes: Dict[Any, int] = {}
+        node_codes = np.array(
+            [
+                codes.setdefault(node_communities.get(node), len(codes))
+                for node in compact.node_ids
+            ],
+            dtype=np.int64,
+        )
+        rows = np.repeat(np.arange(compact.num_nodes), compact.degrees)
+        intra_community_edges = int(
+            np.count_nonzero(node_codes[rows] == node_codes[compact.indices])
+        )
+        inter_community_edges = len(compact.indices) - intra_community_edges
 
         return {
             **metrics,
@@ -456,110 +505,11 @@ class CommunityDetector:
 
     def _build_adjacency(self, graph) -> Dict[str, List[str]]:
         """Build adjacency list from graph."""
-        from collections import defaultdict
-
-        adjacency = defaultdict(list)
-
-        # Extract relationships
-        relationships = []
-        if hasattr(graph, "relationships"):
-            relationships = graph.relationships
-        elif hasattr(graph, "get_relationships"):
-            relationships = graph.get_relationships()
-        elif isinstance(graph, dict):
-            relationships = graph.get("relationships", [])
-
-        # Build adjacency
-        for rel in relationships:
-            source = rel.get("source") or rel.get("subject")
-            target = rel.get("target") or rel.get("object")
-
-            # Extract IDs if objects are passed
-            if source and not isinstance(source, (str, int, float)):
-                if isinstance(source, dict):
-                    source = source.get("id") or source.get("entity_id") or source.get("text") or str(source)
-                else:
-                    source = getattr(source, "id", getattr(source, "text", str(source)))
-            
-            if target and not isinstance(target, (str, int, float)):
-                if isinstance(target, dict):
-                    target = target.get("id") or target.get("entity_id") or target.get("text") or str(target)
-                else:
-                    target = getattr(target, "id", getattr(target, "text", str(target)))
-
-            if source and target:
-                if target not in adjacency[source]:
-                    adjacency[source].append(target)
-                if source not in adjacency[target]:
-                    adjacency[target].append(source)
-
-        return dict(adjacency)
+        return CompactGraph.from_graph(graph).adjacency_lists()
 
     def _to_networkx(self, graph):
         """Convert graph to NetworkX format."""
-        adjacency = self._build_adjacency(graph)
-        nx_graph = self.nx.Graph()
-
-        for source, targets in adjacency.items():
-            for target in targets:
-                nx_graph.add_edge(source, target)
-
-        return nx_graph
-
-    def _basic_community_detection(
-        self, adjacency: Dict[str, List[str]], algorithm="louvain", **options
-    ):
-        """Basic community detection implementation."""
-        # Simple greedy approach
-        nodes = list(adjacency.keys())
-        node_communities = {node: i for i, node in enumerate(nodes)}
-
-        # Simple merge step
-        changed = True
-        iterations = 0
-        max_iter = options.get("max_iter", 10)
-        best_modularity = 0.0
-
-        while changed and iterations < max_iter:
-            changed = False
-            iterations += 1
-
-            for node in nodes:
-                # Find best community for this node
-                best_community = node_communities[node]
-                best_modularity = self._calculate_modularity(
-                    adjacency, node_communities
-                )
-
-                # Try moving to neighbor communities
-                for neighbor in adjacency.get(node, []):
-                    neighbor_comm = node_communities.get(neighbor)
-                    if neighbor_comm != node_communities[node]:
-                        # Try moving
-                        old_comm = node_communities[node]
-                        node_communities[node] = neighbor_comm
-                        new_modularity = self._calculate_modularity(
-                            adjacency, node_communities
-                        )
-
-                        if new_modularity > best_modularity:
-                            best_modularity = new_modularity
-                            best_community = neighbor_comm
-                            changed = True
-                        else:
-                            node_communities[node] = old_comm
-
-        # Build communities
-        communities = defaultdict(list)
-        for node, comm_id in node_communities.items():
-            communities[comm_id].append(node)
-
-        return {
-            "communities": list(communities.values()),
-            "node_assignments": node_communities,
-            "modularity": best_modularity,
-            "algorithm": algorithm,
-        }
+        return CompactGraph.from_graph(graph).to_networkx()
 
     def _basic_overlapping_detection(self, adjacency: Dict[str, List[str]], **options):
         """Basic overlapping community detection."""
@@ -594,30 +544,40 @@ class CommunityDetector:
             "algorithm": "overlapping",
         }
 
-    def _calculate_modularity(
-        self, adjacency: Dict[str, List[str]], node_communities: Dict[str, int]
-    ) -> float:
-        """Calculate modularity."""
-        # Simplified modularity calculation
-        total_edges = sum(len(neighbors) for neighbors in adjacency.values()) // 2
-
-        if total_edges == 0:
-            return 0.0
-
-        modularity = 0.0
-        nodes = list(adjacency.keys())
-
-        for node in nodes:
-            node_comm = node_communities.get(node)
-            degree = len(adjacency.get(node, []))
-
-            for neighbor in adjacency.get(node, []):
-                neighbor_comm = node_communities.get(neighbor)
-
-                if node_comm == neighbor_comm:
-                    # Same community
-                    modularity += 1.0 - (degree * len(adjacency.get(neighbor, []))) / (
-                        2 * total_edges
-                    )
+    def _use_networkx_for(self, compact: CompactGraph) -> bool:
+        """Whether to use NetworkX (backend setting, availability, graph size)."""
+        if not self.use_networkx or self.backend == "native":
+            return False
+        if self.backend == "networkx":
+            return True
+        return compact.num_nodes < self.native_threshold
+
+    @staticmethod
+    def _partition_map(communities: Any) -> Optional[Dict[Any, Any]]:
+        """Node -> community mapping from a result, mapping or community list."""
+        if communities is None:
+            return None
+        if isinstance(communities, dict) and "node_assignments" in communities:
+            return communities["node_assignments"]
+        if isinstance(communities, dict):
+            return communities
+        node_communities = {}
+        for i, community in enumerate(communities):
+            for node in community:
+                node_communities[node] = i
+        return node_communities
 
-        return modularity / (2 * total_edges) if total_edges > 0 else 0.0
+    @staticmethod
+    def _native_result(
+        compact: CompactGraph, labels, algorithm: str
+    ) -> Dict[str, Any]:
+        """Result dictionary from native community labels."""
+        communities = community_engine.labels_to_communities(compact, labels)
+        return {
+            "communities": communities,
+            "node_assignments": {
+                node: i for i, community in enumerate(communities) for node in community
+            },
+            "modularity": community_engine.modularity(compact, labels),
+            "algorithm": algorithm,
+        }
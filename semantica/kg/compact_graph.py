@@ -0,0 +1,343 @@
+"""
+Compact Graph Module
+
+This module provides the shared graph representation used by the knowledge
+graph analyzers (centrality, communities, connectivity). A graph is converted
+once into integer node IDs and CSR arrays; every analyzer then works on the
+same arrays instead of rebuilding its own adjacency dictionaries.
+
+Algorithms Used:
+    - Node Interning: String ID -> dense integer index in first-appearance
+      order
+    - CSR Construction: Both directions of every relationship are encoded as
+      ``row * n + column`` keys and deduplicated with np.unique, giving the
+      sorted ``indptr`` / ``indices`` arrays of the undirected simple graph;
+      parallel relationships are merged and their weights summed with
+      np.bincount
+    - Relation-Type Slices: Per relationship type, the CSR of the subgraph is
+      built from the masked relationship arrays on first use and cached
+    - Degree Arrays: np.diff(indptr) and row sums of the weights, cached
+
+Key Features:
+    - Built once per graph, then passed to any analyzer in place of the graph
+    - Accepts graph dictionaries, objects with ``relationships`` and NetworkX
+      graphs
+    - Lazy, cached conversion to NetworkX and to adjacency dictionaries
+    - Relationship types and weights kept alongside the structure
+
+Main Classes:
+    - CompactGraph: Interned, CSR-backed undirected graph
+
+Example Usage:
+    >>> from semantica.kg import CompactGraph, GraphAnalyzer
+    >>> compact = CompactGraph.from_graph(kg)
+    >>> compact.num_nodes, compact.num_edges
+    >>> compact.neighbor_ids("Alice")
+    >>> works_at = compact.relation_slice(["works_at"])
+    >>> analysis = GraphAnalyzer().analyze_graph(compact)
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+def _endpoint_id(value: Any) -> Any:
+    """Node ID of a relationship endpoint (ID, dictionary or object)."""
+    if value and not isinstance(value, (str, int, float)):
+        if isinstance(value, dict):
+            return (
+                value.get("id")
+                or value.get("entity_id")
+                or value.get("text")
+                or str(value)
+            )
+        return getattr(value, "id", getattr(value, "text", str(value)))
+    return value
+
+
+def _relationships_of(graph: Any) -> Iterable[Any]:
+    if hasattr(graph, "relationships"):
+        return graph.relationships
+    if hasattr(graph, "get_relationships"):
+        return graph.get_relationships()
+    if isinstance(graph, dict):
+        return graph.get("relationships", [])
+    return []
+
+
+class CompactGraph:
+    """
+    Undirected graph on integer node indices with CSR adjacency.
+
+    Attributes:
+        node_ids: Node ID per index
+        index: Node ID -> index
+        indptr, indices, weights: CSR arrays of the undirected simple graph
+            (neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``,
+            sorted; a self-loop appears once in its row)
+        edge_src, edge_dst, edge_type: Relationships as given (directed,
+            possibly parallel), with relationship type codes
+        relation_types: Relationship type per code
+    """
+
+    def __init__(
+        self,
+        node_ids: Sequence[Hashable],
+        edge_src: np.ndarray,
+        edge_dst: np.ndarray,
+        edge_weight: Optional[np.ndarray] = None,
+        edge_type: Optional[np.ndarray] = None,
+        relation_types: Optional[Sequence[str]] = None,
+    ):
+        """
+        Build from interned relationship arrays.
+
+        Args:
+            node_ids: Node ID per index
+            edge_src: Source index per relationship
+            edge_dst: Target index per relationship
+            edge_weight: Weight per relationship (default 1.0)
+            edge_type: Relationship type code per relationship (default 0)
+            relation_types: Relationship type per code
+        """
+        self.node_ids: List[Hashable] = list(node_ids)
+        self.index: Dict[Hashable, int] = {
+            node: i for i, node in enumerate(self.node_ids)
+        }
+        n_rel = len(edge_src)
+        self.edge_src = np.asarray(edge_src, dtype=np.int64)
+        self.edge_dst = np.asarray(edge_dst, dtype=np.int64)
+        self.edge_weight = (
+            np.ones(n_rel)
+            if edge_weight is None
+            else np.asarray(edge_weight, dtype=np.float64)
+        )
+        self.edge_type = (
+            np.zeros(n_rel, dtype=np.int32)
+            if edge_type is None
+            else np.asarray(edge_type, dtype=np.int32)
+        )
+        self.relation_types: List[str] = list(relation_types or [""])
+        self._slices: Dict[FrozenSet[str], "CompactGraph"] = {}
+
+        n = max(len(self.node_ids), 1)
+        # Both directions; the reverse copy of a self-loop is dropped
+        loops = self.edge_src == self.edge_dst
+        rows = np.concatenate([self.edge_src, self.edge_dst[~loops]])
+        cols = np.concatenate([self.edge_dst, self.edge_src[~loops]])
+        weights = np.concatenate([self.edge_weight, self.edge_weight[~loops]])
+        keys, inverse = np.unique(rows * n + cols, return_inverse=True)
+        self.weights = np.bincount(
+            inverse.ravel(), weights=weights, minlength=len(keys)
+        ).astype(np.float64)
+        self.indices = keys % n
+        self.indptr = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(keys // n, minlength=len(self.node_ids)), out=self.indptr[1:]
+        )
+
+    # Construction
+
+    @classmethod
+    def from_graph(cls, graph: Any, include_isolated: bool = False) -> "CompactGraph":
+        """
+        Build from any graph the analyzers accept.
+
+        Args:
+            graph: CompactGraph (returned as is), NetworkX graph, dictionary
+                with "relationships" ("source"/"subject", "target"/"object",
+                optional "type"/"predicate" and "weight"), or object with
+                ``relationships`` / ``get_relationships()``
+            include_isolated: Also add entities without relationships (from
+                ``graph["entities"]``) as nodes
+
+        Returns:
+            CompactGraph
+        """
+        if isinstance(graph, cls):
+            return graph
+        if hasattr(graph, "adj") and hasattr(graph, "edges") and hasattr(graph, "nodes"):
+            return cls.from_networkx(graph)
+
+        index: Dict[Hashable, int] = {}
+        type_codes: Dict[str, int] = {}
+        src: List[int] = []
+        dst: List[int] = []
+        weights: List[float] = []
+        types: List[int] = []
+        for rel in _relationships_of(graph):
+            source = _endpoint_id(rel.get("source") or rel.get("subject"))
+            target = _endpoint_id(rel.get("target") or rel.get("object"))
+            if not (source and target):
+                continue
+            src.append(index.setdefault(source, len(index)))
+            dst.append(index.setdefault(target, len(index)))
+            weight = rel.get("weight", 1.0)
+            weights.append(float(weight) if isinstance(weight, (int, float)) else 1.0)
+            rel_type = str(rel.get("type") or rel.get("predicate") or "")
+            types.append(type_codes.setdefault(rel_type, len(type_codes)))
+
+        if include_isolated and isinstance(graph, dict):
+            for entity in graph.get("entities", []):
+                node = _endpoint_id(entity) if isinstance(entity, dict) else entity
+                if node:
+                    index.setdefault(node, len(index))
+
+        return cls(
+            list(index),
+            np.array(src, dtype=np.int64),
+            np.array(dst, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+            np.array(types, dtype=np.int32),
+            list(type_codes) or [""],
+        )
+
+    @classmethod
+    def from_networkx(cls, nx_graph: Any, weight: str = "weight") -> "CompactGraph":
+        """Build from a NetworkX graph (edge directions are ignored)."""
+        node_ids = list(nx_graph.nodes())
+        index = {node: i for i, node in enumerate(node_ids)}
+        edges = list(nx_graph.edges(data=True))
+        type_codes: Dict[str, int] = {}
+        types = [
+            type_codes.setdefault(str(data.get("type", "")), len(type_codes))
+            for _, _, data in edges
+        ]
+        return cls(
+            node_ids,
+            np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges)),
+            np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges)),
+            np.fromiter(
+                (float(data.get(weight, 1.0)) for _, _, data in edges),
+                dtype=np.float64,
+                count=len(edges),
+            ),
+            np.array(types, dtype=np.int32),
+            list(type_codes) or [""],
+        )
+
+    # Structure
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges (parallel relationships merged)."""
+        return int((len(self.indices) + self.num_self_loops) // 2)
+
+    @cached_property
+    def num_self_loops(self) -> int:
+        """Number of nodes with a self-loop."""
+        return int(np.count_nonzero(self._rows == self.indices))
+
+    @cached_property
+    def degrees(self) -> np.ndarray:
+        """Number of distinct neighbors per node (a self-loop counts once)."""
+        return np.diff(self.indptr)
+
+    @cached_property
+    def weighted_degrees(self) -> np.ndarray:
+        """Sum of edge weights per node."""
+        return np.bincount(self._rows, weights=self.weights, minlength=self.num_nodes)
+
+    @cached_property
+    def _rows(self) -> np.ndarray:
+        """Row index of every CSR entry."""
+        return np.repeat(np.arange(self.num_nodes), self.degrees)
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """Neighbor indices of a node index."""
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def neighbor_ids(self, node_id: Hashable) -> List[Hashable]:
+        """Neighbor IDs of a node ID."""
+        if node_id not in self.index:
+            return []
+        return [self.node_ids[i] for i in self.neighbors(self.index[node_id]).tolist()]
+
+    @cached_property
+    def edge_list(self) -> np.ndarray:
+        """Undirected edges as an (m, 2) array with ``u <= v``."""
+        upper = self._rows <= self.indices
+        return np.column_stack([self._rows[upper], self.indices[upper]])
+
+    @cached_property
+    def edge_weights(self) -> np.ndarray:
+        """Summed weight per row of ``edge_list``."""
+        return self.weights[self._rows <= self.indices]
+
+    def relation_slice(self, relation_types: Iterable[str]) -> "CompactGraph":
+        """
+        Subgraph of the given relationship types over the same node indices.
+
+        Args:
+            relation_types: Relationship types to keep
+
+        Returns:
+            CompactGraph (cached per set of types)
+        """
+        key = frozenset(relation_types)
+        if key not in self._slices:
+            codes = [i for i, name in enumerate(self.relation_types) if name in key]
+            mask = np.isin(self.edge_type, codes)
+            self._slices[key] = CompactGraph(
+                self.node_ids,
+                self.edge_src[mask],
+                self.edge_dst[mask],
+                self.edge_weight[mask],
+                self.edge_type[mask],
+                self.relation_types,
+            )
+        return self._slices[key]
+
+    # Conversions
+
+    def adjacency_lists(self) -> Dict[Hashable, List[Hashable]]:
+        """Node ID -> list of neighbor IDs, for nodes with at least one edge."""
+        return self._adjacency_lists
+
+    @cached_property
+    def _adjacency_lists(self) -> Dict[Hashable, List[Hashable]]:
+        ids = self.node_ids
+        neighbor_ids = [ids[i] for i in self.indices.tolist()]
+        bounds = self.indptr.tolist()
+        return {
+            ids[i]: neighbor_ids[bounds[i] : bounds[i + 1]]
+            for i in range(self.num_nodes)
+            if bounds[i + 1] > bounds[i]
+        }
+
+    def to_networkx(self) -> Any:
+        """
+        NetworkX Graph with the same nodes, edges and summed weights.
+
+        Built on first call and cached; treat it as read-only.
+        """
+        return self._networkx
+
+    @cached_property
+    def _networkx(self) -> Any:
+        import networkx as nx
+
+        graph = nx.Graph()
+        graph.add_nodes_from(self.node_ids)
+        ids = self.node_ids
+        graph.add_weighted_edges_from(
+            (ids[u], ids[v], w)
+            for (u, v), w in zip(self.edge_list.tolist(), self.edge_weights.tolist())
+        )
+        return graph
+
+    def __len__(self) -> int:
+        return self.num_nodes
+
+    def __repr__(self) -> str:
+        return f"CompactGraph(nodes={self.num_nodes}, edges={self.num_edges})"
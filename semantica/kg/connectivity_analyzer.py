@@ -5,34 +5,58 @@ This module provides comprehensive connectivity analysis capabilities for the
 Semantica framework, enabling analysis of graph connectivity, path finding,
 and structural properties.
 
+Algorithms Used:
+    - Connected Components: Vectorized label propagation with pointer jumping
+      on the CSR edge list
+    - Shortest Paths: One BFS per source recording predecessors; paths are
+      reconstructed from the predecessor array only when requested, and the
+      all-pairs result is a lazy mapping that searches from a source on first
+      access
+    - Path Length Statistics: Bit-parallel multi-source BFS over all sources
+      (small graphs) or a uniform sample of sources (large graphs), with a
+      confidence interval for the average path length and lower/upper bounds
+      for the diameter; sources can be spread over a process pool
+    - Bridges and Articulation Points: Tarjan's linear-time low-link DFS
+
 Key Features:
     - Graph connectivity analysis (connected/disconnected)
-    - Connected components detection (DFS-based)
-    - Shortest path calculation (BFS-based)
-    - Bridge edge identification (edges whose removal disconnects graph)
+    - Connected components detection
+    - Shortest path calculation (BFS-based, lazy path reconstruction)
+    - Average path length and diameter, exact or sampled with error bounds
+    - Bridge edge and articulation point identification
     - Connectivity metrics (density, degree statistics)
     - Graph structure classification
-    - NetworkX integration with fallback implementations
+    - Accepts a prebuilt CompactGraph shared with the other analyzers
 
 Main Classes:
     - ConnectivityAnalyzer: Main connectivity analysis engine
 
 Example Usage:
     >>> from semantica.kg import ConnectivityAnalyzer
-    >>> analyzer = ConnectivityAnalyzer()
+    >>> analyzer = ConnectivityAnalyzer(path_sample_size=256, n_jobs=4)
     >>> connectivity = analyzer.analyze_connectivity(graph)
     >>> paths = analyzer.calculate_shortest_paths(graph, source="A", target="B")
+    >>> lengths = analyzer.estimate_path_lengths(graph)
     >>> bridges = analyzer.identify_bridges(graph)
 
 Author: Semantica Contributors
 License: MIT
 """
 
-from collections import defaultdict, deque
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from .compact_graph import CompactGraph
+from .connectivity_engine import (
+    AllPairsShortestPaths,
+    bridges_and_articulation_points,
+    connected_components,
+    estimate_path_lengths,
+    shortest_path_tree,
+)
 
 
 class ConnectivityAnalyzer:
@@ -40,14 +64,16 @@ class ConnectivityAnalyzer:
     Connectivity analysis engine.
 
     This class provides comprehensive connectivity analysis for knowledge graphs,
-    including connected component detection, shortest path calculation, bridge
-    identification, and connectivity metrics. Uses NetworkX when available,
-    with fallback to basic implementations.
+    including connected component detection, shortest path calculation, path
+    length statistics, bridge identification, and connectivity metrics. All
+    algorithms run on the CSR arrays of a CompactGraph in linear time per BFS
+    source.
 
     Features:
-        - Connected component detection (DFS-based)
-        - Shortest path calculation (BFS-based)
-        - Bridge edge identification
+        - Connected component detection
+        - Shortest path calculation (BFS-based, lazy path reconstruction)
+        - Exact or sampled average path length and diameter
+        - Bridge edge and articulation point identification (Tarjan)
         - Connectivity metrics (density, degree statistics)
         - Graph structure classification
 
@@ -62,47 +88,46 @@ class ConnectivityAnalyzer:
         """
         Initialize connectivity analyzer.
 
-        Sets up the analyzer with configuration and checks for optional
-        dependencies (NetworkX). Falls back to basic implementations if
-        NetworkX is not available.
-
         Args:
             **config: Configuration options:
                 - analysis_config: Analysis configuration (optional)
+                - exact_path_limit: Largest graph (in nodes) whose path length
+                  statistics are computed from every source (default: 2000)
+                - path_sample_size: BFS sources sampled above that size
+                  (default: 256)
+                - confidence: Confidence level of the sampled average path
+                  length interval (default: 0.95)
+                - n_jobs: Worker processes for path length BFS (default: 1,
+                  -1 for all CPUs)
+                - seed: Random seed for source sampling (optional)
         """
         self.logger = get_logger("connectivity_analyzer")
         self.connectivity_algorithms = ["dfs", "bfs", "tarjan", "kosaraju"]
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
         self.analysis_config = config.get("analysis_config", {})
         self.config = config
+        self.exact_path_limit = config.get("exact_path_limit", 2000)
+        self.path_sample_size = config.get("path_sample_size", 256)
+        self.confidence = config.get("confidence", 0.95)
+        self.n_jobs = config.get("n_jobs", 1)
+        self.seed = config.get("seed")
 
-        # Try to use networkx if available (optional dependency)
-        from ..utils.helpers import safe_import
-        networkx, nx_available = safe_import("networkx")
-        if nx_available:
-            self.nx = networkx
-            self.use_networkx = True
-            self.logger.debug("NetworkX available, using optimized implementations")
-        else:
-            self.nx = None
-            self.use_networkx = False
-            self.logger.warning("NetworkX not available, using basic implementations")
-
-    def analyze_connectivity(self, graph: Any) -> Dict[str, Any]:
+    def analyze_connectivity(self, graph: Any, **options) -> Dict[str, Any]:
         """
         Analyze graph connectivity.
 
         This method performs comprehensive connectivity analysis, including
-        connected component detection and connectivity metrics calculation.
+        connected component detection, connectivity metrics and path length
+        statistics.
 
         Args:
             graph: Input graph for connectivity analysis (dict, object with
-                  relationships, or NetworkX graph)
+                  relationships, NetworkX graph or CompactGraph)
+            **options: Analysis options:
+                - path_lengths: Include path length statistics (default: True)
+                - path_sample_size, confidence: Override the configuration
 
         Returns:
             dict: Comprehensive connectivity analysis containing:
@@ -118,24 +143,34 @@ class ConnectivityAnalyzer:
                 - max_degree: Maximum node degree
                 - min_degree: Minimum node degree
                 - is_connected: Whether graph is fully connected (single component)
+                - avg_path_length, diameter, path_lengths: Path length
+                  statistics from estimate_path_lengths() (unless disabled)
         """
         self.logger.info("Analyzing graph connectivity")
 
-        components_result = self.find_connected_components(graph)
-        metrics = self.calculate_connectivity_metrics(graph)
+        compact = CompactGraph.from_graph(graph)
+        labels = connected_components(compact)
+        components_result = self._components_result(compact, labels)
+        metrics = self.calculate_connectivity_metrics(compact)
 
-        return {
+        result = {
             **components_result,
             **metrics,
             "is_connected": components_result.get("num_components", 0) == 1,
         }
+        if options.get("path_lengths", True):
+            path_lengths = self._path_lengths(compact, labels, **options)
+            result["avg_path_length"] = path_lengths["avg_path_length"]
+            result["diameter"] = path_lengths["diameter"]
+            result["path_lengths"] = path_lengths
+        return result
 
     def find_connected_components(self, graph: Any) -> Dict[str, Any]:
         """
         Find connected components in graph.
 
         This method identifies all connected components (disconnected subgraphs)
-        in the graph using depth-first search (DFS).
+        in the graph by vectorized label propagation.
 
         Args:
             graph: Input graph for component analysis
@@ -150,39 +185,8 @@ class ConnectivityAnalyzer:
         """
         self.logger.info("Finding connected components")
 
-        adjacency = self._build_adjacency(graph)
-        visited = set()
-        components = []
-
-        # DFS to find components
-        for node in adjacency:
-            if node not in visited:
-                component = []
-                stack = [node]
-
-                while stack:
-                    current = stack.pop()
-                    if current not in visited:
-                        visited.add(current)
-                        component.append(current)
-
-                        for neighbor in adjacency.get(current, []):
-                            if neighbor not in visited:
-                                stack.append(neighbor)
-
-                if component:
-                    components.append(component)
-
-        # Calculate statistics
-        component_sizes = [len(comp) for comp in components]
-
-        return {
-            "components": components,
-            "num_components": len(components),
-            "component_sizes": component_sizes,
-            "largest_component_size": max(component_sizes) if component_sizes else 0,
-            "smallest_component_size": min(component_sizes) if component_sizes else 0,
-        }
+        compact = CompactGraph.from_graph(graph)
+        return self._components_result(compact, connected_components(compact))
 
     def calculate_shortest_paths(
         self, graph: Any, source: Optional[str] = None, target: Optional[str] = None
@@ -192,7 +196,10 @@ class ConnectivityAnalyzer:
 
         This method calculates shortest paths between nodes using breadth-first
         search (BFS). If both source and target are provided, calculates single
-        pair shortest path. If omitted, calculates all pairs shortest paths.
+        pair shortest path, stopping the search at the target's level. If
+        omitted, returns lazy all-pairs mappings: a BFS runs only for the
+        sources that are accessed, and paths are reconstructed from
+        predecessor arrays on access.
 
         Args:
             graph: Input graph for path analysis
@@ -208,20 +215,37 @@ class ConnectivityAnalyzer:
                     - distance: Path length in edges (or -1 if no path)
                     - exists: Whether path exists
                 - If source/target omitted:
-                    - distances: Dictionary of all-pairs distances
-                    - paths: Dictionary of all-pairs paths
-                    - avg_path_length: Average shortest path length
+                    - distances: Lazy mapping source -> {target: distance}
+                      (-1 if no path)
+                    - paths: Lazy mapping source -> target -> path (or None)
+                      (an AllPairsShortestPaths)
+                    - avg_path_length: Average shortest path length (sampled
+                      on graphs above exact_path_limit)
+                    - path_lengths: Full statistics from
+                      estimate_path_lengths()
         """
         self.logger.info(f"Calculating shortest paths from {source} to {target}")
 
-        adjacency = self._build_adjacency(graph)
+        compact = CompactGraph.from_graph(graph)
 
         if source is None or target is None:
-            # Calculate all pairs shortest paths
-            return self._calculate_all_pairs_shortest_paths(adjacency)
+            paths = AllPairsShortestPaths(compact)
+            path_lengths = self._path_lengths(compact)
+            return {
+                "distances": paths.distances,
+                "paths": paths,
+                "avg_path_length": path_lengths["avg_path_length"],
+                "path_lengths": path_lengths,
+            }
 
         # Single pair shortest path
-        path, distance = self._bfs_shortest_path(adjacency, source, target)
+        path, distance = None, -1
+        if source == target:
+            path, distance = [source], 0
+        elif source in compact.index and target in compact.index:
+            target_index = compact.index[target]
+            tree = shortest_path_tree(compact, compact.index[source], target_index)
+            path, distance = tree.path(target), tree.distance(target)
 
         return {
             "source": source,
@@ -231,14 +255,53 @@ class ConnectivityAnalyzer:
             "exists": path is not None,
         }
 
+    def estimate_path_lengths(
+        self,
+        graph: Any,
+        sample_size: Optional[int] = None,
+        confidence: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Average shortest path length and diameter.
+
+        Graphs up to exact_path_limit nodes are searched from every node;
+        larger graphs from a uniform sample of BFS sources, with a confidence
+        interval for the average and lower/upper bounds for the diameter.
+        Averages are over ordered pairs of distinct, connected nodes.
+
+        Args:
+            graph: Input graph for path analysis
+            sample_size: Number of sampled sources (default: path_sample_size
+                above exact_path_limit, otherwise exact)
+            confidence: Confidence level of the interval (default: from
+                configuration)
+
+        Returns:
+            dict: Path length statistics containing:
+                - avg_path_length: Average (or estimated) shortest path length
+                - avg_path_length_ci: (low, high) confidence interval
+                - diameter: Longest shortest path found (a lower bound when
+                  sampled)
+                - diameter_bounds: (low, high) bounds on the diameter
+                - exact: Whether every node was used as a source
+                - num_sources: Number of BFS sources
+                - confidence: Confidence level of the interval
+        """
+        self.logger.info("Estimating path lengths")
+
+        compact = CompactGraph.from_graph(graph)
+        return self._path_lengths(
+            compact, path_sample_size=sample_size, confidence=confidence
+        )
+
     def identify_bridges(self, graph: Any) -> Dict[str, Any]:
         """
         Identify bridge edges in graph.
 
         This method identifies bridge edges (edges whose removal would
-        disconnect the graph or increase the number of connected components).
-        Uses a simple approach: temporarily removes each edge and checks if
-        connectivity changes.
+        increase the number of connected components) and articulation points
+        (nodes whose removal would) with Tarjan's low-link DFS in a single
+        linear-time pass.
 
         Args:
             graph: Input graph for bridge analysis
@@ -249,42 +312,23 @@ class ConnectivityAnalyzer:
                 - num_bridges: Total number of bridge edges
                 - bridge_edges: List of bridge edge dictionaries with
                                "source" and "target" keys
+                - articulation_points: List of articulation point node IDs
+                - num_articulation_points: Number of articulation points
         """
         self.logger.info("Identifying bridge edges")
 
-        adjacency = self._build_adjacency(graph)
-        bridges = []
-
-        # Get all edges
-        edges = set()
-        for source, targets in adjacency.items():
-            for target in targets:
-                edge = tuple(sorted([source, target]))
-                edges.add(edge)
-
-        # Check each edge
-        for edge in edges:
-            source, target = edge
-
-            # Remove edge temporarily
-            temp_adjacency = {
-                k: [v for v in vs if v != target] for k, vs in adjacency.items()
-            }
-            temp_adjacency[source] = [
-                v for v in temp_adjacency.get(source, []) if v != target
-            ]
-
-            # Check connectivity
-            components = self._find_components(temp_adjacency)
-
-            # If more components, it's a bridge
-            if len(components) > 1:
-                bridges.append(edge)
+        compact = CompactGraph.from_graph(graph)
+        bridge_pairs, cut_vertices = bridges_and_articulation_points(compact)
+        ids = compact.node_ids
+        bridges = [(ids[u], ids[v]) for u, v in bridge_pairs.tolist()]
+        articulation_points = [ids[i] for i in cut_vertices.tolist()]
 
         return {
             "bridges": bridges,
             "num_bridges": len(bridges),
             "bridge_edges": [{"source": s, "target": t} for s, t in bridges],
+            "articulation_points": articulation_points,
+            "num_articulation_points": len(articulation_points),
         }
 
     def calculate_connectivity_metrics(self, graph: Any) -> Dict[str, Any]:
@@ -308,28 +352,27 @@ class ConnectivityAnalyzer:
         """
         self.logger.info("Calculating connectivity metrics")
 
-        adjacency = self._build_adjacency(graph)
-        nodes = list(adjacency.keys())
-        n = len(nodes)
+        compact = CompactGraph.from_graph(graph)
+        n = compact.num_nodes
+        degrees = compact.degrees
 
         # Count edges
-        total_edges = sum(len(neighbors) for neighbors in adjacency.values()) // 2
+        total_edges = int(degrees.sum()) // 2
 
         # Calculate density
         max_edges = n * (n - 1) / 2 if n > 1 else 0
         density = total_edges / max_edges if max_edges > 0 else 0.0
 
         # Average degree
-        degrees = [len(adjacency.get(node, [])) for node in nodes]
-        avg_degree = sum(degrees) / n if n > 0 else 0.0
+        avg_degree = float(degrees.mean()) if n > 0 else 0.0
 
         return {
             "num_nodes": n,
             "num_edges": total_edges,
             "density": density,
             "avg_degree": avg_degree,
-            "max_degree": max(degrees) if degrees else 0,
-            "min_degree": min(degrees) if degrees else 0,
+            "max_degree": int(degrees.max()) if n > 0 else 0,
+            "min_degree": int(degrees.min()) if n > 0 else 0,
         }
 
     def analyze_graph_structure(self, graph: Any) -> Dict[str, Any]:
@@ -352,9 +395,10 @@ class ConnectivityAnalyzer:
         """
         self.logger.info("Analyzing graph structure")
 
-        connectivity = self.analyze_connectivity(graph)
-        metrics = self.calculate_connectivity_metrics(graph)
-        bridges = self.identify_bridges(graph)
+        compact = CompactGraph.from_graph(graph)
+        connectivity = self.analyze_connectivity(compact)
+        metrics = self.calculate_connectivity_metrics(compact)
+        bridges = self.identify_bridges(compact)
 
         return {
             **connectivity,
@@ -363,132 +407,44 @@ class ConnectivityAnalyzer:
             "structure_type": self._classify_structure(connectivity, metrics),
         }
 
-    def _build_adjacency(self, graph) -> Dict[str, List[str]]:
-        """Build adjacency list from graph."""
-        adjacency = defaultdict(list)
-
-        # Extract relationships
-        relationships = []
-        if hasattr(graph, "relationships"):
-            relationships = graph.relationships
-        elif hasattr(graph, "get_relationships"):
-            relationships = graph.get_relationships()
-        elif isinstance(graph, dict):
-            relationships = graph.get("relationships", [])
-
-        # Build adjacency
-        for rel in relationships:
-            source = rel.get("source") or rel.get("subject")
-            target = rel.get("target") or rel.get("object")
-
-            # Extract IDs if objects are passed
-            if source and not isinstance(source, (str, int, float)):
-                if isinstance(source, dict):
-                    source = source.get("id") or source.get("entity_id") or source.get("text") or str(source)
-                else:
-                    source = getattr(source, "id", getattr(source, "text", str(source)))
-            
-            if target and not isinstance(target, (str, int, float)):
-                if isinstance(target, dict):
-                    target = target.get("id") or target.get("entity_id") or target.get("text") or str(target)
-                else:
-                    target = getattr(target, "id", getattr(target, "text", str(target)))
-
-            if source and target:
-                if target not in adjacency[source]:
-                    adjacency[source].append(target)
-                if source not in adjacency[target]:
-                    adjacency[target].append(source)
-
-        return dict(adjacency)
-
-    def _bfs_shortest_path(
-        self, adjacency: Dict[str, List[str]], source: str, target: str
-    ) -> Tuple[Optional[List[str]], int]:
-        """Find shortest path using BFS."""
-        if source == target:
-            return [source], 0
-
-        queue = deque([(source, [source])])
-        visited = {source}
-
-        while queue:
-            node, path = queue.popleft()
-
-            for neighbor in adjacency.get(node, []):
-                if neighbor == target:
-                    return path + [target], len(path)
-
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-
-        return None, -1
-
-    def _calculate_all_pairs_shortest_paths(
-        self, adjacency: Dict[str, List[str]]
+    def _components_result(
+        self, compact: CompactGraph, labels: np.ndarray
     ) -> Dict[str, Any]:
-        """Calculate all pairs shortest paths."""
-        nodes = list(adjacency.keys())
-        distances = {}
-        paths = {}
-
-        for source in nodes:
-            distances[source] = {}
-            paths[source] = {}
-
-            for target in nodes:
-                if source == target:
-                    distances[source][target] = 0
-                    paths[source][target] = [source]
-                else:
-                    path, distance = self._bfs_shortest_path(adjacency, source, target)
-                    distances[source][target] = distance
-                    paths[source][target] = path
+        """Component lists and size statistics from component labels."""
+        sizes = np.bincount(labels)
+        members = np.argsort(labels, kind="stable").tolist()
+        ids = compact.node_ids
+        components = []
+        start = 0
+        for size in sizes.tolist():
+            components.append([ids[i] for i in members[start : start + size]])
+            start += size
+        component_sizes = sizes.tolist()
 
         return {
-            "distances": distances,
-            "paths": paths,
-            "avg_path_length": self._calculate_avg_path_length(distances),
+            "components": components,
+            "num_components": len(components),
+            "component_sizes": component_sizes,
+            "largest_component_size": max(component_sizes) if component_sizes else 0,
+            "smallest_component_size": min(component_sizes) if component_sizes else 0,
         }
 
-    def _calculate_avg_path_length(self, distances: Dict[str, Dict[str, int]]) -> float:
-        """Calculate average path length."""
-        total = 0
-        count = 0
-
-        for source_distances in distances.values():
-            for distance in source_distances.values():
-                if distance > 0:
-                    total += distance
-                    count += 1
-
-        return total / count if count > 0 else 0.0
-
-    def _find_components(self, adjacency: Dict[str, List[str]]) -> List[List[str]]:
-        """Find connected components using DFS."""
-        visited = set()
-        components = []
-
-        for node in adjacency:
-            if node not in visited:
-                component = []
-                stack = [node]
-
-                while stack:
-                    current = stack.pop()
-                    if current not in visited:
-                        visited.add(current)
-                        component.append(current)
-
-                        for neighbor in adjacency.get(current, []):
-                            if neighbor not in visited:
-                                stack.append(neighbor)
-
-                if component:
-                    components.append(component)
-
-        return components
+    def _path_lengths(
+        self, compact: CompactGraph, labels: Optional[np.ndarray] = None, **options
+    ) -> Dict[str, Any]:
+        """Path length statistics, sampled above exact_path_limit nodes."""
+        sample_size = options.get("path_sample_size")
+        if sample_size is None and compact.num_nodes > self.exact_path_limit:
+            sample_size = self.path_sample_size
+        confidence = options.get("confidence")
+        return estimate_path_lengths(
+            compact,
+            sample_size=sample_size,
+            confidence=self.confidence if confidence is None else confidence,
+            seed=self.seed,
+            n_jobs=self.n_jobs,
+            labels=labels,
+        )
 
     def _classify_structure(
         self, connectivity: Dict[str, Any], metrics: Dict[str, Any]
@@ -68,9 +68,6 @@ class EntityResolver:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
         self.config = config
 
         # Resolution strategy and threshold
@@ -11,6 +11,7 @@ Key Features:
     - Connectivity analysis and path finding
     - Graph metrics and statistics
     - Temporal graph analysis (optional)
+    - One CompactGraph conversion shared by all analyzers in analyze_graph
 
 Example Usage:
     >>> from semantica.kg import GraphAnalyzer
@@ -27,6 +28,7 @@ from typing import Any, Dict, Optional
 from ..utils.progress_tracker import get_progress_tracker
 from .centrality_calculator import CentralityCalculator
 from .community_detector import CommunityDetector
+from .compact_graph import CompactGraph
 from .connectivity_analyzer import ConnectivityAnalyzer
 
 
@@ -80,9 +82,6 @@ class GraphAnalyzer:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Merge configuration
         self.config = config or {}
@@ -118,10 +117,12 @@ class GraphAnalyzer:
 
         This method runs all available graph analytics including centrality
         measures, community detection, connectivity analysis, and metrics
-        computation. Returns a comprehensive analysis report.
+        computation. Returns a comprehensive analysis report. The graph is
+        converted to a CompactGraph once and shared by all analyzers.
 
         Args:
-            graph: Knowledge graph to analyze (dict with "entities" and "relationships")
+            graph: Knowledge graph to analyze (dict with "entities" and
+                "relationships", or a prebuilt CompactGraph)
             **options: Analysis options passed to individual analyzers
 
         Returns:
@@ -138,21 +139,24 @@ class GraphAnalyzer:
         """
         self.logger.info("Performing comprehensive graph analysis")
 
+        # Build the shared compact representation once
+        compact = CompactGraph.from_graph(graph)
+
         # Calculate centrality measures for all nodes
         self.logger.debug("Calculating centrality measures")
-        centrality = self.calculate_centrality(graph, **options)
+        centrality = self.calculate_centrality(compact, **options)
 
         # Detect community structures
         self.logger.debug("Detecting communities")
-        communities = self.detect_communities(graph, **options)
+        communities = self.detect_communities(compact, **options)
 
         # Analyze graph connectivity
         self.logger.debug("Analyzing connectivity")
-        connectivity = self.analyze_connectivity(graph, **options)
+        connectivity = self.analyze_connectivity(compact, **options)
 
         # Compute overall graph metrics
         self.logger.debug("Computing graph metrics")
-        metrics = self.compute_metrics(graph=graph, **options)
+        metrics = self.compute_metrics(graph=graph, compact_graph=compact, **options)
 
         # Compile comprehensive results
         results = {
@@ -205,7 +209,9 @@ class GraphAnalyzer:
         """
         return self.connectivity_analyzer.analyze_connectivity(graph, **options)
 
-    def compute_metrics(self, graph=None, at_time=None, time_range=None, **options):
+    def compute_metrics(
+        self, graph=None, at_time=None, time_range=None, compact_graph=None, **options
+    ):
         """
         Compute comprehensive graph metrics.
 
@@ -219,6 +225,7 @@ class GraphAnalyzer:
             graph: Graph to analyze (if not provided, uses stored graph)
             at_time: Calculate metrics at specific time point (temporal graphs)
             time_range: Calculate metrics for time range (temporal graphs)
+            compact_graph: Prebuilt CompactGraph of ``graph`` (built if omitted)
             **options: Additional metric calculation options
 
         Returns:
@@ -229,7 +236,9 @@ class GraphAnalyzer:
 
         # Get connectivity metrics
         connectivity_metrics = (
-            self.connectivity_analyzer.calculate_connectivity_metrics(graph)
+            self.connectivity_analyzer.calculate_connectivity_metrics(
+                compact_graph if compact_graph is not None else graph
+            )
         )
 
         # Get entities and relationships
@@ -33,6 +33,7 @@ Centrality Calculation:
     - "betweenness": Betweenness centrality
     - "closeness": Closeness centrality
     - "eigenvector": Eigenvector centrality
+    - "pagerank": PageRank
     - "all": All centrality measures
 
 Community Detection:
@@ -313,6 +314,7 @@ def calculate_centrality(
             - "betweenness": Betweenness centrality
             - "closeness": Closeness centrality
             - "eigenvector": Eigenvector centrality
+            - "pagerank": PageRank
             - "all": All centrality measures
         **kwargs: Additional options passed to CentralityCalculator
 
@@ -350,6 +352,8 @@ def calculate_centrality(
             return calculator.calculate_closeness_centrality(graph)
         elif method == "eigenvector":
             return calculator.calculate_eigenvector_centrality(graph)
+        elif method == "pagerank":
+            return calculator.calculate_pagerank(graph)
         elif method == "all":
             return calculator.calculate_all_centrality(graph)
         else:
@@ -422,7 +426,9 @@ def analyze_connectivity(
             - "default": Comprehensive connectivity analysis
             - "components": Connected components only
             - "paths": Path finding only
-            - "bridges": Bridge detection only
+            - "bridges": Bridge and articulation point detection only
+            - "path_lengths": Average path length and diameter (sampled on
+              large graphs; pass sample_size to override)
         **kwargs: Additional options passed to ConnectivityAnalyzer
 
     Returns:
@@ -460,6 +466,10 @@ def analyze_connectivity(
             )
         elif method == "bridges":
             return analyzer.identify_bridges(graph)
+        elif method == "path_lengths":
+            return analyzer.estimate_path_lengths(
+                graph, sample_size=kwargs.get("sample_size")
+            )
         else:
             return analyzer.analyze_connectivity(graph)
 
@@ -513,13 +523,15 @@ def query_temporal(
         query_engine = TemporalGraphQuery(**config)
 
         if method == "time_point":
-            at_time = kwargs.get("at_time")
-            return query_engine.query_at_time(graph, query, at_time=at_time, **kwargs)
+            options = dict(kwargs)
+            at_time = options.pop("at_time", None)
+            return query_engine.query_at_time(graph, query, at_time=at_time, **options)
         elif method == "time_range":
-            start_time = kwargs.get("start_time")
-            end_time = kwargs.get("end_time")
+            options = dict(kwargs)
+            start_time = options.pop("start_time", None)
+            end_time = options.pop("end_time", None)
             return query_engine.query_time_range(
-                graph, query, start_time, end_time, **kwargs
+                graph, query, start_time, end_time, **options
             )
         elif method == "pattern":
             pattern = kwargs.get("pattern", "sequence")
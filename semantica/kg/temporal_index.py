@@ -0,0 +1,470 @@
+"""
+Temporal Index Module
+
+This module provides the interval index behind TemporalGraphQuery. The
+validity interval (valid_from, valid_until) of every relationship is parsed
+once into epoch seconds and stored in centered interval trees, so
+point-in-time and range queries cost O(log n + k) instead of a scan of every
+relationship with per-call time parsing.
+
+Algorithms Used:
+    - Time Parsing: ISO 8601 strings (including a trailing "Z"), datetime and
+      date objects (naive values are read as UTC) and epoch numbers become
+      float seconds; a missing bound is -inf / +inf. Each distinct time
+      string is parsed once per build
+    - Centered Interval Tree: Each node holds the intervals containing its
+      center (an interval endpoint), sorted once by start and once by end;
+      intervals entirely left or right of the center go to the child trees.
+      A stabbing query walks one root-to-leaf path and takes a sorted prefix
+      or suffix at each node; an overlap query additionally reports whole
+      nodes inside the range
+    - Keyed Trees: Trees over the relationships of one relationship type or
+      one entity (and the row groups behind them) are built on first use and
+      kept on the index
+    - Legacy Fallback: Relationships whose times cannot be parsed, and
+      queries with unparseable times, fall back to the previous string
+      comparison so no relationship is silently dropped
+
+Key Features:
+    - Built once per graph and reusable across queries
+    - Point, overlap and containment ("valid throughout") queries
+    - Filtering by relationship type and entity through dedicated trees
+    - Results in the original relationship order
+
+Main Classes:
+    - TemporalIndex: Interval index over a graph's relationships
+
+Example Usage:
+    >>> from semantica.kg import TemporalIndex
+    >>> index = TemporalIndex.from_graph(kg)
+    >>> rows = index.at("2024-01-01", relation_type="works_at")
+    >>> index.relationships(rows)
+    >>> rows = index.overlapping("2023-01-01", "2023-12-31", entity="Alice")
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+from collections.abc import Hashable
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_UNBOUNDED = (None, "")
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """
+    Epoch seconds of a time value.
+
+    Args:
+        value: ISO 8601 string, datetime, date or number (epoch seconds)
+
+    Returns:
+        Seconds since the epoch, None for a missing value, or NaN if the
+        value cannot be parsed
+    """
+    if value in _UNBOUNDED:
+        return None
+    if isinstance(value, bool):
+        return float("nan")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        try:
+            value = datetime.fromisoformat(text)
+        except ValueError:
+            return float("nan")
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(
+            value.year, value.month, value.day, tzinfo=timezone.utc
+        ).timestamp()
+    return float("nan")
+
+
+def legacy_time(value: Any) -> Optional[str]:
+    """String form of a time value, as compared before the index existed."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class _IntervalTree:
+    """Static centered interval tree over (start, end, row) arrays."""
+
+    __slots__ = (
+        "center",
+        "by_start",
+        "starts",
+        "by_end",
+        "ends",
+        "left",
+        "right",
+    )
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, rows: np.ndarray):
+        endpoints = np.sort(np.concatenate([starts, ends]))
+        self.center = endpoints[len(endpoints) // 2]
+        here = (starts <= self.center) & (ends >= self.center)
+        order = np.argsort(starts[here], kind="stable")
+        self.by_start = rows[here][order]
+        self.starts = starts[here][order]
+        order = np.argsort(ends[here], kind="stable")
+        self.by_end = rows[here][order]
+        self.ends = ends[here][order]
+
+        left = ends < self.center
+        right = starts > self.center
+        self.left = _IntervalTree.build(starts[left], ends[left], rows[left])
+        self.right = _IntervalTree.build(starts[right], ends[right], rows[right])
+
+    @classmethod
+    def build(
+        cls, starts: np.ndarray, ends: np.ndarray, rows: np.ndarray
+    ) -> Optional["_IntervalTree"]:
+        return cls(starts, ends, rows) if len(rows) else None
+
+    def stab(self, t: float, out: List[np.ndarray]) -> None:
+        """Rows of intervals containing ``t``."""
+        node = self
+        while node is not None:
+            if t < node.center:
+                stop = np.searchsorted(node.starts, t, side="right")
+                out.append(node.by_start[:stop])
+                node = node.left
+            elif t > node.center:
+                out.append(node.by_end[np.searchsorted(node.ends, t, side="left") :])
+                node = node.right
+            else:
+                out.append(node.by_start)
+                return
+
+    def overlap(self, low: float, high: float, out: List[np.ndarray]) -> None:
+        """Rows of intervals intersecting ``[low, high]``."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if high < node.center:
+                out.append(
+                    node.by_start[: np.searchsorted(node.starts, high, side="right")]
+                )
+                children = (node.left,)
+            elif low > node.center:
+                out.append(node.by_end[np.searchsorted(node.ends, low, side="left") :])
+                children = (node.right,)
+            else:
+                out.append(node.by_start)
+                children = (node.left, node.right)
+            stack.extend(child for child in children if child is not None)
+
+
+class TemporalIndex:
+    """
+    Interval index over the validity intervals of a graph's relationships.
+
+    Query methods return sorted row positions into ``relationships``; pass
+    them to ``relationships(rows)`` for the relationship dictionaries.
+
+    Attributes:
+        entities: Entity list of the graph
+        relationships_list: Relationship list of the graph (not copied)
+        starts, ends: valid_from / valid_until per relationship in epoch
+            seconds (-inf / +inf when missing)
+        unparsed: Rows whose times could not be parsed (matched by string
+            comparison)
+        inverted: Rows with valid_until before valid_from (matched
+            directly)
+    """
+
+    def __init__(
+        self,
+        relationships: List[Dict[str, Any]],
+        entities: Optional[List[Any]] = None,
+    ):
+        """
+        Parse and index relationship validity intervals.
+
+        Args:
+            relationships: Relationship dictionaries with optional
+                "valid_from", "valid_until", "type", "source" and "target"
+            entities: Entity list returned with query results (optional)
+        """
+        self.relationships_list = relationships
+        self.entities = entities if entities is not None else []
+        n = len(relationships)
+        self.starts = np.full(n, -np.inf)
+        self.ends = np.full(n, np.inf)
+        # Rows per relationship type and per entity, grouped on first use
+        self._type_rows: Optional[Dict[Hashable, List[int]]] = None
+        self._entity_rows: Optional[Dict[Hashable, List[int]]] = None
+        # Time strings repeat across relationships; parse each once
+        epochs: Dict[str, Optional[float]] = {}
+        for row, rel in enumerate(relationships):
+            bounds = []
+            for value in (rel.get("valid_from"), rel.get("valid_until")):
+                if isinstance(value, str):
+                    if value not in epochs:
+                        epochs[value] = to_epoch(value)
+                    bounds.append(epochs[value])
+                else:
+                    bounds.append(to_epoch(value))
+            start, end = bounds
+            if start is not None:
+                self.starts[row] = start
+            if end is not None:
+                self.ends[row] = end
+
+        parsed = ~(np.isnan(self.starts) | np.isnan(self.ends))
+        self.unparsed = np.flatnonzero(~parsed)
+        # Intervals ending before they start match no time point, but can
+        # still intersect a range; they are checked directly
+        inverted = np.zeros(n, dtype=bool)
+        inverted[parsed] = self.starts[parsed] > self.ends[parsed]
+        self.inverted = np.flatnonzero(inverted)
+        self._kinds = {
+            "tree": parsed & ~inverted,
+            "inverted": inverted,
+            "unparsed": ~parsed,
+        }
+        self._kind_rows = {
+            kind: np.flatnonzero(mask) for kind, mask in self._kinds.items()
+        }
+        self._trees: Dict[Tuple[str, Hashable], Optional[_IntervalTree]] = {}
+
+    @classmethod
+    def from_graph(cls, graph: Any) -> "TemporalIndex":
+        """
+        Index of a graph dictionary.
+
+        Args:
+            graph: TemporalIndex (returned as is) or dictionary with
+                "relationships" and optional "entities"
+
+        Returns:
+            TemporalIndex
+        """
+        if isinstance(graph, cls):
+            return graph
+        return cls(graph.get("relationships", []), graph.get("entities", []))
+
+    def __len__(self) -> int:
+        return len(self.relationships_list)
+
+    # Queries
+
+    def at(
+        self,
+        time: Any,
+        relation_type: Optional[Hashable] = None,
+        entity: Optional[Hashable] = None,
+    ) -> np.ndarray:
+        """
+        Rows of relationships valid at a time point (bounds inclusive).
+
+        Args:
+            time: Time point (ISO string, datetime or epoch seconds)
+            relation_type: Only relationships of this type (optional)
+            entity: Only relationships with this source or target (optional)
+
+        Returns:
+            Sorted row positions
+        """
+        return self.overlapping(time, time, relation_type, entity)
+
+    def overlapping(
+        self,
+        start: Any = None,
+        end: Any = None,
+        relation_type: Optional[Hashable] = None,
+        entity: Optional[Hashable] = None,
+    ) -> np.ndarray:
+        """
+        Rows of relationships whose validity intersects ``[start, end]``.
+
+        Args:
+            start: Range start (None: unbounded)
+            end: Range end (None: unbounded)
+            relation_type: Only relationships of this type (optional)
+            entity: Only relationships with this source or target (optional)
+
+        Returns:
+            Sorted row positions
+        """
+        low, high = self._bounds(start, end)
+        if np.isnan(low) or np.isnan(high):
+            rows = self._candidate_rows(relation_type, entity)
+            return self._legacy_overlap(rows, start, end)
+
+        tree = self._tree(relation_type, entity)
+        parts: List[np.ndarray] = []
+        if tree is not None:
+            if low < high:
+                tree.overlap(low, high, parts)
+            else:
+                tree.stab(high, parts)
+        found = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+        if low > high:
+            # A reversed range matches intervals spanning it, as before
+            found = found[self.ends[found] >= low]
+        if relation_type is not None and entity is not None:
+            found = found[self._matches_type(found, relation_type)]
+        found = self._with_irregular(found, relation_type, entity, start, end)
+        return np.sort(found)
+
+    def covering(
+        self,
+        start: Any,
+        end: Any,
+        relation_type: Optional[Hashable] = None,
+        entity: Optional[Hashable] = None,
+    ) -> np.ndarray:
+        """
+        Rows of relationships valid throughout ``[start, end]``.
+
+        Args:
+            start: Range start
+            end: Range end
+            relation_type: Only relationships of this type (optional)
+            entity: Only relationships with this source or target (optional)
+
+        Returns:
+            Sorted row positions
+        """
+        low, high = self._bounds(start, end)
+        found = self.at(start, relation_type, entity)
+        if np.isnan(low) or np.isnan(high):
+            return self._legacy_covering(found, start, end)
+        parsed = ~(np.isnan(self.starts[found]) | np.isnan(self.ends[found]))
+        rows = found[parsed]
+        rows = rows[(self.starts[rows] <= low) & (self.ends[rows] >= high)]
+        legacy = self._legacy_covering(found[~parsed], start, end)
+        return np.sort(np.concatenate([rows, legacy]))
+
+    def relationships(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Relationship dictionaries of the given rows."""
+        relationships = self.relationships_list
+        return [relationships[row] for row in rows.tolist()]
+
+    # Internals
+
+    @staticmethod
+    def _bounds(start: Any, end: Any) -> Tuple[float, float]:
+        """Epoch bounds of a query range (missing bounds are infinite)."""
+        low, high = to_epoch(start), to_epoch(end)
+        return (-np.inf if low is None else low, np.inf if high is None else high)
+
+    def _group_rows(self) -> None:
+        """Group rows by relationship type and by entity."""
+        type_rows: Dict[Hashable, List[int]] = {}
+        entity_rows: Dict[Hashable, List[int]] = {}
+        for row, rel in enumerate(self.relationships_list):
+            type_rows.setdefault(rel.get("type"), []).append(row)
+            source, target = rel.get("source"), rel.get("target")
+            for endpoint in (source,) if source == target else (source, target):
+                if isinstance(endpoint, Hashable):
+                    entity_rows.setdefault(endpoint, []).append(row)
+        self._type_rows, self._entity_rows = type_rows, entity_rows
+
+    def _candidate_rows(
+        self, relation_type: Optional[Hashable], entity: Optional[Hashable]
+    ) -> np.ndarray:
+        if self._type_rows is None and (entity is not None or relation_type is not None):
+            self._group_rows()
+        if entity is not None:
+            rows = np.array(self._entity_rows.get(entity, []), dtype=np.int64)
+            if relation_type is not None:
+                rows = rows[self._matches_type(rows, relation_type)]
+            return rows
+        if relation_type is not None:
+            return np.array(self._type_rows.get(relation_type, []), dtype=np.int64)
+        return np.arange(len(self.starts), dtype=np.int64)
+
+    def _matches_type(self, rows: np.ndarray, relation_type: Hashable) -> np.ndarray:
+        relationships = self.relationships_list
+        return np.array(
+            [relationships[row].get("type") == relation_type for row in rows.tolist()],
+            dtype=bool,
+        )
+
+    def _tree(
+        self, relation_type: Optional[Hashable], entity: Optional[Hashable]
+    ) -> Optional[_IntervalTree]:
+        """Interval tree of all rows, one type or one entity (built on first use)."""
+        if entity is not None:
+            key: Tuple[str, Hashable] = ("entity", entity)
+            relation_type = None
+        elif relation_type is not None:
+            key = ("type", relation_type)
+        else:
+            key = ("all", None)
+        if key not in self._trees:
+            rows = self._rows_of_kind("tree", relation_type, entity)
+            self._trees[key] = _IntervalTree.build(
+                self.starts[rows], self.ends[rows], rows
+            )
+        return self._trees[key]
+
+    def _with_irregular(self, found, relation_type, entity, start, end) -> np.ndarray:
+        """Add matching unparsed and inverted rows to tree results."""
+        if not (len(self.unparsed) or len(self.inverted)):
+            return found
+        low, high = self._bounds(start, end)
+        inverted = self._rows_of_kind("inverted", relation_type, entity)
+        inverted = inverted[
+            (self.starts[inverted] <= high) & (self.ends[inverted] >= low)
+        ]
+        unparsed = self._legacy_overlap(
+            self._rows_of_kind("unparsed", relation_type, entity), start, end
+        )
+        return np.concatenate([found, inverted, unparsed])
+
+    def _rows_of_kind(
+        self, kind: str, relation_type: Optional[Hashable], entity: Optional[Hashable]
+    ) -> np.ndarray:
+        """Candidate rows that are in the trees, inverted or unparsed."""
+        if relation_type is None and entity is None:
+            return self._kind_rows[kind]
+        rows = self._candidate_rows(relation_type, entity)
+        return rows[self._kinds[kind][rows]]
+
+    def _legacy_overlap(self, rows: np.ndarray, start: Any, end: Any) -> np.ndarray:
+        """String comparison filter used before the index existed."""
+        start_s, end_s = legacy_time(start), legacy_time(end)
+        keep = []
+        for row in rows.tolist():
+            rel = self.relationships_list[row]
+            valid_from = legacy_time(rel.get("valid_from"))
+            valid_until = legacy_time(rel.get("valid_until"))
+            if valid_from and end_s is not None and end_s < valid_from:
+                continue
+            if valid_until and start_s is not None and start_s > valid_until:
+                continue
+            keep.append(row)
+        return np.array(keep, dtype=np.int64)
+
+    def _legacy_covering(self, rows: np.ndarray, start: Any, end: Any) -> np.ndarray:
+        """String comparison filter for validity throughout a range."""
+        start_s, end_s = legacy_time(start), legacy_time(end)
+        keep = []
+        for row in rows.tolist():
+            rel = self.relationships_list[row]
+            valid_from = legacy_time(rel.get("valid_from"))
+            valid_until = legacy_time(rel.get("valid_until"))
+            if valid_from and (start_s is None or valid_from > start_s):
+                continue
+            if valid_until and (end_s is None or valid_until < end_s):
+                continue
+            keep.append(row)
+        return np.array(keep, dtype=np.int64)
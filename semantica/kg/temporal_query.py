@@ -5,13 +5,24 @@ This module provides comprehensive time-aware querying capabilities for the
 Semantica framework, enabling temporal queries and analysis on knowledge
 graphs with temporal information.
 
+Algorithms Used:
+    - Temporal Index: Validity intervals parsed once per graph into epoch
+      arrays and centered interval trees (see temporal_index), giving
+      O(log n + k) time-point and time-range lookups, with trees per
+      relationship type and per entity
+    - Delta-Encoded Versions: The first version keeps its items; every later
+      version stores only the items added, removed or changed since the
+      previous one (detected by comparing shallow item snapshots). Comparing
+      two versions composes the deltas between them instead of diffing full
+      copies
+
 Key Features:
     - Time-point queries (query graph at specific time)
     - Time-range queries (query within time intervals)
     - Temporal pattern detection (sequences, cycles, trends)
     - Graph evolution analysis
     - Temporal path finding
-    - Temporal version management
+    - Temporal version management with delta snapshots
 
 Main Classes:
     - TemporalGraphQuery: Main temporal query engine
@@ -23,14 +34,21 @@ Example Usage:
     >>> query_engine = TemporalGraphQuery()
     >>> result = query_engine.query_at_time(graph, query, at_time="2024-01-01")
     >>> evolution = query_engine.analyze_evolution(graph, start_time="2024-01-01")
+    >>> index = query_engine.build_index(graph)  # reuse across many queries
+    >>> result = query_engine.query_at_time(index, query, at_time="2024-06-01")
 
 Author: Semantica Contributors
 License: MIT
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils.exceptions import ValidationError
 from ..utils.progress_tracker import get_progress_tracker
+from .temporal_index import TemporalIndex
 
 
 class TemporalGraphQuery:
@@ -77,10 +95,20 @@ class TemporalGraphQuery:
             max_temporal_depth: Maximum depth for temporal queries (optional)
             **kwargs: Additional configuration options:
                 - pattern_detection: Configuration for pattern detector (optional)
+                - cache_index: Keep the temporal indexes of recently queried
+                  graphs on this engine (default: True). A cached index is
+                  rebuilt when the graph's relationship list is replaced or
+                  changes length; after editing relationships in place, call
+                  clear_index_cache()
+                - index_cache_size: Number of cached indexes (default: 8)
         """
         self.enable_temporal_reasoning = enable_temporal_reasoning
         self.temporal_granularity = temporal_granularity
         self.max_temporal_depth = max_temporal_depth
+        self.cache_index = kwargs.get("cache_index", True)
+        self.index_cache_size = kwargs.get("index_cache_size", 8)
+        self._index_cache: "OrderedDict[int, TemporalIndex]" = OrderedDict()
+        self._index_lock = threading.Lock()
 
         # Initialize temporal query engine
         from ..utils.logging import get_logger
@@ -89,9 +117,6 @@ class TemporalGraphQuery:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Initialize pattern detector
         self.pattern_detector = TemporalPatternDetector(
@@ -115,13 +140,16 @@ class TemporalGraphQuery:
         valid_until fields in relationships.
 
         Args:
-            graph: Knowledge graph to query (dict with "entities" and "relationships")
+            graph: Knowledge graph to query (dict with "entities" and
+                "relationships", or a TemporalIndex from build_index())
             query: Query string (currently unused, reserved for future query parsing)
             at_time: Time point (datetime object, timestamp, or ISO format string)
             include_history: Whether to include all relationships with temporal
                            information (default: False, only valid relationships)
             temporal_precision: Precision for time matching (optional, unused)
-            **options: Additional query options (unused)
+            **options: Additional query options:
+                - relation_type: Only relationships of this type
+                - entity: Only relationships with this source or target
 
         Returns:
             dict: Query results containing:
@@ -137,28 +165,18 @@ class TemporalGraphQuery:
         # Parse time
         query_time = self._parse_time(at_time)
 
-        # Filter relationships valid at query time
-        relationships = []
-        if "relationships" in graph:
-            for rel in graph.get("relationships", []):
-                valid_from = self._parse_time(rel.get("valid_from"))
-                valid_until = self._parse_time(rel.get("valid_until"))
-
-                # Check if relationship is valid at query time
-                if valid_from and self._compare_times(query_time, valid_from) < 0:
-                    continue
-                if valid_until and self._compare_times(query_time, valid_until) > 0:
-                    continue
-
-                relationships.append(rel)
+        # Relationships valid at query time, from the interval index
+        index = self.build_index(graph)
+        rows = index.at(at_time, options.get("relation_type"), options.get("entity"))
+        relationships = index.relationships(rows)
 
         # Get entities
-        entities = graph.get("entities", [])
+        entities = index.entities
 
         # Include history if requested
         if include_history:
             # Add all relationships with temporal information
-            relationships = graph.get("relationships", [])
+            relationships = index.relationships_list
 
         return {
             "query": query,
@@ -195,7 +213,9 @@ class TemporalGraphQuery:
                 - "intersection": Only relationships valid throughout entire range
                 - "evolution": Group relationships by time periods
             include_intervals: Include partial matches within range (default: True)
-            **options: Additional query options (unused)
+            **options: Additional query options:
+                - relation_type: Only relationships of this type
+                - entity: Only relationships with this source or target
 
         Returns:
             dict: Query results containing:
@@ -212,34 +232,18 @@ class TemporalGraphQuery:
         start = self._parse_time(start_time)
         end = self._parse_time(end_time)
 
-        # Filter relationships valid in time range
-        relationships = []
-        if "relationships" in graph:
-            for rel in graph.get("relationships", []):
-                valid_from = self._parse_time(rel.get("valid_from"))
-                valid_until = self._parse_time(rel.get("valid_until"))
-
-                # Check if relationship overlaps with time range
-                if valid_from and self._compare_times(end, valid_from) < 0:
-                    continue
-                if valid_until and self._compare_times(start, valid_until) > 0:
-                    continue
-
-                relationships.append(rel)
-
         # Aggregate based on strategy
+        index = self.build_index(graph)
+        keys = (options.get("relation_type"), options.get("entity"))
         if temporal_aggregation == "intersection":
             # Only relationships valid throughout the entire range
-            relationships = [
-                rel
-                for rel in relationships
-                if self._parse_time(rel.get("valid_from")) <= start
-                and (
-                    not rel.get("valid_until")
-                    or self._parse_time(rel.get("valid_until")) >= end
-                )
-            ]
-        elif temporal_aggregation == "evolution":
+            rows = index.covering(start_time, end_time, *keys)
+        else:
+            # Relationships overlapping the range
+            rows = index.overlapping(start_time, end_time, *keys)
+        relationships = index.relationships(rows)
+
+        if temporal_aggregation == "evolution":
             # Group by time periods
             relationships = self._group_by_time_periods(relationships, start, end)
 
@@ -340,42 +344,16 @@ class TemporalGraphQuery:
         if metrics is None:
             metrics = ["count", "diversity", "stability"]
 
-        # Filter relationships
-        relationships = graph.get("relationships", [])
-
-        if entity:
-            relationships = [
-                rel
-                for rel in relationships
-                if rel.get("source") == entity or rel.get("target") == entity
-            ]
-
-        if relationship:
-            relationships = [
-                rel for rel in relationships if rel.get("type") == relationship
-            ]
-
-        # Filter by time range
-        if start_time or end_time:
-            start = self._parse_time(start_time) if start_time else None
-            end = self._parse_time(end_time) if end_time else None
-
-            filtered = []
-            for rel in relationships:
-                valid_from = self._parse_time(rel.get("valid_from"))
-                valid_until = self._parse_time(rel.get("valid_until"))
-
-                if (
-                    start
-                    and valid_until
-                    and self._compare_times(valid_until, start) < 0
-                ):
-                    continue
-                if end and valid_from and self._compare_times(valid_from, end) > 0:
-                    continue
-
-                filtered.append(rel)
-            relationships = filtered
+        # Filter relationships by entity, type and time range (unbounded
+        # when no times are given) through the interval index
+        index = self.build_index(graph)
+        rows = index.overlapping(
+            start_time or None,
+            end_time or None,
+            relation_type=relationship or None,
+            entity=entity or None,
+        )
+        relationships = index.relationships(rows)
 
         # Calculate metrics
         result = {
@@ -445,32 +423,15 @@ class TemporalGraphQuery:
         """
         self.logger.info(f"Finding temporal paths from {source} to {target}")
 
-        # Build adjacency with temporal constraints
+        # Build adjacency from the relationships valid in the time range
         adjacency = {}
-        relationships = graph.get("relationships", [])
+        index = self.build_index(graph)
+        rows = index.overlapping(start_time or None, end_time or None)
 
-        for rel in relationships:
+        for rel in index.relationships(rows):
             s = rel.get("source")
             t = rel.get("target")
 
-            # Check temporal validity
-            if start_time or end_time:
-                valid_from = self._parse_time(rel.get("valid_from"))
-                valid_until = self._parse_time(rel.get("valid_until"))
-
-                if (
-                    start_time
-                    and valid_until
-                    and self._compare_times(valid_until, start_time) < 0
-                ):
-                    continue
-                if (
-                    end_time
-                    and valid_from
-                    and self._compare_times(valid_from, end_time) > 0
-                ):
-                    continue
-
             if s not in adjacency:
                 adjacency[s] = []
             adjacency[s].append((t, rel))
@@ -508,6 +469,48 @@ class TemporalGraphQuery:
             "num_paths": len(paths),
         }
 
+    def build_index(self, graph: Any) -> TemporalIndex:
+        """
+        Temporal index of a graph.
+
+        The index parses relationship times once into epoch arrays and
+        interval trees. The engine keeps the indexes of recently queried
+        graphs, keyed by their relationship list and its length (unless
+        ``cache_index=False``); call ``clear_index_cache()`` after editing
+        relationships in place. Pass the returned index in place of the
+        graph to reuse it explicitly.
+
+        Args:
+            graph: Knowledge graph (dict with "relationships") or TemporalIndex
+
+        Returns:
+            TemporalIndex
+        """
+        if isinstance(graph, TemporalIndex) or not self.cache_index:
+            return TemporalIndex.from_graph(graph)
+
+        relationships = graph.get("relationships", [])
+        entities = graph.get("entities", [])
+        key = id(relationships)
+        with self._index_lock:
+            index = self._index_cache.pop(key, None)
+            if (
+                index is None
+                or index.relationships_list is not relationships
+                or len(index.starts) != len(relationships)
+            ):
+                index = TemporalIndex(relationships, entities)
+            index.entities = entities
+            self._index_cache[key] = index
+            while len(self._index_cache) > self.index_cache_size:
+                self._index_cache.popitem(last=False)
+        return index
+
+    def clear_index_cache(self) -> None:
+        """Drop the cached temporal indexes of this engine."""
+        with self._index_lock:
+            self._index_cache.clear()
+
     def _parse_time(self, time_value):
         """Parse time value."""
         from datetime import datetime
@@ -523,12 +526,6 @@ class TemporalGraphQuery:
 
         return str(time_value)
 
-    def _compare_times(self, time1, time2):
-        """Compare two time strings."""
-        if time1 is None or time2 is None:
-            return 0
-        return (time1 > time2) - (time1 < time2)
-
     def _group_by_time_periods(self, relationships, start, end):
         """Group relationships by time periods."""
         # Simplified grouping
@@ -629,18 +626,94 @@ class TemporalPatternDetector:
         return []
 
 
+def _fields(item: Any) -> Optional[Dict[str, Any]]:
+    """Field mapping of a dict or plain object item, else None."""
+    if isinstance(item, dict):
+        return item
+    fields = getattr(item, "__dict__", None)
+    return fields if isinstance(fields, dict) else None
+
+
+def _snapshot(item: Any) -> Any:
+    """
+    Content of an item as of now, compared with == between versions.
+
+    Dicts and objects are copied one level deep, so replacing a field is
+    seen as a change; nested values are shared with the graph.
+    """
+    fields = _fields(item)
+    if fields is not None:
+        return dict(fields)
+    if isinstance(item, (list, set)):
+        return type(item)(item)
+    return item
+
+
+def _same(before: Any, after: Any) -> bool:
+    """Snapshot equality that tolerates values without a boolean ==."""
+    try:
+        return bool(before == after)
+    except Exception:
+        return before is after
+
+
+def _keyed_items(kind: str, items: List[Any]) -> Dict[Hashable, Tuple[Any, Any]]:
+    """
+    Stable key -> (snapshot, item) for the entities or relationships of a
+    version.
+
+    Entities are keyed by ID, relationships by ID or by (source, type,
+    target, valid_from), read from dict keys or object attributes; other
+    dicts by their content. Remaining hashable items are their own key and
+    unhashable ones are keyed by position.
+    Repeated keys get an occurrence number. Dict items are stored as their
+    snapshot, so the history keeps their content as of the version.
+    """
+    keyed: Dict[Hashable, Tuple[Any, Any]] = {}
+    relationships = kind == "relationships"
+    for position, item in enumerate(items):
+        if isinstance(item, dict):
+            fields = snapshot = dict(item)
+            item = snapshot
+        else:
+            fields = _fields(item)
+            snapshot = _snapshot(item)
+        if fields is not None:
+            base = fields.get("id") or fields.get("entity_id")
+            if base is None and relationships:
+                get = fields.get
+                base = (get("source"), get("type"), get("target"), get("valid_from"))
+            if base is None and item is snapshot:
+                base = tuple(sorted(snapshot.items(), key=lambda field: str(field[0])))
+        else:
+            base = item
+        try:
+            hash(base)
+        except TypeError:
+            base = None
+        if base is None:
+            base = ("position", position)
+        key, occurrence = base, 1
+        while key in keyed:
+            key, occurrence = (base, occurrence), occurrence + 1
+        keyed[key] = (snapshot, item)
+    return keyed
+
+
 class TemporalVersionManager:
     """
     Temporal version management engine.
 
     This class provides version/snapshot management capabilities for knowledge
     graphs, enabling creation of temporal versions, version comparison, and
-    version history tracking.
+    version history tracking. Versions created by a manager are stored as
+    deltas: each keeps only the entities and relationships added, removed or
+    changed since the previous version.
 
     Features:
-        - Version snapshot creation
-        - Version comparison
-        - Version history tracking
+        - Version snapshot creation (delta-encoded history)
+        - Version comparison from stored deltas
+        - Version history tracking and reconstruction
         - Automatic snapshotting (planned)
         - Version rollback (planned)
 
@@ -648,8 +721,11 @@ class TemporalVersionManager:
         >>> manager = TemporalVersionManager()
         >>> version = manager.create_version(graph, version_label="v1.0")
         >>> comparison = manager.compare_versions(version1, version2)
+        >>> snapshot = manager.reconstruct_version(version1["sequence"])
     """
 
+    _KINDS = ("entities", "relationships")
+
     def __init__(
         self,
         snapshot_interval: Optional[int] = None,
@@ -671,11 +747,27 @@ class TemporalVersionManager:
                 - "timestamp": Use timestamps for version labels (default)
                 - "incremental": Use incremental version numbers (planned)
                 - "semantic": Use semantic versioning (planned)
-            **config: Additional configuration options (unused)
+            **config: Additional configuration options:
+                - max_versions: Number of versions kept in ``history``
+                  (default: None, keep all). Older versions are folded into
+                  the oldest kept one and can no longer be compared from
+                  deltas or reconstructed
         """
         self.snapshot_interval = snapshot_interval
         self.auto_snapshot = auto_snapshot
         self.version_strategy = version_strategy
+        self.max_versions = config.get("max_versions")
+
+        # Per version: label, timestamp, metadata and, per kind, the delta
+        # key -> (snapshot before, item before, snapshot after, item after).
+        # The first kept version holds every item as added.
+        self.history: List[Dict[str, Any]] = []
+        # Sequence number of history[0] once older versions are dropped
+        self._first_sequence = 0
+        # Keyed snapshots of the latest version only, to diff the next one
+        self._latest: Dict[str, Dict[Hashable, Tuple[Any, Any]]] = {
+            kind: {} for kind in self._KINDS
+        }
 
     def create_version(
         self,
@@ -689,7 +781,9 @@ class TemporalVersionManager:
         Create version snapshot of graph.
 
         This method creates a snapshot/version of the knowledge graph at a
-        specific point in time, copying entities and relationships.
+        specific point in time. The manager records only the delta from its
+        previous version; the returned snapshot also carries shallow copies
+        of the entity and relationship lists.
 
         Args:
             graph: Knowledge graph to version (dict with "entities" and "relationships")
@@ -705,17 +799,55 @@ class TemporalVersionManager:
                 - entities: Copy of entities list
                 - relationships: Copy of relationships list
                 - metadata: Version metadata dictionary
+                - sequence: Position in this manager's history
+                - changes: Added/removed/modified counts per kind since the
+                  previous version
         """
         from datetime import datetime
 
         version_time = timestamp or datetime.now().isoformat()
+        label = version_label or f"version_{version_time}"
+
+        delta = {}
+        for kind in self._KINDS:
+            current = _keyed_items(kind, graph.get(kind, []))
+            previous = self._latest[kind]
+            changes = {}
+            for key, (snapshot, item) in current.items():
+                before = previous.get(key)
+                if before is None:
+                    changes[key] = (None, None, snapshot, item)
+                elif not _same(before[0], snapshot):
+                    changes[key] = (before[0], before[1], snapshot, item)
+            for key, (snapshot, item) in previous.items():
+                if key not in current:
+                    changes[key] = (snapshot, item, None, None)
+            delta[kind] = changes
+            self._latest[kind] = current
+
+        self.history.append(
+            {
+                "label": label,
+                "timestamp": version_time,
+                "metadata": metadata or {},
+                "delta": delta,
+            }
+        )
+        if self.max_versions is not None:
+            while len(self.history) > max(1, self.max_versions):
+                self._drop_oldest()
 
         version = {
-            "label": version_label or f"version_{version_time}",
+            "label": label,
             "timestamp": version_time,
             "entities": graph.get("entities", []).copy(),
             "relationships": graph.get("relationships", []).copy(),
             "metadata": metadata or {},
+            "sequence": self._first_sequence + len(self.history) - 1,
+            "changes": {
+                kind: self._summarize(delta[kind].values())
+                for kind in self._KINDS
+            },
         }
 
         return version
@@ -731,7 +863,10 @@ class TemporalVersionManager:
         Compare two graph versions.
 
         This method compares two version snapshots and calculates differences
-        in entities and relationships.
+        in entities and relationships. For versions created by this manager
+        the stored deltas between them are composed, so the cost depends on
+        how much changed, not on the graph size; other snapshots are diffed
+        item by item.
 
         Args:
             version1: First version snapshot dictionary
@@ -745,6 +880,9 @@ class TemporalVersionManager:
                 - version2: Label of second version
                 - entities_added: Change in entity count (version2 - version1)
                 - relationships_added: Change in relationship count (version2 - version1)
+                - entities_delta / relationships_delta: Dictionaries with
+                  "added", "removed" and "modified" item lists going from
+                  version1 to version2
         """
         comparison = {
             "version1": version1.get("label", "unknown"),
@@ -755,4 +893,125 @@ class TemporalVersionManager:
             - len(version1.get("relationships", [])),
         }
 
+        first, second = self._sequence(version1), self._sequence(version2)
+        for kind in self._KINDS:
+            if first is not None and second is not None:
+                changes = self._compose(kind, first, second)
+            else:
+                changes = self._diff(
+                    _keyed_items(kind, version1.get(kind, [])),
+                    _keyed_items(kind, version2.get(kind, [])),
+                )
+            comparison[f"{kind}_delta"] = self._summarize(
+                changes.values(), items=True
+            )
+
         return comparison
+
+    def reconstruct_version(self, sequence: int) -> Dict[str, Any]:
+        """
+        Rebuild a version snapshot by replaying the stored deltas.
+
+        Args:
+            sequence: Sequence number of a version created by this manager
+
+        Returns:
+            dict: Version snapshot with label, timestamp, entities,
+            relationships, metadata and sequence
+
+        Raises:
+            ValidationError: If the version is not (or no longer) kept
+        """
+        position = sequence - self._first_sequence
+        if not 0 <= position < len(self.history):
+            raise ValidationError(f"Version {sequence} is not in the version history")
+        record = self.history[position]
+        snapshot = {kind: {} for kind in self._KINDS}
+        for past in self.history[: position + 1]:
+            for kind in self._KINDS:
+                items = snapshot[kind]
+                for key, (_, _, after, item) in past["delta"][kind].items():
+                    if after is None:
+                        items.pop(key, None)
+                    else:
+                        items[key] = item
+        return {
+            "label": record["label"],
+            "timestamp": record["timestamp"],
+            "entities": list(snapshot["entities"].values()),
+            "relationships": list(snapshot["relationships"].values()),
+            "metadata": record["metadata"],
+            "sequence": sequence,
+        }
+
+    def _sequence(self, version: Dict[str, Any]) -> Optional[int]:
+        """History position of a version kept by this manager, or None."""
+        sequence = version.get("sequence")
+        if not isinstance(sequence, int):
+            return None
+        position = sequence - self._first_sequence
+        if (
+            0 <= position < len(self.history)
+            and self.history[position]["label"] == version.get("label")
+            and self.history[position]["timestamp"] == version.get("timestamp")
+        ):
+            return position
+        return None
+
+    def _drop_oldest(self) -> None:
+        """Fold the oldest kept version into the next one."""
+        base, following = self.history[0], self.history[1]
+        for kind in self._KINDS:
+            items = base["delta"][kind]
+            for key, (_, _, after, item) in following["delta"][kind].items():
+                if after is None:
+                    items.pop(key, None)
+                else:
+                    items[key] = (None, None, after, item)
+            following["delta"][kind] = items
+        del self.history[0]
+        self._first_sequence += 1
+
+    def _compose(self, kind: str, first: int, second: int) -> Dict[Hashable, Tuple]:
+        """Net change from version ``first`` to ``second`` from the deltas."""
+        low, high = min(first, second), max(first, second)
+        net: Dict[Hashable, Tuple] = {}
+        for record in self.history[low + 1 : high + 1]:
+            for key, change in record["delta"][kind].items():
+                earlier = net.get(key)
+                net[key] = change if earlier is None else earlier[:2] + change[2:]
+        if first > second:
+            net = {key: change[2:] + change[:2] for key, change in net.items()}
+        return net
+
+    @staticmethod
+    def _diff(
+        before: Dict[Hashable, Tuple[Any, Any]], after: Dict[Hashable, Tuple[Any, Any]]
+    ) -> Dict[Hashable, Tuple]:
+        """Change tuples between two keyed item maps."""
+        changes: Dict[Hashable, Tuple] = {}
+        for key, (snapshot, item) in after.items():
+            old = before.get(key)
+            if old is None:
+                changes[key] = (None, None, snapshot, item)
+            elif not _same(old[0], snapshot):
+                changes[key] = old + (snapshot, item)
+        for key, old in before.items():
+            if key not in after:
+                changes[key] = old + (None, None)
+        return changes
+
+    @staticmethod
+    def _summarize(changes, items: bool = False) -> Dict[str, Any]:
+        """Added/removed/modified counts (or item lists) of change tuples."""
+        added, removed, modified = [], [], []
+        for before, before_item, after, after_item in changes:
+            if before is None and after is not None:
+                added.append(after_item)
+            elif after is None and before is not None:
+                removed.append(before_item)
+            elif before is not None and not _same(before, after):
+                modified.append(after_item)
+        if items:
+            return {"added": added, "removed": removed, "modified": modified}
+        return {"added": len(added), "removed": len(removed), "modified": len(modified)}
@@ -80,9 +80,6 @@ class EncodingHandler:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.logger.debug(
             f"Encoding handler initialized (default={self.default_encoding})"
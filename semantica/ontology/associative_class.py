@@ -121,9 +121,6 @@ class AssociativeClassBuilder:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.associative_classes: Dict[str, AssociativeClass] = {}
 
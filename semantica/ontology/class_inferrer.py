@@ -85,9 +85,6 @@ class ClassInferrer:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.naming_conventions = NamingConventions(**self.config)
         self.min_occurrences = self.config.get("min_occurrences", 2)
@@ -116,9 +116,6 @@ class CompetencyQuestionsManager:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.questions: List[CompetencyQuestion] = []
 
@@ -62,9 +62,6 @@ class DomainOntologies:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.ontology_generator = OntologyGenerator(**self.config)
         self.domain_templates: Dict[str, Dict[str, Any]] = {}
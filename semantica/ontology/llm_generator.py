@@ -10,9 +10,6 @@ class LLMOntologyGenerator:
     def __init__(self, provider: str = "openai", model: Optional[str] = None, **config):
         self.logger = get_logger("llm_ontology_generator")
         self.progress = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress.enabled:
-            self.progress.enabled = True
         self.provider_name = provider
         self.model = model
         self.config = config
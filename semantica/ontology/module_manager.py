@@ -77,9 +77,6 @@ class ModuleManager:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.modules: Dict[str, OntologyModule] = {}
 
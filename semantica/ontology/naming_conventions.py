@@ -64,9 +64,6 @@ class NamingConventions:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def validate_class_name(self, name: str) -> Tuple[bool, Optional[str]]:
         """
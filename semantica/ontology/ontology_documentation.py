@@ -83,9 +83,6 @@ class OntologyDocumentationManager:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.documentation: Dict[str, OntologyDocumentation] = {}
 
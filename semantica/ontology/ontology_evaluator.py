@@ -75,9 +75,6 @@ class OntologyEvaluator:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.competency_questions_manager = CompetencyQuestionsManager(**self.config)
 
@@ -91,9 +91,6 @@ class OntologyGenerator:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Initialize components
         self.namespace_manager = self.config.get(
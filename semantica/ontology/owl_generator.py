@@ -78,9 +78,6 @@ class OWLGenerator:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.namespace_manager = self.config.get(
             "namespace_manager"
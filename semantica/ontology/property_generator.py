@@ -62,9 +62,6 @@ class PropertyGenerator:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.naming_conventions = NamingConventions(**self.config)
 
@@ -79,9 +79,6 @@ class RequirementsSpecManager:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.competency_questions_manager = CompetencyQuestionsManager(**self.config)
         self.specs: Dict[str, RequirementsSpec] = {}
@@ -60,9 +60,6 @@ class CSVParser:
         self.logger = get_logger("csv_parser")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def parse(
         self, file_path: Union[str, Path], delimiter: str = ",", **options
@@ -92,9 +92,6 @@ class DoclingParser:
         self.logger = get_logger("docling_parser")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Store config for lazy initialization
         self.export_format = config.get("export_format", "markdown")
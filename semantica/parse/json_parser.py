@@ -59,9 +59,6 @@ class JSONParser:
         self.logger = get_logger("json_parser")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def parse(self, file_path: Union[str, Path], **options) -> JSONData:
         """
@@ -15,13 +15,16 @@ Key Features:
     - Pre-built pipeline templates
     - Progress tracking and monitoring
     - Failure recovery strategies
+    - Resumable runs and incremental rebuilds from checkpoints
 
 Main Classes:
     - PipelineBuilder: Pipeline construction DSL
     - ExecutionEngine: Pipeline execution engine
     - FailureHandler: Error handling and retry mechanisms
     - ParallelismManager: Parallel execution management
+    - ChunkStream: Streams map-step results to the next step
     - ResourceScheduler: Resource allocation and scheduling
+    - CheckpointStore: Step output and source result checkpoints
     - PipelineValidator: Pipeline validation and testing
     - PipelineTemplateManager: Pre-built pipeline templates
     - Pipeline: Pipeline definition dataclass
@@ -38,6 +41,7 @@ Author: Semantica Contributors
 License: MIT
 """
 
+from .checkpoint_store import CheckpointStore, hash_config, hash_content
 from .execution_engine import (
     ExecutionEngine,
     ExecutionResult,
@@ -55,6 +59,7 @@ from .failure_handler import (
     RetryStrategy,
 )
 from .parallelism_manager import (
+    ChunkStream,
     ParallelExecutionResult,
     ParallelExecutor,
     ParallelismManager,
@@ -88,6 +93,10 @@ __all__ = [
     "ExecutionResult",
     "PipelineStatus",
     "ProgressTracker",
+    # Checkpointing
+    "CheckpointStore",
+    "hash_config",
+    "hash_content",
     # Failure handling
     "FailureHandler",
     "RetryHandler",
@@ -99,6 +108,7 @@ __all__ = [
     "FailureRecovery",
     # Parallelism
     "ParallelismManager",
+    "ChunkStream",
     "ParallelExecutor",
     "Task",
     "ParallelExecutionResult",
@@ -0,0 +1,342 @@
+"""
+Checkpoint Store Module
+
+This module provides a local, SQLite-backed checkpoint store that makes
+pipeline runs resumable and knowledge base rebuilds incremental.
+
+Algorithms Used:
+    - Content Hashing: SHA-256 over file contents (streamed) or the source string
+    - Config Fingerprinting: SHA-256 over canonical JSON of the pipeline
+      definition, with handlers identified by module and qualified name
+    - Run Keys: Fingerprint of pipeline plus input, so a re-run of the same
+      pipeline on the same input finds the step outputs of the failed run
+
+Key Features:
+    - Per-step output checkpoints: a failed run resumes at the first
+      unfinished step
+    - Per-source results keyed by source and config hash: unchanged sources
+      are skipped on re-runs
+    - Single SQLite file in a local directory, safe across threads and processes
+    - Picklable store handle for process workers
+
+Main Classes:
+    - CheckpointStore: SQLite checkpoint store
+
+Main Functions:
+    - hash_content: Content hash of a source
+    - hash_config: Stable hash of a configuration or pipeline definition
+
+Example Usage:
+    >>> from semantica.pipeline import CheckpointStore, ExecutionEngine
+    >>> store = CheckpointStore(".semantica/checkpoints")
+    >>> engine = ExecutionEngine(checkpoint_store=store)
+    >>> result = engine.execute_pipeline(pipeline, data)  # resumes a failed run
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import hashlib
+import json
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..utils.logging import get_logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS step_outputs (
+    run_key TEXT NOT NULL,
+    step_name TEXT NOT NULL,
+    output BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (run_key, step_name)
+);
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    result BLOB NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (source, config_hash)
+);
+"""
+
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _stable_default(value: Any) -> Any:
+    """
+    JSON fallback that is stable across runs.
+
+    Raises:
+        TypeError: If the value only has an address-bearing repr, which would
+            give a different hash on every run
+    """
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    if isinstance(value, (set, frozenset)):
+        return sorted(map(repr, value))
+    if isinstance(value, Path):
+        return str(value)
+    text = repr(value)
+    if _ADDRESS.search(text):
+        raise TypeError(
+            f"Cannot hash configuration value of type {type(value).__name__}: "
+            "it has no stable representation; pass plain data "
+            "(or an object with a stable repr) instead"
+        )
+    return text
+
+
+def hash_config(config: Any) -> str:
+    """
+    Stable hash of a configuration or pipeline definition.
+
+    Pipelines hash their name, configuration and steps (name, type,
+    dependencies, configuration and handler name). Handlers are identified by
+    name only, so change the configuration (e.g. a ``version`` entry) to
+    invalidate checkpoints after changing handler code. Values whose only
+    representation includes a memory address are rejected rather than
+    hashed to a key that never matches again.
+
+    Args:
+        config: Configuration dictionary, Pipeline, or any JSON-able value
+
+    Returns:
+        Hex SHA-256 digest
+
+    Raises:
+        TypeError: If the configuration holds a value with no stable form
+    """
+    if hasattr(config, "steps") and hasattr(config, "name"):
+        config = {
+            "name": config.name,
+            "config": getattr(config, "config", {}),
+            "steps": [
+                {
+                    "name": step.name,
+                    "type": step.step_type,
+                    "dependencies": list(step.dependencies),
+                    "handler": step.handler,
+                    "config": {
+                        k: v for k, v in step.config.items() if k != "handler"
+                    },
+                }
+                for step in config.steps
+            ],
+        }
+    payload = json.dumps(config, sort_keys=True, default=_stable_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_content(source: Any, block_size: int = 1 << 20) -> str:
+    """
+    Content hash of a source.
+
+    Existing files are hashed by content; anything else (URLs, in-memory
+    data) by its pickled form, or its repr if it cannot be pickled.
+
+    Args:
+        source: File path, URL or data
+        block_size: Read size for file hashing
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        try:
+            is_file = path.is_file()
+        except (OSError, ValueError):
+            is_file = False
+        if is_file:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(block_size), b""):
+                    digest.update(block)
+            return digest.hexdigest()
+        digest.update(str(source).encode("utf-8"))
+        return digest.hexdigest()
+    try:
+        digest.update(pickle.dumps(source, protocol=4))
+    except Exception:
+        digest.update(repr(source).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CheckpointStore:
+    """
+    SQLite checkpoint store in a local directory.
+
+    • Step outputs per run, for resuming failed pipeline runs
+    • Source results per content and config hash, for skipping unchanged sources
+    • Values are pickled; a value that cannot be pickled is not checkpointed
+    """
+
+    def __init__(self, directory: Union[str, Path], filename: str = "checkpoints.db"):
+        """
+        Initialize checkpoint store.
+
+        Args:
+            directory: Directory for the SQLite file (created if missing)
+            filename: Database file name
+        """
+        self.logger = get_logger("checkpoint_store")
+        self.directory = Path(directory)
+        self.path = self.directory / filename
+        self.lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Process workers reopen the database themselves
+        return {"directory": self.directory, "path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["directory"], state["path"].name)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection, opened on first use."""
+        if self._conn is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), timeout=30.0, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _dumps(self, value: Any, what: str) -> Optional[bytes]:
+        try:
+            return pickle.dumps(value, protocol=4)
+        except Exception as e:
+            self.logger.debug(f"Not checkpointing {what}: {e}")
+            return None
+
+    def run_key(self, pipeline: Any, data: Any) -> str:
+        """
+        Key identifying a run of a pipeline on an input.
+
+        Args:
+            pipeline: Pipeline object
+            data: Pipeline input
+
+        Returns:
+            Hex digest combining the pipeline and input hashes
+        """
+        return hashlib.sha256(
+            f"{hash_config(pipeline)}:{hash_content(data)}".encode("utf-8")
+        ).hexdigest()
+
+    def save_step(self, run_key: str, step_name: str, output: Any) -> bool:
+        """
+        Checkpoint a completed step's output.
+
+        Args:
+            run_key: Run key from ``run_key``
+            step_name: Step name
+            output: Step output
+
+        Returns:
+            True if the output was stored
+        """
+        blob = self._dumps(output, f"output of step {step_name}")
+        if blob is None:
+            return False
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO step_outputs VALUES (?, ?, ?, ?)",
+                (run_key, step_name, blob, time.time()),
+            )
+        return True
+
+    def load_steps(self, run_key: str) -> Dict[str, Any]:
+        """
+        Checkpointed step outputs of a run.
+
+        Args:
+            run_key: Run key from ``run_key``
+
+        Returns:
+            Mapping of step name to output
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT step_name, output FROM step_outputs WHERE run_key = ?",
+                (run_key,),
+            ).fetchall()
+        return {name: pickle.loads(blob) for name, blob in rows}
+
+    def clear_run(self, run_key: str) -> None:
+        """Delete the step checkpoints of a run."""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM step_outputs WHERE run_key = ?", (run_key,))
+
+    def get_source(
+        self, source: Any, config_hash: str, content_hash: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Stored result of a source if its content is unchanged.
+
+        Args:
+            source: Source path or URL
+            config_hash: Hash of the processing configuration
+            content_hash: Current content hash (computed if omitted)
+
+        Returns:
+            The stored result, or None if missing or stale
+        """
+        content_hash = content_hash or hash_content(source)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT content_hash, result FROM sources WHERE source = ? AND config_hash = ?",
+                (str(source), config_hash),
+            ).fetchone()
+        if row is None or row[0] != content_hash:
+            return None
+        return pickle.loads(row[1])
+
+    def put_source(
+        self, source: Any, config_hash: str, content_hash: str, result: Any
+    ) -> bool:
+        """
+        Store the result of a processed source.
+
+        Args:
+            source: Source path or URL
+            config_hash: Hash of the processing configuration
+            content_hash: Content hash the result was computed from
+            result: Result to store
+
+        Returns:
+            True if the result was stored
+        """
+        blob = self._dumps(result, f"result of source {source}")
+        if blob is None:
+            return False
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                (str(source), config_hash, content_hash, blob, time.time()),
+            )
+        return True
+
+    def clear(self) -> None:
+        """Delete all checkpoints."""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM step_outputs")
+            self.conn.execute("DELETE FROM sources")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
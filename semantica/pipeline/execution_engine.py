@@ -14,6 +14,9 @@ Key Features:
     - Status management (pending, running, paused, completed, failed)
     - Execution result tracking
     - Thread-safe execution
+    - DAG-aware parallel step scheduling on thread or process pools
+    - Per-step CPU/memory slots from the resource scheduler
+    - Resumable runs from per-step output checkpoints
 
 Main Classes:
     - ExecutionEngine: Pipeline execution engine
@@ -34,20 +37,36 @@ License: MIT
 
 import threading
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..utils.exceptions import ProcessingError, ValidationError
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from .checkpoint_store import CheckpointStore
 from .failure_handler import FailureHandler
-from .parallelism_manager import ParallelismManager
+from .parallelism_manager import ChunkStream, ParallelismManager
 from .pipeline_builder import Pipeline, PipelineStep, StepStatus
 from .resource_scheduler import ResourceScheduler
 
 
+def _run_step_handler(
+    handler: Callable, data: Any, config: Dict[str, Any], options: Dict[str, Any]
+) -> Any:
+    """Run a step handler in a worker process."""
+    return handler(data, **config, **options)
+
+
 class PipelineStatus(Enum):
     """Pipeline execution status."""
 
@@ -89,8 +108,13 @@ class ExecutionEngine:
         Args:
             config: Configuration dictionary
             **kwargs: Additional configuration options:
-                - max_workers: Maximum parallel workers
+                - max_workers: Maximum parallel workers per executor kind
+                - step_executors: Map of step type to "thread" or "process"
+                  (default "thread"); a step's ``executor`` config overrides it
                 - retry_on_failure: Enable retry on failure
+                - checkpoint_store: CheckpointStore for resumable runs
+                - checkpoint_dir: Directory for a CheckpointStore (used when
+                  no checkpoint_store is given)
         """
         self.logger = get_logger("execution_engine")
         self.config = config or {}
@@ -100,15 +124,22 @@ class ExecutionEngine:
         self.parallelism_manager = ParallelismManager(**self.config)
         self.resource_scheduler = ResourceScheduler(**self.config)
 
+        self.max_workers = self.config.get("max_workers", 4)
+        self.checkpoint_store: Optional[CheckpointStore] = self.config.get(
+            "checkpoint_store"
+        )
+        if self.checkpoint_store is None and self.config.get("checkpoint_dir"):
+            self.checkpoint_store = CheckpointStore(self.config["checkpoint_dir"])
+        self.step_executors: Dict[str, str] = dict(
+            self.config.get("step_executors") or {}
+        )
+
         self.running_pipelines: Dict[str, Pipeline] = {}
         self.pipeline_status: Dict[str, PipelineStatus] = {}
         self.pipeline_lock = threading.Lock()
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def execute_pipeline(
         self, pipeline: Pipeline, data: Any = None, **options
@@ -171,9 +202,23 @@ class ExecutionEngine:
             # Allocate resources
             resources = self.resource_scheduler.allocate_resources(pipeline, **options)
 
+            # Resume from the checkpoints of an earlier, unfinished run
+            run_key = None
+            restored: Dict[str, Any] = {}
+            if self.checkpoint_store is not None:
+                run_key = self.checkpoint_store.run_key(pipeline, data)
+                restored = self.checkpoint_store.load_steps(run_key)
+                if restored:
+                    self.logger.info(
+                        f"Resuming pipeline {pipeline_id}: "
+                        f"{len(restored)} step(s) restored from checkpoints"
+                    )
+
             try:
                 # Execute steps
-                result = self._execute_steps(pipeline, data, **options)
+                result = self._execute_steps(
+                    pipeline, data, run_key=run_key, restored=restored, **options
+                )
 
                 # Collect metrics
                 execution_time = time.time() - start_time
@@ -185,6 +230,7 @@ class ExecutionEngine:
                     "steps_failed": len(
                         [s for s in pipeline.steps if s.status == StepStatus.FAILED]
                     ),
+                    "steps_restored": len(restored),
                 }
 
                 # Update status
@@ -230,74 +276,479 @@ class ExecutionEngine:
 
             return ExecutionResult(success=False, output=None, errors=[str(e)])
 
-    def _execute_steps(self, pipeline: Pipeline, data: Any, **options) -> Any:
-        """Execute pipeline steps."""
-        # Sort steps by dependencies (topological sort)
+    def _execute_steps(
+        self,
+        pipeline: Pipeline,
+        data: Any,
+        run_key: Optional[str] = None,
+        restored: Optional[Dict[str, Any]] = None,
+        **options,
+    ) -> Any:
+        """
+        Execute pipeline steps as a dependency graph.
+
+        Steps are dispatched as soon as all of their dependencies have
+        completed, on a thread pool or (per step type) a process pool. Each
+        step receives its parents' outputs: the pipeline input when it has no
+        dependencies, the parent's output when it has one, and a
+        ``{parent_name: output}`` dict when it has several. Pipelines that
+        declare no dependencies at all keep the chained behaviour, each step
+        receiving the previous step's output.
+
+        Returns the output of the single sink step, or a ``{step_name:
+        output}`` dict when several sink steps completed.
+
+        With a checkpoint store, steps found in ``restored`` (whose parents
+        are restored too) are not run again, each completed step's output is
+        checkpointed under ``run_key``, and the checkpoints are dropped once
+        the whole run has succeeded.
+        """
         sorted_steps = self._topological_sort(pipeline.steps)
-
-        # Execute steps
-        current_data = data
-        total_steps = len(sorted_steps)
-
-        for step_idx, step in enumerate(sorted_steps):
-            if self.pipeline_status.get(pipeline.name) == PipelineStatus.STOPPED:
-                break
-
-            # Wait if paused
-            while self.pipeline_status.get(pipeline.name) == PipelineStatus.PAUSED:
+        for step in sorted_steps:
+            step.status = StepStatus.PENDING
+            step.result = None
+            step.error = None
+        step_map = {step.name: step for step in sorted_steps}
+        order = {step.name: idx for idx, step in enumerate(sorted_steps)}
+        parents = self._step_parents(pipeline.steps)
+        children: Dict[str, List[str]] = {name: [] for name in step_map}
+        for name, deps in parents.items():
+            for dep in deps:
+                children[dep].append(name)
+
+        remaining = {name: len(deps) for name, deps in parents.items()}
+        outputs: Dict[str, Any] = {}
+        for step in sorted_steps:
+            if step.name in (restored or {}) and all(
+                parent in outputs for parent in parents[step.name]
+            ):
+                step.status = StepStatus.COMPLETED
+                step.result = outputs[step.name] = restored[step.name]
+                for child in children[step.name]:
+                    remaining[child] -= 1
+        ready = [
+            step
+            for step in sorted_steps
+            if remaining[step.name] == 0 and step.status == StepStatus.PENDING
+        ]
+        delayed: List[Tuple[float, PipelineStep]] = []
+        held: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        attempts: Dict[str, int] = {}
+        in_flight: Dict[Future, Tuple[PipelineStep, str, Dict[str, Any], str]] = {}
+        running = {"thread": 0, "process": 0}
+        pools: Dict[str, Executor] = {}
+        streams: Dict[str, ChunkStream] = {}  # consumer step -> stream it reads
+        halt = threading.Event()
+        failure: Optional[Exception] = None
+        last_status = None
+        changed = True
+        dispatched = 0
+
+        def should_continue() -> bool:
+            # Polled by map steps between chunks: honour pause, stop and failure
+            while (
+                self.pipeline_status.get(pipeline.name) == PipelineStatus.PAUSED
+                and not halt.is_set()
+            ):
                 time.sleep(0.1)
-
-            # Track step execution
-            step_tracking_id = self.progress_tracker.start_tracking(
-                module="pipeline",
-                submodule=step.step_type or step.name,
-                message=f"Step {step_idx + 1}/{total_steps}: {step.name}",
+            return not halt.is_set() and (
+                self.pipeline_status.get(pipeline.name) != PipelineStatus.STOPPED
             )
 
-            try:
-                # Execute step
-                step.status = StepStatus.RUNNING
-                step_result = self._execute_step(step, current_data, **options)
-                step.status = StepStatus.COMPLETED
-                step.result = step_result
-                current_data = step_result
-
-                self.progress_tracker.stop_tracking(
-                    step_tracking_id,
-                    status="completed",
-                    message=f"Completed step: {step.name}",
-                )
-
-            except Exception as e:
-                step.status = StepStatus.FAILED
-                step.error = e
+        def dispatch(step, kind, step_input, allocations, tracking_id, sink=None):
+            step.status = StepStatus.RUNNING
+            future = self._submit_step(
+                pools, kind, step, step_input, sink, tracking_id, should_continue, **options
+            )
+            in_flight[future] = (step, kind, allocations, tracking_id)
+            running[kind] += 1
 
-                # Handle failure
-                recovery_result = self.failure_handler.handle_step_failure(step, e)
-                if not recovery_result.get("retry", False):
-                    self.progress_tracker.stop_tracking(
-                        step_tracking_id, status="failed", message=str(e)
-                    )
-                    raise
-                else:
-                    # Retry step
-                    self.progress_tracker.update_tracking(
-                        step_tracking_id,
-                        status="running",
-                        message=f"Retrying step: {step.name}",
-                    )
-                    step.status = StepStatus.RUNNING
-                    step_result = self._execute_step(step, current_data, **options)
+        try:
+            while ready or delayed or in_flight:
+                status = self.pipeline_status.get(pipeline.name)
+                if status == PipelineStatus.STOPPED or failure is not None:
+                    # Let in-flight steps finish, dispatch nothing new
+                    halt.set()
+                    for name, (allocations, tracking_id) in held.items():
+                        self.resource_scheduler.release_resources(allocations)
+                        self.progress_tracker.stop_tracking(
+                            tracking_id,
+                            status="failed",
+                            message=str(step_map[name].error),
+                        )
+                    held, ready, delayed = {}, [], []
+                    if not in_flight:
+                        break
+
+                now = time.time()
+                if any(not_before <= now for not_before, _ in delayed):
+                    ready.extend(step for not_before, step in delayed if not_before <= now)
+                    delayed = [entry for entry in delayed if entry[0] > now]
+                    ready.sort(key=lambda s: order[s.name])
+                    changed = True
+                if status != last_status:
+                    last_status, changed = status, True
+
+                # Re-check waiting steps only when a slot may have freed up
+                if ready and changed and status != PipelineStatus.PAUSED:
+                    changed = False
+                    waiting = []
+                    for step in ready:
+                        if any(p not in outputs for p in parents[step.name]):
+                            # A streamed step retrying waits for its parent's full output
+                            waiting.append(step)
+                            continue
+                        kind = self._step_pool_kind(step)
+                        if running[kind] >= self.max_workers:
+                            waiting.append(step)
+                            continue
+                        if step.name in held:
+                            allocations, tracking_id = held.pop(step.name)
+                        else:
+                            allocations = self._allocate_step_resources(
+                                pipeline.name, step, force=not in_flight
+                            )
+                            if allocations is None:
+                                waiting.append(step)
+                                continue
+                            dispatched += 1
+                            tracking_id = self.progress_tracker.start_tracking(
+                                module="pipeline",
+                                submodule=step.step_type or step.name,
+                                message=f"Step {dispatched}/{len(sorted_steps)}: {step.name}",
+                            )
+
+                        step_input = self._step_input(parents[step.name], data, outputs)
+                        child = self._stream_child(step, parents, children, step_map)
+                        child_allocations = None
+                        if (
+                            child is not None
+                            and child.status == StepStatus.PENDING
+                            and running["thread"] + 1 < self.max_workers
+                        ):
+                            child_allocations = self._allocate_step_resources(
+                                pipeline.name, child
+                            )
+                        if child_allocations is None:
+                            dispatch(step, kind, step_input, allocations, tracking_id)
+                            continue
+
+                        # Start the child now, consuming results as chunks complete
+                        stream = ChunkStream()
+                        dispatch(step, kind, step_input, allocations, tracking_id, stream)
+                        dispatched += 1
+                        child_tracking_id = self.progress_tracker.start_tracking(
+                            module="pipeline",
+                            submodule=child.step_type or child.name,
+                            message=f"Step {dispatched}/{len(sorted_steps)}: {child.name} (streaming)",
+                        )
+                        streams[child.name] = stream
+                        dispatch(child, "thread", stream, child_allocations, child_tracking_id)
+                    ready = waiting
+
+                if not in_flight:
+                    # Paused, or only retries waiting out their delay
+                    next_retry = min((entry[0] for entry in delayed), default=now + 0.1)
+                    time.sleep(min(max(next_retry - time.time(), 0.0), 0.1))
+                    continue
+
+                done, _ = wait(list(in_flight), timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step, kind, allocations, tracking_id = in_flight.pop(future)
+                    running[kind] -= 1
+                    changed = True
+                    stream = streams.pop(step.name, None)
+                    try:
+                        step_result = future.result()
+                    except Exception as e:
+                        if stream is not None and stream.error is not None:
+                            # Its upstream failed; the step runs again with the parent
+                            step.status = StepStatus.PENDING
+                            self.resource_scheduler.release_resources(allocations)
+                            self.progress_tracker.stop_tracking(
+                                tracking_id, status="failed", message=str(e)
+                            )
+                            # A retried parent may have completed meanwhile
+                            if all(p in outputs for p in parents[step.name]):
+                                ready.append(step)
+                                ready.sort(key=lambda s: order[s.name])
+                            continue
+                        step.status = StepStatus.FAILED
+                        step.error = e
+                        if failure is None and (
+                            self.pipeline_status.get(pipeline.name)
+                            != PipelineStatus.STOPPED
+                        ):
+                            attempts[step.name] = attempts.get(step.name, 0) + 1
+                            recovery_result = self.failure_handler.handle_step_failure(
+                                step, e, attempt=attempts[step.name]
+                            )
+                            if recovery_result.get("retry", False):
+                                self.progress_tracker.update_tracking(
+                                    tracking_id,
+                                    status="running",
+                                    message=f"Retrying step: {step.name}",
+                                )
+                                # The step keeps its resource slots until it retries
+                                held[step.name] = (allocations, tracking_id)
+                                delayed.append(
+                                    (time.time() + recovery_result.get("retry_delay", 0.0), step)
+                                )
+                                continue
+                            failure = e
+                            halt.set()
+                        self.resource_scheduler.release_resources(allocations)
+                        self.progress_tracker.stop_tracking(
+                            tracking_id, status="failed", message=str(e)
+                        )
+                        continue
+
+                    self.resource_scheduler.release_resources(allocations)
                     step.status = StepStatus.COMPLETED
                     step.result = step_result
-                    current_data = step_result
+                    outputs[step.name] = step_result
+                    if run_key is not None:
+                        self.checkpoint_store.save_step(run_key, step.name, step_result)
                     self.progress_tracker.stop_tracking(
-                        step_tracking_id,
+                        tracking_id,
                         status="completed",
-                        message=f"Retry successful: {step.name}",
+                        message=(
+                            f"Retry successful: {step.name}"
+                            if step.name in attempts
+                            else f"Completed step: {step.name}"
+                        ),
                     )
+                    for child in children[step.name]:
+                        remaining[child] -= 1
+                        if (
+                            remaining[child] == 0
+                            and step_map[child].status == StepStatus.PENDING
+                        ):
+                            ready.append(step_map[child])
+                    ready.sort(key=lambda s: order[s.name])
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=True)
+
+        if failure is not None:
+            raise failure
+        if run_key is not None and len(outputs) == len(sorted_steps):
+            self.checkpoint_store.clear_run(run_key)
+
+        # Outputs of completed steps none of whose dependents completed
+        sinks = [
+            step.name
+            for step in sorted_steps
+            if step.name in outputs
+            and not any(child in outputs for child in children[step.name])
+        ]
+        if not sinks:
+            return data
+        if len(sinks) == 1:
+            return outputs[sinks[0]]
+        return {name: outputs[name] for name in sinks}
+
+    def _step_parents(self, steps: List[PipelineStep]) -> Dict[str, List[str]]:
+        """Parents of each step; dependency-free pipelines run as a chain."""
+        if not any(step.dependencies for step in steps):
+            return {
+                step.name: [steps[idx - 1].name] if idx > 0 else []
+                for idx, step in enumerate(steps)
+            }
+        return {step.name: list(step.dependencies) for step in steps}
+
+    def _step_input(
+        self, parent_names: List[str], data: Any, outputs: Dict[str, Any]
+    ) -> Any:
+        """Build a step's input from its parents' outputs."""
+        if not parent_names:
+            return data
+        if len(parent_names) == 1:
+            return outputs[parent_names[0]]
+        return {name: outputs[name] for name in parent_names}
+
+    def _step_executor_kind(self, step: PipelineStep) -> str:
+        """Executor kind ("thread" or "process") for a step's handler."""
+        kind = step.config.get("executor") or self.step_executors.get(
+            step.step_type, "thread"
+        )
+        if kind not in ("thread", "process"):
+            raise ValidationError(
+                f"Unknown executor '{kind}' for step {step.name}; "
+                "expected 'thread' or 'process'"
+            )
+        # Pass-through steps have nothing to ship to another process
+        return kind if step.handler else "thread"
+
+    def _step_pool_kind(self, step: PipelineStep) -> str:
+        """Pool the step itself runs on; map steps drive their chunks from a thread."""
+        if self._is_map_step(step):
+            return "thread"
+        return self._step_executor_kind(step)
+
+    def _is_map_step(self, step: PipelineStep) -> bool:
+        """Whether a step maps its handler over chunks of its input."""
+        return bool(step.handler) and step.config.get("map_over") not in (None, False)
+
+    def _stream_child(
+        self,
+        step: PipelineStep,
+        parents: Dict[str, List[str]],
+        children: Dict[str, List[str]],
+        step_map: Dict[str, PipelineStep],
+    ) -> Optional[PipelineStep]:
+        """
+        The map step that can consume this map step's results as a stream.
 
-        return current_data
+        Streaming applies when a map step (with ``stream`` not disabled) has a
+        single dependent, which maps over its input as a whole
+        (``map_over=True``) and depends on nothing else.
+        """
+        if not self._is_map_step(step) or not step.config.get("stream", True):
+            return None
+        if len(children[step.name]) != 1:
+            return None
+        child = step_map[children[step.name][0]]
+        if parents[child.name] != [step.name] or not self._is_map_step(child):
+            return None
+        return child if child.config.get("map_over") is True else None
+
+    def _submit_step(
+        self,
+        pools: Dict[str, Executor],
+        kind: str,
+        step: PipelineStep,
+        data: Any,
+        sink: Optional[ChunkStream],
+        tracking_id: str,
+        should_continue: Callable[[], bool],
+        **options,
+    ) -> Future:
+        """Submit a step to the pool of the given kind, creating it on first use."""
+        if kind not in pools:
+            pool_class = ProcessPoolExecutor if kind == "process" else ThreadPoolExecutor
+            pools[kind] = pool_class(max_workers=self.max_workers)
+        if self._is_map_step(step):
+            return pools[kind].submit(
+                self._execute_map_step,
+                step,
+                data,
+                sink,
+                tracking_id,
+                should_continue,
+                **options,
+            )
+        if kind == "process":
+            # Handler, input and config must be picklable
+            return pools[kind].submit(_run_step_handler, step.handler, data, step.config, options)
+        return pools[kind].submit(self._execute_step, step, data, **options)
+
+    def _execute_map_step(
+        self,
+        step: PipelineStep,
+        data: Any,
+        sink: Optional[ChunkStream],
+        tracking_id: str,
+        should_continue: Callable[[], bool],
+        **options,
+    ) -> List[Any]:
+        """
+        Run a map step: fan its input out in chunks over the long-lived pool.
+
+        The handler is called with each chunk (a list) and returns a list of
+        results, which are concatenated in input order. Each chunk's results
+        are also put on ``sink`` as soon as they are in order, for a
+        streaming consumer.
+        """
+        map_over = step.config["map_over"]
+        interrupted = []
+
+        def proceed() -> bool:
+            if should_continue():
+                return True
+            interrupted.append(True)
+            return False
+
+        try:
+            if map_over is True:
+                items = data
+            elif isinstance(data, dict) and map_over in data:
+                items = data[map_over]
+            else:
+                raise ValidationError(
+                    f"Step {step.name} maps over '{map_over}', "
+                    "which is not a key of its input"
+                )
+
+            results: List[Any] = []
+            for chunk_result in self.parallelism_manager.map_chunks(
+                step.handler,
+                items,
+                chunk_size=step.config.get("chunk_size"),
+                max_in_flight=step.config.get("max_in_flight"),
+                use_processes=self._step_executor_kind(step) == "process",
+                should_continue=proceed,
+                handler_kwargs={**step.config, **options},
+            ):
+                chunk_result = (
+                    list(chunk_result)
+                    if isinstance(chunk_result, (list, tuple))
+                    else [chunk_result]
+                )
+                results.extend(chunk_result)
+                if sink is not None:
+                    sink.put(chunk_result)
+                self.progress_tracker.update_tracking(
+                    tracking_id,
+                    message=lambda: f"{step.name}: {len(results)} items processed",
+                )
+            if interrupted:
+                raise ProcessingError(f"Step {step.name} interrupted")
+        except BaseException as e:
+            if sink is not None:
+                sink.abort(e)
+            raise
+
+        if sink is not None:
+            sink.close()
+        return results
+
+    def _allocate_step_resources(
+        self, pipeline_id: str, step: PipelineStep, force: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Reserve a step's CPU and memory slots with the resource scheduler.
+
+        Steps request ``cpu_cores`` (default 1 for process steps, 0 for
+        thread steps) and ``memory_gb`` (default 0) in their config. Returns
+        None when the slots are not available yet; with ``force`` the step is
+        admitted anyway so a request larger than the whole capacity cannot
+        stall the pipeline.
+        """
+        cpu_cores = step.config.get(
+            "cpu_cores", 1 if self._step_executor_kind(step) == "process" else 0
+        )
+        memory_gb = step.config.get("memory_gb", 0)
+        allocations = {}
+
+        if cpu_cores:
+            allocation = self.resource_scheduler.allocate_cpu(
+                cpu_cores, pipeline_id, step.name
+            )
+            if allocation:
+                allocations["cpu"] = allocation
+            elif not force:
+                return None
+        if memory_gb:
+            allocation = self.resource_scheduler.allocate_memory(
+                memory_gb, pipeline_id, step.name
+            )
+            if allocation:
+                allocations["memory"] = allocation
+            elif not force:
+                self.resource_scheduler.release_resources(allocations)
+                return None
+        return allocations
 
     def _execute_step(self, step: PipelineStep, data: Any, **options) -> Any:
         """Execute a single step."""
@@ -388,6 +839,10 @@ class ExecutionEngine:
                 self.pipeline_status[pipeline_id] = PipelineStatus.STOPPED
                 self.logger.info(f"Stopped pipeline: {pipeline_id}")
 
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the long-lived worker pools used by map steps."""
+        self.parallelism_manager.shutdown(wait=wait)
+
     def get_pipeline_status(self, pipeline_id: str) -> Optional[PipelineStatus]:
         """Get pipeline status."""
         return self.pipeline_status.get(pipeline_id)
@@ -113,9 +113,6 @@ class FailureHandler:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.default_max_retries = self.config.get("default_max_retries", 3)
         self.default_backoff_factor = self.config.get("default_backoff_factor", 2.0)
@@ -132,7 +129,10 @@ class FailureHandler:
         Args:
             step: Failed step
             error: Exception that occurred
-            **options: Additional options
+            **options: Additional options:
+                - attempt: Number of times the step has failed so far
+                  (default 1); no retry is offered once it exceeds the
+                  policy's ``max_retries``
 
         Returns:
             Recovery result with retry information
@@ -160,12 +160,18 @@ class FailureHandler:
             self.progress_tracker.update_tracking(
                 tracking_id, message="Checking if error is retryable..."
             )
-            should_retry = self._should_retry(error, retry_policy)
+            attempt = options.get("attempt", 1)
+            should_retry = (
+                self._should_retry(error, retry_policy)
+                and attempt <= retry_policy.max_retries
+            )
 
             # Calculate retry delay
             retry_delay = 0.0
             if should_retry:
-                retry_delay = self._calculate_retry_delay(step.name, retry_policy)
+                retry_delay = self._calculate_retry_delay(
+                    step.name, retry_policy, attempt
+                )
 
             # Log error
             self.logger.error(f"Step '{step.name}' failed: {error}", exc_info=True)
@@ -13,28 +13,41 @@ Key Features:
     - Error handling and recovery
     - Thread and process pool execution
     - Task priority management
+    - Chunked data-parallel map over long-lived worker pools with bounded
+      in-flight chunks and ordered, streaming results
 
 Main Classes:
     - ParallelismManager: Parallelism management system
     - ParallelExecutor: Parallel execution coordinator
     - Task: Dataclass for parallel task definition
     - ParallelExecutionResult: Dataclass for parallel execution results
+    - ChunkStream: Thread-safe iterable that streams chunk results between steps
 
 Example Usage:
     >>> from semantica.pipeline import ParallelismManager, Task
     >>> manager = ParallelismManager(max_workers=4)
     >>> tasks = [Task("task1", handler, args), Task("task2", handler2, args2)]
     >>> results = manager.execute_parallel(tasks)
+    >>> for chunk_result in manager.map_chunks(tag_entities, documents, chunk_size=64):
+    ...     store(chunk_result)
 
 Author: Semantica Contributors
 License: MIT
 """
 
+import queue
 import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from ..utils.exceptions import ProcessingError, ValidationError
 from ..utils.logging import get_logger
@@ -64,6 +77,48 @@ class ParallelExecutionResult:
     execution_time: float = 0.0
 
 
+class ChunkStream:
+    """
+    Thread-safe iterable carrying a map step's results to the next step.
+
+    The producer ``put``s each chunk's results in order and then ``close``s
+    the stream, or ``abort``s it with the error that stopped it. Iterating
+    yields the individual items as they arrive and raises ProcessingError if
+    the stream was aborted. A stream can be iterated once.
+    """
+
+    _CLOSED = object()
+
+    def __init__(self):
+        """Initialize an empty, open stream."""
+        self._queue: "queue.Queue" = queue.Queue()
+        self.error: Optional[BaseException] = None
+
+    def put(self, items: List[Any]) -> None:
+        """Append one chunk of results."""
+        self._queue.put(items)
+
+    def close(self) -> None:
+        """Mark the end of the stream."""
+        self._queue.put(self._CLOSED)
+
+    def abort(self, error: BaseException) -> None:
+        """End the stream with an error."""
+        self.error = error
+        self._queue.put(self._CLOSED)
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            items = self._queue.get()
+            if items is self._CLOSED:
+                if self.error is not None:
+                    raise ProcessingError(
+                        f"Upstream step failed: {self.error}"
+                    ) from self.error
+                return
+            yield from items
+
+
 class ParallelismManager:
     """
     Parallelism management system.
@@ -85,6 +140,9 @@ class ParallelismManager:
             **kwargs: Additional configuration options:
                 - max_workers: Maximum parallel workers
                 - use_processes: Use processes instead of threads
+                - chunk_size: Items per chunk in map_chunks (default 256)
+                - max_in_flight: Chunks submitted but not yet consumed in
+                  map_chunks (default 2 * max_workers)
         """
         self.logger = get_logger("parallelism_manager")
         self.config = config or {}
@@ -92,12 +150,11 @@ class ParallelismManager:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.max_workers = self.config.get("max_workers", 4)
         self.use_processes = self.config.get("use_processes", False)
+        self.chunk_size = self.config.get("chunk_size", 256)
+        self.max_in_flight = self.config.get("max_in_flight", 2 * self.max_workers)
 
         self.executor: Optional[ThreadPoolExecutor] = None
         self.process_executor: Optional[ProcessPoolExecutor] = None
@@ -165,88 +222,170 @@ class ParallelismManager:
         self, tasks: List[Task], **options
     ) -> List[ParallelExecutionResult]:
         """Execute tasks using thread pool."""
-        results = []
-        max_workers = options.get("max_workers", self.max_workers)
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {
-                executor.submit(task.handler, *task.args, **task.kwargs): task
-                for task in tasks
-            }
-
-            # Collect results
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                start_time = time.time()
-
-                try:
-                    result = future.result()
-                    execution_time = time.time() - start_time
-                    results.append(
-                        ParallelExecutionResult(
-                            task_id=task.task_id,
-                            success=True,
-                            result=result,
-                            execution_time=execution_time,
-                        )
-                    )
-                except Exception as e:
-                    execution_time = time.time() - start_time
-                    results.append(
-                        ParallelExecutionResult(
-                            task_id=task.task_id,
-                            success=False,
-                            error=e,
-                            execution_time=execution_time,
-                        )
-                    )
-
-        return results
+        return self._execute_with_pool(tasks, use_processes=False, **options)
 
     def _execute_with_processes(
         self, tasks: List[Task], **options
     ) -> List[ParallelExecutionResult]:
         """Execute tasks using process pool."""
-        results = []
+        return self._execute_with_pool(tasks, use_processes=True, **options)
+
+    def _execute_with_pool(
+        self, tasks: List[Task], use_processes: bool, **options
+    ) -> List[ParallelExecutionResult]:
+        """Execute tasks on the long-lived pool, or a one-off pool of another size."""
         max_workers = options.get("max_workers", self.max_workers)
+        if max_workers == self.max_workers:
+            return self._collect_results(self.get_executor(use_processes), tasks)
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {
-                executor.submit(task.handler, *task.args, **task.kwargs): task
-                for task in tasks
-            }
+        pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool_class(max_workers=max_workers) as executor:
+            return self._collect_results(executor, tasks)
+
+    def _collect_results(
+        self, executor: Executor, tasks: List[Task]
+    ) -> List[ParallelExecutionResult]:
+        """Submit tasks to an executor and collect their results."""
+        results = []
 
-            # Collect results
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                start_time = time.time()
-
-                try:
-                    result = future.result()
-                    execution_time = time.time() - start_time
-                    results.append(
-                        ParallelExecutionResult(
-                            task_id=task.task_id,
-                            success=True,
-                            result=result,
-                            execution_time=execution_time,
-                        )
+        # Submit all tasks
+        future_to_task = {
+            executor.submit(task.handler, *task.args, **task.kwargs): task
+            for task in tasks
+        }
+
+        # Collect results
+        for future in as_completed(future_to_task):
+            task = future_to_task[future]
+            start_time = time.time()
+
+            try:
+                result = future.result()
+                execution_time = time.time() - start_time
+                results.append(
+                    ParallelExecutionResult(
+                        task_id=task.task_id,
+                        success=True,
+                        result=result,
+                        execution_time=execution_time,
                     )
-                except Exception as e:
-                    execution_time = time.time() - start_time
-                    results.append(
-                        ParallelExecutionResult(
-                            task_id=task.task_id,
-                            success=False,
-                            error=e,
-                            execution_time=execution_time,
-                        )
+                )
+            except Exception as e:
+                execution_time = time.time() - start_time
+                results.append(
+                    ParallelExecutionResult(
+                        task_id=task.task_id,
+                        success=False,
+                        error=e,
+                        execution_time=execution_time,
                     )
+                )
 
         return results
 
+    def get_executor(self, use_processes: Optional[bool] = None) -> Executor:
+        """
+        Get the long-lived thread or process pool, creating it on first use.
+
+        Args:
+            use_processes: Process pool instead of thread pool (default:
+                the manager's ``use_processes`` setting)
+
+        Returns:
+            Shared executor with ``max_workers`` workers
+        """
+        if use_processes is None:
+            use_processes = self.use_processes
+        with self.lock:
+            if use_processes:
+                if self.process_executor is None:
+                    self.process_executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers
+                    )
+                return self.process_executor
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="semantica-parallel",
+                )
+            return self.executor
+
+    def map_chunks(
+        self,
+        handler: Callable,
+        items: Iterable[Any],
+        chunk_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        use_processes: Optional[bool] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
+        handler_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        Map a handler over chunks of items on the long-lived worker pool.
+
+        ``items`` is consumed lazily, so it may itself be a stream. At most
+        ``max_in_flight`` chunks are submitted ahead of the consumer, which
+        bounds memory and applies backpressure. Chunk results are yielded in
+        input order as soon as each chunk and all earlier ones are done.
+
+        Args:
+            handler: Called as ``handler(chunk, **handler_kwargs)`` with a
+                list of items; must be picklable when using processes
+            items: Iterable of items to process
+            chunk_size: Items per chunk (default: manager's ``chunk_size``)
+            max_in_flight: Chunks in flight (default: manager's ``max_in_flight``)
+            use_processes: Run chunks on the process pool (default: manager's
+                ``use_processes``)
+            should_continue: Checked before each submission; returning False
+                stops submitting and ends the iteration after the chunks
+                already in flight
+            handler_kwargs: Keyword arguments for the handler
+
+        Yields:
+            One handler result per chunk, in order
+        """
+        handler_kwargs = handler_kwargs or {}
+        chunk_size = chunk_size or self.chunk_size
+        max_in_flight = max(1, max_in_flight or self.max_in_flight)
+        if chunk_size < 1:
+            raise ValidationError(f"chunk_size must be positive, got {chunk_size}")
+
+        executor = self.get_executor(use_processes)
+        iterator = iter(items)
+        pending = deque()
+        exhausted = False
+        try:
+            while True:
+                if pending and pending[0].done():
+                    yield pending.popleft().result()
+                    continue
+                if not exhausted and len(pending) < max_in_flight:
+                    if should_continue is not None and not should_continue():
+                        exhausted = True
+                        continue
+                    chunk = list(islice(iterator, chunk_size))
+                    if chunk:
+                        pending.append(executor.submit(handler, chunk, **handler_kwargs))
+                    else:
+                        exhausted = True
+                    continue
+                if not pending:
+                    return
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the long-lived worker pools."""
+        with self.lock:
+            executors = [self.executor, self.process_executor]
+            self.executor = None
+            self.process_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=wait)
+
     def execute_pipeline_steps_parallel(
         self, steps: List[PipelineStep], data: Any, **options
     ) -> List[Any]:
@@ -74,9 +74,6 @@ class PipelineValidator:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def validate_pipeline(
         self, pipeline: Union["Pipeline", "PipelineBuilder"], **options
@@ -103,13 +103,11 @@ class ResourceScheduler:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.resources: Dict[str, Resource] = {}
         self.allocations: Dict[str, ResourceAllocation] = {}
-        self.lock = threading.Lock()
+        # Re-entrant: allocate_resources holds the lock while calling allocate_cpu etc.
+        self.lock = threading.RLock()
 
         self._initialize_resources()
 
@@ -114,9 +114,6 @@ class AbductiveReasoner:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.reasoner = Reasoner(**self.config)
         self.max_hypotheses = self.config.get("max_hypotheses", 10)
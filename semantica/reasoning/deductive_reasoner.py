@@ -111,9 +111,6 @@ class DeductiveReasoner:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.reasoner = Reasoner(**self.config)
         self.known_facts: Set[Any] = set()
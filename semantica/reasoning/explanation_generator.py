@@ -120,9 +120,6 @@ class ExplanationGenerator:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.generate_nl = self.config.get("generate_nl", True)
         self.detail_level = self.config.get("detail_level", "detailed")
@@ -71,9 +71,6 @@ class Reasoner:
         """
         self.logger = get_logger("reasoner")
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
         self.config = kwargs
         
         self.rules: List[Rule] = []
@@ -195,7 +192,7 @@ class Reasoner:
         self.progress_tracker.stop_tracking(
             tracking_id,
             status="completed",
-            message=f"Forward chaining completed: {len(results)} new facts inferred"
+            message=lambda: f"Forward chaining completed: {len(results)} new facts inferred"
         )
         return results
 
@@ -143,9 +143,6 @@ class ReteEngine:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.network: Dict[str, ReteNode] = {}
         self.facts: List[Fact] = []
@@ -76,9 +76,6 @@ class SPARQLReasoner:
 
         # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.reasoner = Reasoner(**self.config)
         self.triplet_store = self.config.get("triplet_store")
@@ -126,9 +126,6 @@ class SeedDataManager:
         self.config = config or {}
         self.config.update(kwargs)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.sources: Dict[str, SeedDataSource] = {}
         self.seed_data: SeedData = SeedData()
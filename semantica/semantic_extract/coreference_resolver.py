@@ -108,9 +108,6 @@ class CoreferenceResolver:
         self.config = config or {}
         self.config.update(kwargs)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Store method for passing to extractors if needed
         if method is not None:
@@ -98,9 +98,6 @@ class LLMExtraction:
         self.logger = get_logger("llm_extraction")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.provider_name = provider
         self.model = config.get("model")
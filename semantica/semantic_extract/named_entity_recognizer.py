@@ -91,9 +91,6 @@ class NamedEntityRecognizer:
         self.config = config or {}
         self.config.update(kwargs)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Store parameters
         self.methods = methods or ["spacy"]
@@ -141,9 +141,6 @@ class NERExtractor:
         self.ensemble_voting = config.get("ensemble_voting", False)
         self.post_process = config.get("post_process", False)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Initialize spaCy model if ML method is used
         self.nlp = None
@@ -129,9 +129,6 @@ class RelationExtractor:
         self.logger = get_logger("relation_extractor")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Store parameters
         self.relation_types = relation_types
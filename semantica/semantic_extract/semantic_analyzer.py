@@ -105,9 +105,6 @@ class SemanticAnalyzer:
         self.config = config or {}
         self.config.update(kwargs)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Store method for passing to extractors if needed
         if method is not None:
@@ -466,10 +463,8 @@ class SemanticClusterer:
         """Initialize semantic clusterer."""
         self.logger = get_logger("semantic_clusterer")
         self.config = config
-        # Initialize progress tracker and ensure it's enabled
+        # Initialize progress tracker
         self.progress_tracker = get_progress_tracker()
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
     def cluster(
         self, texts: Union[List[str], List[Dict[str, Any]]], **options
@@ -140,9 +140,6 @@ class SemanticNetworkExtractor:
         self.logger = get_logger("semantic_network_extractor")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Store method for passing to extractors if needed
         if method is not None:
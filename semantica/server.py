@@ -3,20 +3,33 @@ Semantica Server Entry Point
 
 This module provides the REST API server for the Semantica framework
 using FastAPI and uvicorn.
+
+Knowledge base builds and pipeline runs are submitted as jobs to the job
+queue (SEMANTICA_JOB_QUEUE, default .semantica/jobs.db) and processed by
+``semantica-worker`` processes; clients poll ``/jobs/{job_id}`` for status
+and results.
 """
 
+import os
+
 import uvicorn
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
 from . import __version__
+from .core.job_queue import JobStatus, create_job_queue
 from .core.orchestrator import Semantica
 from .utils.logging import setup_logging
+from .utils.metrics import PROMETHEUS_CONTENT_TYPE, enable_metrics, render_prometheus
 
 # Initialize logging
 setup_logging()
 
+# Collect span metrics for the /metrics endpoint
+metrics_registry = enable_metrics()
+
 app = FastAPI(
     title="Semantica API",
     description="REST API for the Semantica Framework",
@@ -26,9 +39,27 @@ app = FastAPI(
 # Global framework instance
 framework = Semantica()
 
+# Job queue shared with the workers
+job_queue = create_job_queue(
+    "sqlite", path=os.environ.get("SEMANTICA_JOB_QUEUE", ".semantica/jobs.db")
+)
+
 class BuildRequest(BaseModel):
     sources: List[str]
     config: Optional[Dict[str, Any]] = None
+    max_attempts: int = 3
+
+class JobRequest(BaseModel):
+    kind: str
+    payload: Dict[str, Any] = {}
+    max_attempts: int = 3
+
+def _enqueue(kind: str, payload: Dict[str, Any], max_attempts: int) -> Dict[str, Any]:
+    try:
+        job_id = job_queue.enqueue(kind, payload, max_attempts=max_attempts)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "accepted", "job_id": job_id, "status_url": f"/jobs/{job_id}"}
 
 @app.get("/")
 async def root():
@@ -44,14 +75,57 @@ async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
 
-@app.post("/build")
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics for all tracked operations."""
+    return PlainTextResponse(
+        render_prometheus(metrics_registry), media_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+@app.post("/build", status_code=202)
 async def build_kb(request: BuildRequest):
-    """Initiate knowledge base construction."""
+    """Queue knowledge base construction; ``config`` holds build options."""
+    response = _enqueue(
+        "build_knowledge_base",
+        {"sources": request.sources, "options": request.config or {}},
+        request.max_attempts,
+    )
+    response["message"] = "Knowledge base construction initiated"
+    return response
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: JobRequest):
+    """Queue a job ("build_knowledge_base", "pipeline" or a custom kind)."""
+    return _enqueue(request.kind, request.payload, request.max_attempts)
+
+@app.get("/jobs")
+async def list_jobs(status: Optional[str] = None, limit: int = 100):
+    """List jobs, newest first."""
     try:
-        # result = framework.build_knowledge_base(sources=request.sources, config=request.config)
-        return {"status": "accepted", "message": "Knowledge base construction initiated"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        job_status = JobStatus(status) if status else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Unknown job status: {status}")
+    return {"jobs": [job.to_dict() for job in job_queue.list_jobs(job_status, limit)]}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Job status, with the result or error once finished."""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job.to_dict()
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued job."""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    if not job_queue.cancel(job_id):
+        raise HTTPException(
+            status_code=409, detail=f"Job {job_id} is {job.status.value}"
+        )
+    return {"status": JobStatus.CANCELLED.value, "job_id": job_id}
 
 def main():
     """Server entry point."""
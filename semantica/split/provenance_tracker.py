@@ -67,9 +67,6 @@ class ProvenanceTracker:
         self.logger = get_logger("provenance_tracker")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.store_metadata = config.get("store_metadata", True)
         self.track_versions = config.get("track_versions", False)
@@ -50,9 +50,6 @@ class SlidingWindowChunker:
         self.logger = get_logger("sliding_window_chunker")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.chunk_size = config.get("chunk_size", 1000)
         self.overlap = config.get("overlap", 0)
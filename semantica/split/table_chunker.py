@@ -63,9 +63,6 @@ class TableChunker:
         self.logger = get_logger("table_chunker")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.max_rows = config.get("max_rows", 100)
         self.preserve_headers = config.get("preserve_headers", True)
@@ -65,9 +65,6 @@ class BlazegraphStore:
         self.logger = get_logger("blazegraph_store")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.endpoint = endpoint.rstrip("/")
         self.namespace = config.get("namespace", "kb")
@@ -7,7 +7,8 @@ monitoring.
 
 Key Features:
     - SPARQL query execution and optimization
-    - Query planning and caching
+    - Query planning and bounded LRU/TTL result caching, invalidated on
+      store writes
     - Result processing and formatting
     - Performance monitoring and profiling
     - Query validation
@@ -30,11 +31,13 @@ Author: Semantica Contributors
 License: MIT
 """
 
+import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ..utils.cache import QueryCache, WriteGeneration, make_cache_key
 from ..utils.exceptions import ProcessingError, ValidationError
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
@@ -82,21 +85,27 @@ class QueryEngine:
             **kwargs: Additional configuration options:
                 - enable_caching: Enable query caching (default: True)
                 - cache_size: Cache size limit
+                - cache_ttl: Seconds a cached result stays valid
+                  (default: no expiry)
+                - cache_max_bytes: Maximum estimated size of cached results
                 - enable_optimization: Enable query optimization (default: True)
         """
         self.logger = get_logger("query_engine")
         self.config = config or {}
         self.config.update(kwargs)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.enable_caching = self.config.get("enable_caching", True)
         self.enable_optimization = self.config.get("enable_optimization", True)
         self.cache_size = self.config.get("cache_size", 1000)
 
-        self.query_cache: Dict[str, QueryResult] = {}
+        # Bumped by the store after every write; older cached results are stale
+        self.generation = WriteGeneration()
+        self.query_cache = QueryCache(
+            max_entries=self.cache_size,
+            max_bytes=self.config.get("cache_max_bytes"),
+            ttl=self.config.get("cache_ttl"),
+        )
         self.query_history: List[Dict[str, Any]] = []
 
     def execute_query(self, query: str, store_backend: Any, **options) -> QueryResult:
@@ -130,22 +139,29 @@ class QueryEngine:
                 )
                 raise ValidationError("Invalid SPARQL query")
 
+            # SPARQL Update is never cached and invalidates cached results
+            is_update = self._is_update(query)
+            use_cache = self.enable_caching and not is_update
+
             # Check cache
-            if self.enable_caching:
+            if use_cache:
                 self.progress_tracker.update_tracking(
                     tracking_id, message="Checking cache..."
                 )
-                cache_key = self._get_cache_key(query)
-                if cache_key in self.query_cache:
+                cache_key = self._get_cache_key(query, options)
+                generation = int(self.generation)
+                cached_result = self.query_cache.get(cache_key, generation=generation)
+                if cached_result is not None:
                     self.logger.debug("Returning cached query result")
-                    cached_result = self.query_cache[cache_key]
-                    cached_result.metadata["cached"] = True
                     self.progress_tracker.stop_tracking(
                         tracking_id,
                         status="completed",
                         message="Returned cached result",
                     )
-                    return cached_result
+                    return replace(
+                        cached_result,
+                        metadata={**cached_result.metadata, "cached": True},
+                    )
 
             # Optimize query
             if self.enable_optimization:
@@ -160,10 +176,13 @@ class QueryEngine:
             self.progress_tracker.update_tracking(
                 tracking_id, message="Executing query on store..."
             )
-            if hasattr(store_backend, "execute_sparql"):
-                result_data = store_backend.execute_sparql(optimized_query, **options)
-            else:
+            if not hasattr(store_backend, "execute_sparql"):
                 raise ProcessingError("Store backend does not support SPARQL execution")
+            try:
+                result_data = store_backend.execute_sparql(optimized_query, **options)
+            finally:
+                if is_update:
+                    self.generation.bump()
 
             execution_time = time.time() - start_time
 
@@ -179,11 +198,11 @@ class QueryEngine:
             )
 
             # Cache result
-            if self.enable_caching:
+            if use_cache:
                 self.progress_tracker.update_tracking(
                     tracking_id, message="Caching result..."
                 )
-                self._cache_result(query, result)
+                self.query_cache.put(cache_key, result, generation=generation)
 
             # Record history
             self.query_history.append(
@@ -328,22 +347,27 @@ class QueryEngine:
 
         return steps
 
-    def _get_cache_key(self, query: str) -> str:
-        """Generate cache key for query."""
-        import hashlib
-
-        normalized = " ".join(query.split())
-        return hashlib.md5(normalized.encode()).hexdigest()
+    def _is_update(self, query: str) -> bool:
+        """Check whether a query is a SPARQL Update."""
+        # Drop prologue and comments before looking at the first keyword
+        body = re.sub(r"#[^\n]*", " ", query)
+        body = re.sub(r"(?is)^\s*((BASE|PREFIX)\s+[^<]*<[^>]*>\s*)*", "", body)
+        return bool(
+            re.match(
+                r"(?i)\s*(INSERT|DELETE|LOAD|CLEAR|CREATE|DROP|COPY|MOVE|ADD|WITH)\b",
+                body,
+            )
+        )
 
-    def _cache_result(self, query: str, result: QueryResult) -> None:
-        """Cache query result."""
-        if len(self.query_cache) >= self.cache_size:
-            # Remove oldest entry
-            oldest_key = next(iter(self.query_cache))
-            del self.query_cache[oldest_key]
+    def _get_cache_key(
+        self, query: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Generate cache key for query."""
+        return make_cache_key(query, parameters)
 
-        cache_key = self._get_cache_key(query)
-        self.query_cache[cache_key] = result
+    def invalidate_cache(self) -> None:
+        """Mark cached results stale (called by the store after writes)."""
+        self.generation.bump()
 
     def clear_cache(self) -> None:
         """Clear query cache."""
@@ -367,5 +391,6 @@ class QueryEngine:
             "min_execution_time": min(execution_times),
             "max_execution_time": max(execution_times),
             "cache_size": len(self.query_cache),
-            "cache_hit_rate": 0.0,  # Would need to track hits/misses
+            "cache_hit_rate": self.query_cache.stats()["hit_rate"],
+            "cache": self.query_cache.stats(),
         }
@@ -63,9 +63,6 @@ class TripletStore:
         """
         self.logger = get_logger("triplet_store")
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         # Validate backend
         if backend.lower() not in self.SUPPORTED_BACKENDS:
@@ -302,7 +299,10 @@ class TripletStore:
         if not self._validate_triplet(triplet):
             raise ValidationError("Invalid triplet structure or confidence")
 
-        return self._store_backend.add_triplet(triplet, **options)
+        try:
+            return self._store_backend.add_triplet(triplet, **options)
+        finally:
+            self.query_engine.invalidate_cache()
 
     def add_triplets(
         self, 
@@ -329,12 +329,15 @@ class TripletStore:
             )
 
         # Use bulk loader for efficient processing
-        progress = self.bulk_loader.load_triplets(
-            valid_triplets, 
-            self._store_backend, 
-            batch_size=batch_size, 
-            **options
-        )
+        try:
+            progress = self.bulk_loader.load_triplets(
+                valid_triplets, 
+                self._store_backend, 
+                batch_size=batch_size, 
+                **options
+            )
+        finally:
+            self.query_engine.invalidate_cache()
 
         return {
             "success": progress.metadata.get("success", progress.failed_triplets == 0),
@@ -381,7 +384,10 @@ class TripletStore:
         Returns:
             Operation status
         """
-        return self._store_backend.delete_triplet(triplet, **options)
+        try:
+            return self._store_backend.delete_triplet(triplet, **options)
+        finally:
+            self.query_engine.invalidate_cache()
 
     def update_triplet(
         self, 
@@ -12,6 +12,8 @@ Key Features:
     - Common helper functions for data manipulation
     - Framework constants and configuration defaults
     - Type definitions and protocols
+    - Progress tracking and scrapeable metrics/tracing (Prometheus, OpenTelemetry JSON lines)
+    - Bounded LRU/TTL query result cache with write-generation invalidation
 
 Main Classes:
     - Logging utilities: setup_logging, get_logger, log_performance, log_error
@@ -19,6 +21,8 @@ Main Classes:
     - Validators: validate_data, validate_config, validate_entity, validate_relationship
     - Helpers: format_data, clean_text, normalize_entities, hash_data, merge_dicts
     - Types: Entity, Relationship, ProcessingResult, QualityMetrics
+    - Metrics: MetricsRegistry, enable_metrics, render_prometheus, JSONLinesSpanExporter
+    - Cache: QueryCache, WriteGeneration, make_cache_key
 
 Example Usage:
     >>> from semantica.utils import setup_logging, get_logger
@@ -37,6 +41,7 @@ Author: Semantica Contributors
 License: MIT
 """
 
+from .cache import QueryCache, WriteGeneration, make_cache_key
 from .constants import (
     API_ENDPOINTS,
     CACHE_CONFIG,
@@ -95,6 +100,20 @@ from .logging import (
     log_performance,
     setup_logging,
 )
+from .metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    InMemorySpanExporter,
+    JSONLinesSpanExporter,
+    MetricsRegistry,
+    Span,
+    SpanExporter,
+    disable_metrics,
+    enable_metrics,
+    get_metrics_registry,
+    render_prometheus,
+)
 from .progress_tracker import (
     ConsoleProgressDisplay,
     FileProgressDisplay,
@@ -104,6 +123,7 @@ from .progress_tracker import (
     ProgressItem,
     ProgressTracker,
     get_progress_tracker,
+    set_progress_enabled,
     track_progress,
 )
 from .types import (  # Type Aliases; Enums; Data Classes; Generic Types; Type Guards; Conversion Functions
@@ -249,5 +269,23 @@ __all__ = [
     "ProgressItem",
     "ModuleDetector",
     "get_progress_tracker",
+    "set_progress_enabled",
     "track_progress",
+    # Metrics and Tracing
+    "MetricsRegistry",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Span",
+    "SpanExporter",
+    "InMemorySpanExporter",
+    "JSONLinesSpanExporter",
+    "enable_metrics",
+    "disable_metrics",
+    "get_metrics_registry",
+    "render_prometheus",
+    # Cache
+    "QueryCache",
+    "WriteGeneration",
+    "make_cache_key",
 ]
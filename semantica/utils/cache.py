@@ -0,0 +1,295 @@
+"""
+Query Result Cache Module
+
+This module provides the bounded result cache shared by the graph store and
+triplet store query engines.
+
+Algorithms Used:
+    - LRU Eviction: OrderedDict in recency order; hits move an entry to the
+      end, inserts evict from the front until both the entry and byte
+      bounds hold
+    - TTL Expiry: Per-entry deadline on the monotonic clock, checked lazily
+      on lookup
+    - Write Generations: Entries record the store's write generation when
+      they are stored; a lookup with a newer generation treats the entry as
+      stale and drops it, so a write invalidates every earlier result in O(1)
+    - Canonical Keys: BLAKE2b over the whitespace-normalized query and the
+      parameters serialized as sorted JSON, so equal parameter dictionaries
+      give equal keys regardless of insertion order
+    - Size Estimation: Recursive sys.getsizeof over containers, dataclasses
+      and objects (only when a byte bound is set)
+
+Key Features:
+    - Entry count and byte bounded
+    - Default and per-entry TTL
+    - Hit, miss, eviction, expiration and invalidation counts
+    - Thread-safe
+
+Main Classes:
+    - QueryCache: Bounded LRU/TTL cache
+    - WriteGeneration: Thread-safe write counter of a store
+
+Main Functions:
+    - make_cache_key: Canonical cache key for a query and its parameters
+
+Example Usage:
+    >>> from semantica.utils.cache import QueryCache, WriteGeneration, make_cache_key
+    >>> cache = QueryCache(max_entries=500, max_bytes=64 * 2**20, ttl=300)
+    >>> generation = WriteGeneration()
+    >>> key = make_cache_key("MATCH (n:Person) RETURN n", {"limit": 10})
+    >>> cache.put(key, result, generation=int(generation))
+    >>> generation.bump()  # a write happened
+    >>> cache.get(key, generation=int(generation))  # -> None (stale)
+    >>> cache.stats()["invalidations"]
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, Optional
+
+_MISSING = object()
+
+
+def make_cache_key(query: str, parameters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Canonical cache key for a query and its parameters.
+
+    Args:
+        query: Query string (whitespace runs are collapsed)
+        parameters: Query parameters (serialized as sorted JSON; values that
+            are not JSON serializable use ``str``)
+
+    Returns:
+        Hex digest
+    """
+    normalized = " ".join(query.split())
+    params = json.dumps(
+        parameters or {}, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(
+        f"{normalized}\x00{params}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """Approximate memory size of a value in bytes, following containers."""
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, seen) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return size + sum(
+            estimate_size(getattr(value, f.name), seen) for f in fields(value)
+        )
+    if hasattr(value, "nbytes"):
+        return size + int(value.nbytes)
+    if hasattr(value, "__dict__"):
+        return size + estimate_size(vars(value), seen)
+    return size
+
+
+class WriteGeneration:
+    """Monotonic write counter of a store; bumped after every write."""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def bump(self) -> int:
+        """Record a write and return the new generation."""
+        with self._lock:
+            self._value += 1
+            return self._value
+
+    @property
+    def value(self) -> int:
+        """Current generation."""
+        return self._value
+
+    def __int__(self) -> int:
+        return self._value
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+    generation: Optional[int]
+
+
+class QueryCache:
+    """
+    Bounded LRU cache with TTL and write-generation invalidation.
+
+    • Evicts least recently used entries beyond ``max_entries`` / ``max_bytes``
+    • Expires entries after their TTL
+    • Drops entries stored under an older write generation
+    • Counts hits, misses, evictions, expirations and invalidations
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        size_of: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Initialize query cache.
+
+        Args:
+            max_entries: Maximum number of entries (0 disables caching)
+            max_bytes: Maximum estimated size of all values (default: unbounded)
+            ttl: Default time to live in seconds (default: no expiry)
+            size_of: Size function for values (default: estimate_size)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size_of = size_of or estimate_size
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            ("hits", "misses", "evictions", "expirations", "invalidations"), 0
+        )
+
+    def get(self, key: str, default: Any = None, generation: Optional[int] = None) -> Any:
+        """
+        Look up a value.
+
+        Args:
+            key: Cache key
+            default: Returned on a miss
+            generation: Current write generation of the store; entries
+                stored under another generation are stale
+
+        Returns:
+            Cached value or ``default``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counts["misses"] += 1
+                return default
+            if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+                self._remove(key)
+                self._counts["expirations"] += 1
+                self._counts["misses"] += 1
+                return default
+            if generation is not None and entry.generation != generation:
+                self._remove(key)
+                self._counts["invalidations"] += 1
+                self._counts["misses"] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._counts["hits"] += 1
+            return entry.value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        generation: Optional[int] = None,
+        ttl: Optional[float] = _MISSING,
+    ) -> bool:
+        """
+        Store a value, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: Write generation the value was computed under
+            ttl: Time to live in seconds (default: the cache TTL; None for
+                no expiry)
+
+        Returns:
+            False if the value was not cached (caching disabled or the value
+            alone exceeds ``max_bytes``)
+        """
+        if self.max_entries <= 0:
+            return False
+        size = self.size_of(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, size, expires_at, generation)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._counts["evictions"] += 1
+        return True
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """
+        Remove one entry, or all entries when ``key`` is None.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if key is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+            elif key in self._entries:
+                self._remove(key)
+                removed = 1
+            else:
+                removed = 0
+            self._counts["invalidations"] += removed
+            return removed
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counts."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._counts = dict.fromkeys(self._counts, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, estimated bytes, counts and hit rate."""
+        with self._lock:
+            lookups = self._counts["hits"] + self._counts["misses"]
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                **self._counts,
+                "hit_rate": self._counts["hits"] / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
@@ -0,0 +1,726 @@
+"""
+Metrics and Tracing Module
+
+This module provides a scrapeable metrics and tracing surface for Semantica.
+It is fed by the same ``start_tracking`` / ``stop_tracking`` calls the
+ProgressTracker already receives from every module, so enabling it requires
+no changes at call sites.
+
+Algorithms Used:
+    - Log-Bucketed Histograms: Latencies are counted in exponential buckets
+      (8 per power of two); p50/p95/p99 are read from cumulative bucket counts
+      with bounded relative error and constant memory per series
+    - Span Nesting: The currently open span is kept in a ``contextvars``
+      variable, so nested tracking calls become parent/child spans in both
+      threads and asyncio tasks; spans of a registered pipeline without an
+      enclosing span are parented to the pipeline's root span
+    - Trace IDs: Derived from ``pipeline_id`` (BLAKE2b), so all spans of a
+      pipeline share one trace
+
+Key Features:
+    - Counters, gauges and histograms with labels
+    - Per-module / per-submodule span counts, latency quantiles and in-flight gauges
+    - Pluggable span exporters: in-memory and OpenTelemetry JSON lines
+    - Prometheus text exposition (served by ``semantica.server`` at ``/metrics``)
+    - In-process snapshots as plain dictionaries
+
+Main Classes:
+    - Counter, Gauge, Histogram: Labelled metric families
+    - MetricsRegistry: Metric families, open spans and exporters
+    - Span: A finished or in-flight tracked operation
+    - SpanExporter: Abstract base class for span exporters
+    - InMemorySpanExporter: Keeps the most recent spans in memory
+    - JSONLinesSpanExporter: Writes OTLP/JSON trace requests, one per line
+
+Example Usage:
+    >>> from semantica.utils.metrics import enable_metrics, render_prometheus
+    >>> registry = enable_metrics(jsonl_path="spans.jsonl")
+    >>> # ... run any Semantica workload ...
+    >>> registry.snapshot()["histograms"]["semantica_span_duration_seconds"]
+    >>> print(render_prometheus(registry))
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+import atexit
+import contextvars
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Environment variable that enables metrics collection at import time when set to 1/true/on
+METRICS_ENV_VAR = "SEMANTICA_METRICS"
+
+SPAN_COUNT = "semantica_spans_total"
+SPAN_DURATION = "semantica_span_duration_seconds"
+SPANS_IN_FLIGHT = "semantica_spans_in_flight"
+SPAN_LABELS = ("module", "submodule")
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+# Histogram buckets: 8 per power of two starting at 1 microsecond
+_BUCKETS_PER_OCTAVE = 8
+_BUCKET_BASE = 1e-6
+_BUCKET_COUNT = 40 * _BUCKETS_PER_OCTAVE
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    """Labelled metric family."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, description: str = "", labelnames: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str = "", labelnames: Sequence[str] = ()):
+        super().__init__(name, description, labelnames)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter of a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, description: str = "", labelnames: Sequence[str] = ()):
+        super().__init__(name, description, labelnames)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the gauge of a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrease the gauge of a label set."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge of a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = float(value)
+
+
+class _HistogramSeries:
+    """Bucket counts and exact count/sum/min/max of one label set."""
+
+    __slots__ = ("buckets", "count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.buckets = [0] * (_BUCKET_COUNT + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def observe(self, value: float) -> None:
+        if value <= _BUCKET_BASE:
+            index = 0
+        else:
+            index = min(
+                _BUCKET_COUNT,
+                math.ceil(math.log2(value / _BUCKET_BASE) * _BUCKETS_PER_OCTAVE),
+            )
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile, clamped to min/max."""
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                upper = _BUCKET_BASE * 2 ** (index / _BUCKETS_PER_OCTAVE)
+                return min(max(upper, self.minimum), self.maximum)
+        return self.maximum
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values with quantile estimates.
+
+    Quantiles are accurate to one bucket (about 9% relative error) within
+    1 microsecond to about 12 days.
+    """
+
+    type_name = "summary"
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        labelnames: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ):
+        super().__init__(name, description, labelnames)
+        self.quantiles = tuple(quantiles)
+        self.series: Dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = _HistogramSeries()
+            series.observe(value)
+
+    def summary(self, key: LabelValues) -> Dict[str, float]:
+        """Count, sum, min, max and quantiles of one label set."""
+        with self._lock:
+            series = self.series[key]
+            result = {
+                "count": series.count,
+                "sum": series.total,
+                "min": series.minimum,
+                "max": series.maximum,
+            }
+            for q in self.quantiles:
+                result[f"p{q * 100:g}"] = series.quantile(q)
+        return result
+
+
+@dataclass
+class Span:
+    """A tracked operation (OpenTelemetry span semantics)."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    module: Optional[str] = None
+    submodule: Optional[str] = None
+    pipeline_id: Optional[str] = None
+    start_time_ns: int = 0
+    end_time_ns: Optional[int] = None
+    status: str = "running"
+    message: str = ""
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    # perf_counter at start, for accurate durations
+    start_counter: float = field(default=0.0, repr=False)
+    duration: Optional[float] = None
+    parent_span: Optional["Span"] = field(default=None, repr=False, compare=False)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Span in the OTLP/JSON encoding."""
+        attributes = {
+            "semantica.module": self.module,
+            "semantica.submodule": self.submodule,
+            "semantica.pipeline_id": self.pipeline_id,
+            **self.attributes,
+        }
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or self.start_time_ns),
+            "attributes": [
+                _otlp_attribute(key, value)
+                for key, value in attributes.items()
+                if value is not None
+            ],
+            "status": {"code": 2, "message": self.message}
+            if self.status == "failed"
+            else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    elif isinstance(value, str):
+        encoded = {"stringValue": value}
+    else:
+        encoded = {"stringValue": json.dumps(value, default=str)}
+    return {"key": key, "value": encoded}
+
+
+class SpanExporter(ABC):
+    """Abstract base class for span exporters."""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Export finished spans."""
+        pass
+
+    def flush(self) -> None:
+        """Write out buffered spans."""
+        pass
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+        self.flush()
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the most recent finished spans in memory."""
+
+    def __init__(self, max_spans: int = 10000):
+        """
+        Initialize exporter.
+
+        Args:
+            max_spans: Number of most recent spans kept
+        """
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.spans.extend(spans)
+
+    def clear(self) -> None:
+        """Drop all kept spans."""
+        self.spans.clear()
+
+
+class JSONLinesSpanExporter(SpanExporter):
+    """
+    Writes spans as OpenTelemetry JSON lines.
+
+    Each line is an OTLP ``ExportTraceServiceRequest`` in JSON encoding (the
+    format of the OpenTelemetry Collector file exporter), so the file can be
+    replayed into any OTLP-compatible backend.
+    """
+
+    def __init__(self, path: Union[str, Path], service_name: str = "semantica", batch_size: int = 64):
+        """
+        Initialize exporter.
+
+        Args:
+            path: Output file (appended to)
+            service_name: ``service.name`` resource attribute
+            batch_size: Spans buffered before a line is written
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.service_name = service_name
+        self.batch_size = max(1, batch_size)
+        self._buffer: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._buffer.extend(spans)
+            if len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self._write(batch)
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self._write(batch)
+
+    def _write(self, spans: List[Span]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", self.service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "semantica"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(request, default=str) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "semantica_current_span", default=None
+)
+
+
+def _trace_id_for(pipeline_id: Optional[str]) -> str:
+    if pipeline_id:
+        return hashlib.blake2b(str(pipeline_id).encode("utf-8"), digest_size=16).hexdigest()
+    return f"{random.getrandbits(128):032x}"
+
+
+class MetricsRegistry:
+    """
+    Metric families, open spans and span exporters.
+
+    ``start_span`` / ``end_span`` are called by ProgressTracker for every
+    tracked operation and maintain three families labelled by module and
+    submodule: ``semantica_spans_total`` (also labelled by status),
+    ``semantica_span_duration_seconds`` and ``semantica_spans_in_flight``.
+    """
+
+    def __init__(self, exporters: Optional[Iterable[SpanExporter]] = None):
+        """
+        Initialize registry.
+
+        Args:
+            exporters: Span exporters receiving every finished span
+        """
+        self.metrics: Dict[str, _Metric] = {}
+        self.exporters: List[SpanExporter] = list(exporters or [])
+        self._open: Dict[str, Span] = {}
+        self._pipeline_roots: Dict[str, Span] = {}
+        self._lock = threading.Lock()
+
+        self.span_count = self.counter(
+            SPAN_COUNT, "Tracked operations by final status", SPAN_LABELS + ("status",)
+        )
+        self.span_duration = self.histogram(SPAN_DURATION, "Tracked operation latency", SPAN_LABELS)
+        self.in_flight = self.gauge(SPANS_IN_FLIGHT, "Tracked operations in progress", SPAN_LABELS)
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered as {existing.type_name}")
+                return existing
+            self.metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, description: str = "", labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter family."""
+        return self._register(Counter(name, description, labelnames))
+
+    def gauge(self, name: str, description: str = "", labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge family."""
+        return self._register(Gauge(name, description, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        labelnames: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> Histogram:
+        """Get or create a histogram family."""
+        return self._register(Histogram(name, description, labelnames, quantiles))
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        """Send finished spans to an additional exporter."""
+        self.exporters.append(exporter)
+
+    # ------------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------------
+
+    def start_pipeline(self, pipeline_id: str) -> Span:
+        """Open the root span of a pipeline; its module spans become children."""
+        with self._lock:
+            root = self._pipeline_roots.get(pipeline_id)
+        if root is None:
+            root = self._new_span(f"pipeline {pipeline_id}", None, None, pipeline_id, parent=None)
+            with self._lock:
+                root = self._pipeline_roots.setdefault(pipeline_id, root)
+        return root
+
+    def end_pipeline(self, pipeline_id: str, status: str = "completed") -> Optional[Span]:
+        """Close the root span of a pipeline."""
+        with self._lock:
+            root = self._pipeline_roots.pop(pipeline_id, None)
+        if root is not None:
+            self._finish(root, status, "")
+        return root
+
+    def start_span(
+        self,
+        key: str,
+        module: Optional[str] = None,
+        submodule: Optional[str] = None,
+        pipeline_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Span:
+        """
+        Open a span under ``key`` (the tracking ID).
+
+        The parent is the span currently open in this context, or the
+        pipeline root span when ``pipeline_id`` belongs to a started pipeline.
+        """
+        parent = _current_span.get()
+        if parent is None and pipeline_id:
+            with self._lock:
+                parent = self._pipeline_roots.get(pipeline_id)
+        name = ".".join(part for part in (module, submodule) if part) or "operation"
+        span = self._new_span(name, module, submodule, pipeline_id, parent)
+        if attributes:
+            span.attributes.update({k: v for k, v in attributes.items() if v is not None})
+
+        with self._lock:
+            self._open[key] = span
+        self.in_flight.inc(module=module or "", submodule=submodule or "")
+        _current_span.set(span)
+        return span
+
+    def end_span(
+        self,
+        key: str,
+        status: str = "completed",
+        message: str = "",
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Span]:
+        """Close the span opened under ``key``; returns None if it is not open."""
+        with self._lock:
+            span = self._open.pop(key, None)
+        if span is None:
+            return None
+        if attributes:
+            span.attributes.update(attributes)
+
+        if _current_span.get() is span:
+            parent = span.parent_span
+            _current_span.set(parent if parent is not None and parent.end_time_ns is None else None)
+
+        labels = {"module": span.module or "", "submodule": span.submodule or ""}
+        self.in_flight.dec(**labels)
+        self._finish(span, status, message)
+        self.span_count.inc(status=status, **labels)
+        self.span_duration.observe(span.duration, **labels)
+        return span
+
+    def _new_span(self, name, module, submodule, pipeline_id, parent: Optional[Span]) -> Span:
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else _trace_id_for(pipeline_id),
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent is not None else None,
+            module=module,
+            submodule=submodule,
+            pipeline_id=pipeline_id or (parent.pipeline_id if parent is not None else None),
+            start_time_ns=time.time_ns(),
+            start_counter=time.perf_counter(),
+            parent_span=parent,
+        )
+        return span
+
+    def _finish(self, span: Span, status: str, message: str) -> None:
+        span.duration = time.perf_counter() - span.start_counter
+        span.end_time_ns = span.start_time_ns + int(span.duration * 1e9)
+        span.status = status
+        span.message = message
+        span.parent_span = None
+        for exporter in self.exporters:
+            exporter.export([span])
+
+    def open_spans(self) -> List[Span]:
+        """Spans currently in flight."""
+        with self._lock:
+            return list(self._open.values())
+
+    # ------------------------------------------------------------------
+    # Snapshots and lifecycle
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Current values of all metric families.
+
+        Returns:
+            {"counters" | "gauges" | "histograms": {name: [{"labels": {...}, ...}]}};
+            counter/gauge entries carry "value", histogram entries carry
+            "count", "sum", "min", "max" and "p50"/"p95"/"p99".
+        """
+        result: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+            "counters": {},
+            "gauges": {},
+            "histograms": {},
+        }
+        with self._lock:
+            metrics = list(self.metrics.values())
+        for metric in metrics:
+            if isinstance(metric, Histogram):
+                with metric._lock:
+                    keys = list(metric.series)
+                result["histograms"][metric.name] = [
+                    {"labels": dict(zip(metric.labelnames, key)), **metric.summary(key)}
+                    for key in keys
+                ]
+            else:
+                with metric._lock:
+                    values = list(metric.values.items())
+                section = "counters" if isinstance(metric, Counter) else "gauges"
+                result[section][metric.name] = [
+                    {"labels": dict(zip(metric.labelnames, key)), "value": value}
+                    for key, value in values
+                ]
+        return result
+
+    def flush(self) -> None:
+        """Flush all exporters."""
+        for exporter in self.exporters:
+            exporter.flush()
+
+    def shutdown(self) -> None:
+        """Shut down all exporters."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+# ----------------------------------------------------------------------
+# Prometheus text exposition
+# ----------------------------------------------------------------------
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in (*zip(names, values), *extra)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def render_prometheus(registry: "MetricsRegistry") -> str:
+    """
+    Render all metric families in the Prometheus text exposition format.
+
+    Histograms are exposed as summaries (quantiles plus ``_sum``/``_count``).
+
+    Args:
+        registry: Metrics registry
+
+    Returns:
+        Exposition text
+    """
+    lines: List[str] = []
+    with registry._lock:
+        metrics = list(registry.metrics.values())
+    for metric in metrics:
+        lines.append(f"# HELP {metric.name} {_escape(metric.description)}")
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+        if isinstance(metric, Histogram):
+            with metric._lock:
+                keys = sorted(metric.series)
+            for key in keys:
+                summary = metric.summary(key)
+                for q in metric.quantiles:
+                    labels = _labels(metric.labelnames, key, [("quantile", f"{q:g}")])
+                    lines.append(f"{metric.name}{labels} {_number(summary[f'p{q * 100:g}'])}")
+                labels = _labels(metric.labelnames, key)
+                lines.append(f"{metric.name}_sum{labels} {_number(summary['sum'])}")
+                lines.append(f"{metric.name}_count{labels} {summary['count']}")
+        else:
+            with metric._lock:
+                values = sorted(metric.values.items())
+            for key, value in values:
+                lines.append(f"{metric.name}{_labels(metric.labelnames, key)} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ----------------------------------------------------------------------
+# Global registry
+# ----------------------------------------------------------------------
+
+
+def get_metrics_registry() -> Optional[MetricsRegistry]:
+    """Registry attached to the global progress tracker (None if metrics are off)."""
+    from .progress_tracker import get_progress_tracker
+
+    return get_progress_tracker().metrics
+
+
+def enable_metrics(
+    registry: Optional[MetricsRegistry] = None,
+    jsonl_path: Optional[Union[str, Path]] = None,
+    in_memory: bool = False,
+) -> MetricsRegistry:
+    """
+    Collect metrics and spans for every tracked operation.
+
+    Works independently of progress display: with ``SEMANTICA_PROGRESS=0``
+    spans are still recorded.
+
+    Args:
+        registry: Registry to use (default: the current one or a new one)
+        jsonl_path: Also write spans as OpenTelemetry JSON lines to this file
+        in_memory: Also keep recent spans in an InMemorySpanExporter
+
+    Returns:
+        The active MetricsRegistry
+    """
+    from .progress_tracker import get_progress_tracker
+
+    tracker = get_progress_tracker()
+    registry = registry or tracker.metrics or MetricsRegistry()
+    if jsonl_path is not None:
+        registry.add_exporter(JSONLinesSpanExporter(jsonl_path))
+    if in_memory:
+        registry.add_exporter(InMemorySpanExporter())
+    if tracker.metrics is not registry:
+        tracker.metrics = registry
+        atexit.register(registry.shutdown)
+    return registry
+
+
+def disable_metrics() -> None:
+    """Stop collecting metrics and flush the active registry's exporters."""
+    from .progress_tracker import get_progress_tracker
+
+    tracker = get_progress_tracker()
+    if tracker.metrics is not None:
+        tracker.metrics.flush()
+        tracker.metrics = None
+
+
+def _metrics_from_env() -> bool:
+    return os.environ.get(METRICS_ENV_VAR, "").strip().lower() in ("1", "true", "on", "yes")
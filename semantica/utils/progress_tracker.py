@@ -12,6 +12,17 @@ Key Features:
     - Console, Jupyter notebook, and log file support
     - Zero configuration required - works automatically
     - Final summary display
+    - Production mode: disabled tracking costs one attribute check per call
+      (``SEMANTICA_PROGRESS=0``, ``ProgressTracker(enabled=False)`` or
+      ``set_progress_enabled(False)``)
+    - Lazy messages: callables are only formatted when an update is displayed
+    - Update coalescing: running updates are pushed to displays at most once
+      per ``update_interval`` per item
+    - Unique tracking IDs per call, safe for concurrent threads
+    - Metrics and spans: with a MetricsRegistry attached (``enable_metrics()``
+      or ``SEMANTICA_METRICS=1``), every tracked operation is also recorded as
+      a span with counters, latency histograms and in-flight gauges, even
+      when progress display is disabled
 
 Main Classes:
     - ProgressTracker: Main tracking coordinator
@@ -20,6 +31,7 @@ Main Classes:
     - JupyterProgressDisplay: IPython/Jupyter notebook display
     - FileProgressDisplay: Log file progress tracking
     - track_progress: Decorator for automatic progress tracking
+    - set_progress_enabled: Enable/disable the global tracker
 
 Example Usage:
     >>> from semantica.utils import track_progress
@@ -28,12 +40,20 @@ Example Usage:
     >>> def process_file(file_path):
     ...     # Processing code - progress tracked automatically
     ...     pass
+    >>>
+    >>> # Production: turn tracking off, or format messages lazily
+    >>> from semantica.utils import get_progress_tracker, set_progress_enabled
+    >>> set_progress_enabled(False)
+    >>> tracker = get_progress_tracker()
+    >>> tracker.update_progress(tid, i, n, message=lambda: f"Processed {i}/{n}")
 
 Author: Semantica Contributors
 License: MIT
 """
 
 import inspect
+import itertools
+import os
 import sys
 import threading
 import time
@@ -45,6 +65,28 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .logging import get_logger
+from .metrics import MetricsRegistry, _metrics_from_env
+
+# A message may be given as a string or as a zero-argument callable that is
+# only evaluated when the update is actually displayed
+Message = Union[str, Callable[[], str]]
+
+# Environment variable that disables tracking when set to 0/false/off/no
+PROGRESS_ENV_VAR = "SEMANTICA_PROGRESS"
+
+# Seconds between Jupyter re-detection attempts
+_JUPYTER_PROBE_INTERVAL = 5.0
+
+
+def _enabled_from_env(default: bool = True) -> bool:
+    value = os.environ.get(PROGRESS_ENV_VAR)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "off", "no")
+
+
+def _resolve_message(message: Message) -> str:
+    return message() if callable(message) else message
 
 # Try to import IPython for Jupyter support
 try:
@@ -79,6 +121,8 @@ class ProgressItem:
     estimated_remaining: Optional[float] = None  # Estimated remaining time in seconds
     pipeline_id: Optional[str] = None  # Pipeline ID this item belongs to
     pipeline_order: Optional[int] = None  # Order of this module in the pipeline
+    last_emit: float = 0.0  # Monotonic time of the last display update
+    pending_message: Optional[Message] = field(default=None, repr=False)  # Not yet displayed
 
 
 class ProgressDisplay(ABC):
@@ -1005,18 +1049,23 @@ class ProgressTracker:
         Initialize progress tracker.
 
         Args:
-            enabled: Enable progress tracking (default: True, always enabled)
+            enabled: Enable progress tracking (default: True). Setting the
+                ``SEMANTICA_PROGRESS`` environment variable to 0/false/off
+                disables tracking regardless of this argument.
             use_emoji: Use emoji indicators
-            update_interval: Minimum time between updates (seconds)
+            update_interval: Minimum time between display updates of a
+                running item (seconds); intermediate updates are coalesced
         """
-        # Always enable progress tracking by default - cannot be disabled via constructor
-        # This ensures progress is always shown automatically
-        self.enabled = True  # Force enabled, ignore parameter
+        self.enabled = enabled and _enabled_from_env()
+        # Span/metrics collection, independent of the displays
+        self.metrics: Optional[MetricsRegistry] = MetricsRegistry() if _metrics_from_env() else None
         self.use_emoji = use_emoji
         self.update_interval = update_interval
 
-        # Detect environment - will be checked dynamically
+        # Detect environment - re-checked at most every few seconds
         self.is_jupyter = self._detect_jupyter()
+        self._last_jupyter_probe = time.monotonic()
+        self._ids = itertools.count(1)
 
         # Create displays
         self.displays: List[ProgressDisplay] = []
@@ -1045,12 +1094,14 @@ class ProgressTracker:
         # Track items
         self.items: List[ProgressItem] = []
         self.active_items: Dict[str, ProgressItem] = {}
-        self.lock = threading.Lock()
+        # Re-entrant: displays updated under the lock read pipeline items back
+        self.lock = threading.RLock()
         
         # Pipeline context tracking
         self.pipeline_contexts: Dict[str, List[str]] = {}  # pipeline_id -> list of module names
         self.pipeline_items: Dict[str, Dict[str, ProgressItem]] = {}  # pipeline_id -> {tracking_id: item}
         self.pipeline_module_order: Dict[str, Dict[str, int]] = {}  # pipeline_id -> {module: order}
+        self._module_pipelines: Dict[str, str] = {}  # module -> first registered pipeline_id
 
     def _detect_jupyter(self) -> bool:
         """Detect if running in Jupyter notebook or Google Colab."""
@@ -1098,6 +1149,20 @@ class ProgressTracker:
         except Exception:
             return False
 
+    def _refresh_jupyter(self) -> None:
+        """Re-detect Jupyter (rate-limited) and add a Jupyter display if it appeared."""
+        if not IPYTHON_AVAILABLE or self.is_jupyter:
+            return
+        now = time.monotonic()
+        if now - self._last_jupyter_probe < _JUPYTER_PROBE_INTERVAL:
+            return
+        self._last_jupyter_probe = now
+        self.is_jupyter = self._detect_jupyter()
+        # If Jupyter is now detected and we don't have a Jupyter display, add it
+        if self.is_jupyter and not any(isinstance(d, JupyterProgressDisplay) for d in self.displays):
+            # Insert Jupyter display at the beginning for priority
+            self.displays.insert(0, JupyterProgressDisplay(use_emoji=self.use_emoji))
+
     @classmethod
     def get_instance(cls) -> "ProgressTracker":
         """Get singleton instance."""
@@ -1105,13 +1170,16 @@ class ProgressTracker:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = cls()
-                    # Ensure it's always enabled
-                    cls._instance.enabled = True
-        else:
-            # Always ensure enabled when getting instance
-            cls._instance.enabled = True
         return cls._instance
 
+    def enable(self) -> None:
+        """Enable progress tracking."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable progress tracking; tracking calls become no-ops."""
+        self.enabled = False
+
     def register_pipeline_modules(
         self, pipeline_id: str, module_list: List[str], module_order: Optional[Dict[str, int]] = None
     ) -> None:
@@ -1123,9 +1191,12 @@ class ProgressTracker:
             module_list: List of module names in the pipeline
             module_order: Optional dict mapping module names to their order in pipeline
         """
-        if not self.enabled:
+        if not self.enabled and self.metrics is None:
             return
 
+        if self.metrics is not None:
+            self.metrics.start_pipeline(pipeline_id)
+
         with self.lock:
             self.pipeline_contexts[pipeline_id] = module_list
             if module_order:
@@ -1138,6 +1209,8 @@ class ProgressTracker:
             # Initialize pipeline items dict
             if pipeline_id not in self.pipeline_items:
                 self.pipeline_items[pipeline_id] = {}
+            for module in module_list:
+                self._module_pipelines.setdefault(module, pipeline_id)
 
     def get_pipeline_items(self, pipeline_id: str) -> List[ProgressItem]:
         """
@@ -1174,9 +1247,12 @@ class ProgressTracker:
         Args:
             pipeline_id: Pipeline identifier to clear
         """
-        if not self.enabled:
+        if not self.enabled and self.metrics is None:
             return
 
+        if self.metrics is not None:
+            self.metrics.end_pipeline(pipeline_id)
+
         with self.lock:
             if pipeline_id in self.pipeline_contexts:
                 del self.pipeline_contexts[pipeline_id]
@@ -1184,13 +1260,18 @@ class ProgressTracker:
                 del self.pipeline_items[pipeline_id]
             if pipeline_id in self.pipeline_module_order:
                 del self.pipeline_module_order[pipeline_id]
+            # Point modules at the next registered pipeline that contains them
+            self._module_pipelines = {}
+            for pid, modules in self.pipeline_contexts.items():
+                for module in modules:
+                    self._module_pipelines.setdefault(module, pid)
 
     def start_tracking(
         self,
         file: Optional[str] = None,
         module: Optional[str] = None,
         submodule: Optional[str] = None,
-        message: str = "",
+        message: Message = "",
         pipeline_id: Optional[str] = None,
     ) -> str:
         """
@@ -1200,22 +1281,19 @@ class ProgressTracker:
             file: File being processed
             module: Module name
             submodule: Submodule/class name
-            message: Progress message
+            message: Progress message (string or zero-argument callable)
 
         Returns:
-            Tracking ID
+            Tracking ID, unique per call ("" when tracking and metrics are disabled)
         """
         if not self.enabled:
-            return ""
+            if self.metrics is None:
+                return ""
+            return self._start_span_only(file, module, submodule, pipeline_id)
 
         # Re-detect Jupyter environment in case it wasn't detected at init
         # This helps if the tracker was created before Jupyter was fully initialized
-        if IPYTHON_AVAILABLE and not self.is_jupyter:
-            self.is_jupyter = self._detect_jupyter()
-            # If Jupyter is now detected and we don't have a Jupyter display, add it
-            if self.is_jupyter and not any(isinstance(d, JupyterProgressDisplay) for d in self.displays):
-                # Insert Jupyter display at the beginning for priority
-                self.displays.insert(0, JupyterProgressDisplay(use_emoji=self.use_emoji))
+        self._refresh_jupyter()
 
         # Auto-detect if not provided
         if not module or not submodule:
@@ -1225,19 +1303,18 @@ class ProgressTracker:
             module = module or detected_module
             submodule = submodule or detected_submodule
 
-        # Create tracking ID
-        tracking_id = f"{module}:{submodule}:{file or ''}"
+        # Create tracking ID (the counter keeps concurrent calls apart)
+        tracking_id = f"{module}:{submodule}:{file or ''}:{next(self._ids)}"
 
         # Determine pipeline_id and pipeline_order if module is part of a pipeline
         pipeline_order = None
         if pipeline_id is None and module:
-            # Try to find pipeline_id from existing contexts
-            for pid, modules in self.pipeline_contexts.items():
-                if module in modules:
-                    pipeline_id = pid
-                    if pid in self.pipeline_module_order:
-                        pipeline_order = self.pipeline_module_order[pid].get(module)
-                    break
+            pipeline_id = self._module_pipelines.get(module)
+            if pipeline_id is not None:
+                pipeline_order = self.pipeline_module_order.get(pipeline_id, {}).get(module)
+
+        if self.metrics is not None:
+            self.metrics.start_span(tracking_id, module, submodule, pipeline_id, {"file": file})
 
         with self.lock:
             item = ProgressItem(
@@ -1246,10 +1323,11 @@ class ProgressTracker:
                 submodule=submodule,
                 status="running",
                 start_time=time.time(),
-                message=message,
+                message=_resolve_message(message),
                 emoji=self._get_emoji_for_module(module or ""),
                 pipeline_id=pipeline_id,
                 pipeline_order=pipeline_order,
+                last_emit=time.monotonic(),
             )
 
             self.active_items[tracking_id] = item
@@ -1266,25 +1344,63 @@ class ProgressTracker:
 
         return tracking_id
 
+    def _start_span_only(
+        self,
+        file: Optional[str],
+        module: Optional[str],
+        submodule: Optional[str],
+        pipeline_id: Optional[str],
+    ) -> str:
+        """Record a span without creating a display item (progress display disabled)."""
+        if not module or not submodule:
+            detected_module, detected_submodule = ModuleDetector.detect_from_call_stack(
+                depth=4
+            )
+            module = module or detected_module
+            submodule = submodule or detected_submodule
+        if pipeline_id is None and module:
+            pipeline_id = self._module_pipelines.get(module)
+        tracking_id = f"{module}:{submodule}:{file or ''}:{next(self._ids)}"
+        self.metrics.start_span(tracking_id, module, submodule, pipeline_id, {"file": file})
+        return tracking_id
+
+    def _due(self, item: ProgressItem) -> bool:
+        """Whether a running item may be pushed to the displays again."""
+        return time.monotonic() - item.last_emit >= self.update_interval
+
     def update_tracking(
-        self, tracking_id: str, status: str = "running", message: str = ""
+        self, tracking_id: str, status: str = "running", message: Message = ""
     ) -> None:
         """
         Update tracking status.
 
+        Running updates arriving within ``update_interval`` of the last
+        displayed update of the item are coalesced: the latest message is
+        kept and shown (and formatted, if lazy) with the next displayed update.
+
         Args:
             tracking_id: Tracking ID from start_tracking
             status: New status (running, completed, failed)
-            message: Progress message
+            message: Progress message (string or zero-argument callable)
         """
-        if not self.enabled or not tracking_id:
+        if not tracking_id or not self.enabled:
             return
 
+        if status == "running":
+            item = self.active_items.get(tracking_id)
+            if item is None:
+                return
+            item.pending_message = message
+            if not self._due(item):
+                return
+
         with self.lock:
             if tracking_id in self.active_items:
                 item = self.active_items[tracking_id]
                 item.status = status
-                item.message = message
+                item.message = _resolve_message(message)
+                item.pending_message = None
+                item.last_emit = time.monotonic()
 
                 # Calculate ETA if progress information is available
                 if item.processed_items is not None and item.total_items is not None:
@@ -1323,55 +1439,62 @@ class ProgressTracker:
         tracking_id: str,
         processed: int,
         total: int,
-        message: str = "",
+        message: Message = "",
     ) -> None:
         """
         Update progress with item counts and calculate ETA.
 
+        Counts are always recorded; the displays are only updated when
+        ``update_interval`` has passed since the item was last displayed or
+        the item reached its total, so calling this for every processed item
+        is cheap.
+
         Args:
             tracking_id: Tracking ID from start_tracking
             processed: Number of items processed so far
             total: Total number of items to process
-            message: Optional progress message
+            message: Optional progress message (string or zero-argument callable)
         """
-        if not self.enabled or not tracking_id:
+        if not tracking_id or not self.enabled:
             return
 
-        # Re-detect Jupyter environment in case it wasn't detected at init
-        if IPYTHON_AVAILABLE and not self.is_jupyter:
-            self.is_jupyter = self._detect_jupyter()
-            # If Jupyter is now detected and we don't have a Jupyter display, add it
-            if self.is_jupyter and not any(isinstance(d, JupyterProgressDisplay) for d in self.displays):
-                # Insert Jupyter display at the beginning for priority
-                self.displays.insert(0, JupyterProgressDisplay(use_emoji=self.use_emoji))
+        item = self.active_items.get(tracking_id)
+        if item is None:
+            return
+        item.processed_items = processed
+        item.total_items = total
+        if message:
+            item.pending_message = message
+        if processed < total and not self._due(item):
+            return
 
         with self.lock:
-            if tracking_id in self.active_items:
-                item = self.active_items[tracking_id]
-                item.processed_items = processed
-                item.total_items = total
-                item.progress_percentage = (
-                    (processed / total * 100) if total > 0 else 0.0
-                )
-                item.estimated_remaining = self._calculate_eta(item)
-                if message:
-                    item.message = message
+            if tracking_id not in self.active_items:
+                return
+            item.progress_percentage = (
+                (processed / total * 100) if total > 0 else 0.0
+            )
+            item.estimated_remaining = self._calculate_eta(item)
+            if item.pending_message:
+                item.message = _resolve_message(item.pending_message)
+            item.pending_message = None
+            item.last_emit = time.monotonic()
 
-                # Update displays - force immediate update for progress
-                for display in self.displays:
-                    # For Jupyter, always update immediately
-                    if isinstance(display, JupyterProgressDisplay):
-                        display.update(item)
-                    # For console, force update by temporarily bypassing interval check
-                    elif isinstance(display, ConsoleProgressDisplay):
-                        # Force update by setting last_update far in the past
-                        original_last_update = display.last_update
-                        display.last_update = 0.0  # This will make _should_update return True
-                        display.update(item)
-                        # Restore original value (update() will set it to current time anyway)
-                        display.last_update = original_last_update
-                    else:
-                        display.update(item)
+            # Update displays - force immediate update for progress
+            for display in self.displays:
+                # For Jupyter, always update immediately
+                if isinstance(display, JupyterProgressDisplay):
+                    display.update(item)
+                # For console, force update by temporarily bypassing interval check
+                elif isinstance(display, ConsoleProgressDisplay):
+                    # Force update by setting last_update far in the past
+                    original_last_update = display.last_update
+                    display.last_update = 0.0  # This will make _should_update return True
+                    display.update(item)
+                    # Restore original value (update() will set it to current time anyway)
+                    display.last_update = original_last_update
+                else:
+                    display.update(item)
 
     def _calculate_eta(self, item: ProgressItem) -> Optional[float]:
         """
@@ -1410,7 +1533,11 @@ class ProgressTracker:
         return max(0.0, eta_seconds)
 
     def stop_tracking(
-        self, tracking_id: str, status: str = "completed", message: str = "", metadata: Optional[Dict[str, Any]] = None
+        self,
+        tracking_id: str,
+        status: str = "completed",
+        message: Message = "",
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Stop tracking an item.
@@ -1418,22 +1545,32 @@ class ProgressTracker:
         Args:
             tracking_id: Tracking ID from start_tracking
             status: Final status (completed, failed)
-            message: Final message
+            message: Final message (string or zero-argument callable)
             metadata: Optional metadata to store (e.g., extraction_counts, core_dependency)
         """
-        with self.lock:
-            # Update metadata if provided
-            if tracking_id in self.active_items:
-                item = self.active_items[tracking_id]
-                if metadata:
+        if not tracking_id:
+            return
+        if self.metrics is not None:
+            self.metrics.end_span(
+                tracking_id,
+                status=status,
+                message=_resolve_message(message) if status == "failed" else "",
+                attributes=metadata,
+            )
+        if not self.enabled:
+            return
+
+        if metadata:
+            with self.lock:
+                # Active and pipeline entries share the same ProgressItem
+                item = self.active_items.get(tracking_id)
+                if item is None:
+                    for items in self.pipeline_items.values():
+                        if tracking_id in items:
+                            item = items[tracking_id]
+                            break
+                if item is not None:
                     item.metadata.update(metadata)
-            # Also check pipeline_items
-            for pipeline_id, items in self.pipeline_items.items():
-                if tracking_id in items:
-                    item = items[tracking_id]
-                    if metadata:
-                        item.metadata.update(metadata)
-                    break
         
         self.update_tracking(tracking_id, status=status, message=message)
 
@@ -1478,6 +1615,10 @@ class ProgressTracker:
         with self.lock:
             # Add any remaining active items
             all_items = self.items + list(self.active_items.values())
+            for item in all_items:
+                if item.pending_message:
+                    item.message = _resolve_message(item.pending_message)
+                    item.pending_message = None
 
             # Show summary on all displays
             for display in self.displays:
@@ -1489,7 +1630,7 @@ class ProgressTracker:
         file: Optional[str] = None,
         module: Optional[str] = None,
         submodule: Optional[str] = None,
-        message: str = "",
+        message: Message = "",
     ):
         """
         Context manager for automatic tracking.
@@ -1518,21 +1659,22 @@ def get_progress_tracker() -> ProgressTracker:
     global _global_tracker
     if _global_tracker is None:
         _global_tracker = ProgressTracker.get_instance()
-    
-    # Always ensure progress tracker is enabled automatically
-    _global_tracker.enabled = True
-    
-    # Re-detect Jupyter environment dynamically (in case it wasn't ready at init)
-    if IPYTHON_AVAILABLE and not _global_tracker.is_jupyter:
-        _global_tracker.is_jupyter = _global_tracker._detect_jupyter()
-        # If Jupyter is now detected and we don't have a Jupyter display, add it
-        if _global_tracker.is_jupyter and not any(isinstance(d, JupyterProgressDisplay) for d in _global_tracker.displays):
-            # Insert Jupyter display at the beginning for priority
-            _global_tracker.displays.insert(0, JupyterProgressDisplay(use_emoji=_global_tracker.use_emoji))
-    
     return _global_tracker
 
 
+def set_progress_enabled(enabled: bool) -> None:
+    """
+    Enable or disable the global progress tracker.
+
+    When disabled, every tracking call returns after a single attribute
+    check, which is the recommended setting for production hot paths.
+
+    Args:
+        enabled: Whether progress tracking is enabled
+    """
+    get_progress_tracker().enabled = enabled
+
+
 def track_progress(
     file: Optional[str] = None,
     module: Optional[str] = None,
@@ -1556,6 +1698,8 @@ def track_progress(
     def decorator(func: Callable) -> Callable:
         def wrapper(*args, **kwargs):
             tracker = get_progress_tracker()
+            if not tracker.enabled and tracker.metrics is None:
+                return func(*args, **kwargs)
 
             # Try to extract file from args/kwargs
             detected_file = file
@@ -9,17 +9,18 @@ metadata filtering, metadata management, and namespace isolation.
 Algorithms Used:
 
 Vector Storage Operations:
-    - Vector Storage: ID generation (sequential or UUID-based), vector normalization (L2 normalization), batch storage (chunking algorithm), metadata association (vector-to-metadata mapping), vector validation (dimension checking, type validation)
+    - Vector Storage: ID generation (sequential or UUID-based), vector normalization (L2 normalization), batch storage (chunking algorithm), metadata association (vector-to-metadata mapping), vector validation (dimension checking, type validation), contiguous float32 matrix with capacity doubling (amortized O(1) append)
     - Vector Indexing: Index construction (FAISS index types: Flat, IVF, HNSW, PQ), index training (k-means clustering for IVF, graph construction for HNSW), index optimization (index rebuilding, parameter tuning), incremental indexing (add vectors to existing index)
     - Vector Retrieval: Direct vector lookup by ID, batch retrieval, vector-to-metadata mapping
     - Vector Update: In-place vector update, index rebuilding after update, metadata update propagation
-    - Vector Deletion: Vector removal, index rebuilding after deletion, metadata cleanup, orphaned metadata detection
+    - Vector Deletion: Tombstoning with periodic compaction, metadata cleanup, orphaned metadata detection
 
 Similarity Search Algorithms:
-    - Cosine Similarity: Normalized dot product (dot(v1, v2) / (||v1|| * ||v2||)), similarity score calculation (0 to 1 range), top-k selection (argsort with descending order, slice top k)
+    - Cosine Similarity: Normalized dot product (dot(v1, v2) / (||v1|| * ||v2||)), similarity score calculation (0 to 1 range), top-k selection (argpartition then sort of the k survivors), cached per-vector norms
     - L2 Distance: Euclidean distance calculation (sqrt(sum((v1 - v2)^2))), distance-to-similarity conversion (1 / (1 + distance)), top-k selection
     - Inner Product: Dot product calculation (dot(v1, v2)), unnormalized similarity, top-k selection
     - Approximate Nearest Neighbor (ANN): FAISS IVF (inverted file index with k-means clustering), FAISS HNSW (hierarchical navigable small world graph), FAISS PQ (product quantization for compression), approximate search with configurable accuracy/speed tradeoff
+    - Built-in IVF (no FAISS): Spherical k-means coarse quantizer over the in-process matrix, CSR posting lists of row numbers, incremental row assignment, nprobe-controlled recall/latency
     - k-NN Search: Exact k-nearest neighbors (brute force with full distance calculation), approximate k-NN (using ANN indices), batch k-NN search
 
 Index Construction:
@@ -59,7 +60,7 @@ Supported Backends:
     - Weaviate: Cloud/Self-hosted (Schema-aware vector database)
     - Qdrant: Cloud/Self-hosted (Vector database for the next generation of AI)
     - Milvus: Cloud/Self-hosted (Highly scalable vector database)
-    - InMemory: Simple list-based storage for testing/small datasets
+    - InMemory: Contiguous float32 matrix storage for testing/small datasets
 
 Configuration:
     - Environment variables (SEMANTICA_VECTOR_STORE_*)
@@ -88,6 +89,8 @@ Main Classes:
     - VectorIndexer: Vector indexing engine
     - VectorRetriever: Vector retrieval and similarity search
     - VectorManager: Vector store management and operations
+    - VectorMatrix: Contiguous float32 vector storage with id/row maps
+    - IVFIndex: Pure-NumPy inverted file ANN index for in-process stores
     - FAISSStore: FAISS integration for local vector storage
     - WeaviateStore: Weaviate vector database integration
     - QdrantStore: Qdrant vector database integration
@@ -130,7 +133,8 @@ License: MIT
 from .config import VectorStoreConfig, vector_store_config
 from .faiss_store import FAISSStore, FAISSIndex, FAISSIndexBuilder, FAISSSearch
 from .hybrid_search import HybridSearch, MetadataFilter, SearchRanker
-from .metadata_store import MetadataIndex, MetadataSchema, MetadataStore
+from .ivf_index import IVFIndex, recall_at_k
+from .metadata_store import MetadataIndex, MetadataSchema, MetadataStore, MetadataView
 from .methods import (
     create_index,
     delete_vectors,
@@ -147,6 +151,7 @@ from .milvus_store import MilvusStore, MilvusClient, MilvusCollection, MilvusSea
 from .namespace_manager import Namespace, NamespaceManager
 from .qdrant_store import QdrantStore, QdrantClient, QdrantCollection, QdrantSearch
 from .registry import MethodRegistry, method_registry
+from .vector_matrix import VectorMatrix
 from .vector_store import VectorIndexer, VectorManager, VectorRetriever, VectorStore
 from .weaviate_store import (
     WeaviateStore,
@@ -161,6 +166,9 @@ __all__ = [
     "VectorIndexer",
     "VectorRetriever",
     "VectorManager",
+    "VectorMatrix",
+    "IVFIndex",
+    "recall_at_k",
     # FAISS
     "FAISSStore",
     "FAISSIndex",
@@ -189,6 +197,7 @@ __all__ = [
     "MetadataStore",
     "MetadataIndex",
     "MetadataSchema",
+    "MetadataView",
     # Namespace manager
     "NamespaceManager",
     "Namespace",
@@ -9,9 +9,11 @@ Key Features:
     - Combined vector similarity and metadata filtering
     - Multiple ranking strategies (RRF, Weighted Average)
     - Metadata filter builder with various operators
+    - Index-backed filtering (inverted postings, sorted numeric columns) that
+      restricts similarity scoring to the selected rows
     - Multi-source search and result fusion
     - Configurable ranking parameters
-    - Performance optimization
+    - Cached-norm cosine scoring with partial-sort (argpartition) top-k
 
 Main Classes:
     - HybridSearch: Main hybrid search coordinator
@@ -42,6 +44,8 @@ import numpy as np
 from ..utils.exceptions import ProcessingError, ValidationError
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
+from .metadata_store import MetadataIndex
+from .vector_matrix import VectorMatrix, compute_similarity, select_top_k
 
 
 class MetadataFilter:
@@ -265,9 +269,6 @@ class HybridSearch:
         self.config = config
         self.vector_store = vector_store
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
         self.ranker = SearchRanker(
             config.get("ranking_strategy", "reciprocal_rank_fusion")
         )
@@ -311,8 +312,20 @@ class HybridSearch:
         try:
             # Resolve vector store data if not provided
             if vectors is None and self.vector_store:
-                vector_ids = list(self.vector_store.vectors.keys())
-                vectors = [self.vector_store.vectors[vid] for vid in vector_ids]
+                store_vectors = self.vector_store.vectors
+                if isinstance(store_vectors, VectorMatrix):
+                    return self._search_matrix(
+                        tracking_id,
+                        query,
+                        store_vectors,
+                        self.vector_store.metadata,
+                        k,
+                        metadata_filter,
+                        metadata_index=getattr(self.vector_store, "metadata_index", None),
+                        **options,
+                    )
+                vector_ids = list(store_vectors.keys())
+                vectors = [store_vectors[vid] for vid in vector_ids]
                 metadata = [self.vector_store.metadata.get(vid, {}) for vid in vector_ids]
 
             if vectors is None or metadata is None:
@@ -325,24 +338,7 @@ class HybridSearch:
                  if vector_ids is None:
                      vector_ids = []
 
-            # Handle string query
-            if isinstance(query, str):
-                self.progress_tracker.update_tracking(
-                    tracking_id, message="Generating query embedding..."
-                )
-                if not self.embedding_generator:
-                    try:
-                        from ..embeddings import EmbeddingGenerator
-                        self.embedding_generator = EmbeddingGenerator()
-                    except (ImportError, OSError):
-                        raise ImportError("EmbeddingGenerator not available for string queries")
-                
-                query_vector = self.embedding_generator.generate_embeddings(query, data_type="text")
-                # Handle if it returns batch (2D) or single (1D)
-                if len(query_vector.shape) == 2:
-                     query_vector = query_vector[0]
-            else:
-                query_vector = query
+            query_vector = self._resolve_query_vector(query, tracking_id)
 
             # Check if vectors/metadata are empty
             # Handle both list and numpy array cases safely
@@ -397,10 +393,12 @@ class HybridSearch:
             self.progress_tracker.update_tracking(
                 tracking_id, message="Adding metadata to results..."
             )
+            id_to_position = {
+                result_id: idx for idx, result_id in enumerate(filtered_ids)
+            }
             for result in vector_results:
-                result_id = result.get("id")
-                if result_id in filtered_ids:
-                    idx = filtered_ids.index(result_id)
+                idx = id_to_position.get(result.get("id"))
+                if idx is not None:
                     result["metadata"] = filtered_metadata[idx]
 
             # Rank and return top k
@@ -416,6 +414,131 @@ class HybridSearch:
             )
             raise
 
+    def _resolve_query_vector(
+        self, query: Union[str, np.ndarray], tracking_id: str
+    ) -> np.ndarray:
+        """Embed string queries; pass vectors through unchanged."""
+        if not isinstance(query, str):
+            return query
+
+        self.progress_tracker.update_tracking(
+            tracking_id, message="Generating query embedding..."
+        )
+        if not self.embedding_generator:
+            try:
+                from ..embeddings import EmbeddingGenerator
+                self.embedding_generator = EmbeddingGenerator()
+            except (ImportError, OSError):
+                raise ImportError("EmbeddingGenerator not available for string queries")
+
+        query_vector = self.embedding_generator.generate_embeddings(query, data_type="text")
+        # Handle if it returns batch (2D) or single (1D)
+        if len(query_vector.shape) == 2:
+            query_vector = query_vector[0]
+        return query_vector
+
+    def _search_matrix(
+        self,
+        tracking_id: str,
+        query: Union[str, np.ndarray],
+        matrix: VectorMatrix,
+        metadata: Dict[str, Dict[str, Any]],
+        k: int,
+        metadata_filter: Optional[MetadataFilter],
+        metadata_index: Optional[MetadataIndex] = None,
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """Hybrid search reading the vector store's matrix in place."""
+        if len(matrix) == 0:
+            self.progress_tracker.stop_tracking(
+                tracking_id,
+                status="completed",
+                message="No vectors or metadata to search",
+            )
+            return []
+
+        query_vector = self._resolve_query_vector(query, tracking_id)
+        row_ids = matrix.row_ids
+
+        if metadata_filter:
+            self.progress_tracker.update_tracking(
+                tracking_id, message="Filtering by metadata..."
+            )
+            rows = self._filter_rows(matrix, metadata, metadata_filter, metadata_index)
+        else:
+            rows = None
+
+        if rows is not None and len(rows) == 0:
+            self.progress_tracker.stop_tracking(
+                tracking_id,
+                status="completed",
+                message="No vectors after filtering",
+            )
+            return []
+
+        self.progress_tracker.update_tracking(
+            tracking_id, message="Performing vector similarity search..."
+        )
+        top_rows, top_scores = matrix.search(
+            np.asarray(query_vector), k=k, metric="cosine", rows=rows
+        )
+
+        results = []
+        for row, score in zip(top_rows.tolist(), top_scores.tolist()):
+            vector_id = row_ids[row]
+            results.append(
+                {
+                    "id": vector_id,
+                    "score": score,
+                    "distance": 1.0 - score,
+                    "metadata": dict(metadata.get(vector_id, {})),
+                }
+            )
+
+        self.progress_tracker.stop_tracking(
+            tracking_id,
+            status="completed",
+            message=f"Hybrid search completed: {len(results)} results",
+        )
+        return results
+
+    def _filter_rows(
+        self,
+        matrix: VectorMatrix,
+        metadata: Dict[str, Dict[str, Any]],
+        metadata_filter: MetadataFilter,
+        metadata_index: Optional[MetadataIndex] = None,
+    ) -> np.ndarray:
+        """
+        Compile a metadata filter into the sorted matrix rows it selects.
+
+        Indexable conditions are answered by the metadata index (inverted
+        postings and sorted numeric columns); only the resulting candidates
+        are checked with ``MetadataFilter.matches``. Without an index, or when
+        no condition is indexable, every live row is checked.
+        """
+        candidates = None
+        if metadata_index is not None:
+            candidates = metadata_index.candidates(metadata_filter.conditions)
+
+        if candidates is None:
+            selected = (
+                row
+                for row, vector_id in enumerate(matrix.row_ids)
+                if vector_id is not None
+                and metadata_filter.matches(metadata.get(vector_id, {}))
+            )
+            return np.fromiter(selected, dtype=np.int64)
+
+        matched = [
+            vector_id
+            for vector_id in candidates
+            if vector_id in metadata and metadata_filter.matches(metadata[vector_id])
+        ]
+        rows = matrix.rows_of(matched)
+        rows.sort()
+        return rows
+
     def _vector_search(
         self,
         query_vector: np.ndarray,
@@ -429,7 +552,9 @@ class HybridSearch:
             return []
 
         # Convert to numpy
-        if isinstance(vectors[0], list):
+        if isinstance(vectors, np.ndarray) and vectors.ndim == 2:
+            pass
+        elif isinstance(vectors[0], list):
             vectors = np.array(vectors)
         else:
             vectors = np.vstack(vectors)
@@ -438,15 +563,10 @@ class HybridSearch:
             query_vector = np.array(query_vector)
 
         # Calculate cosine similarity
-        query_norm = np.linalg.norm(query_vector)
-        vector_norms = np.linalg.norm(vectors, axis=1)
-
-        similarities = np.dot(vectors, query_vector) / (
-            vector_norms * query_norm + 1e-8
-        )
+        similarities = compute_similarity(query_vector, vectors, metric="cosine")
 
-        # Get top k
-        top_indices = np.argsort(similarities)[::-1][:k]
+        # Get top k (partial sort)
+        top_indices = select_top_k(similarities, k)
 
         results = []
         for idx in top_indices:
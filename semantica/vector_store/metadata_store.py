@@ -7,6 +7,8 @@ and efficient filtering for hybrid search operations.
 
 Key Features:
     - Fast metadata indexing and lookup
+    - Sorted numeric columns for range (gt/gte/lt/lte) lookups
+    - Filter condition narrowing for hybrid search
     - Schema validation and enforcement
     - Field-based querying with AND/OR operators
     - Metadata import/export (JSON, dict)
@@ -18,6 +20,7 @@ Main Classes:
     - MetadataStore: Main metadata store coordinator
     - MetadataIndex: Fast metadata indexing and querying
     - MetadataSchema: Schema validation and management
+    - MetadataView: Read-only view of a vector store's metadata
 
 Example Usage:
     >>> from semantica.vector_store import MetadataStore
@@ -30,6 +33,7 @@ Example Usage:
     >>> index = MetadataIndex()
     >>> index.index_metadata("vec1", {"category": "science"})
     >>> matching_ids = index.query({"category": "science"})
+    >>> recent_ids = index.range_query("year", "gt", 2020)
 
 Author: Semantica Contributors
 License: MIT
@@ -37,7 +41,11 @@ License: MIT
 
 import json
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Union
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
 
 from ..utils.exceptions import ProcessingError, ValidationError
 from ..utils.logging import get_logger
@@ -47,20 +55,37 @@ from ..utils.progress_tracker import get_progress_tracker
 class MetadataIndex:
     """Metadata index for fast lookups."""
 
+    # Operators that can be answered from the inverted index or numeric columns
+    RANGE_OPERATORS = {"gt", "gte", "lt", "lte"}
+
     def __init__(self):
         """Initialize metadata index."""
         self.field_indexes: Dict[str, Dict[Any, Set[str]]] = defaultdict(
             lambda: defaultdict(set)
         )
         self.vector_metadata: Dict[str, Dict[str, Any]] = {}
+        # Numeric field values per vector, plus lazily sorted column caches
+        self.numeric_columns: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._sorted_columns: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+
+    @staticmethod
+    def _is_numeric(value: Any) -> bool:
+        """Check whether a value belongs in a sorted numeric column."""
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
 
     def index_metadata(self, vector_id: str, metadata: Dict[str, Any]):
         """Index metadata for a vector."""
+        if vector_id in self.vector_metadata:
+            self.remove_metadata(vector_id)
+
         self.vector_metadata[vector_id] = metadata
 
         for field, value in metadata.items():
             if isinstance(value, (str, int, float, bool)):
                 self.field_indexes[field][value].add(vector_id)
+                if self._is_numeric(value):
+                    self.numeric_columns[field][vector_id] = float(value)
+                    self._sorted_columns.pop(field, None)
             elif isinstance(value, list):
                 for item in value:
                     if isinstance(item, (str, int, float, bool)):
@@ -77,6 +102,8 @@ class MetadataIndex:
             if isinstance(value, (str, int, float, bool)):
                 if vector_id in self.field_indexes[field].get(value, set()):
                     self.field_indexes[field][value].remove(vector_id)
+                if self.numeric_columns[field].pop(vector_id, None) is not None:
+                    self._sorted_columns.pop(field, None)
             elif isinstance(value, list):
                 for item in value:
                     if isinstance(item, (str, int, float, bool)):
@@ -85,6 +112,13 @@ class MetadataIndex:
 
         del self.vector_metadata[vector_id]
 
+    def clear(self):
+        """Remove all indexed metadata."""
+        self.field_indexes.clear()
+        self.vector_metadata.clear()
+        self.numeric_columns.clear()
+        self._sorted_columns.clear()
+
     def query(self, conditions: Dict[str, Any], operator: str = "AND") -> Set[str]:
         """
         Query vectors by metadata conditions.
@@ -117,6 +151,126 @@ class MetadataIndex:
 
         return result
 
+    def _sorted_column(self, field: str) -> Tuple[np.ndarray, List[str]]:
+        """Get (sorted values, ids in the same order) for a numeric field."""
+        column = self._sorted_columns.get(field)
+        if column is None:
+            items = sorted(self.numeric_columns.get(field, {}).items(), key=lambda x: x[1])
+            column = (
+                np.fromiter((value for _, value in items), dtype=np.float64, count=len(items)),
+                [vector_id for vector_id, _ in items],
+            )
+            self._sorted_columns[field] = column
+        return column
+
+    def range_query(self, field: str, operator: str, value: Any) -> Set[str]:
+        """
+        Query a numeric field with a range operator using binary search.
+
+        Args:
+            field: Field name
+            operator: "gt", "gte", "lt" or "lte"
+            value: Bound value
+
+        Returns:
+            Set of vector IDs whose numeric field value satisfies the bound
+        """
+        values, ids = self._sorted_column(field)
+        if operator in ("gt", "lte"):
+            cut = int(np.searchsorted(values, value, side="right"))
+        else:
+            cut = int(np.searchsorted(values, value, side="left"))
+        return set(ids[cut:]) if operator in ("gt", "gte") else set(ids[:cut])
+
+    def candidates(self, conditions: List[Dict[str, Any]]) -> Optional[Set[str]]:
+        """
+        Narrow filter conditions (AND semantics) to candidate vector IDs.
+
+        Conditions are answered from the inverted index (eq, in, list
+        contains) or the sorted numeric columns (gt, gte, lt, lte). The result
+        is a superset of the exact matches; callers verify candidates with
+        the filter itself, so the cost is proportional to the selected set.
+
+        Args:
+            conditions: Condition dictionaries with "field", "operator", "value"
+
+        Returns:
+            Candidate ID set, or None if no condition could use the index
+        """
+        narrowed: List[Set[str]] = []
+
+        for condition in conditions:
+            field = condition["field"]
+            operator = condition["operator"]
+            value = condition["value"]
+            postings = self.field_indexes.get(field, {})
+
+            if operator == "eq":
+                if not isinstance(value, (str, int, float, bool)):
+                    continue
+                narrowed.append(postings.get(value, set()))
+            elif operator == "in":
+                if isinstance(value, str):
+                    continue
+                try:
+                    narrowed.append(
+                        set().union(*(postings.get(item, set()) for item in value))
+                    )
+                except TypeError:
+                    # Unhashable members cannot be looked up
+                    continue
+            elif operator == "contains":
+                # Only list membership is indexed; substring matches need a scan
+                if isinstance(value, str) or not isinstance(value, (int, float, bool)):
+                    continue
+                narrowed.append(postings.get(value, set()))
+            elif operator in self.RANGE_OPERATORS and self._is_numeric(value):
+                narrowed.append(self.range_query(field, operator, value))
+
+            if narrowed and not narrowed[-1]:
+                return set()
+
+        if not narrowed:
+            return None
+
+        narrowed.sort(key=len)
+        result = set(narrowed[0])
+        for ids in narrowed[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+
+class MetadataView(Mapping):
+    """
+    Read-only view of vector ID to metadata.
+
+    Metadata values are returned as read-only mappings, so the metadata
+    index built from them cannot go stale; write through the owning store
+    (e.g. ``VectorStore.update_metadata``) instead.
+    """
+
+    __slots__ = ("_metadata",)
+
+    def __init__(self, metadata: Dict[str, Dict[str, Any]]):
+        self._metadata = metadata
+
+    def __getitem__(self, vector_id: str) -> Mapping:
+        return MappingProxyType(self._metadata[vector_id])
+
+    def __iter__(self):
+        return iter(self._metadata)
+
+    def __len__(self) -> int:
+        return len(self._metadata)
+
+    def __contains__(self, vector_id: object) -> bool:
+        return vector_id in self._metadata
+
+    def __repr__(self) -> str:
+        return f"MetadataView({self._metadata!r})"
+
 
 class MetadataSchema:
     """Metadata schema validator."""
@@ -183,9 +337,6 @@ class MetadataStore:
         self.logger = get_logger("metadata_store")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
         self.schema = MetadataSchema(schema)
         self.index = MetadataIndex()
         self.metadata: Dict[str, Dict[str, Any]] = {}
@@ -52,7 +52,7 @@ Vector Search:
     - Cosine Similarity: Normalized dot product calculation
     - L2 Distance: Euclidean distance calculation
     - Inner Product: Dot product calculation
-    - Top-k Selection: Argsort with descending order
+    - Top-k Selection: Argpartition followed by a sort of the top k
 
 Index Creation:
     - FAISS Index Types: Flat, IVF, HNSW, PQ index construction
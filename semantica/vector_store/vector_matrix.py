@@ -0,0 +1,594 @@
+"""
+Vector Matrix Module
+
+This module provides the contiguous, growable float32 matrix that backs the
+in-process vector store. Vectors live in a single row-major buffer so that
+similarity search can run one matrix product over the store without stacking
+per-vector arrays on every query.
+
+Key Features:
+    - Append-only contiguous float32 storage with amortized O(1) inserts
+    - Bidirectional id <-> row maps
+    - In-place vector updates
+    - Tombstone-based deletion with periodic compaction
+    - Cached inverse L2 norms, so cosine scoring never re-normalizes the store
+    - Single and batched scoring (cosine, inner product, L2) with one matrix product
+    - Partial-sort (argpartition) top-k selection
+    - Dict-like access (``matrix[vector_id]``) for backwards compatibility
+    - Raw ``.npy`` persistence that can be reopened as a memory map
+
+Main Classes:
+    - VectorMatrix: Growable contiguous vector matrix with id/row bookkeeping
+
+Main Functions:
+    - compute_similarity: Score query vectors against a matrix block
+    - select_top_k: Top-k indices via argpartition plus a small sort
+
+Example Usage:
+    >>> from semantica.vector_store import VectorMatrix
+    >>> matrix = VectorMatrix(dimension=768)
+    >>> matrix.add_batch(["vec_0", "vec_1"], [v0, v1])
+    >>> rows, scores = matrix.search(query, k=10, metric="cosine")
+    >>> batch_rows, batch_scores = matrix.search(queries, k=10)  # queries: (Q, D)
+    >>> matrix.remove("vec_0")
+
+Author: Semantica Contributors
+License: MIT
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.exceptions import ValidationError
+
+SUPPORTED_METRICS = ("cosine", "inner_product", "l2")
+
+_EPSILON = 1e-10
+
+
+def select_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Select indices of the ``k`` highest scores, sorted descending.
+
+    Uses ``np.argpartition`` (O(n)) and only sorts the ``k`` survivors, instead
+    of sorting the full score array.
+
+    Args:
+        scores: 1-D array of shape (N,) or 2-D array of shape (Q, N)
+        k: Number of indices to select
+
+    Returns:
+        Index array of shape (k,) or (Q, k)
+    """
+    n = scores.shape[-1]
+    k = min(int(k), n)
+    if k <= 0:
+        return np.zeros(scores.shape[:-1] + (0,), dtype=np.int64)
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n), scores.shape).copy()
+    candidate_scores = np.take_along_axis(scores, candidates, axis=-1)
+    order = np.argsort(-candidate_scores, axis=-1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+def compute_similarity(
+    queries: np.ndarray,
+    vectors: np.ndarray,
+    metric: str = "cosine",
+    inv_norms: Optional[np.ndarray] = None,
+    sq_norms: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Score queries against vectors with a single matrix product.
+
+    Higher scores are always better: cosine similarity, raw inner product, or
+    negated squared L2 distance.
+
+    Args:
+        queries: Query array of shape (D,) or (Q, D)
+        vectors: Vector block of shape (N, D)
+        metric: "cosine", "inner_product" or "l2"
+        inv_norms: Cached ``1 / ||v||`` per row (computed if omitted)
+        sq_norms: Cached ``||v||^2`` per row for L2 (computed if omitted)
+
+    Returns:
+        Scores of shape (N,) or (Q, N)
+    """
+    if metric not in SUPPORTED_METRICS:
+        raise ValidationError(
+            f"Unsupported metric: {metric}. "
+            f"Supported metrics are: {', '.join(SUPPORTED_METRICS)}"
+        )
+    queries = np.asarray(queries, dtype=vectors.dtype)
+    products = queries @ vectors.T
+
+    if metric == "inner_product":
+        return products
+
+    query_sq = np.einsum("...d,...d->...", queries, queries)
+    if metric == "cosine":
+        if inv_norms is None:
+            inv_norms = 1.0 / (np.linalg.norm(vectors, axis=1) + _EPSILON)
+        query_inv = 1.0 / (np.sqrt(query_sq) + _EPSILON)
+        return products * inv_norms * np.expand_dims(query_inv, -1)
+
+    if sq_norms is None:
+        sq_norms = np.einsum("nd,nd->n", vectors, vectors)
+    return 2.0 * products - sq_norms - np.expand_dims(query_sq, -1)
+
+
+class VectorMatrix(MutableMapping):
+    """
+    Contiguous float32 vector matrix with id <-> row maps.
+
+    Rows are appended to a pre-allocated buffer that doubles in capacity when
+    full. Deleted rows are tombstoned (excluded through ``valid_mask``) and
+    reclaimed by ``compact`` once they exceed ``compaction_threshold`` of the
+    used rows. Every compaction bumps ``layout_version`` so that structures
+    keyed by row number can detect that rows have moved.
+    """
+
+    def __init__(
+        self,
+        dimension: Optional[int] = None,
+        initial_capacity: int = 1024,
+        compaction_threshold: float = 0.25,
+        dtype: Any = np.float32,
+    ):
+        """
+        Initialize vector matrix.
+
+        Args:
+            dimension: Vector dimension (inferred from the first insert if None)
+            initial_capacity: Number of rows allocated up front
+            compaction_threshold: Fraction of tombstoned rows that triggers compaction
+            dtype: Storage dtype
+        """
+        self.dimension = dimension
+        self.dtype = np.dtype(dtype)
+        self.compaction_threshold = compaction_threshold
+        self._initial_capacity = max(1, int(initial_capacity))
+
+        self._data: Optional[np.ndarray] = None
+        self._valid = np.zeros(0, dtype=bool)
+        self._norms = np.zeros(0, dtype=self.dtype)
+        self._inv_norms = np.zeros(0, dtype=self.dtype)
+        self._size = 0
+        self._tombstones = 0
+        self._id_to_row: Dict[str, int] = {}
+        self._row_ids: List[Optional[str]] = []
+
+        # Incremented whenever row numbers change (compaction / clear)
+        self.layout_version = 0
+        # Incremented on every mutation
+        self.version = 0
+
+        if dimension is not None:
+            self._allocate(self._initial_capacity)
+
+    # ------------------------------------------------------------------
+    # Buffer management
+    # ------------------------------------------------------------------
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate (or grow) the backing buffer to ``capacity`` rows."""
+        data = np.zeros((capacity, self.dimension), dtype=self.dtype)
+        valid = np.zeros(capacity, dtype=bool)
+        norms = np.zeros(capacity, dtype=self.dtype)
+        inv_norms = np.zeros(capacity, dtype=self.dtype)
+        if self._data is not None and self._size:
+            data[: self._size] = self._data[: self._size]
+            valid[: self._size] = self._valid[: self._size]
+            norms[: self._size] = self._norms[: self._size]
+            inv_norms[: self._size] = self._inv_norms[: self._size]
+        self._data = data
+        self._valid = valid
+        self._norms = norms
+        self._inv_norms = inv_norms
+
+    def _refresh_norms(self, start: int, end: int) -> None:
+        """Recompute cached norms for rows ``start:end``."""
+        norms = np.linalg.norm(self._data[start:end], axis=1)
+        self._norms[start:end] = norms
+        self._inv_norms[start:end] = 1.0 / (norms + _EPSILON)
+
+    def _ensure_capacity(self, extra: int) -> None:
+        """Make room for ``extra`` more rows, doubling capacity as needed."""
+        required = self._size + extra
+        capacity = 0 if self._data is None else self._data.shape[0]
+        if required <= capacity:
+            return
+        new_capacity = max(capacity, self._initial_capacity)
+        while new_capacity < required:
+            new_capacity *= 2
+        self._allocate(new_capacity)
+
+    def _coerce(self, vector: Any) -> np.ndarray:
+        """Convert a vector to a 1-D array and validate its dimension."""
+        array = np.asarray(vector, dtype=self.dtype).reshape(-1)
+        if self.dimension is None:
+            self.dimension = int(array.shape[0])
+            self._allocate(self._initial_capacity)
+        elif array.shape[0] != self.dimension:
+            raise ValidationError(
+                f"Vector dimension {array.shape[0]} does not match store "
+                f"dimension {self.dimension}"
+            )
+        return array
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add(self, vector_id: str, vector: Any) -> int:
+        """
+        Add or overwrite a single vector.
+
+        Args:
+            vector_id: Vector ID
+            vector: Vector values
+
+        Returns:
+            Row number of the vector
+        """
+        array = self._coerce(vector)
+        row = self._id_to_row.get(vector_id)
+        if row is not None:
+            self._data[row] = array
+            self._refresh_norms(row, row + 1)
+            self.version += 1
+            return row
+
+        self._ensure_capacity(1)
+        row = self._size
+        self._data[row] = array
+        self._refresh_norms(row, row + 1)
+        self._valid[row] = True
+        self._id_to_row[vector_id] = row
+        self._row_ids.append(vector_id)
+        self._size += 1
+        self.version += 1
+        return row
+
+    def add_batch(self, vector_ids: Sequence[str], vectors: Any) -> List[int]:
+        """
+        Add or overwrite a batch of vectors.
+
+        New vectors are copied into the buffer with a single slice assignment.
+
+        Args:
+            vector_ids: Vector IDs
+            vectors: Sequence of vectors or a 2-D array
+
+        Returns:
+            Row numbers of the vectors, in input order
+        """
+        if len(vector_ids) == 0:
+            return []
+
+        if isinstance(vectors, np.ndarray) and vectors.ndim == 2:
+            block = vectors.astype(self.dtype, copy=False)
+        else:
+            block = np.vstack([np.asarray(v, dtype=self.dtype).reshape(-1) for v in vectors])
+
+        if block.shape[0] != len(vector_ids):
+            raise ValidationError("Number of vector IDs must match number of vectors")
+        if self.dimension is None:
+            self._coerce(block[0])
+        if block.shape[1] != self.dimension:
+            raise ValidationError(
+                f"Vector dimension {block.shape[1]} does not match store "
+                f"dimension {self.dimension}"
+            )
+
+        rows: List[int] = [-1] * len(vector_ids)
+        new_positions: List[int] = []
+        seen: Dict[str, int] = {}
+        for pos, vector_id in enumerate(vector_ids):
+            row = self._id_to_row.get(vector_id)
+            if row is not None:
+                self._data[row] = block[pos]
+                self._refresh_norms(row, row + 1)
+                rows[pos] = row
+            elif vector_id in seen:
+                # Duplicate id within the batch: last write wins
+                new_positions[seen[vector_id]] = pos
+            else:
+                seen[vector_id] = len(new_positions)
+                new_positions.append(pos)
+
+        if new_positions:
+            self._ensure_capacity(len(new_positions))
+            start = self._size
+            end = start + len(new_positions)
+            self._data[start:end] = block[new_positions]
+            self._refresh_norms(start, end)
+            self._valid[start:end] = True
+            for offset, pos in enumerate(new_positions):
+                vector_id = vector_ids[pos]
+                self._id_to_row[vector_id] = start + offset
+                self._row_ids.append(vector_id)
+            self._size = end
+            for pos, vector_id in enumerate(vector_ids):
+                if rows[pos] < 0:
+                    rows[pos] = self._id_to_row[vector_id]
+
+        self.version += 1
+        return rows
+
+    def remove(self, vector_id: str) -> bool:
+        """
+        Tombstone a vector.
+
+        Args:
+            vector_id: Vector ID
+
+        Returns:
+            True if the vector existed
+        """
+        row = self._id_to_row.pop(vector_id, None)
+        if row is None:
+            return False
+        self._valid[row] = False
+        self._row_ids[row] = None
+        self._tombstones += 1
+        self.version += 1
+        if self._tombstones > self.compaction_threshold * self._size:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and renumber the remaining rows."""
+        if not self._tombstones:
+            return
+        keep = np.flatnonzero(self._valid[: self._size])
+        count = int(keep.shape[0])
+        self._data[:count] = self._data[keep]
+        self._norms[:count] = self._norms[keep]
+        self._inv_norms[:count] = self._inv_norms[keep]
+        self._valid[:count] = True
+        self._valid[count : self._size] = False
+        self._row_ids = [self._row_ids[row] for row in keep]
+        self._id_to_row = {vector_id: row for row, vector_id in enumerate(self._row_ids)}
+        self._size = count
+        self._tombstones = 0
+        self.layout_version += 1
+        self.version += 1
+
+    def clear(self) -> None:
+        """Remove all vectors, keeping the allocated buffer."""
+        if self._data is not None:
+            self._valid[:] = False
+        self._size = 0
+        self._tombstones = 0
+        self._id_to_row = {}
+        self._row_ids = []
+        self.layout_version += 1
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # Read access
+    # ------------------------------------------------------------------
+
+    @property
+    def data(self) -> np.ndarray:
+        """View of the used rows (including tombstones); no copy is made."""
+        if self._data is None:
+            return np.zeros((0, self.dimension or 0), dtype=self.dtype)
+        return self._data[: self._size]
+
+    @property
+    def valid_mask(self) -> np.ndarray:
+        """Boolean view marking live rows of ``data``."""
+        return self._valid[: self._size]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """Cached L2 norm of each row of ``data``."""
+        return self._norms[: self._size]
+
+    @property
+    def inv_norms(self) -> np.ndarray:
+        """Cached inverse L2 norm of each row of ``data`` (used for cosine)."""
+        return self._inv_norms[: self._size]
+
+    @property
+    def row_ids(self) -> List[Optional[str]]:
+        """Row -> vector ID list (None for tombstoned rows)."""
+        return self._row_ids
+
+    @property
+    def tombstone_count(self) -> int:
+        """Number of tombstoned rows awaiting compaction."""
+        return self._tombstones
+
+    def row_of(self, vector_id: str) -> Optional[int]:
+        """Get the row number of a vector ID."""
+        return self._id_to_row.get(vector_id)
+
+    def rows_of(self, vector_ids: Sequence[str]) -> np.ndarray:
+        """Get row numbers for vector IDs, skipping unknown IDs."""
+        lookup = self._id_to_row
+        return np.fromiter(
+            (lookup[v] for v in vector_ids if v in lookup), dtype=np.int64
+        )
+
+    def live_rows(self) -> np.ndarray:
+        """Row numbers of all live vectors."""
+        return np.flatnonzero(self.valid_mask)
+
+    def similarity(
+        self,
+        queries: np.ndarray,
+        metric: str = "cosine",
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Score queries against the matrix (or a subset of rows).
+
+        Cosine scoring reuses the cached row norms, so the stored vectors are
+        never re-normalized per query.
+
+        Args:
+            queries: Query array of shape (D,) or (Q, D)
+            metric: "cosine", "inner_product" or "l2"
+            rows: Optional row numbers restricting the scored rows
+
+        Returns:
+            Scores of shape (N,) or (Q, N), aligned with ``data`` or ``rows``
+        """
+        vectors = self.data
+        norms = self.norms
+        inv_norms = self.inv_norms
+        if rows is not None:
+            vectors = vectors[rows]
+            norms = norms[rows]
+            inv_norms = inv_norms[rows]
+        return compute_similarity(
+            queries,
+            vectors,
+            metric=metric,
+            inv_norms=inv_norms,
+            sq_norms=norms * norms if metric == "l2" else None,
+        )
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        metric: str = "cosine",
+        rows: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the top-k rows for one query or a batch of queries.
+
+        Args:
+            queries: Query array of shape (D,) or (Q, D)
+            k: Number of results per query
+            metric: "cosine", "inner_product" or "l2"
+            rows: Optional row numbers restricting the search
+
+        Returns:
+            Tuple of (row numbers, scores), each of shape (k,) or (Q, k).
+            Tombstoned rows are excluded, so fewer than ``k`` may be returned.
+        """
+        scores = self.similarity(queries, metric=metric, rows=rows)
+        if rows is None:
+            if self._tombstones:
+                scores = np.where(self.valid_mask, scores, -np.inf)
+            available = len(self)
+        else:
+            available = len(rows)
+
+        top = select_top_k(scores, min(k, available))
+        top_scores = np.take_along_axis(scores, top, axis=-1)
+        top_rows = top if rows is None else np.asarray(rows)[top]
+        return top_rows, top_scores
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save_arrays(self, vectors_file: Any, norms_file: Any) -> List[str]:
+        """
+        Write the live rows and their norms as raw ``.npy`` arrays.
+
+        Tombstoned rows are dropped, so the written row order is the order
+        of the returned IDs.
+
+        Args:
+            vectors_file: Destination path or binary file for the (N, D) matrix
+            norms_file: Destination path or binary file for the (N,) norms
+
+        Returns:
+            Vector IDs in row order
+        """
+        if self._tombstones:
+            keep = self.live_rows()
+            data, norms = self.data[keep], self.norms[keep]
+            ids = [self._row_ids[row] for row in keep]
+        else:
+            data, norms, ids = self.data, self.norms, list(self._row_ids)
+        np.save(vectors_file, np.ascontiguousarray(data, dtype=self.dtype))
+        np.save(norms_file, np.ascontiguousarray(norms, dtype=self.dtype))
+        return ids
+
+    @classmethod
+    def from_arrays(
+        cls,
+        data: np.ndarray,
+        vector_ids: Sequence[str],
+        norms: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> "VectorMatrix":
+        """
+        Wrap existing arrays (e.g. ``np.memmap``) without copying the vectors.
+
+        The arrays are adopted as the backing buffer at exactly their current
+        size, so the first append reallocates into process memory; reads,
+        updates and deletes work in place (copy-on-write for memmaps opened
+        with ``mmap_mode="c"``).
+
+        Args:
+            data: (N, D) vector array
+            vector_ids: Row-aligned vector IDs
+            norms: Optional cached row norms (computed if omitted)
+            **kwargs: VectorMatrix constructor options
+
+        Returns:
+            VectorMatrix backed by ``data``
+        """
+        if data.ndim != 2 or data.shape[0] != len(vector_ids):
+            raise ValidationError("Vector array must be 2-D and aligned with vector IDs")
+
+        matrix = cls(dimension=None, dtype=data.dtype, **kwargs)
+        matrix.dimension = int(data.shape[1])
+        size = int(data.shape[0])
+        if norms is None:
+            norms = np.linalg.norm(data, axis=1).astype(data.dtype)
+        matrix._data = data
+        matrix._norms = norms
+        matrix._inv_norms = (1.0 / (np.asarray(norms) + _EPSILON)).astype(data.dtype)
+        matrix._valid = np.ones(size, dtype=bool)
+        matrix._size = size
+        matrix._row_ids = list(vector_ids)
+        matrix._id_to_row = {vector_id: row for row, vector_id in enumerate(matrix._row_ids)}
+        return matrix
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Copy the live vectors into an ``{id: vector}`` dictionary."""
+        return {vector_id: self._data[row].copy() for vector_id, row in self._id_to_row.items()}
+
+    # ------------------------------------------------------------------
+    # Mapping protocol
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, vector_id: str) -> np.ndarray:
+        row = self._id_to_row[vector_id]
+        return self._data[row].copy()
+
+    def __setitem__(self, vector_id: str, vector: Any) -> None:
+        self.add(vector_id, vector)
+
+    def __delitem__(self, vector_id: str) -> None:
+        if not self.remove(vector_id):
+            raise KeyError(vector_id)
+
+    def __contains__(self, vector_id: object) -> bool:
+        return vector_id in self._id_to_row
+
+    def __iter__(self) -> Iterator[str]:
+        return (vector_id for vector_id in self._row_ids if vector_id is not None)
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    def __repr__(self) -> str:
+        return (
+            f"VectorMatrix(size={len(self)}, dimension={self.dimension}, "
+            f"tombstones={self._tombstones})"
+        )
@@ -7,10 +7,11 @@ management, and vector store maintenance capabilities.
 
 Key Features:
     - Vector storage and management
-    - Similarity search and retrieval
-    - Vector indexing and optimization
+    - Similarity search and retrieval (single and batched queries)
+    - Vector indexing and optimization (pure-NumPy IVF ANN for in-process stores)
     - Metadata association with vectors
     - Vector update and deletion operations
+    - Contiguous float32 matrix storage with incremental inserts
     - Multi-backend support through stores
 
 Main Classes:
@@ -24,12 +25,15 @@ Example Usage:
     >>> store = VectorStore(backend="faiss", dimension=768)
     >>> vector_ids = store.store_vectors(vectors, metadata=metadata_list)
     >>> results = store.search_vectors(query_vector, k=10)
+    >>> batch_results = store.search_vectors_batch(query_matrix, k=10)
     >>> store.update_vectors(vector_ids, new_vectors)
     >>> store.delete_vectors(vector_ids)
     >>> 
     >>> from semantica.vector_store import VectorIndexer, VectorRetriever
     >>> indexer = VectorIndexer(backend="faiss", dimension=768)
     >>> index = indexer.create_index(vectors, ids)
+    >>> store.indexer.optimize_index(store.vectors, index_type="ivf", nlist=1024)
+    >>> results = store.search_vectors(query_vector, k=10, nprobe=16)
     >>> retriever = VectorRetriever(backend="faiss")
     >>> results = retriever.search_similar(query_vector, vectors, ids, k=10)
 
@@ -37,6 +41,7 @@ Author: Semantica Contributors
 License: MIT
 """
 
+import threading
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -45,6 +50,9 @@ from ..utils.exceptions import ProcessingError, ValidationError
 from ..utils.logging import get_logger
 from ..utils.progress_tracker import get_progress_tracker
 from ..embeddings import EmbeddingGenerator
+from .metadata_store import MetadataIndex, MetadataView
+from .ivf_index import IVFIndex
+from .vector_matrix import VectorMatrix, compute_similarity, select_top_k
 
 
 class VectorStore:
@@ -61,6 +69,10 @@ class VectorStore:
 
     SUPPORTED_BACKENDS = {"faiss", "weaviate", "qdrant", "milvus", "inmemory"}
 
+    # On-disk layout written by save(); bump the version when the layout changes
+    STORAGE_FORMAT = "semantica.vector_store"
+    STORAGE_VERSION = 1
+
     def __init__(self, backend="faiss", config=None, **kwargs):
         """Initialize vector store."""
         if backend.lower() not in self.SUPPORTED_BACKENDS:
@@ -73,14 +85,21 @@ class VectorStore:
         self.config = config or {}
         self.config.update(kwargs)
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.backend = backend
-        self.vectors: Dict[str, np.ndarray] = {}
-        self.metadata: Dict[str, Dict[str, Any]] = {}
+        # Inverted metadata index used by filtered (hybrid) search
+        self._metadata_index = MetadataIndex()
+        self._metadata_by_id: Dict[str, Dict[str, Any]] = {}
+        # Metadata of a loaded store that has not been read yet (see load())
+        self._saved_metadata: Optional[Dict[str, Any]] = None
+        self._saved_metadata_lock = threading.Lock()
         self.dimension = self.config.get("dimension", 768)
+        self._id_counter = 0
+        # Contiguous float32 storage; dimension is inferred from the first insert
+        self._matrix = VectorMatrix(
+            initial_capacity=self.config.get("initial_capacity", 1024),
+            compaction_threshold=self.config.get("compaction_threshold", 0.25),
+        )
 
         # Initialize backend-specific indexer
         # Avoid duplicate dimension argument
@@ -105,6 +124,140 @@ class VectorStore:
             self.logger.warning(f"Could not initialize embedding generator: {e}")
             self.embedder = None
 
+    @property
+    def vectors(self) -> VectorMatrix:
+        """Dict-like view of stored vectors, backed by a contiguous matrix."""
+        return self._matrix
+
+    @vectors.setter
+    def vectors(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Replace all stored vectors."""
+        matrix = VectorMatrix(
+            initial_capacity=max(len(vectors), self.config.get("initial_capacity", 1024)),
+            compaction_threshold=self.config.get("compaction_threshold", 0.25),
+        )
+        if vectors:
+            matrix.add_batch(list(vectors.keys()), list(vectors.values()))
+        self._matrix = matrix
+        self._sync_index()
+
+    @property
+    def metadata(self) -> MetadataView:
+        """
+        Read-only vector ID to metadata mapping.
+
+        Use ``update_metadata()`` to change the metadata of a vector, so the
+        metadata index used by filtered search stays in sync.
+        """
+        return MetadataView(self._metadata)
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Dict[str, Any]]) -> None:
+        """Replace all metadata and rebuild the metadata index."""
+        metadata_by_id = {vector_id: dict(meta) for vector_id, meta in metadata.items()}
+        metadata_index = MetadataIndex()
+        for vector_id, meta in metadata_by_id.items():
+            metadata_index.index_metadata(vector_id, meta)
+        self._metadata_by_id = metadata_by_id
+        self._metadata_index = metadata_index
+        self._saved_metadata = None
+
+    @property
+    def metadata_index(self) -> MetadataIndex:
+        """Inverted metadata index used by filtered search."""
+        self._load_saved_metadata()
+        return self._metadata_index
+
+    @property
+    def _metadata(self) -> Dict[str, Dict[str, Any]]:
+        """Vector ID to metadata dict, read from disk on first use after load()."""
+        self._load_saved_metadata()
+        return self._metadata_by_id
+
+    def _load_saved_metadata(self) -> None:
+        """Read and index all metadata deferred by load()."""
+        import json
+
+        if self._saved_metadata is None:
+            return
+        with self._saved_metadata_lock:
+            saved = self._saved_metadata
+            if saved is None:
+                return
+            metadata: Dict[str, Dict[str, Any]] = {}
+            with open(saved["path"], "r", encoding="utf-8") as f:
+                for vector_id, line in zip(saved["ids"], f):
+                    metadata[vector_id] = json.loads(line)
+            # The setter clears the saved state once the index is complete
+            self.metadata = metadata
+
+    def _metadata_of(self, vector_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Copies of the metadata of some vectors.
+
+        While the metadata of a loaded store is still on disk, only the
+        requested rows are read, using the saved line offsets.
+        """
+        import json
+
+        saved = self._saved_metadata
+        if saved is None or saved["offsets"] is None:
+            metadata = self._metadata
+            return {
+                vector_id: dict(metadata[vector_id])
+                for vector_id in vector_ids
+                if vector_id in metadata
+            }
+
+        if saved["rows"] is None:
+            saved["rows"] = {vector_id: row for row, vector_id in enumerate(saved["ids"])}
+        rows = saved["rows"]
+        offsets = saved["offsets"]
+        found: Dict[str, Dict[str, Any]] = {}
+        with open(saved["path"], "rb") as f:
+            for vector_id in vector_ids:
+                row = rows.get(vector_id)
+                if row is None or vector_id in found:
+                    continue
+                f.seek(int(offsets[row]))
+                found[vector_id] = json.loads(f.read(int(offsets[row + 1] - offsets[row])))
+        return found
+
+    def update_metadata(
+        self, vector_id: str, metadata: Dict[str, Any], replace: bool = False
+    ) -> None:
+        """
+        Set metadata fields of a vector and reindex it.
+
+        Args:
+            vector_id: Vector ID
+            metadata: Fields to set
+            replace: Replace the existing metadata instead of merging into it
+        """
+        metadata_by_id = self._metadata
+        current = {} if replace else metadata_by_id.get(vector_id, {})
+        updated = {**current, **metadata}
+        metadata_by_id[vector_id] = updated
+        self._metadata_index.index_metadata(vector_id, updated)
+
+    def _next_vector_id(self) -> str:
+        """Generate the next unused sequential vector ID."""
+        while True:
+            vector_id = f"vec_{self._id_counter}"
+            self._id_counter += 1
+            if vector_id not in self._matrix:
+                return vector_id
+
+    def _sync_index(self) -> None:
+        """
+        Point the indexer at the vector matrix.
+
+        The in-process index reads the matrix directly, so it only needs to be
+        (re)created when the matrix object itself is replaced.
+        """
+        if self.indexer.index is not self._matrix:
+            self.indexer.create_index(self._matrix, self._matrix.row_ids)
+
     def embed(self, text: str) -> np.ndarray:
         """
         Generate embedding for text using the internal embedder.
@@ -127,6 +280,36 @@ class VectorStore:
         self.logger.warning("Using random fallback embedding")
         return np.random.rand(self.dimension).astype(np.float32)
 
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for several texts in one embedder call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Numpy array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        if self.embedder:
+            try:
+                embeddings = np.asarray(
+                    self.embedder.generate_embeddings(list(texts)), dtype=np.float32
+                )
+                if embeddings.ndim == 2 and len(embeddings) == len(texts):
+                    return embeddings
+                self.logger.warning(
+                    f"Batch embedding returned shape {embeddings.shape} "
+                    f"for {len(texts)} texts"
+                )
+            except Exception as e:
+                self.logger.warning(f"Batch embedding generation failed: {e}")
+
+        self.logger.warning("Using random fallback embeddings")
+        return np.random.rand(len(texts), self.dimension).astype(np.float32)
+
     def store(
         self,
         vectors: List[np.ndarray],
@@ -197,23 +380,25 @@ class VectorStore:
         )
 
         try:
-            vector_ids = []
             metadata = metadata or [{}] * len(vectors)
 
             self.progress_tracker.update_tracking(
                 tracking_id, message="Storing vectors..."
             )
-            for i, (vector, meta) in enumerate(zip(vectors, metadata)):
-                vector_id = f"vec_{len(self.vectors) + i}"
-                self.vectors[vector_id] = vector
-                self.metadata[vector_id] = meta
-                vector_ids.append(vector_id)
+            metadata = [dict(meta) for meta in metadata[: len(vectors)]]
+            vector_ids = [self._next_vector_id() for _ in metadata]
+            # Vectors first: a rejected batch must leave no metadata behind
+            self._matrix.add_batch(vector_ids, vectors[: len(vector_ids)])
+            metadata_by_id = self._metadata
+            for vector_id, meta in zip(vector_ids, metadata):
+                metadata_by_id[vector_id] = meta
+                self._metadata_index.index_metadata(vector_id, meta)
 
             # Update index
             self.progress_tracker.update_tracking(
                 tracking_id, message="Updating vector index..."
             )
-            self.indexer.create_index(list(self.vectors.values()), vector_ids)
+            self._sync_index()
 
             self.progress_tracker.stop_tracking(
                 tracking_id,
@@ -226,71 +411,179 @@ class VectorStore:
                 tracking_id, status="failed", message=str(e)
             )
             raise
+
     def save(self, path: str) -> None:
         """
         Save vector store to disk.
-        
+
+        Writes a versioned, pickle-free layout into ``path``:
+
+        - ``vectors.npy``: float32 (N, D) matrix, reopened with ``np.memmap``
+        - ``norms.npy``: cached per-row L2 norms
+        - ``ids.json``: vector IDs in row order
+        - ``metadata.jsonl``: one JSON metadata object per row
+        - ``metadata_offsets.npy``: byte offset of each ``metadata.jsonl`` line
+        - ``manifest.json``: format version, dimension, count and config
+
+        Files are written under temporary names and renamed into place, with
+        the manifest renamed last.
+
         Args:
             path: Directory path to save to
         """
+        import json
         import os
-        import pickle
-        
+
         os.makedirs(path, exist_ok=True)
-        
-        # Save metadata and vectors (generic fallback)
-        # Ideally, backends like FAISS have their own save methods
+
+        # Backends like FAISS have their own index persistence
         if hasattr(self.indexer, "save_index"):
-             self.indexer.save_index(os.path.join(path, "index.bin"))
-        
-        # Save Python-level data
-        data = {
-            "vectors": self.vectors,
-            "metadata": self.metadata,
-            "config": self.config,
+            self.indexer.save_index(os.path.join(path, "index.bin"))
+
+        # Every file is written to a temporary name and renamed into place
+        def _tmp(name: str) -> str:
+            return os.path.join(path, f".{name}.tmp")
+
+        with open(_tmp("vectors.npy"), "wb") as vf, open(_tmp("norms.npy"), "wb") as nf:
+            ids = self._matrix.save_arrays(vf, nf)
+
+        with open(_tmp("ids.json"), "w", encoding="utf-8") as f:
+            json.dump(ids, f)
+
+        metadata = self._metadata
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        with open(_tmp("metadata.jsonl"), "wb") as f:
+            for row, vector_id in enumerate(ids):
+                line = json.dumps(metadata.get(vector_id, {}), default=str) + "\n"
+                f.write(line.encode("utf-8"))
+                offsets[row + 1] = offsets[row] + len(line.encode("utf-8"))
+        with open(_tmp("metadata_offsets.npy"), "wb") as f:
+            np.save(f, offsets)
+
+        manifest = {
+            "format": self.STORAGE_FORMAT,
+            "version": self.STORAGE_VERSION,
             "backend": self.backend,
-            "dimension": self.dimension
+            "dimension": self.dimension,
+            "count": len(ids),
+            "dtype": str(self._matrix.dtype),
+            "id_counter": self._id_counter,
+            "config": self.config,
         }
-        
-        with open(os.path.join(path, "store_data.pkl"), "wb") as f:
-            pickle.dump(data, f)
-            
+        with open(_tmp("manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, default=str)
+
+        for name in (
+            "vectors.npy",
+            "norms.npy",
+            "ids.json",
+            "metadata.jsonl",
+            "metadata_offsets.npy",
+            "manifest.json",
+        ):
+            os.replace(_tmp(name), os.path.join(path, name))
+
         self.logger.info(f"Saved vector store to {path}")
 
-    def load(self, path: str) -> None:
+    def load(self, path: str, mmap: bool = True) -> None:
         """
         Load vector store from disk.
-        
+
+        Vectors are opened as a copy-on-write memory map by default, so
+        loading does not read the matrix; pages are faulted in as queries
+        touch them and are shared through the OS page cache between
+        processes that open the same store. Metadata is not read either:
+        search results read just their own rows, and the whole file is
+        parsed and indexed on first filtered search, metadata write or
+        ``metadata`` access. Stores saved in the legacy pickle format
+        (``store_data.pkl``) are still readable.
+
         Args:
             path: Directory path to load from
+            mmap: Memory-map the vector matrix instead of reading it into memory
         """
+        import json
+        import os
+
+        manifest_path = os.path.join(path, "manifest.json")
+        if not os.path.exists(manifest_path):
+            self._load_legacy(path)
+            return
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        if manifest.get("format") != self.STORAGE_FORMAT:
+            raise ValidationError(f"Not a vector store directory: {path}")
+        if manifest.get("version", 0) > self.STORAGE_VERSION:
+            raise ValidationError(
+                f"Vector store format version {manifest.get('version')} is newer "
+                f"than supported version {self.STORAGE_VERSION}"
+            )
+
+        with open(os.path.join(path, "ids.json"), "r", encoding="utf-8") as f:
+            ids = json.load(f)
+
+        offsets_path = os.path.join(path, "metadata_offsets.npy")
+        offsets = np.load(offsets_path) if os.path.exists(offsets_path) else None
+
+        self.config = manifest.get("config", {})
+        self.backend = manifest.get("backend", "faiss")
+        self.dimension = manifest.get("dimension", 768)
+        self._id_counter = manifest.get("id_counter", len(ids))
+        self.metadata = {}
+        self._saved_metadata = {
+            "path": os.path.join(path, "metadata.jsonl"),
+            "ids": ids,
+            "offsets": offsets,
+            "rows": None,
+        }
+
+        matrix_options = {
+            "initial_capacity": self.config.get("initial_capacity", 1024),
+            "compaction_threshold": self.config.get("compaction_threshold", 0.25),
+        }
+        if ids:
+            mmap_mode = "c" if mmap else None
+            data = np.load(os.path.join(path, "vectors.npy"), mmap_mode=mmap_mode)
+            norms = np.load(os.path.join(path, "norms.npy"), mmap_mode=mmap_mode)
+            self._matrix = VectorMatrix.from_arrays(data, ids, norms, **matrix_options)
+        else:
+            self._matrix = VectorMatrix(**matrix_options)
+        self._sync_index()
+
+        # Restore backend-specific index
+        if hasattr(self.indexer, "load_index"):
+            index_path = os.path.join(path, "index.bin")
+            if os.path.exists(index_path):
+                self.indexer.load_index(index_path)
+
+        self.logger.info(f"Loaded vector store from {path}")
+
+    def _load_legacy(self, path: str) -> None:
+        """Load a store saved in the legacy pickle format."""
         import os
         import pickle
-        
+
         data_path = os.path.join(path, "store_data.pkl")
         if not os.path.exists(data_path):
             self.logger.warning(f"Store data not found: {data_path}")
             return
-            
+
+        self.logger.warning(
+            f"Loading legacy pickle vector store from {path}; "
+            "call save() to migrate it to the memory-mappable format"
+        )
         with open(data_path, "rb") as f:
             data = pickle.load(f)
-            
-        self.vectors = data.get("vectors", {})
+
         self.metadata = data.get("metadata", {})
         self.config = data.get("config", {})
         self.backend = data.get("backend", "faiss")
         self.dimension = data.get("dimension", 768)
-        
-        # Restore backend-specific index
-        if hasattr(self.indexer, "load_index"):
-            index_path = os.path.join(path, "index.bin")
-            if os.path.exists(index_path):
-                self.indexer.load_index(index_path)
-            else:
-                # Rebuild if index file missing but vectors present
-                self.indexer.create_index(list(self.vectors.values()), list(self.vectors.keys()))
-        
-        self.logger.info(f"Loaded vector store from {path}")
+        # Setter rebuilds the vector matrix and rebinds the index
+        self.vectors = data.get("vectors", {})
+        self._id_counter = len(self._matrix)
 
     def search(self, query: str, limit: int = 10, **options) -> List[Dict[str, Any]]:
         """
@@ -319,7 +612,11 @@ class VectorStore:
         Args:
             query_vector: Query vector
             k: Number of results to return
-            **options: Search options
+            **options: Search options:
+                - metric: "cosine" (default), "inner_product" or "l2"
+                - nprobe: IVF lists probed when an ANN index is built
+                  (higher = better recall, slower)
+                - exact: Force brute-force search even if an ANN index exists
 
         Returns:
             List of search results with scores
@@ -327,38 +624,41 @@ class VectorStore:
         tracking_id = self.progress_tracker.start_tracking(
             module="vector_store",
             submodule="VectorStore",
-            message=f"Searching for {k} similar vectors",
+            message=lambda: f"Searching for {k} similar vectors",
         )
 
         try:
-            if not self.vectors:
+            if not self._matrix:
                 self.progress_tracker.stop_tracking(
                     tracking_id, status="completed", message="No vectors to search"
                 )
                 return []
 
-            # Use retriever for similarity search
+            # Use retriever for similarity search directly over the matrix
             self.progress_tracker.update_tracking(
                 tracking_id, message="Performing similarity search..."
             )
+            if not options.get("exact", False):
+                options.setdefault("ann_index", self.indexer.get_ann_index(self._matrix))
             results = self.retriever.search_similar(
                 query_vector,
-                list(self.vectors.values()),
-                list(self.vectors.keys()),
+                self._matrix,
+                self._matrix.row_ids,
                 k=k,
                 **options,
             )
 
             # Add metadata to results if available
+            metadata = self._metadata_of([result.get("id") for result in results])
             for result in results:
                 vector_id = result.get("id")
-                if vector_id and vector_id in self.metadata:
-                    result["metadata"] = self.metadata[vector_id]
+                if vector_id and vector_id in metadata:
+                    result["metadata"] = metadata[vector_id]
 
             self.progress_tracker.stop_tracking(
                 tracking_id,
                 status="completed",
-                message=f"Found {len(results)} similar vectors",
+                message=lambda: f"Found {len(results)} similar vectors",
             )
             return results
         except Exception as e:
@@ -367,42 +667,105 @@ class VectorStore:
             )
             raise
 
+    def search_vectors_batch(
+        self, query_vectors: np.ndarray, k: int = 10, **options
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar vectors for a batch of queries.
+
+        All queries are scored with a single matrix product against the
+        stored matrix (chunked by ``batch_size`` to bound memory).
+
+        Args:
+            query_vectors: Query array of shape (Q, D)
+            k: Number of results per query
+            **options: Search options (metric, batch_size, nprobe, exact)
+
+        Returns:
+            One list of search results with scores per query
+        """
+        query_vectors = np.atleast_2d(np.asarray(query_vectors))
+        tracking_id = self.progress_tracker.start_tracking(
+            module="vector_store",
+            submodule="VectorStore",
+            message=lambda: f"Searching {len(query_vectors)} queries for {k} similar vectors",
+        )
+
+        try:
+            if not self._matrix:
+                self.progress_tracker.stop_tracking(
+                    tracking_id, status="completed", message="No vectors to search"
+                )
+                return [[] for _ in range(len(query_vectors))]
+
+            self.progress_tracker.update_tracking(
+                tracking_id, message="Performing batched similarity search..."
+            )
+            if not options.get("exact", False):
+                options.setdefault("ann_index", self.indexer.get_ann_index(self._matrix))
+            batch_results = self.retriever.search_similar_batch(
+                query_vectors,
+                self._matrix,
+                self._matrix.row_ids,
+                k=k,
+                **options,
+            )
+
+            metadata = self._metadata_of(
+                [result.get("id") for results in batch_results for result in results]
+            )
+            for results in batch_results:
+                for result in results:
+                    vector_id = result.get("id")
+                    if vector_id and vector_id in metadata:
+                        result["metadata"] = dict(metadata[vector_id])
+
+            self.progress_tracker.stop_tracking(
+                tracking_id,
+                status="completed",
+                message=lambda: f"Searched {len(batch_results)} queries",
+            )
+            return batch_results
+        except Exception as e:
+            self.progress_tracker.stop_tracking(
+                tracking_id, status="failed", message=str(e)
+            )
+            raise
+
     def update_vectors(
         self, vector_ids: List[str], new_vectors: List[np.ndarray], **options
     ) -> bool:
-        """Update existing vectors."""
+        """Update existing vectors in place."""
+        updated_rows = []
         for vec_id, new_vec in zip(vector_ids, new_vectors):
-            if vec_id in self.vectors:
-                self.vectors[vec_id] = new_vec
+            if vec_id in self._matrix:
+                updated_rows.append(self._matrix.add(vec_id, new_vec))
 
-        # Rebuild index
-        self.indexer.create_index(
-            list(self.vectors.values()), list(self.vectors.keys())
-        )
+        self._sync_index()
+        if updated_rows:
+            self.indexer.refresh_rows(updated_rows)
 
         return True
 
     def delete_vectors(self, vector_ids: List[str], **options) -> bool:
-        """Delete vectors from store."""
+        """Delete vectors from store (tombstoned, compacted periodically)."""
+        metadata_by_id = self._metadata
         for vec_id in vector_ids:
-            self.vectors.pop(vec_id, None)
-            self.metadata.pop(vec_id, None)
+            self._matrix.remove(vec_id)
+            metadata_by_id.pop(vec_id, None)
+            self._metadata_index.remove_metadata(vec_id)
 
-        # Rebuild index
-        if self.vectors:
-            self.indexer.create_index(
-                list(self.vectors.values()), list(self.vectors.keys())
-            )
+        self._sync_index()
 
         return True
 
     def get_vector(self, vector_id: str) -> Optional[np.ndarray]:
         """Get vector by ID."""
-        return self.vectors.get(vector_id)
+        return self._matrix.get(vector_id)
 
     def get_metadata(self, vector_id: str) -> Optional[Dict[str, Any]]:
-        """Get metadata for vector."""
-        return self.metadata.get(vector_id)
+        """Get a copy of the metadata of a vector."""
+        return self._metadata_of([vector_id]).get(vector_id)
 
 
 class VectorIndexer:
@@ -415,6 +778,10 @@ class VectorIndexer:
         self.backend = backend
         self.dimension = dimension
         self.index = None
+        # Optional pure-NumPy ANN index over a bound VectorMatrix
+        self.ann_index: Optional[IVFIndex] = None
+        # Monotonic counter for IDs generated by update_index
+        self._new_id_counter = 0
 
     def create_index(
         self, vectors: List[np.ndarray], ids: Optional[List[str]] = None, **options
@@ -423,14 +790,23 @@ class VectorIndexer:
         Create vector index.
 
         Args:
-            vectors: List of vectors
+            vectors: List of vectors, or a VectorMatrix to index in place
             ids: Vector IDs
             **options: Indexing options
 
         Returns:
             Index object
         """
-        if not vectors:
+        if isinstance(vectors, VectorMatrix):
+            # The matrix is already contiguous and tracks its own ids, so the
+            # in-process index is a live reference rather than a copy
+            if self.index is not vectors and self.ann_index is not None:
+                # Same ANN settings, rebuilt lazily over the new matrix
+                self.ann_index = self._new_ann_index()
+            self.index = vectors
+            return self.index
+
+        if len(vectors) == 0:
             return None
 
         # Convert to numpy array
@@ -444,19 +820,134 @@ class VectorIndexer:
 
         return self.index
 
-    def update_index(self, index: Any, new_vectors: List[np.ndarray], **options) -> Any:
-        """Update existing index."""
+    def update_index(
+        self,
+        index: Any,
+        new_vectors: List[np.ndarray],
+        ids: Optional[List[str]] = None,
+        **options,
+    ) -> Any:
+        """
+        Add vectors to an existing index.
+
+        Args:
+            index: Index from create_index (VectorMatrix or dict)
+            new_vectors: Vectors to add
+            ids: IDs of the new vectors (default: generated ``new_<n>`` IDs
+                that are not in use)
+            **options: Update options
+
+        Returns:
+            Updated index
+
+        Raises:
+            ValidationError: If an ID is already in the index, or the number
+                of IDs does not match the number of vectors
+        """
+        existing = index if isinstance(index, VectorMatrix) else set(index["ids"])
+        if ids is None:
+            ids = []
+            while len(ids) < len(new_vectors):
+                candidate = f"new_{self._new_id_counter}"
+                self._new_id_counter += 1
+                if candidate not in existing:
+                    ids.append(candidate)
+        else:
+            ids = list(ids)
+            if len(ids) != len(new_vectors):
+                raise ValidationError(
+                    f"Got {len(ids)} IDs for {len(new_vectors)} vectors"
+                )
+            if len(set(ids)) != len(ids):
+                raise ValidationError("Vector IDs must be unique")
+            duplicates = [vid for vid in ids if vid in existing]
+            if duplicates:
+                raise ValidationError(f"Vector IDs already exist: {duplicates}")
+
+        if isinstance(index, VectorMatrix):
+            index.add_batch(ids, new_vectors)
+            return index
+
         # Simplified - rebuild index
         return self.create_index(
-            list(index["vectors"]) + new_vectors,
-            index["ids"] + [f"new_{i}" for i in range(len(new_vectors))],
+            list(index["vectors"]) + list(new_vectors), index["ids"] + ids
+        )
+
+    def _new_ann_index(self, **options) -> IVFIndex:
+        """Create an (untrained) IVF index from options and indexer config."""
+        previous = self.ann_index
+        defaults = {"nlist": previous.nlist, "nprobe": previous.nprobe} if previous else {}
+
+        def _option(name: str, default: Any = None) -> Any:
+            return options.get(name, self.config.get(name, defaults.get(name, default)))
+
+        return IVFIndex(
+            nlist=_option("nlist"),
+            nprobe=_option("nprobe", 8),
+            metric=_option("metric", "cosine"),
+            max_iter=_option("max_iter", 10),
+            train_size=_option("train_size"),
         )
 
-    def optimize_index(self, index: Any, **options) -> Any:
-        """Optimize index for better performance."""
-        # Simplified - return as-is
+    def optimize_index(self, index: Any = None, **options) -> Any:
+        """
+        Optimize index for better performance.
+
+        For an in-process VectorMatrix this builds a pure-NumPy IVF index
+        (k-means coarse quantizer + posting lists) used for approximate
+        search. Other index objects are returned as-is.
+
+        Args:
+            index: Index to optimize (defaults to the bound index)
+            **options: Optimization options:
+                - index_type: "ivf" (default) or "flat" to drop the ANN index
+                - nlist: Number of IVF lists (default: sqrt of store size)
+                - nprobe: Default lists probed per query
+                - metric, max_iter, train_size: IVF training options
+
+        Returns:
+            The optimized index
+        """
+        index = self.index if index is None else index
+        if not isinstance(index, VectorMatrix):
+            return index
+
+        index_type = options.get("index_type", self.config.get("index_type", "ivf"))
+        if index_type == "flat":
+            self.ann_index = None
+            return index
+        if index_type != "ivf":
+            raise ValidationError(f"Unsupported in-memory index type: {index_type}")
+
+        if len(index) == 0:
+            self.logger.warning("Cannot build IVF index over an empty store")
+            return index
+
+        self.ann_index = self._new_ann_index(**options).build(index)
+        self.logger.info(
+            f"Built IVF index with {self.ann_index.nlist} lists over {len(index)} vectors"
+        )
         return index
 
+    def get_ann_index(self, matrix: VectorMatrix) -> Optional[IVFIndex]:
+        """
+        Get the ANN index for a matrix, building it when configured.
+
+        With ``index_type="ivf"`` in the indexer config the index is built
+        automatically once the store holds ``ann_min_vectors`` vectors.
+        """
+        if self.ann_index is None and self.index is matrix:
+            if self.config.get("index_type") == "ivf" and len(matrix) >= self.config.get(
+                "ann_min_vectors", 10000
+            ):
+                self.optimize_index(matrix)
+        return self.ann_index if self.index is matrix else None
+
+    def refresh_rows(self, rows: List[int]) -> None:
+        """Reassign updated matrix rows in the ANN index."""
+        if self.ann_index is not None and self.ann_index.is_trained:
+            self.ann_index.add_rows(self.index, np.asarray(rows, dtype=np.int64))
+
 
 class VectorRetriever:
     """Vector retrieval engine."""
@@ -480,46 +971,98 @@ class VectorRetriever:
 
         Args:
             query_vector: Query vector
-            vectors: List of vectors to search
-            ids: Vector IDs
+            vectors: List of vectors, a 2-D array, or a VectorMatrix to search
+            ids: Vector IDs (row-aligned with ``vectors``)
             k: Number of results
 
         Returns:
             List of results with scores
         """
-        if not vectors:
-            return []
-
-        # Convert to numpy
-        if isinstance(vectors[0], list):
-            vectors = np.array(vectors)
-        else:
-            vectors = np.vstack(vectors)
-
-        if isinstance(query_vector, list):
-            query_vector = np.array(query_vector)
-
-        # Calculate cosine similarity with epsilon to avoid division by zero
-        epsilon = 1e-10
-        query_norm = np.linalg.norm(query_vector)
-        vector_norms = np.linalg.norm(vectors, axis=1)
-
-        similarities = np.dot(vectors, query_vector) / (
-            (vector_norms * query_norm) + epsilon
+        batch = self.search_similar_batch(
+            np.asarray(query_vector).reshape(1, -1), vectors, ids, k=k, **options
         )
+        return batch[0] if batch else []
 
-        # Get top k
-        top_indices = np.argsort(similarities)[::-1][:k]
+    def search_similar_batch(
+        self,
+        query_vectors: np.ndarray,
+        vectors: List[np.ndarray],
+        ids: List[str],
+        k: int = 10,
+        **options,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar vectors for many queries with one matrix product.
 
-        results = []
-        for idx in top_indices:
-            results.append(
-                {
-                    "id": ids[idx],
-                    "vector": vectors[idx],
-                    "score": float(similarities[idx]),
-                }
-            )
+        Args:
+            query_vectors: Query array of shape (Q, D)
+            vectors: List of vectors, a 2-D array, or a VectorMatrix to search
+            ids: Vector IDs (row-aligned with ``vectors``)
+            k: Number of results per query
+            **options: Search options:
+                - metric: "cosine" (default), "inner_product" or "l2"
+                - batch_size: Queries scored per matrix product (bounds memory)
+                - ann_index: IVFIndex over ``vectors`` (VectorMatrix only) for
+                  approximate search
+                - nprobe: IVF lists probed per query
+
+        Returns:
+            One list of results with scores per query
+        """
+        metric = options.get("metric", self.config.get("metric", "cosine"))
+        batch_size = options.get("batch_size", self.config.get("batch_size", 256))
+        ann_index = options.get("ann_index")
+        query_vectors = np.atleast_2d(np.asarray(query_vectors))
+
+        if isinstance(vectors, VectorMatrix):
+            if len(vectors) == 0:
+                return [[] for _ in range(len(query_vectors))]
+            matrix = vectors
+            ids = matrix.row_ids
+            data = matrix.data
+        else:
+            if len(vectors) == 0:
+                return [[] for _ in range(len(query_vectors))]
+            # Convert to numpy
+            if isinstance(vectors, np.ndarray):
+                data = np.atleast_2d(vectors)
+            elif isinstance(vectors[0], list):
+                data = np.array(vectors)
+            else:
+                data = np.vstack(vectors)
+            matrix = None
+
+        results: List[List[Dict[str, Any]]] = []
+        for start in range(0, len(query_vectors), max(1, int(batch_size))):
+            chunk = query_vectors[start : start + batch_size]
+            if (
+                matrix is not None
+                and isinstance(ann_index, IVFIndex)
+                and ann_index.metric == metric
+            ):
+                top_rows, top_scores = ann_index.search(
+                    matrix, chunk, k=k, nprobe=options.get("nprobe")
+                )
+            elif matrix is not None:
+                top_rows, top_scores = matrix.search(chunk, k=k, metric=metric)
+            else:
+                scores = compute_similarity(chunk, data, metric=metric)
+                top_rows = select_top_k(scores, k)
+                top_scores = np.take_along_axis(scores, top_rows, axis=-1)
+
+            for rows, row_scores in zip(top_rows, top_scores):
+                results.append(
+                    [
+                        {
+                            "id": ids[idx],
+                            # A copy: rows of a VectorMatrix are live buffer views
+                            "vector": data[idx].copy(),
+                            "score": float(score),
+                        }
+                        for idx, score in zip(rows.tolist(), row_scores.tolist())
+                        if idx >= 0
+                    ]
+                )
 
         return results
 
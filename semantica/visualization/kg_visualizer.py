@@ -92,9 +92,6 @@ class KGVisualizer:
         self.logger = get_logger("kg_visualizer")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
 
         self.layout_type = config.get("layout", "force")
         color_scheme_name = config.get("color_scheme", "default")
@@ -60,9 +60,6 @@ class SemanticNetworkVisualizer:
         self.logger = get_logger("semantic_network_visualizer")
         self.config = config
         self.progress_tracker = get_progress_tracker()
-        # Ensure progress tracker is enabled
-        if not self.progress_tracker.enabled:
-            self.progress_tracker.enabled = True
         color_scheme_name = config.get("color_scheme", "vibrant")
         try:
             self.color_scheme = ColorScheme[color_scheme_name.upper()]
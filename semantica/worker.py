@@ -3,53 +3,246 @@ Semantica Worker Entry Point
 
 This module provides the worker process for the Semantica framework,
 enabling distributed and background task processing.
+
+The worker claims jobs from a JobQueue and runs up to ``concurrency`` of them
+at once on a pool of worker processes. Leases are extended while jobs run,
+failed jobs are retried by the queue, and SIGTERM/SIGINT drain the worker:
+no new jobs are claimed and running jobs finish (or are returned to the queue
+after ``drain_timeout``). Start several workers, on one or more hosts sharing
+the queue, to scale out.
+
+Usage:
+    semantica-worker --queue .semantica/jobs.db --concurrency 4
 """
 
-import time
+import argparse
+import os
 import signal
-import sys
-from .utils.logging import get_logger, setup_logging
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Optional
+
+from .core.job_queue import Job, JobQueue, create_job_queue
 from .core.orchestrator import Semantica
+from .utils.logging import get_logger, setup_logging
 
 # Initialize logging
 setup_logging()
 logger = get_logger("semantica.worker")
 
+DEFAULT_QUEUE_PATH = os.environ.get("SEMANTICA_JOB_QUEUE", ".semantica/jobs.db")
+
+
+def build_knowledge_base_job(framework: Semantica, payload: Dict[str, Any]) -> Any:
+    """Run ``build_knowledge_base(sources, **options)`` from a job payload."""
+    return framework.build_knowledge_base(
+        payload["sources"], **payload.get("options", {})
+    )
+
+
+def pipeline_job(framework: Semantica, payload: Dict[str, Any]) -> Any:
+    """Run ``run_pipeline(pipeline, data)`` from a job payload."""
+    return framework.run_pipeline(payload["pipeline"], payload.get("data"))
+
+
+JOB_HANDLERS: Dict[str, Callable[[Semantica, Dict[str, Any]], Any]] = {
+    "build_knowledge_base": build_knowledge_base_job,
+    "pipeline": pipeline_job,
+}
+
+_job_framework: Optional[Semantica] = None
+
+
+def _run_job(
+    config: Optional[Dict[str, Any]],
+    handler: Callable[[Semantica, Dict[str, Any]], Any],
+    payload: Dict[str, Any],
+) -> Any:
+    """Run one job in a pool worker, reusing a per-process framework."""
+    global _job_framework
+    if _job_framework is None:
+        _job_framework = Semantica(config=config)
+    return handler(_job_framework, payload)
+
+
 class SemanticaWorker:
     """Worker for processing Semantica tasks."""
-    
-    def __init__(self):
-        self.framework = Semantica()
+
+    def __init__(
+        self,
+        queue: Optional[JobQueue] = None,
+        concurrency: Optional[int] = None,
+        visibility_timeout: float = 300.0,
+        poll_interval: float = 1.0,
+        drain_timeout: Optional[float] = None,
+        executor: str = "process",
+        handlers: Optional[Dict[str, Callable]] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            queue: Job queue (default: SQLite queue at SEMANTICA_JOB_QUEUE or
+                .semantica/jobs.db)
+            concurrency: Jobs run at once (default: CPU count)
+            visibility_timeout: Job lease in seconds, extended while running
+            poll_interval: Seconds between polls when idle
+            drain_timeout: Seconds to wait for running jobs on shutdown
+                before returning them to the queue (default: wait for all)
+            executor: "process" (default) or "thread"; process handlers must
+                be picklable module-level functions
+            handlers: Job kind to handler ``(framework, payload) -> result``
+                (default: JOB_HANDLERS)
+            config: Framework configuration for the job workers
+        """
+        self.queue = queue or create_job_queue("sqlite", path=DEFAULT_QUEUE_PATH)
+        self.concurrency = max(1, concurrency or os.cpu_count() or 1)
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.drain_timeout = drain_timeout
+        self.executor = executor
+        self.handlers = dict(handlers or JOB_HANDLERS)
+        self.config = config
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
         self.running = False
-        
+        self._stopping = threading.Event()
+
         # Setup signal handlers
-        signal.signal(signal.SIGINT, self.handle_exit)
-        signal.signal(signal.SIGTERM, self.handle_exit)
-    
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.handle_exit)
+            signal.signal(signal.SIGTERM, self.handle_exit)
+
     def handle_exit(self, signum, frame):
         """Graceful shutdown."""
         logger.info("Worker shutting down...")
+        self.stop()
+
+    def stop(self):
+        """Stop claiming jobs and drain running ones."""
         self.running = False
-    
+        self._stopping.set()
+
+    def _create_pool(self) -> Executor:
+        if self.executor == "thread":
+            return ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="semantica-job"
+            )
+        return ProcessPoolExecutor(max_workers=self.concurrency)
+
+    def _submit(self, pool: Executor, job: Job) -> Optional[Future]:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            self.queue.fail(
+                job.id, self.worker_id, f"Unknown job kind: {job.kind}", retry=False
+            )
+            return None
+        logger.info(f"Running job {job.id} ({job.kind}, attempt {job.attempts})")
+        return pool.submit(_run_job, self.config, handler, job.payload)
+
+    def _finish(self, job: Job, future: Future) -> None:
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            self.queue.fail(job.id, self.worker_id, str(e))
+            return
+        if not self.queue.complete(job.id, self.worker_id, result):
+            logger.warning(f"Job {job.id} finished after its lease was lost")
+
     def run(self):
         """Main worker loop."""
-        logger.info("Semantica worker started")
+        logger.info(
+            f"Semantica worker {self.worker_id} started (concurrency {self.concurrency})"
+        )
         self.running = True
-        
-        while self.running:
-            try:
-                # Poll for tasks or process queue
-                # logger.debug("Polling for tasks...")
-                time.sleep(5)
-            except Exception as e:
-                logger.error(f"Error in worker loop: {e}")
-                time.sleep(10)
-        
+        self._stopping.clear()
+
+        pool = self._create_pool()
+        in_flight: Dict[Future, Job] = {}
+        heartbeat_interval = self.visibility_timeout / 3
+        last_heartbeat = time.monotonic()
+        drain_deadline = None
+        try:
+            while self.running or in_flight:
+                try:
+                    # Claim up to the concurrency limit
+                    while self.running and len(in_flight) < self.concurrency:
+                        job = self.queue.claim(self.worker_id, self.visibility_timeout)
+                        if job is None:
+                            break
+                        future = self._submit(pool, job)
+                        if future is not None:
+                            in_flight[future] = job
+
+                    if not in_flight:
+                        self._stopping.wait(self.poll_interval)
+                        continue
+
+                    done, _ = wait(
+                        list(in_flight),
+                        timeout=min(self.poll_interval, heartbeat_interval),
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        self._finish(in_flight.pop(future), future)
+
+                    if time.monotonic() - last_heartbeat >= heartbeat_interval:
+                        for job in in_flight.values():
+                            self.queue.extend(
+                                job.id, self.worker_id, self.visibility_timeout
+                            )
+                        last_heartbeat = time.monotonic()
+
+                    if not self.running and self.drain_timeout is not None:
+                        if drain_deadline is None:
+                            drain_deadline = time.monotonic() + self.drain_timeout
+                        elif time.monotonic() >= drain_deadline:
+                            for job in in_flight.values():
+                                self.queue.release(job.id, self.worker_id)
+                            logger.warning(
+                                f"Returned {len(in_flight)} unfinished job(s) to the queue"
+                            )
+                            break
+                except Exception as e:
+                    logger.error(f"Error in worker loop: {e}")
+                    self._stopping.wait(self.poll_interval)
+        finally:
+            # Cancel queued jobs by hand; shutdown(cancel_futures=...) needs 3.9
+            for future in in_flight:
+                future.cancel()
+            pool.shutdown(wait=not in_flight)
+
         logger.info("Worker stopped")
 
+
 def main():
     """Worker entry point."""
-    worker = SemanticaWorker()
+    parser = argparse.ArgumentParser(description="Semantica job worker")
+    parser.add_argument("--queue", default=DEFAULT_QUEUE_PATH, help="SQLite queue file")
+    parser.add_argument("--concurrency", type=int, default=None, help="Jobs run at once")
+    parser.add_argument("--visibility-timeout", type=float, default=300.0)
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--drain-timeout", type=float, default=None)
+    args = parser.parse_args()
+
+    worker = SemanticaWorker(
+        queue=create_job_queue("sqlite", path=args.queue),
+        concurrency=args.concurrency,
+        visibility_timeout=args.visibility_timeout,
+        poll_interval=args.poll_interval,
+        drain_timeout=args.drain_timeout,
+    )
     worker.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from semantica.context.context_retriever import ContextRetriever
+
+VOCAB = ["python", "java", "language", "snake", "coffee", "island", "graph", "code"]
+
+
+class KeywordVectorStore:
+    """Deterministic bag-of-words store that counts embedding calls."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.embed_calls = 0
+        self.embed_batch_calls = 0
+        self.matrix = np.vstack([self._vector(doc) for doc in documents])
+
+    def _vector(self, text):
+        words = text.lower().split()
+        return np.array([words.count(w) for w in VOCAB], dtype=np.float32) + 0.01
+
+    def embed(self, text):
+        self.embed_calls += 1
+        return self._vector(text)
+
+    def embed_batch(self, texts):
+        self.embed_batch_calls += 1
+        return np.vstack([self._vector(t) for t in texts])
+
+    def _results(self, query_vector, k):
+        scores = self.matrix @ query_vector / (
+            np.linalg.norm(self.matrix, axis=1) * np.linalg.norm(query_vector)
+        )
+        order = np.argsort(-scores)[:k]
+        return [
+            {"id": f"d{i}", "content": self.documents[i], "score": float(scores[i])}
+            for i in order
+        ]
+
+    def search(self, query, limit=10):
+        return self._results(self.embed(query), limit)
+
+    def search_vectors_batch(self, query_vectors, k=10):
+        return [self._results(q, k) for q in query_vectors]
+
+
+class TestContextRetrieverBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.store = KeywordVectorStore(
+            [
+                "python language code",
+                "java language code",
+                "python snake",
+                "java island coffee",
+                "graph code",
+            ]
+        )
+        self.graph = {
+            "entities": [
+                {"id": "e1", "name": "Python", "type": "language"},
+                {"id": "e2", "name": "Java", "type": "island"},
+            ],
+            "relationships": [{"source": "e1", "target": "e2", "type": "graph"}],
+        }
+        self.memory = MagicMock()
+        self.memory.retrieve.side_effect = lambda query, max_results: [
+            {"id": f"m-{query}", "content": f"remembered {query}", "score": 0.5}
+        ]
+        self.queries = ["python code", "java coffee", "graph", "python code"]
+
+    def _assert_same(self, batch, single):
+        self.assertEqual([r.source for r in batch], [r.source for r in single])
+        np.testing.assert_allclose(
+            [r.score for r in batch], [r.score for r in single], rtol=1e-5
+        )
+
+    def test_vector_leg_matches_retrieve(self):
+        retriever = ContextRetriever(vector_store=self.store)
+        batch = retriever.batch_search(self.queries, max_results=3)
+        self.assertEqual(set(batch), set(self.queries))
+
+        for query in self.queries:
+            self._assert_same(batch[query], retriever.retrieve(query, max_results=3))
+
+    def test_embeds_queries_in_one_call(self):
+        retriever = ContextRetriever(vector_store=self.store)
+        retriever.batch_retrieve(self.queries, max_results=3)
+        self.assertEqual(self.store.embed_calls, 0)
+        # One call for the queries and one for re-ranking content
+        self.assertEqual(self.store.embed_batch_calls, 2)
+
+    def test_all_legs_match_retrieve(self):
+        retriever = ContextRetriever(
+            vector_store=self.store,
+            knowledge_graph=self.graph,
+            memory_store=self.memory,
+            batch_max_workers=2,
+        )
+        batch = retriever.batch_retrieve(self.queries, max_results=4)
+        self.assertEqual(len(batch), len(self.queries))
+        self.assertEqual(self.memory.retrieve.call_count, 3)
+
+        for query, results in zip(self.queries, batch):
+            self.assertTrue(any(r.source == f"memory:m-{query}" for r in results))
+            self._assert_same(results, retriever.retrieve(query, max_results=4))
+
+    def test_falls_back_without_batch_support(self):
+        store = MagicMock(spec=["search"])
+        store.search.return_value = [{"id": "x", "content": "hit", "score": 1.0}]
+        retriever = ContextRetriever(vector_store=store)
+        results = retriever.batch_get_context(["a", "b"], max_results=2)
+        self.assertEqual([r.source for r in results["a"]], ["vector:x"])
+        self.assertEqual(store.search.call_count, 2)
+
+    def test_empty_queries(self):
+        retriever = ContextRetriever(vector_store=self.store)
+        self.assertEqual(retriever.batch_retrieve([]), [])
+        self.assertEqual(retriever.batch_search([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+
+import numpy as np
+
+from semantica.context.context_retriever import ContextRetriever
+from semantica.context.graph_embedding_index import GraphEmbeddingIndex
+
+VOCAB = ["aspirin", "drug", "cox", "enzyme", "inhibits", "paris", "city", "gene"]
+
+
+class CountingStore:
+    """Deterministic bag-of-words embedder that counts embedded texts."""
+
+    def __init__(self):
+        self.embed_calls = 0
+        self.embedded_texts = []
+
+    def _vector(self, text):
+        words = text.lower().split()
+        return np.array([words.count(w) for w in VOCAB], dtype=float) + 0.01
+
+    def embed(self, text):
+        self.embed_calls += 1
+        return self._vector(text)
+
+    def embed_batch(self, texts):
+        self.embedded_texts.extend(texts)
+        return np.vstack([self._vector(t) for t in texts])
+
+
+def make_graph():
+    return {
+        "entities": [
+            {"id": "e1", "name": "Aspirin", "type": "drug"},
+            {"id": "e2", "name": "COX", "type": "enzyme"},
+            {"id": "e3", "name": "Paris", "type": "city"},
+        ],
+        "relationships": [{"source": "e1", "target": "e2", "type": "inhibits"}],
+    }
+
+
+class TestGraphEmbeddingIndex(unittest.TestCase):
+
+    def test_maps_and_scores(self):
+        store = CountingStore()
+        index = GraphEmbeddingIndex()
+        graph = make_graph()
+        self.assertTrue(index.refresh(graph))
+        self.assertFalse(index.refresh(graph))
+        self.assertTrue(index.ensure_embeddings(store.embed_batch))
+
+        self.assertEqual(index.names["e2"], "COX")
+        self.assertEqual(len(index.relationships_by_entity["e1"]), 1)
+        self.assertEqual(index.relationship_endpoints, [("e1", "e2")])
+        self.assertIn("inhibits Aspirin COX", store.embedded_texts)
+
+        query = store._vector("aspirin drug")
+        expected = [
+            float(
+                np.dot(query, store._vector(t))
+                / (np.linalg.norm(query) * np.linalg.norm(store._vector(t)))
+            )
+            for t in ["Aspirin drug", "COX enzyme", "Paris city"]
+        ]
+        np.testing.assert_allclose(index.score_entities(query), expected)
+
+    def test_incremental_embedding(self):
+        store = CountingStore()
+        index = GraphEmbeddingIndex()
+        graph = make_graph()
+        index.refresh(graph)
+        index.ensure_embeddings(store.embed_batch)
+        first = len(store.embedded_texts)
+
+        graph["entities"].append({"id": "e4", "name": "BRCA1", "type": "gene"})
+        self.assertTrue(index.refresh(graph))
+        index.ensure_embeddings(store.embed_batch)
+        self.assertEqual(store.embedded_texts[first:], ["BRCA1 gene"])
+        self.assertEqual(len(index.entity_matrix), 4)
+
+
+class TestRetrieverGraphCache(unittest.TestCase):
+
+    def test_graph_embedded_once_across_queries(self):
+        store = CountingStore()
+        retriever = ContextRetriever(vector_store=store, knowledge_graph=make_graph())
+        queries = ["aspirin drug", "cox enzyme", "paris city"]
+        for query in queries:
+            results = retriever._retrieve_from_graph(query, 5)
+            self.assertTrue(results)
+
+        # Four graph texts embedded once, plus one embed per query
+        self.assertEqual(len(store.embedded_texts), 4)
+        self.assertEqual(store.embed_calls, len(queries))
+
+    def test_graph_results_include_relationships(self):
+        retriever = ContextRetriever(vector_store=CountingStore(), knowledge_graph=make_graph())
+        results = retriever._retrieve_from_graph("aspirin drug inhibits", 5)
+        top = results[0]
+        self.assertEqual(top.source, "graph:e1")
+        self.assertIn("inhibits COX (enzyme)", top.content)
+        self.assertEqual([e["id"] for e in top.related_entities], ["e2"])
+
+    def test_keyword_fallback_without_store(self):
+        retriever = ContextRetriever(knowledge_graph=make_graph())
+        results = retriever._retrieve_from_graph("Paris", 5)
+        self.assertEqual([r.source for r in results], ["graph:e3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
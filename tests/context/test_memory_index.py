@@ -0,0 +1,147 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from semantica.context.agent_memory import AgentMemory
+from semantica.context.memory_index import BM25Index, MemoryTimeline, SecondaryIndex
+
+
+class TestBM25Index(unittest.TestCase):
+
+    def setUp(self):
+        self.index = BM25Index()
+        self.index.add("a", "Python is a programming language")
+        self.index.add("b", "Python python snakes")
+        self.index.add("c", "Java coffee")
+
+    def test_ranking_and_normalization(self):
+        results = self.index.search("python snakes")
+        self.assertEqual([doc for doc, _ in results], ["b", "a"])
+        for _, score in results:
+            self.assertTrue(0.0 < score <= 1.0)
+        self.assertEqual(self.index.search("ruby"), [])
+
+    def test_remove_and_reindex(self):
+        self.index.remove("b")
+        self.assertEqual([doc for doc, _ in self.index.search("snakes")], [])
+        self.index.add("a", "coffee break")
+        self.assertEqual(
+            sorted(doc for doc, _ in self.index.search("coffee")), ["a", "c"]
+        )
+        self.assertNotIn("python", self.index.postings)
+
+    def test_limit_and_accept(self):
+        results = self.index.search("python", limit=1, accept=lambda doc: doc != "b")
+        self.assertEqual([doc for doc, _ in results], ["a"])
+
+
+class TestSecondaryIndexAndTimeline(unittest.TestCase):
+
+    def test_secondary_index(self):
+        index = SecondaryIndex()
+        index.add("m1", [("user_id", "u1"), ("type", None), ("entity", ["x"])])
+        index.add("m2", [("user_id", "u1")])
+        self.assertEqual(list(index.get("user_id", "u1")), ["m1", "m2"])
+        index.remove("m1")
+        self.assertEqual(index.counts("user_id"), {"u1": 1})
+        self.assertEqual(index.get("type", None), {})
+
+    def test_timeline_order_and_expiry(self):
+        timeline = MemoryTimeline()
+        base = datetime(2024, 1, 1)
+        timeline.add("b", base + timedelta(days=2))
+        timeline.add("a", base + timedelta(days=1))
+        timeline.add("c", base + timedelta(days=3))
+        self.assertEqual(list(timeline.latest()), ["c", "b", "a"])
+        self.assertEqual(
+            list(timeline.between(base + timedelta(days=1), base + timedelta(days=2))),
+            ["a", "b"],
+        )
+
+        timeline.remove("b")
+        self.assertEqual(timeline.expire(base + timedelta(days=3)), ["a"])
+        self.assertEqual(list(timeline.latest()), ["c"])
+        self.assertEqual(len(timeline), 1)
+
+
+class TestIndexedAgentMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.memory = AgentMemory()
+        self.base = datetime.now() - timedelta(days=10)
+        self.ids = [
+            self.memory.store(
+                f"message {i} about {'python' if i % 2 else 'java'}",
+                metadata={
+                    "type": "conversation",
+                    "user_id": f"u{i % 3}",
+                    "conversation_id": f"c{i % 2}",
+                },
+                entities=[{"id": f"e{i % 4}"}],
+                relationships=[{"type": "mentions"}] if i % 5 == 0 else [],
+                timestamp=self.base + timedelta(hours=i),
+            )
+            for i in range(20)
+        ]
+
+    def test_ids_are_unique(self):
+        self.assertEqual(len(set(self.ids)), 20)
+        self.assertTrue(all(i.startswith("mem_") for i in self.ids))
+
+    def test_secondary_lookups(self):
+        self.assertEqual(len(self.memory.get_by_user("u0", limit=100)), 7)
+        self.assertEqual(len(self.memory.find_by_entity("e1")), 5)
+        self.assertEqual(len(self.memory.find_by_relationship("mentions")), 4)
+        self.assertEqual(self.memory.count(conversation_id="c1", user_id="u0"), 3)
+        self.assertEqual(self.memory.count_by_user(), {"u0": 7, "u1": 7, "u2": 6})
+
+        history = self.memory.get_conversation_history("c0", max_items=3)
+        self.assertEqual([h["memory_id"] for h in history], self.ids[14:20:2])
+
+    def test_recent_and_date_range(self):
+        recent = self.memory.get_recent(limit=2)
+        self.assertEqual([m["memory_id"] for m in recent], [self.ids[19], self.ids[18]])
+        in_range = self.memory.get_by_date(
+            self.base + timedelta(hours=3), self.base + timedelta(hours=5)
+        )
+        self.assertEqual([m["memory_id"] for m in in_range], self.ids[3:6])
+
+    def test_keyword_search_respects_filters(self):
+        results = self.memory._keyword_search("python", 3, {"user_id": "u1"})
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIn("python", result["content"])
+            self.assertEqual(result["metadata"]["user_id"], "u1")
+
+    def test_delete_updates_indexes(self):
+        self.memory.delete_memory(self.ids[19])
+        self.assertNotIn(self.ids[19], [m["memory_id"] for m in self.memory.get_recent(5)])
+        self.assertEqual(self.memory.clear_memory(user_id="u2"), 6)
+        self.assertEqual(self.memory.get_by_user("u2"), [])
+        self.assertEqual(self.memory.count(), 13)
+
+    def test_retention_expires_oldest(self):
+        memory = AgentMemory(retention_policy="5_days")
+        old_id = memory.store("old note", timestamp=datetime.now() - timedelta(days=6))
+        new_id = memory.store("new note")
+        self.assertFalse(memory.exists(old_id))
+        self.assertTrue(memory.exists(new_id))
+
+    def test_short_term_token_pruning(self):
+        memory = AgentMemory(short_term_limit=10, token_limit=10)
+        for text in ["a" * 20, "b" * 20, "c" * 20]:
+            memory.store(text)
+        self.assertEqual([m.content[0] for m in memory.short_term_memory], ["b", "c"])
+
+    def test_load_rebuilds_indexes(self):
+        with tempfile.TemporaryDirectory() as path:
+            self.memory.save(path)
+            loaded = AgentMemory()
+            loaded.load(path)
+        self.assertEqual(len(loaded.get_by_user("u0")), 7)
+        self.assertEqual(loaded.get_recent(1)[0]["memory_id"], self.ids[19])
+        self.assertTrue(loaded._keyword_search("java", 5, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
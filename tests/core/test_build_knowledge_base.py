@@ -0,0 +1,163 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from semantica.core.orchestrator import Semantica
+from semantica.utils.exceptions import ProcessingError
+
+
+class SlowPipeline:
+    """Pipeline stand-in whose output carries the source text and entities."""
+
+    def __init__(self, delay=0.0, fail=(), hang=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.hang = set(hang)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def execute(self, source):
+        name = Path(source).name
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(1.0 if name in self.hang else self.delay)
+            if name in self.fail:
+                raise ValueError(f"cannot parse {name}")
+            return {"text": name}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TextPipeline:
+    """Picklable pipeline stand-in for process workers."""
+
+    def execute(self, source):
+        return {"text": Path(source).name}
+
+
+class FakeEmbeddingGenerator:
+    def generate_embeddings(self, text):
+        return [float(len(text))]
+
+
+class TestConcurrentBuildKnowledgeBase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sources = []
+        for i in range(12):
+            path = Path(self.tmp.name) / f"doc{i:02d}.txt"
+            path.write_text(f"document {i}")
+            self.sources.append(str(path))
+        self.framework = Semantica()
+        self.framework._initialized = True
+        self.framework._modules["embedding_generator"] = FakeEmbeddingGenerator()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, pipeline, **kwargs):
+        with patch.object(Semantica, "_create_pipeline", return_value=pipeline):
+            return self.framework.build_knowledge_base(self.sources, graph=False, **kwargs)
+
+    def test_concurrent_matches_sequential(self):
+        sequential = self.build(SlowPipeline())
+        pipeline = SlowPipeline(delay=0.05)
+        concurrent = self.build(pipeline, max_workers=4)
+
+        # Four sources were in flight at once
+        self.assertEqual(pipeline.peak, 4)
+        self.assertEqual(
+            [r["output"] for r in concurrent["results"]],
+            [r["output"] for r in sequential["results"]],
+        )
+        self.assertEqual(concurrent["embeddings"], sequential["embeddings"])
+        self.assertEqual(concurrent["embeddings"]["embeddings"][0], [9.0])
+        self.assertEqual(concurrent["statistics"]["sources_processed"], 12)
+
+    def test_failures_are_skipped_without_fail_fast(self):
+        result = self.build(SlowPipeline(fail=["doc03.txt"]), max_workers=3)
+
+        self.assertEqual(result["statistics"]["sources_processed"], 11)
+        self.assertNotIn({"text": "doc03.txt"}, [r["output"] for r in result["results"]])
+
+    def test_fail_fast(self):
+        with self.assertRaises(ProcessingError):
+            self.build(SlowPipeline(fail=["doc00.txt"]), max_workers=3, fail_fast=True)
+
+    def test_source_timeout(self):
+        start = time.time()
+        result = self.build(
+            SlowPipeline(hang=["doc05.txt"]), max_workers=2, source_timeout=0.3
+        )
+
+        self.assertLess(time.time() - start, 1.0)
+        self.assertEqual(result["statistics"]["sources_processed"], 11)
+
+    def test_bounded_pending_without_results(self):
+        result = self.build(
+            SlowPipeline(delay=0.01), max_workers=2, max_pending=2, keep_results=False
+        )
+
+        self.assertEqual(result["results"], [])
+        self.assertEqual(len(result["embeddings"]["embeddings"]), 12)
+        self.assertEqual(result["statistics"]["success_rate"], 1.0)
+
+    def test_process_executor(self):
+        result = self.build(
+            TextPipeline(), max_workers=2, executor="process", embeddings=False
+        )
+
+        self.assertEqual(
+            [r["output"]["text"] for r in result["results"]],
+            [Path(source).name for source in self.sources],
+        )
+
+    def test_checkpoint_skips_unchanged_sources(self):
+        checkpoint_dir = Path(self.tmp.name) / "checkpoints"
+        first = self.build(SlowPipeline(), max_workers=3, checkpoint_dir=checkpoint_dir)
+        self.assertEqual(first["statistics"]["sources_skipped"], 0)
+
+        Path(self.sources[4]).write_text("edited")
+        pipeline = SlowPipeline()
+        calls = []
+        execute = pipeline.execute
+        pipeline.execute = lambda source: calls.append(source) or execute(source)
+        second = self.build(pipeline, max_workers=3, checkpoint_dir=checkpoint_dir)
+
+        self.assertEqual(calls, [self.sources[4]])
+        self.assertEqual(second["statistics"]["sources_skipped"], 11)
+        self.assertEqual(second["statistics"]["sources_processed"], 12)
+        self.assertEqual(second["embeddings"], first["embeddings"])
+        self.assertEqual(
+            [r["output"] for r in second["results"]],
+            [r["output"] for r in first["results"]],
+        )
+
+    def test_checkpoint_invalidated_by_framework_config(self):
+        checkpoint_dir = Path(self.tmp.name) / "checkpoints"
+        self.build(SlowPipeline(), checkpoint_dir=checkpoint_dir)
+        self.framework.config.update({"embedding_model": {"name": "other-model"}})
+        result = self.build(SlowPipeline(), checkpoint_dir=checkpoint_dir)
+
+        self.assertEqual(result["statistics"]["sources_skipped"], 0)
+
+    def test_checkpoint_with_process_executor(self):
+        checkpoint_dir = Path(self.tmp.name) / "checkpoints"
+        self.build(TextPipeline(), max_workers=2, executor="process", checkpoint_dir=checkpoint_dir)
+        result = self.build(
+            TextPipeline(), max_workers=2, executor="process", checkpoint_dir=checkpoint_dir
+        )
+
+        self.assertEqual(result["statistics"]["sources_skipped"], 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
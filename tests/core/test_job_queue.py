@@ -0,0 +1,304 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from semantica.core.job_queue import JobStatus, SQLiteJobQueue, create_job_queue
+from semantica.utils.exceptions import ValidationError
+from semantica.worker import SemanticaWorker
+
+
+def echo_job(framework, payload):
+    return {"echo": payload["value"], "pid": os.getpid()}
+
+
+def failing_job(framework, payload):
+    raise ValueError("broken input")
+
+
+class TestSQLiteJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = SQLiteJobQueue(Path(self.tmp.name) / "jobs.db", retry_delay=0.0)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp.cleanup()
+
+    def test_claim_complete(self):
+        job_id = self.queue.enqueue("echo", {"value": 1})
+        job = self.queue.claim("w1")
+
+        self.assertEqual((job.id, job.payload, job.attempts), (job_id, {"value": 1}, 1))
+        self.assertIsNone(self.queue.claim("w2"))
+        self.assertFalse(self.queue.complete(job_id, "w2", "stolen"))
+        self.assertTrue(self.queue.complete(job_id, "w1", {"ok": True}))
+
+        stored = self.queue.get(job_id)
+        self.assertEqual(stored.status, JobStatus.SUCCEEDED)
+        self.assertEqual(stored.result, {"ok": True})
+
+    def test_concurrent_claims_are_exclusive(self):
+        for i in range(50):
+            self.queue.enqueue("echo", {"value": i})
+        claimed = []
+        lock = threading.Lock()
+
+        def claim_all(worker_id):
+            queue = SQLiteJobQueue(self.queue.path)
+            while True:
+                job = queue.claim(worker_id)
+                if job is None:
+                    break
+                with lock:
+                    claimed.append(job.id)
+            queue.close()
+
+        threads = [threading.Thread(target=claim_all, args=(f"w{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(claimed), 50)
+        self.assertEqual(len(set(claimed)), 50)
+
+    def test_retries_until_max_attempts(self):
+        job_id = self.queue.enqueue("echo", max_attempts=2)
+        job = self.queue.claim("w1")
+        self.queue.fail(job.id, "w1", "first")
+        self.assertEqual(self.queue.get(job_id).status, JobStatus.QUEUED)
+
+        job = self.queue.claim("w1")
+        self.assertEqual(job.attempts, 2)
+        self.queue.fail(job.id, "w1", "second")
+
+        stored = self.queue.get(job_id)
+        self.assertEqual(stored.status, JobStatus.FAILED)
+        self.assertEqual(stored.error, "second")
+
+    def test_expired_lease_is_reclaimed(self):
+        job_id = self.queue.enqueue("echo", max_attempts=2)
+        self.queue.claim("w1", visibility_timeout=0.05)
+        self.assertIsNone(self.queue.claim("w2"))
+        time.sleep(0.1)
+
+        job = self.queue.claim("w2", visibility_timeout=0.05)
+        self.assertEqual((job.id, job.attempts), (job_id, 2))
+        self.assertFalse(self.queue.complete(job_id, "w1"))
+
+        time.sleep(0.1)
+        self.assertIsNone(self.queue.claim("w3"))
+        self.assertEqual(self.queue.get(job_id).status, JobStatus.FAILED)
+
+    def test_max_running_per_kind(self):
+        queue = SQLiteJobQueue(self.queue.path, max_running={"build": 1})
+        queue.enqueue("build")
+        queue.enqueue("build")
+        queue.enqueue("echo")
+
+        self.assertEqual(queue.claim("w1").kind, "build")
+        self.assertEqual(queue.claim("w2").kind, "echo")
+        self.assertIsNone(queue.claim("w3"))
+        queue.close()
+
+    def test_cancel_only_queued(self):
+        first = self.queue.enqueue("echo")
+        second = self.queue.enqueue("echo")
+        self.queue.claim("w1")
+
+        self.assertFalse(self.queue.cancel(first))
+        self.assertTrue(self.queue.cancel(second))
+        self.assertIsNone(self.queue.claim("w1"))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValidationError):
+            create_job_queue("redis")
+
+
+class TestSemanticaWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = SQLiteJobQueue(Path(self.tmp.name) / "jobs.db", retry_delay=0.0)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp.cleanup()
+
+    def run_worker(self, worker, until):
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        deadline = time.time() + 20
+        while not until() and time.time() < deadline:
+            time.sleep(0.05)
+        worker.stop()
+        thread.join(timeout=20)
+        self.assertFalse(thread.is_alive())
+
+    def finished(self, job_ids):
+        return lambda: all(
+            self.queue.get(job_id).status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+            for job_id in job_ids
+        )
+
+    def test_process_workers_run_jobs(self):
+        job_ids = [self.queue.enqueue("echo", {"value": i}) for i in range(6)]
+        worker = SemanticaWorker(
+            queue=self.queue,
+            concurrency=2,
+            poll_interval=0.05,
+            handlers={"echo": echo_job},
+        )
+        self.run_worker(worker, self.finished(job_ids))
+
+        jobs = [self.queue.get(job_id) for job_id in job_ids]
+        self.assertEqual([job.status for job in jobs], [JobStatus.SUCCEEDED] * 6)
+        self.assertEqual([job.result["echo"] for job in jobs], list(range(6)))
+        self.assertNotIn(os.getpid(), {job.result["pid"] for job in jobs})
+
+    def test_failed_jobs_are_retried_then_failed(self):
+        job_id = self.queue.enqueue("bad", max_attempts=2)
+        unknown_id = self.queue.enqueue("missing")
+        worker = SemanticaWorker(
+            queue=self.queue,
+            executor="thread",
+            poll_interval=0.05,
+            handlers={"bad": failing_job},
+        )
+        self.run_worker(worker, self.finished([job_id, unknown_id]))
+
+        job = self.queue.get(job_id)
+        self.assertEqual((job.status, job.attempts), (JobStatus.FAILED, 2))
+        self.assertIn("broken input", job.error)
+        self.assertEqual(self.queue.get(unknown_id).attempts, 1)
+
+    def test_drain_finishes_running_jobs(self):
+        started = threading.Event()
+
+        def slow_job(framework, payload):
+            started.set()
+            time.sleep(0.3)
+            return "done"
+
+        job_id = self.queue.enqueue("slow")
+        queued_id = self.queue.enqueue("slow")
+        worker = SemanticaWorker(
+            queue=self.queue,
+            concurrency=1,
+            executor="thread",
+            poll_interval=0.05,
+            handlers={"slow": slow_job},
+        )
+        self.run_worker(worker, started.is_set)
+
+        self.assertEqual(self.queue.get(job_id).result, "done")
+        self.assertEqual(self.queue.get(queued_id).status, JobStatus.QUEUED)
+
+    def test_drain_timeout_returns_jobs_to_queue(self):
+        release = threading.Event()
+
+        def blocked_job(framework, payload):
+            release.wait(5)
+            return "late"
+
+        job_id = self.queue.enqueue("blocked")
+        worker = SemanticaWorker(
+            queue=self.queue,
+            executor="thread",
+            poll_interval=0.05,
+            drain_timeout=0.1,
+            handlers={"blocked": blocked_job},
+        )
+        self.run_worker(worker, lambda: self.queue.get(job_id).status == JobStatus.RUNNING)
+        release.set()
+
+        job = self.queue.get(job_id)
+        self.assertEqual((job.status, job.attempts), (JobStatus.QUEUED, 0))
+
+    def test_shutdown_without_cancel_futures(self):
+        release = threading.Event()
+        shutdowns = []
+
+        class LegacyPool(ThreadPoolExecutor):
+            # Executor.shutdown before Python 3.9 has no cancel_futures
+            def shutdown(self, wait=True):
+                shutdowns.append(wait)
+                super().shutdown(wait=wait)
+
+        def blocked_job(framework, payload):
+            release.wait(5)
+            return "late"
+
+        job_id = self.queue.enqueue("blocked")
+        worker = SemanticaWorker(
+            queue=self.queue,
+            executor="thread",
+            poll_interval=0.05,
+            drain_timeout=0.1,
+            handlers={"blocked": blocked_job},
+        )
+        worker._create_pool = lambda: LegacyPool(max_workers=1)
+        self.run_worker(worker, lambda: self.queue.get(job_id).status == JobStatus.RUNNING)
+        release.set()
+
+        self.assertEqual(shutdowns, [False])
+        self.assertEqual(self.queue.get(job_id).status, JobStatus.QUEUED)
+
+
+class TestJobEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            from fastapi.testclient import TestClient
+
+            from semantica import server
+        except ImportError as e:
+            self.skipTest(f"server dependencies unavailable: {e}")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.server = server
+        self.original_queue = server.job_queue
+        server.job_queue = SQLiteJobQueue(Path(self.tmp.name) / "jobs.db")
+        self.client = TestClient(server.app)
+
+    def tearDown(self):
+        self.server.job_queue.close()
+        self.server.job_queue = self.original_queue
+        self.tmp.cleanup()
+
+    def test_build_creates_job(self):
+        response = self.client.post("/build", json={"sources": ["a.txt"], "config": {"graph": False}})
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()["job_id"]
+
+        job = self.client.get(f"/jobs/{job_id}").json()
+        self.assertEqual(job["kind"], "build_knowledge_base")
+        self.assertEqual(job["status"], "queued")
+        self.assertEqual(job["payload"], {"sources": ["a.txt"], "options": {"graph": False}})
+
+    def test_job_result_and_cancel(self):
+        job_id = self.client.post("/jobs", json={"kind": "pipeline", "payload": {"data": 1}}).json()["job_id"]
+        queue = self.server.job_queue
+        job = queue.claim("w1")
+        queue.complete(job.id, "w1", {"output": 2})
+
+        body = self.client.get(f"/jobs/{job_id}").json()
+        self.assertEqual((body["status"], body["result"]), ("succeeded", {"output": 2}))
+        self.assertEqual(self.client.delete(f"/jobs/{job_id}").status_code, 409)
+
+        other = self.client.post("/jobs", json={"kind": "pipeline"}).json()["job_id"]
+        self.assertEqual(self.client.delete(f"/jobs/{other}").status_code, 200)
+        listed = self.client.get("/jobs", params={"status": "cancelled"}).json()["jobs"]
+        self.assertEqual([job["id"] for job in listed], [other])
+
+    def test_unknown_job(self):
+        self.assertEqual(self.client.get("/jobs/missing").status_code, 404)
+        self.assertEqual(self.client.get("/jobs", params={"status": "bogus"}).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
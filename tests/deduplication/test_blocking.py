@@ -0,0 +1,177 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from semantica.deduplication.blocking import (
+    CandidateIndex,
+    EmbeddingBlocker,
+    MinHashLSHBlocker,
+    PrefixBlocker,
+    SortedNeighborhoodBlocker,
+    create_blocker,
+)
+from semantica.deduplication.duplicate_detector import DuplicateDetector
+from semantica.deduplication.similarity_calculator import SimilarityCalculator
+from semantica.utils.exceptions import ValidationError
+
+
+def make_entities(n, seed=0):
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    return [
+        {"id": f"e{i}", "name": "".join(rng.choice(letters, size=8)) + " " + "".join(rng.choice(letters, size=6))}
+        for i in range(n)
+    ]
+
+
+class TestBlockers(unittest.TestCase):
+
+    def test_minhash_finds_near_duplicates(self):
+        blocker = MinHashLSHBlocker()
+        entities = make_entities(500)
+        blocker.add_many([(e["id"], e) for e in entities])
+
+        found = blocker.candidates({"name": entities[42]["name"] + "s"})
+        self.assertIn("e42", found)
+        self.assertLess(len(found), 20)
+        self.assertNotIn("e42", blocker.candidates(entities[42], key="e42"))
+
+    def test_minhash_acronyms_and_remove(self):
+        blocker = MinHashLSHBlocker()
+        blocker.add("ibm", {"name": "International Business Machines Corp."})
+        self.assertEqual(blocker.candidates({"name": "IBM"}), {"ibm"})
+        self.assertTrue(blocker.remove("ibm"))
+        self.assertEqual(blocker.candidates({"name": "IBM"}), set())
+        self.assertFalse(blocker.remove("ibm"))
+
+    def test_sorted_neighborhood_window_and_passes(self):
+        blocker = SortedNeighborhoodBlocker(window=1, passes=("name", "tokens"))
+        blocker.add_many(
+            [("a", {"name": "Apple Inc"}), ("b", {"name": "Banana"}), ("c", {"name": "Inc Apple"})]
+        )
+        # Token pass puts "Apple Inc" and "Inc Apple" next to each other
+        self.assertIn("c", blocker.candidates({"name": "Apple Inc"}, key="a"))
+        blocker.remove("c")
+        self.assertEqual(blocker.candidates({"name": "Apple Inc"}, key="a"), {"b"})
+
+        with self.assertRaises(ValidationError):
+            SortedNeighborhoodBlocker(passes=("phonetic",))
+
+    def test_embedding_blocker(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(50, 16)).astype(np.float32)
+        blocker = EmbeddingBlocker(k=3, min_similarity=0.9)
+        blocker.add_many([(f"v{i}", {"embedding": vectors[i]}) for i in range(50)])
+        blocker.add("plain", {"name": "no embedding"})
+
+        self.assertEqual(len(blocker), 50)
+        self.assertEqual(blocker.candidates({"embedding": vectors[7] * 2}), {"v7"})
+        self.assertEqual(blocker.candidates({"name": "x"}), set())
+
+        many = blocker.candidates_many([("v7", {}), ("plain", {})])
+        self.assertEqual(many, {"v7": set(), "plain": set()})
+
+    def test_create_blocker(self):
+        self.assertIsInstance(create_blocker("prefix"), PrefixBlocker)
+        blocker = create_blocker({"type": "sorted_neighborhood", "window": 2})
+        self.assertEqual(blocker.window, 2)
+        with self.assertRaises(ValidationError):
+            create_blocker("soundex")
+
+
+class TestCandidateIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.entities = make_entities(300)
+        self.index = CandidateIndex()
+        self.index.add_many(self.entities)
+
+    def test_candidate_pairs_are_unique_and_ordered(self):
+        pairs = self.index.candidate_pairs()
+        self.assertEqual(len(pairs), len(set(pairs)))
+        order = {e["id"]: i for i, e in enumerate(self.entities)}
+        for a, b in pairs:
+            self.assertLess(order[a], order[b])
+        self.assertLess(len(pairs), 300 * 299 // 2 // 5)
+
+    def test_sync_mirrors_entities(self):
+        changed = dict(self.entities[0], name="Completely Different")
+        keys = self.index.sync([changed] + self.entities[1:100] + [{"name": "no id"}])
+        self.assertEqual(len(self.index), 101)
+        self.assertNotIn("e150", self.index)
+        self.assertTrue(keys[-1].startswith("entity_"))
+        self.assertIs(self.index.get("e0"), changed)
+        self.assertIn("e0", self.index.candidates({"name": "Completely Different"}))
+
+    def test_save_and_load(self):
+        entities = [dict(e, embedding=[float(i), 1.0, 0.0]) for i, e in enumerate(self.entities[:20])]
+        index = CandidateIndex(blockers=["minhash", {"type": "embedding", "k": 2}])
+        index.add_many(entities)
+
+        with tempfile.TemporaryDirectory() as path:
+            index.save(path)
+            loaded = CandidateIndex.load(path)
+
+        self.assertEqual(loaded.keys(), index.keys())
+        self.assertEqual(loaded.get("e3")["embedding"], [3.0, 1.0, 0.0])
+        probe = {"name": entities[5]["name"], "embedding": [5.0, 1.0, 0.0]}
+        self.assertEqual(loaded.candidates(probe), index.candidates(probe))
+        self.assertEqual(loaded.candidate_pairs(), index.candidate_pairs())
+
+    def test_load_missing_directory(self):
+        with tempfile.TemporaryDirectory() as path:
+            with self.assertRaises(ValidationError):
+                CandidateIndex.load(path)
+
+
+class TestBlockedDetection(unittest.TestCase):
+
+    def test_batch_similarity_uses_blocking(self):
+        entities = [
+            {"id": "1", "name": "Apple Inc."},
+            {"id": "2", "name": "apple inc"},
+            {"id": "3", "name": "Zebra Apple Inc."},
+        ]
+        calculator = SimilarityCalculator()
+        pairs = calculator.batch_calculate_similarity(entities, threshold=0.5)
+        self.assertIn(("1", "2"), {(a["id"], b["id"]) for a, b, _ in pairs})
+
+        prefix_only = calculator.batch_calculate_similarity(
+            entities, threshold=0.0, blocking=["prefix"]
+        )
+        self.assertEqual({(a["id"], b["id"]) for a, b, _ in prefix_only}, {("1", "2")})
+
+    def test_incremental_detect_compares_candidates_only(self):
+        existing = make_entities(400)
+        new = [{"id": "n1", "name": existing[10]["name"] + "x"}]
+        detector = DuplicateDetector(similarity_threshold=0.8, confidence_threshold=0.5)
+
+        calls = []
+        original = detector.similarity_calculator.calculate_similarity
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        detector.similarity_calculator.calculate_similarity = counting
+        candidates = detector.incremental_detect(new, existing)
+
+        self.assertEqual([c.entity2["id"] for c in candidates], ["e10"])
+        self.assertLess(len(calls), 50)
+        self.assertIn("n1", detector.candidate_index)
+
+        # Without an explicit existing list, the persistent index is used
+        again = detector.incremental_detect([{"id": "n2", "name": new[0]["name"]}], update_index=False)
+        self.assertIn("n1", {c.entity2["id"] for c in again})
+        self.assertNotIn("n2", detector.candidate_index)
+
+    def test_empty_candidate_index_is_kept(self):
+        index = CandidateIndex(blockers=["prefix"])
+        detector = DuplicateDetector(candidate_index=index)
+        self.assertIs(detector.candidate_index, index)
+        self.assertEqual([type(b) for b in detector.candidate_index.blockers], [PrefixBlocker])
+
+
+if __name__ == "__main__":
+    unittest.main()
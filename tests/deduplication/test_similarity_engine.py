@@ -0,0 +1,110 @@
+import random
+import unittest
+
+import numpy as np
+
+from semantica.deduplication.similarity_calculator import SimilarityCalculator
+from semantica.deduplication.similarity_engine import (
+    BatchSimilarityEngine,
+    EncodedStrings,
+    string_similarity_matrix,
+    string_similarity_one_to_many,
+    string_similarity_pairs,
+)
+
+
+def random_strings(n, rng):
+    alphabet = "abcde fgAB.éü"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14))) for _ in range(n)]
+
+
+def random_entity(rng):
+    entity = {"name": rng.choice(["Apple Inc", "apple", "Apple Corp", "Banana", "banana co", ""])}
+    if rng.random() < 0.6:
+        entity["properties"] = {
+            key: rng.choice(["Tech", "tech co", 1, 1.0, None, ["x"], float("nan")])
+            for key in rng.sample(["a", "b", "c"], rng.randint(0, 3))
+        }
+    if rng.random() < 0.5:
+        entity["relationships"] = [
+            {"type": rng.choice("ab"), "target": rng.choice("xyz")} for _ in range(rng.randint(0, 2))
+        ]
+    if rng.random() < 0.3:
+        entity["embedding"] = [rng.random() for _ in range(4)]
+    return entity
+
+
+class TestStringKernels(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.left = random_strings(500, rng) + ["  ", "Apple", "MARTHA", "dixon"]
+        self.right = random_strings(500, rng) + ["abc", "apple inc.", "marhta", "dicksonx"]
+        self.calculator = SimilarityCalculator()
+
+    def test_pairs_match_per_pair_methods(self):
+        idx = np.arange(len(self.left))
+        left, right = EncodedStrings(self.left), EncodedStrings(self.right)
+        for method in ("levenshtein", "jaro_winkler", "cosine"):
+            expected = [
+                self.calculator.calculate_string_similarity(a, b, method=method)
+                for a, b in zip(self.left, self.right)
+            ]
+            scores = string_similarity_pairs(left, idx, right, idx, method)
+            np.testing.assert_array_equal(scores, expected, err_msg=method)
+
+    def test_one_to_many_and_matrix(self):
+        scores = self.calculator.calculate_string_similarity_batch("apple", self.right)
+        expected = [self.calculator.calculate_string_similarity("apple", s) for s in self.right]
+        np.testing.assert_array_equal(scores, expected)
+
+        matrix = string_similarity_matrix(["Apple", "Banana"], ["apple", "bananas", ""])
+        self.assertEqual(matrix.shape, (2, 3))
+        self.assertEqual(matrix[0, 0], 1.0)
+        self.assertEqual(matrix[1, 2], 0.0)
+        self.assertEqual(len(string_similarity_one_to_many("x", [])), 0)
+
+
+class TestBatchSimilarityEngine(unittest.TestCase):
+
+    def _check(self, calculator, seed):
+        rng = random.Random(seed)
+        entities = [random_entity(rng) for _ in range(200)]
+        li = np.array([rng.randrange(200) for _ in range(2000)])
+        ri = np.array([rng.randrange(200) for _ in range(2000)])
+        expected = np.array(
+            [calculator.calculate_similarity(entities[a], entities[b]).score for a, b in zip(li, ri)]
+        )
+
+        engine = BatchSimilarityEngine(calculator)
+        cache = engine.build_cache(entities)
+        np.testing.assert_allclose(engine.score_pairs(cache, li, cache, ri), expected, rtol=0, atol=1e-12)
+        # Separate caches map value IDs across caches
+        other = engine.build_cache(entities)
+        np.testing.assert_allclose(engine.score_pairs(cache, li, other, ri), expected, rtol=0, atol=1e-12)
+
+        # Pruning only zeroes pairs that cannot reach min_score
+        pruned = engine.score_pairs(cache, li, cache, ri, min_score=0.7)
+        keep = expected >= 0.7
+        np.testing.assert_allclose(pruned[keep], expected[keep], rtol=0, atol=1e-12)
+        self.assertTrue(np.all(pruned[~keep] < 0.7))
+
+    def test_matches_calculate_similarity(self):
+        self._check(SimilarityCalculator(), seed=1)
+
+    def test_matches_with_embedding_weight(self):
+        calculator = SimilarityCalculator(
+            string_weight=0.4, property_weight=0.2, relationship_weight=0.1, embedding_weight=0.3
+        )
+        self._check(calculator, seed=2)
+
+    def test_batch_calculate_similarity_threshold(self):
+        entities = [{"name": "Apple Inc."}, {"name": "apple inc"}, {"name": "Microsoft"}]
+        pairs = SimilarityCalculator().batch_calculate_similarity(
+            entities, threshold=0.85, blocking=["prefix"]
+        )
+        self.assertEqual([(a["name"], b["name"]) for a, b, _ in pairs], [("Apple Inc.", "apple inc")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from semantica.kg import CompactGraph
+from semantica.kg import centrality_engine as engine
+from semantica.kg.centrality_calculator import CentralityCalculator
+
+
+class TestCentralityEngine(unittest.TestCase):
+    def setUp(self):
+        self.graph = nx.gnm_random_graph(120, 260, seed=4)
+        self.graph.add_edge(3, 3)
+        self.graph.add_node(500)  # isolated
+        self.compact = CompactGraph.from_graph(self.graph)
+
+    def assertMatches(self, scores, expected):
+        for i, node in enumerate(self.compact.node_ids):
+            self.assertAlmostEqual(scores[i], expected[node], places=9)
+
+    def test_betweenness_matches_networkx(self):
+        self.assertMatches(
+            engine.betweenness_centrality(self.compact, batch_size=7),
+            nx.betweenness_centrality(self.graph),
+        )
+        self.assertMatches(
+            engine.betweenness_centrality(self.compact, normalized=False),
+            nx.betweenness_centrality(self.graph, normalized=False),
+        )
+
+    def test_sampled_betweenness(self):
+        sampled = engine.betweenness_centrality(self.compact, k=60, seed=1)
+        np.testing.assert_allclose(
+            sampled, engine.betweenness_centrality(self.compact, k=60, seed=1)
+        )
+        exact = engine.betweenness_centrality(self.compact)
+        self.assertGreater(np.corrcoef(sampled, exact)[0, 1], 0.9)
+        np.testing.assert_allclose(
+            engine.betweenness_centrality(self.compact, k=10_000), exact
+        )
+
+    def test_parallel_matches_serial(self):
+        np.testing.assert_allclose(
+            engine.betweenness_centrality(self.compact, n_jobs=2),
+            engine.betweenness_centrality(self.compact),
+        )
+        np.testing.assert_allclose(
+            engine.closeness_centrality(self.compact, n_jobs=2),
+            engine.closeness_centrality(self.compact),
+        )
+
+    def test_closeness_eigenvector_pagerank_match_networkx(self):
+        self.assertMatches(
+            engine.closeness_centrality(self.compact, batch_size=50),
+            nx.closeness_centrality(self.graph),
+        )
+        self.assertMatches(
+            engine.eigenvector_centrality(self.compact, max_iter=500),
+            nx.eigenvector_centrality(self.graph, max_iter=500),
+        )
+        self.assertMatches(engine.pagerank(self.compact), nx.pagerank(self.graph))
+
+    def test_empty_graph(self):
+        empty = CompactGraph.from_graph({})
+        for func in (
+            engine.betweenness_centrality,
+            engine.closeness_centrality,
+            engine.eigenvector_centrality,
+            engine.pagerank,
+        ):
+            self.assertEqual(len(func(empty)), 0)
+
+
+class TestCalculatorNativeBackend(unittest.TestCase):
+    def setUp(self):
+        self.graph = {
+            "relationships": [{"source": "A", "target": leaf} for leaf in "BCDE"]
+        }
+
+    def test_native_backend_matches_networkx_backend(self):
+        native = CentralityCalculator(backend="native")
+        networkx = CentralityCalculator(backend="networkx")
+        for measure in ("betweenness", "closeness", "eigenvector", "pagerank"):
+            result = native.calculate_all_centrality(self.graph, [measure])
+            expected = networkx.calculate_all_centrality(self.graph, [measure])
+            scores = result["centrality_measures"][measure]["centrality"]
+            for node, score in expected["centrality_measures"][measure]["centrality"].items():
+                self.assertAlmostEqual(scores[node], score, places=5)
+        self.assertEqual(
+            native.calculate_betweenness_centrality(self.graph)["rankings"][0]["node"], "A"
+        )
+
+    def test_large_graphs_are_sampled(self):
+        calculator = CentralityCalculator(
+            max_exact_betweenness_nodes=3, betweenness_k=2, seed=0
+        )
+        result = calculator.calculate_betweenness_centrality(self.graph)
+        self.assertTrue(result["approximate"])
+        self.assertEqual(result["pivots"], 2)
+        self.assertNotIn(
+            "approximate", CentralityCalculator().calculate_betweenness_centrality(self.graph)
+        )
+
+    def test_without_networkx(self):
+        calculator = CentralityCalculator()
+        calculator.use_networkx = False
+        result = calculator.calculate_closeness_centrality(self.graph)
+        self.assertAlmostEqual(result["centrality"]["A"], 1.0)
+        self.assertIn("pagerank", calculator.calculate_all_centrality(self.graph)["types_calculated"])
+
+
+if __name__ == "__main__":
+    unittest.main()
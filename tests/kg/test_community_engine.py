@@ -0,0 +1,104 @@
+import unittest
+
+import networkx as nx
+
+from semantica.kg import CompactGraph
+from semantica.kg import community_engine as engine
+from semantica.kg.community_detector import CommunityDetector
+
+
+def _planted(groups=6, size=15, seed=2):
+    return nx.planted_partition_graph(groups, size, 0.6, 0.01, seed=seed)
+
+
+class TestCommunityEngine(unittest.TestCase):
+    def setUp(self):
+        self.graph = _planted()
+        self.compact = CompactGraph.from_graph(self.graph)
+        self.planted = {node: node // 15 for node in self.graph}
+
+    def assertRecovers(self, labels):
+        found = {node: int(labels[i]) for i, node in enumerate(self.compact.node_ids)}
+        for group in range(6):
+            members = [n for n, g in self.planted.items() if g == group]
+            self.assertEqual(len({found[n] for n in members}), 1)
+        self.assertEqual(len(set(found.values())), 6)
+
+    def test_louvain_and_leiden_recover_planted_partition(self):
+        self.assertRecovers(engine.louvain(self.compact, seed=0))
+        self.assertRecovers(engine.leiden(self.compact, seed=0))
+
+    def test_modularity_matches_networkx(self):
+        graph = nx.karate_club_graph()
+        graph.add_edge(0, 0, weight=2.0)
+        compact = CompactGraph.from_graph(graph)
+        labels = engine.leiden(compact, seed=1)
+        communities = engine.labels_to_communities(compact, labels)
+        for resolution in (1.0, 0.5):
+            self.assertAlmostEqual(
+                engine.modularity(compact, labels, resolution),
+                nx.community.modularity(graph, communities, resolution=resolution),
+            )
+        reference = nx.community.louvain_communities(graph, seed=1)
+        self.assertGreater(
+            engine.modularity(compact, labels),
+            nx.community.modularity(graph, reference) - 0.02,
+        )
+
+    def test_leiden_communities_are_connected(self):
+        graph = nx.gnm_random_graph(300, 700, seed=5)
+        compact = CompactGraph.from_graph(graph)
+        for community in engine.labels_to_communities(compact, engine.leiden(compact, seed=3)):
+            self.assertTrue(nx.is_connected(graph.subgraph(community)))
+
+    def test_seeded_update_after_edit(self):
+        labels = engine.louvain(self.compact, seed=0)
+        previous = dict(zip(self.compact.node_ids, labels.tolist()))
+
+        edited = self.graph.copy()
+        edited.add_edges_from([(1000, 0), (1000, 1), (1000, 2)])
+        compact = CompactGraph.from_graph(edited)
+        for algorithm in (engine.louvain, engine.leiden):
+            updated = algorithm(compact, seed=0, initial_partition=previous)
+            index = compact.index
+            self.assertEqual(updated[index[1000]], updated[index[0]])
+            self.assertEqual(len(set(updated.tolist())), 6)
+
+    def test_graph_without_edges(self):
+        compact = CompactGraph.from_graph(nx.empty_graph(3))
+        self.assertEqual(engine.louvain(compact).tolist(), [0, 1, 2])
+        self.assertEqual(engine.modularity(compact, [0, 0, 0]), 0.0)
+
+
+class TestCommunityDetectorNative(unittest.TestCase):
+    def setUp(self):
+        graph = _planted(groups=3, size=8)
+        self.graph = {
+            "relationships": [{"source": f"n{u}", "target": f"n{v}"} for u, v in graph.edges()]
+        }
+
+    def test_native_backend_and_leiden(self):
+        detector = CommunityDetector(backend="native", seed=0)
+        louvain = detector.detect_communities(self.graph, algorithm="louvain")
+        leiden = detector.detect_communities(self.graph, algorithm="leiden")
+        for result in (louvain, leiden):
+            self.assertEqual(len(result["communities"]), 3)
+            self.assertEqual(
+                result["node_assignments"]["n0"], result["node_assignments"]["n7"]
+            )
+        self.assertEqual(leiden["algorithm"], "leiden")
+        metrics = detector.calculate_community_metrics(self.graph, leiden)
+        self.assertAlmostEqual(metrics["modularity"], leiden["modularity"])
+
+    def test_initial_partition_without_networkx(self):
+        detector = CommunityDetector(seed=0)
+        detector.use_networkx = False
+        first = detector.detect_communities_louvain(self.graph)
+        self.graph["relationships"].append({"source": "new", "target": "n0"})
+        updated = detector.detect_communities_louvain(self.graph, initial_partition=first)
+        assignments = updated["node_assignments"]
+        self.assertEqual(assignments["new"], assignments["n0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
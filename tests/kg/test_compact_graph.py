@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import patch
+
+import networkx as nx
+import numpy as np
+
+from semantica.kg import CompactGraph, GraphAnalyzer
+from semantica.kg.centrality_calculator import CentralityCalculator
+from semantica.kg.community_detector import CommunityDetector
+from semantica.kg.connectivity_analyzer import ConnectivityAnalyzer
+
+
+class TestCompactGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = {
+            "entities": [{"id": n} for n in "ABCDE"],
+            "relationships": [
+                {"source": "A", "target": "B", "type": "knows"},
+                {"source": "B", "target": "A", "type": "likes", "weight": 2.0},
+                {"subject": {"id": "B"}, "object": {"id": "C"}, "type": "knows"},
+                {"source": "C", "target": "C", "type": "self"},
+                {"source": "D", "target": "A", "type": "works_at"},
+            ],
+        }
+
+    def test_csr_structure(self):
+        compact = CompactGraph.from_graph(self.graph)
+        self.assertEqual(compact.node_ids, ["A", "B", "C", "D"])
+        self.assertEqual((compact.num_nodes, compact.num_edges), (4, 4))
+        self.assertEqual(compact.indptr.tolist(), [0, 2, 4, 6, 7])
+        self.assertEqual(compact.neighbor_ids("A"), ["B", "D"])
+        self.assertEqual(compact.neighbor_ids("missing"), [])
+        # A self-loop appears once in its row
+        self.assertEqual(compact.adjacency_lists()["C"], ["B", "C"])
+        self.assertEqual(compact.degrees.tolist(), [2, 2, 2, 1])
+        # Parallel A-B relationships merge with summed weights
+        self.assertEqual(compact.weighted_degrees.tolist(), [4.0, 4.0, 2.0, 1.0])
+        self.assertEqual(compact.edge_list.tolist(), [[0, 1], [0, 3], [1, 2], [2, 2]])
+
+    def test_isolated_entities(self):
+        compact = CompactGraph.from_graph(self.graph, include_isolated=True)
+        self.assertEqual(compact.node_ids[-1], "E")
+        self.assertEqual(compact.degrees[-1], 0)
+        self.assertNotIn("E", compact.adjacency_lists())
+        self.assertIs(CompactGraph.from_graph(compact), compact)
+
+    def test_relation_slice(self):
+        compact = CompactGraph.from_graph(self.graph)
+        knows = compact.relation_slice(["knows"])
+        self.assertIs(compact.relation_slice({"knows"}), knows)
+        self.assertEqual(knows.node_ids, compact.node_ids)
+        self.assertEqual(knows.adjacency_lists(), {"A": ["B"], "B": ["A", "C"], "C": ["B"]})
+        self.assertEqual(compact.relation_slice(["missing"]).num_edges, 0)
+
+    def test_networkx_round_trip(self):
+        compact = CompactGraph.from_graph(self.graph)
+        nx_graph = compact.to_networkx()
+        self.assertIs(compact.to_networkx(), nx_graph)
+        self.assertEqual(nx_graph.number_of_edges(), 4)
+        self.assertEqual(nx_graph["A"]["B"]["weight"], 3.0)
+
+        back = CompactGraph.from_graph(nx_graph)
+        self.assertEqual(back.adjacency_lists(), compact.adjacency_lists())
+
+    def test_matches_networkx_on_random_graph(self):
+        rng = np.random.default_rng(7)
+        edges = rng.integers(0, 60, size=(150, 2))
+        graph = {
+            "relationships": [
+                {"source": f"n{a}", "target": f"n{b}"} for a, b in edges.tolist()
+            ]
+        }
+        expected = nx.Graph()
+        expected.add_edges_from((f"n{a}", f"n{b}") for a, b in edges.tolist())
+
+        compact = CompactGraph.from_graph(graph)
+        self.assertEqual(compact.num_edges, expected.number_of_edges())
+        for node in expected:
+            self.assertEqual(set(compact.neighbor_ids(node)), set(expected[node]))
+
+
+class TestAnalyzersShareCompactGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = {
+            "entities": [{"id": n} for n in "ABCDEF"],
+            "relationships": [
+                {"source": "A", "target": "B"},
+                {"source": "B", "target": "C"},
+                {"source": "C", "target": "A"},
+                {"source": "D", "target": "E"},
+                {"source": "E", "target": "F"},
+            ],
+        }
+
+    def test_compact_input_gives_same_results(self):
+        compact = CompactGraph.from_graph(self.graph)
+        calculator = CentralityCalculator()
+        analyzer = ConnectivityAnalyzer()
+        self.assertEqual(
+            calculator.calculate_degree_centrality(compact)["centrality"],
+            calculator.calculate_degree_centrality(self.graph)["centrality"],
+        )
+        self.assertEqual(
+            analyzer.analyze_connectivity(compact), analyzer.analyze_connectivity(self.graph)
+        )
+        metrics = CommunityDetector().analyze_community_structure(
+            compact, [["A", "B", "C"], ["D", "E", "F"]]
+        )
+        self.assertEqual(
+            (metrics["intra_community_edges"], metrics["inter_community_edges"]), (10, 0)
+        )
+
+    def test_analyze_graph_converts_once(self):
+        with patch.object(
+            CompactGraph, "from_graph", wraps=CompactGraph.from_graph
+        ) as from_graph:
+            analysis = GraphAnalyzer().analyze_graph(self.graph)
+
+        built = [c for c in from_graph.call_args_list if c.args[0] is self.graph]
+        self.assertEqual(len(built), 1)
+        self.assertEqual(analysis["connectivity"]["num_components"], 2)
+        self.assertEqual(analysis["metrics"]["entity_count"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
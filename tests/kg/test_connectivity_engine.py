@@ -0,0 +1,139 @@
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from semantica.kg import CompactGraph
+from semantica.kg import connectivity_engine as engine
+from semantica.kg.connectivity_analyzer import ConnectivityAnalyzer
+
+
+class TestConnectivityEngine(unittest.TestCase):
+    def setUp(self):
+        self.graph = nx.gnm_random_graph(150, 160, seed=3)
+        self.graph.add_edge(5, 5)
+        self.graph.add_node(500)  # isolated
+        self.compact = CompactGraph.from_graph(self.graph)
+        self.ids = self.compact.node_ids
+
+    def test_components_match_networkx(self):
+        labels = engine.connected_components(self.compact)
+        found = {
+            frozenset(self.ids[i] for i in np.flatnonzero(labels == label))
+            for label in np.unique(labels)
+        }
+        self.assertEqual(
+            found, {frozenset(c) for c in nx.connected_components(self.graph)}
+        )
+        self.assertEqual(labels[0], 0)
+
+    def test_bridges_and_articulation_points_match_networkx(self):
+        bridges, cut_vertices = engine.bridges_and_articulation_points(self.compact)
+        self.assertEqual(
+            {frozenset((self.ids[u], self.ids[v])) for u, v in bridges.tolist()},
+            {frozenset(edge) for edge in nx.bridges(self.graph)},
+        )
+        self.assertEqual(
+            {self.ids[i] for i in cut_vertices.tolist()},
+            set(nx.articulation_points(self.graph)),
+        )
+
+    def test_shortest_path_tree(self):
+        tree = engine.shortest_path_tree(self.compact, self.compact.index[0])
+        expected = nx.single_source_shortest_path_length(self.graph, 0)
+        for node in self.graph:
+            self.assertEqual(tree.distance(node), expected.get(node, -1))
+            path = tree[node]
+            if node not in expected:
+                self.assertIsNone(path)
+                continue
+            self.assertEqual((path[0], path[-1], len(path) - 1), (0, node, expected[node]))
+            self.assertTrue(all(self.graph.has_edge(a, b) for a, b in zip(path, path[1:])))
+
+    def test_lazy_all_pairs(self):
+        paths = engine.AllPairsShortestPaths(self.compact, cache_size=2)
+        self.assertEqual(len(paths._trees), 0)
+        self.assertEqual(paths.distances[0][500], -1)
+        self.assertIsNone(paths[0][500])
+        self.assertEqual(paths.distance(0, 0), 0)
+        for source in (1, 2, 3):
+            paths.tree(source)
+        self.assertEqual(list(paths._trees), [self.compact.index[s] for s in (2, 3)])
+        with self.assertRaises(KeyError):
+            paths["missing"]
+
+    def test_exact_path_lengths(self):
+        lengths = [
+            d
+            for _, row in nx.all_pairs_shortest_path_length(self.graph)
+            for d in row.values()
+            if d > 0
+        ]
+        stats = engine.estimate_path_lengths(self.compact)
+        self.assertTrue(stats["exact"])
+        self.assertAlmostEqual(stats["avg_path_length"], np.mean(lengths))
+        self.assertEqual(stats["diameter_bounds"], (max(lengths), max(lengths)))
+
+    def test_sampled_path_lengths_bound_exact_values(self):
+        exact = engine.estimate_path_lengths(self.compact)
+        sampled = engine.estimate_path_lengths(self.compact, sample_size=40, seed=2)
+        self.assertFalse(sampled["exact"])
+        self.assertEqual(sampled["num_sources"], 40)
+        self.assertEqual(
+            sampled, engine.estimate_path_lengths(self.compact, sample_size=40, seed=2)
+        )
+        low, high = sampled["avg_path_length_ci"]
+        self.assertLess(low, high)
+        self.assertLess(abs(sampled["avg_path_length"] - exact["avg_path_length"]), 1.0)
+        low, high = sampled["diameter_bounds"]
+        self.assertLessEqual(low, exact["diameter"])
+        self.assertGreaterEqual(high, exact["diameter"])
+
+
+class TestConnectivityAnalyzerPaths(unittest.TestCase):
+    def setUp(self):
+        # Two triangles joined through C-D, plus a separate edge X-Y
+        self.graph = {
+            "relationships": [
+                {"source": a, "target": b}
+                for a, b in [
+                    ("A", "B"), ("B", "C"), ("C", "A"),
+                    ("C", "D"),
+                    ("D", "E"), ("E", "F"), ("F", "D"),
+                    ("X", "Y"),
+                ]
+            ]
+        }
+        self.analyzer = ConnectivityAnalyzer()
+
+    def test_bridges_and_articulation_points(self):
+        result = self.analyzer.identify_bridges(self.graph)
+        self.assertEqual(result["bridges"], [("C", "D"), ("X", "Y")])
+        self.assertEqual(result["articulation_points"], ["C", "D"])
+
+    def test_all_pairs_and_path_lengths(self):
+        result = self.analyzer.calculate_shortest_paths(self.graph)
+        self.assertEqual(result["paths"]["A"]["F"][0], "A")
+        self.assertEqual(result["distances"]["A"]["F"], 3)
+        self.assertEqual(result["distances"]["A"]["X"], -1)
+
+        connectivity = self.analyzer.analyze_connectivity(self.graph)
+        self.assertEqual(connectivity["num_components"], 2)
+        self.assertEqual(connectivity["diameter"], 3)
+        self.assertAlmostEqual(
+            connectivity["avg_path_length"], result["avg_path_length"]
+        )
+        self.assertNotIn(
+            "diameter", self.analyzer.analyze_connectivity(self.graph, path_lengths=False)
+        )
+
+    def test_sampling_above_exact_limit(self):
+        analyzer = ConnectivityAnalyzer(exact_path_limit=4, path_sample_size=3, seed=0)
+        stats = analyzer.estimate_path_lengths(self.graph)
+        self.assertFalse(stats["exact"])
+        self.assertEqual(stats["num_sources"], 3)
+        self.assertTrue(analyzer.estimate_path_lengths(self.graph, sample_size=100)["exact"])
+
+
+if __name__ == "__main__":
+    unittest.main()
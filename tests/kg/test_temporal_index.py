@@ -0,0 +1,255 @@
+import random
+import unittest
+from datetime import datetime, timezone
+
+from semantica.kg import TemporalIndex
+from semantica.kg.temporal_index import to_epoch
+from semantica.kg.temporal_query import TemporalGraphQuery, TemporalVersionManager
+from semantica.utils.exceptions import ValidationError
+
+
+def _linear_overlap(relationships, start, end):
+    """Reference scan with the string comparisons the index replaces."""
+    rows = []
+    for row, rel in enumerate(relationships):
+        valid_from, valid_until = rel.get("valid_from"), rel.get("valid_until")
+        if valid_from and end is not None and end < valid_from:
+            continue
+        if valid_until and start is not None and start > valid_until:
+            continue
+        rows.append(row)
+    return rows
+
+
+class TestTemporalIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        self.relationships = []
+        for _ in range(600):
+            year = rng.randint(2000, 2030)
+            rel = {
+                "source": f"e{rng.randint(0, 20)}",
+                "target": f"e{rng.randint(0, 20)}",
+                "type": rng.choice(["works_at", "knows", "owns"]),
+            }
+            if rng.random() < 0.8:
+                rel["valid_from"] = f"{year}-0{rng.randint(1, 9)}-01"
+            if rng.random() < 0.8:
+                rel["valid_until"] = f"{year + rng.randint(0, 4)}-0{rng.randint(1, 9)}-15"
+            self.relationships.append(rel)
+        # Unparseable times fall back to string comparison
+        self.relationships.append(
+            {"source": "e1", "target": "e2", "type": "knows", "valid_until": "later"}
+        )
+        self.graph = {"entities": [], "relationships": self.relationships}
+        self.index = TemporalIndex(self.relationships)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(9)
+        for _ in range(100):
+            year = rng.randint(1998, 2034)
+            start = f"{year}-0{rng.randint(1, 9)}-0{rng.randint(1, 9)}"
+            end = f"{year + rng.randint(-1, 3)}-0{rng.randint(1, 9)}-01"
+            self.assertEqual(
+                self.index.at(start).tolist(),
+                _linear_overlap(self.relationships, start, start),
+            )
+            self.assertEqual(
+                self.index.overlapping(start, end).tolist(),
+                _linear_overlap(self.relationships, start, end),
+            )
+            self.assertEqual(
+                self.index.overlapping(None, end).tolist(),
+                _linear_overlap(self.relationships, None, end),
+            )
+        self.assertEqual(len(self.index.unparsed), 1)
+
+    def test_type_and_entity_filters(self):
+        expected = [
+            row
+            for row in _linear_overlap(self.relationships, "2015-05-05", "2015-05-05")
+            if self.relationships[row]["type"] == "knows"
+            and "e3" in (self.relationships[row]["source"], self.relationships[row]["target"])
+        ]
+        self.assertEqual(
+            self.index.at("2015-05-05", relation_type="knows", entity="e3").tolist(),
+            expected,
+        )
+        self.assertEqual(self.index.at("2015-05-05", entity="missing").tolist(), [])
+
+    def test_time_formats(self):
+        epoch = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+        self.assertEqual(to_epoch("2024-01-01T00:00:00Z"), epoch)
+        self.assertEqual(to_epoch(datetime(2024, 1, 1)), epoch)
+        self.assertEqual(to_epoch(epoch), epoch)
+        self.assertIsNone(to_epoch(None))
+        self.assertEqual(
+            self.index.at(datetime(2015, 5, 5)).tolist(),
+            self.index.at("2015-05-05").tolist(),
+        )
+
+    def test_engine_cache_reuse_and_rebuild(self):
+        engine = TemporalGraphQuery()
+        first = engine.build_index(self.graph)
+        self.assertIs(engine.build_index(self.graph), first)
+        self.assertIsNot(TemporalGraphQuery().build_index(self.graph), first)
+        self.relationships.append({"source": "x", "target": "y"})
+        rebuilt = engine.build_index(self.graph)
+        self.assertIsNot(rebuilt, first)
+        self.assertEqual(len(rebuilt), len(self.relationships))
+        engine.clear_index_cache()
+        self.assertIsNot(engine.build_index(self.graph), rebuilt)
+
+        uncached = TemporalGraphQuery(cache_index=False)
+        self.assertIsNot(uncached.build_index(self.graph), uncached.build_index(self.graph))
+
+
+class TestIndexedTemporalQueries(unittest.TestCase):
+    def setUp(self):
+        self.graph = {
+            "entities": [{"id": "A"}, {"id": "B"}, {"id": "C"}],
+            "relationships": [
+                {"source": "A", "target": "B", "type": "works_at",
+                 "valid_from": "2020-01-01", "valid_until": "2022-12-31"},
+                {"source": "B", "target": "C", "type": "knows",
+                 "valid_from": "2021-06-01"},
+                {"source": "A", "target": "C", "type": "knows"},
+            ],
+        }
+        self.engine = TemporalGraphQuery()
+
+    def test_intersection_with_open_bounds(self):
+        result = self.engine.query_time_range(
+            self.graph, "", "2021-07-01", "2022-06-30", temporal_aggregation="intersection"
+        )
+        self.assertEqual(result["num_relationships"], 3)
+        result = self.engine.query_time_range(
+            self.graph, "", "2019-01-01", "2021-01-01", temporal_aggregation="intersection"
+        )
+        self.assertEqual(
+            [rel["target"] for rel in result["relationships"]], ["C"]
+        )
+
+    def test_in_place_edit_is_seen(self):
+        self.assertEqual(
+            self.engine.query_at_time(self.graph, "", "2024-06-01")["num_relationships"], 2
+        )
+        self.graph["relationships"][1]["valid_until"] = "2023-01-01"
+        self.assertEqual(
+            TemporalGraphQuery(cache_index=False)
+            .query_at_time(self.graph, "", "2024-06-01")["num_relationships"],
+            1,
+        )
+        self.engine.clear_index_cache()
+        self.assertEqual(
+            self.engine.query_at_time(self.graph, "", "2024-06-01")["num_relationships"], 1
+        )
+
+    def test_index_in_place_of_graph(self):
+        index = self.engine.build_index(self.graph)
+        result = self.engine.query_at_time(
+            index, "", "2021-01-01", relation_type="knows"
+        )
+        self.assertEqual(result["num_relationships"], 1)
+        self.assertEqual(result["num_entities"], 3)
+        evolution = self.engine.analyze_evolution(index, entity="C", end_time="2021-01-01")
+        self.assertEqual(evolution["count"], 1)
+        paths = self.engine.find_temporal_paths(index, "A", "C", start_time="2023-01-01")
+        self.assertEqual(paths["paths"][0]["path"], ["A", "C"])
+
+
+class TestDeltaVersions(unittest.TestCase):
+    def setUp(self):
+        self.manager = TemporalVersionManager()
+        self.v1 = self.manager.create_version(
+            {
+                "entities": [{"id": "A"}, {"id": "B"}],
+                "relationships": [{"source": "A", "target": "B", "type": "knows"}],
+            },
+            version_label="v1",
+        )
+        self.v2 = self.manager.create_version(
+            {
+                "entities": [{"id": "A", "name": "Alice"}, {"id": "C"}],
+                "relationships": [
+                    {"source": "A", "target": "B", "type": "knows"},
+                    {"source": "A", "target": "C", "type": "knows"},
+                ],
+            },
+            version_label="v2",
+        )
+
+    def test_stored_deltas(self):
+        self.assertEqual(
+            self.v2["changes"]["entities"], {"added": 1, "removed": 1, "modified": 1}
+        )
+        self.assertEqual(len(self.manager.history[1]["delta"]["relationships"]), 1)
+
+    def test_compare_composes_deltas(self):
+        comparison = self.manager.compare_versions(self.v1, self.v2)
+        self.assertEqual(comparison["entities_delta"]["added"], [{"id": "C"}])
+        self.assertEqual(comparison["entities_delta"]["removed"], [{"id": "B"}])
+        self.assertEqual(comparison["relationships_delta"]["modified"], [])
+        self.assertEqual(comparison["relationships_added"], 1)
+
+        backwards = self.manager.compare_versions(self.v2, self.v1)
+        self.assertEqual(backwards["entities_delta"]["added"], [{"id": "B"}])
+
+        # Snapshots the manager did not create are diffed item by item
+        foreign = dict(self.v1, sequence=None)
+        self.assertEqual(self.manager.compare_versions(foreign, self.v2), comparison)
+
+    def test_reconstruct_version(self):
+        snapshot = self.manager.reconstruct_version(0)
+        self.assertEqual(snapshot["entities"], self.v1["entities"])
+        self.assertEqual(snapshot["relationships"], self.v1["relationships"])
+
+    def test_in_place_edits_and_object_items(self):
+        class Node:
+            def __init__(self, name):
+                self.name = name
+
+        nodes = [Node("a"), Node("b")]
+        graph = {"entities": [{"id": "A", "age": 1}], "relationships": nodes}
+        manager = TemporalVersionManager()
+        first = manager.create_version(graph, version_label="first")
+        graph["entities"][0]["age"] = 2
+        second = manager.create_version(graph, version_label="second")
+        # Objects without a stable repr are not reported as modified
+        self.assertEqual(
+            second["changes"]["relationships"], {"added": 0, "removed": 0, "modified": 0}
+        )
+        self.assertEqual(second["changes"]["entities"]["modified"], 1)
+        nodes[0].name = "c"
+        third = manager.create_version(graph, version_label="third")
+        self.assertEqual(third["changes"]["relationships"]["modified"], 1)
+        # History keeps item content as of each version
+        self.assertEqual(manager.reconstruct_version(0)["entities"], [{"id": "A", "age": 1}])
+        self.assertEqual(
+            manager.compare_versions(first, second)["entities_delta"]["modified"],
+            [{"id": "A", "age": 2}],
+        )
+
+    def test_max_versions(self):
+        manager = TemporalVersionManager(max_versions=2)
+        versions = [
+            manager.create_version(
+                {"entities": [{"id": str(i)} for i in range(n)], "relationships": []},
+                version_label=f"v{n}",
+            )
+            for n in range(1, 5)
+        ]
+        self.assertEqual(len(manager.history), 2)
+        self.assertEqual([v["sequence"] for v in versions], [0, 1, 2, 3])
+        self.assertEqual(len(manager.reconstruct_version(2)["entities"]), 3)
+        with self.assertRaises(ValidationError):
+            manager.reconstruct_version(1)
+        comparison = manager.compare_versions(versions[2], versions[3])
+        self.assertEqual(comparison["entities_delta"]["added"], [{"id": "3"}])
+        # Dropped versions are still compared item by item
+        comparison = manager.compare_versions(versions[0], versions[3])
+        self.assertEqual(len(comparison["entities_delta"]["added"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
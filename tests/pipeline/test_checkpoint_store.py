@@ -0,0 +1,142 @@
+import pickle
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from semantica.pipeline.checkpoint_store import (
+    CheckpointStore,
+    hash_config,
+    hash_content,
+)
+from semantica.pipeline.execution_engine import ExecutionEngine
+from semantica.pipeline.pipeline_builder import PipelineBuilder, StepStatus
+
+
+def add_one(data, **kwargs):
+    return data + 1
+
+
+class TestCheckpointStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(self.tmp.name)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_step_outputs_round_trip(self):
+        self.store.save_step("run", "a", {"x": [1, 2]})
+        self.store.save_step("run", "b", 3)
+        self.assertEqual(self.store.load_steps("run"), {"a": {"x": [1, 2]}, "b": 3})
+
+        self.store.clear_run("run")
+        self.assertEqual(self.store.load_steps("run"), {})
+
+    def test_unpicklable_output_is_skipped(self):
+        self.assertFalse(self.store.save_step("run", "lock", threading.Lock()))
+        self.assertEqual(self.store.load_steps("run"), {})
+
+    def test_source_result_invalidated_by_content(self):
+        path = Path(self.tmp.name) / "doc.txt"
+        path.write_text("v1")
+        content_hash = hash_content(path)
+        self.store.put_source(path, "cfg", content_hash, {"text": "v1"})
+
+        self.assertEqual(self.store.get_source(path, "cfg"), {"text": "v1"})
+        self.assertIsNone(self.store.get_source(path, "other"))
+        path.write_text("v2")
+        self.assertIsNone(self.store.get_source(path, "cfg"))
+
+    def test_store_is_picklable(self):
+        self.store.save_step("run", "a", 1)
+        clone = pickle.loads(pickle.dumps(self.store))
+        self.assertEqual(clone.load_steps("run"), {"a": 1})
+        clone.close()
+
+    def test_hash_config_is_stable(self):
+        self.assertEqual(hash_config({"a": 1, "b": [2]}), hash_config({"b": [2], "a": 1}))
+        self.assertNotEqual(hash_config({"a": 1}), hash_config({"a": 2}))
+
+        def build(version):
+            builder = PipelineBuilder()
+            builder.add_step("inc", "op", handler=add_one, version=version)
+            return builder.build("p")
+
+        self.assertEqual(hash_config(build(1)), hash_config(build(1)))
+        self.assertNotEqual(hash_config(build(1)), hash_config(build(2)))
+
+    def test_hash_config_rejects_unstable_values(self):
+        with self.assertRaises(TypeError):
+            hash_config({"model": object()})
+        self.assertEqual(
+            hash_config({"handler": add_one, "path": Path("a")}),
+            hash_config({"handler": add_one, "path": Path("a")}),
+        )
+
+
+class TestResumableExecution(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.calls = []
+        self.crash = True
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self):
+        def step(name, value):
+            def run(data, **kwargs):
+                self.calls.append(name)
+                if name == "c" and self.crash:
+                    raise ValueError("crash")
+                return value
+
+            return run
+
+        builder = PipelineBuilder()
+        builder.add_step("a", "op", handler=step("a", 1))
+        builder.add_step("b", "op", handler=step("b", 2), dependencies=["a"])
+        builder.add_step("c", "op", handler=step("c", 3), dependencies=["b"])
+        return builder.build("resume")
+
+    def test_resumes_at_first_unfinished_step(self):
+        engine = ExecutionEngine(checkpoint_dir=self.tmp.name)
+        pipeline = self.build()
+
+        result = engine.execute_pipeline(pipeline, data="input")
+        self.assertFalse(result.success)
+        self.assertEqual(self.calls[:3], ["a", "b", "c"])
+
+        self.crash = False
+        self.calls.clear()
+        result = engine.execute_pipeline(pipeline, data="input")
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.output, 3)
+        self.assertEqual(self.calls, ["c"])
+        self.assertEqual(result.metrics["steps_restored"], 2)
+        self.assertTrue(all(s.status == StepStatus.COMPLETED for s in pipeline.steps))
+
+        # A successful run clears its checkpoints
+        self.calls.clear()
+        engine.execute_pipeline(pipeline, data="input")
+        self.assertEqual(self.calls, ["a", "b", "c"])
+
+    def test_different_input_does_not_resume(self):
+        engine = ExecutionEngine(checkpoint_dir=self.tmp.name)
+        engine.execute_pipeline(self.build(), data="input")
+
+        self.calls.clear()
+        self.crash = False
+        result = engine.execute_pipeline(self.build(), data="other")
+
+        self.assertEqual(self.calls, ["a", "b", "c"])
+        self.assertEqual(result.metrics["steps_restored"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
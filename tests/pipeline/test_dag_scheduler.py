@@ -0,0 +1,194 @@
+import threading
+import time
+import unittest
+
+from semantica.pipeline.execution_engine import ExecutionEngine, PipelineStatus
+from semantica.pipeline.failure_handler import RetryPolicy, RetryStrategy
+from semantica.pipeline.pipeline_builder import PipelineBuilder, StepStatus
+
+
+def square(data, **kwargs):
+    return data * data
+
+
+class ConcurrencyProbe:
+    """Records how many handlers run at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def handler(self, value, delay=0.2):
+        def run(data, **kwargs):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(delay)
+            with self.lock:
+                self.active -= 1
+            return value
+
+        return run
+
+
+class TestDAGScheduler(unittest.TestCase):
+
+    def test_independent_branches_run_concurrently(self):
+        probe = ConcurrencyProbe()
+        builder = PipelineBuilder()
+        builder.add_step("load", "io", handler=lambda data, **kw: data + 1)
+        builder.add_step("left", "io", handler=probe.handler("L"), dependencies=["load"])
+        builder.add_step("right", "io", handler=probe.handler("R"), dependencies=["load"])
+        builder.add_step(
+            "merge",
+            "io",
+            handler=lambda data, **kw: data,
+            dependencies=["left", "right"],
+        )
+
+        start = time.time()
+        result = ExecutionEngine().execute_pipeline(builder.build("diamond"), data=1)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.output, {"left": "L", "right": "R"})
+        self.assertEqual(probe.peak, 2)
+        self.assertLess(time.time() - start, 0.39)
+
+    def test_steps_receive_parent_outputs(self):
+        seen = {}
+
+        def record(name, value):
+            def run(data, **kwargs):
+                seen[name] = data
+                return value
+
+            return run
+
+        builder = PipelineBuilder()
+        builder.add_step("a", "op", handler=record("a", 1))
+        builder.add_step("b", "op", handler=record("b", 2))
+        builder.add_step("c", "op", handler=record("c", 3), dependencies=["a"])
+        pipeline = builder.build("inputs")
+        pipeline.steps[1].dependencies.append("a")
+
+        result = ExecutionEngine().execute_pipeline(pipeline, data="input")
+
+        self.assertEqual(seen, {"a": "input", "b": 1, "c": 1})
+        # Two sinks: outputs keyed by step name
+        self.assertEqual(result.output, {"b": 2, "c": 3})
+
+    def test_cpu_slots_limit_concurrency(self):
+        probe = ConcurrencyProbe()
+        builder = PipelineBuilder()
+        for name in ("a", "b", "c"):
+            builder.add_step(
+                name, "cpu", handler=probe.handler(name, delay=0.05), cpu_cores=2
+            )
+        builder.add_step(
+            "end", "cpu", handler=lambda d, **kw: d, dependencies=["a", "b", "c"]
+        )
+
+        engine = ExecutionEngine()
+        cpu = engine.resource_scheduler.resources["cpu"]
+        # One core goes to the pipeline itself, leaving room for one step
+        cpu.capacity = cpu.allocated + 3.0
+        result = engine.execute_pipeline(builder.build("slots"), data=None)
+
+        self.assertTrue(result.success)
+        self.assertEqual(probe.peak, 1)
+        self.assertEqual(engine.resource_scheduler.resources["cpu"].allocated, 0.0)
+
+    def test_oversized_request_does_not_stall(self):
+        builder = PipelineBuilder()
+        builder.add_step("big", "op", handler=lambda d, **kw: "ok", cpu_cores=10**6)
+
+        result = ExecutionEngine().execute_pipeline(builder.build("big"), data=None)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.output, "ok")
+
+    def test_process_executor(self):
+        builder = PipelineBuilder()
+        builder.add_step("sq", "compute", handler=square)
+        builder.add_step("sq2", "compute", handler=square, dependencies=["sq"])
+
+        engine = ExecutionEngine(step_executors={"compute": "process"}, max_workers=2)
+        result = engine.execute_pipeline(builder.build("proc"), data=3)
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.output, 81)
+
+    def test_stop_skips_remaining_steps(self):
+        engine = ExecutionEngine()
+
+        def stop(data, **kwargs):
+            engine.stop_pipeline("stopped")
+            return "first"
+
+        builder = PipelineBuilder()
+        builder.add_step("first", "op", handler=stop)
+        builder.add_step("second", "op", handler=lambda d, **kw: "second")
+        pipeline = builder.build("stopped")
+
+        result = engine.execute_pipeline(pipeline, data=None)
+
+        self.assertEqual(result.output, "first")
+        self.assertEqual(pipeline.steps[1].status, StepStatus.PENDING)
+
+    def test_pause_holds_dispatch_until_resume(self):
+        engine = ExecutionEngine()
+        resumed_at = []
+
+        def pause(data, **kwargs):
+            engine.pause_pipeline("paused")
+
+            def resume():
+                resumed_at.append(time.time())
+                engine.resume_pipeline("paused")
+
+            threading.Timer(0.3, resume).start()
+            return data
+
+        started_at = []
+        builder = PipelineBuilder()
+        builder.add_step("first", "op", handler=pause)
+        builder.add_step(
+            "second", "op", handler=lambda d, **kw: started_at.append(time.time()) or d
+        )
+
+        result = engine.execute_pipeline(builder.build("paused"), data=7)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.output, 7)
+        self.assertGreaterEqual(started_at[0], resumed_at[0])
+        self.assertEqual(engine.get_pipeline_status("paused"), PipelineStatus.COMPLETED)
+
+    def test_retries_stop_at_max_retries(self):
+        calls = []
+
+        def fail(data, **kwargs):
+            calls.append(1)
+            raise ValueError("always")
+
+        builder = PipelineBuilder()
+        builder.add_step("flaky", "flaky_type", handler=fail)
+        builder.add_step("after", "op", handler=lambda d, **kw: d, dependencies=["flaky"])
+        pipeline = builder.build("exhausted")
+
+        engine = ExecutionEngine()
+        engine.failure_handler.set_retry_policy(
+            "flaky_type",
+            RetryPolicy(max_retries=2, strategy=RetryStrategy.FIXED, initial_delay=0.01),
+        )
+        result = engine.execute_pipeline(pipeline, data=None)
+
+        self.assertFalse(result.success)
+        self.assertIn("always", result.errors[0])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(pipeline.steps[0].status, StepStatus.FAILED)
+        self.assertEqual(pipeline.steps[1].status, StepStatus.PENDING)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+import random
+import threading
+import time
+import unittest
+
+from semantica.pipeline.execution_engine import ExecutionEngine
+from semantica.pipeline.failure_handler import RetryPolicy, RetryStrategy
+from semantica.pipeline.parallelism_manager import (
+    ChunkStream,
+    ParallelismManager,
+    Task,
+)
+from semantica.pipeline.pipeline_builder import PipelineBuilder, StepStatus
+
+
+def double_chunk(chunk, **kwargs):
+    return [x * 2 for x in chunk]
+
+
+class TestMapChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ParallelismManager(max_workers=4)
+
+    def tearDown(self):
+        self.manager.shutdown()
+
+    def test_results_in_input_order(self):
+        rng = random.Random(0)
+        delays = [rng.random() * 0.01 for _ in range(40)]
+
+        def slow_double(chunk):
+            time.sleep(delays[chunk[0] % 40])
+            return [x * 2 for x in chunk]
+
+        results = []
+        for chunk_result in self.manager.map_chunks(slow_double, range(400), chunk_size=7):
+            results.extend(chunk_result)
+        self.assertEqual(results, [x * 2 for x in range(400)])
+
+    def test_in_flight_chunks_are_bounded(self):
+        pulled = []
+
+        def source():
+            for i in range(10**6):
+                pulled.append(i)
+                yield i
+
+        results = self.manager.map_chunks(
+            double_chunk, source(), chunk_size=10, max_in_flight=3
+        )
+        self.assertEqual(next(results), list(range(0, 20, 2)))
+        time.sleep(0.05)
+        self.assertLessEqual(len(pulled), 40)
+        results.close()
+
+    def test_should_continue_stops_submission(self):
+        calls = []
+
+        def record(chunk):
+            calls.append(chunk)
+            return chunk
+
+        results = list(
+            self.manager.map_chunks(
+                record, range(100), chunk_size=10, max_in_flight=1,
+                should_continue=lambda: len(calls) < 3,
+            )
+        )
+        self.assertEqual(len(results), 3)
+
+    def test_pool_is_reused(self):
+        executor = self.manager.get_executor()
+        self.manager.execute_parallel([Task("t", lambda: 1)])
+        self.assertIs(self.manager.get_executor(), executor)
+
+    def test_process_pool(self):
+        results = list(
+            self.manager.map_chunks(double_chunk, range(50), chunk_size=8, use_processes=True)
+        )
+        self.assertEqual(sum(results, []), [x * 2 for x in range(50)])
+
+    def test_chunk_stream(self):
+        stream = ChunkStream()
+        stream.put([1, 2])
+        stream.put([3])
+        stream.close()
+        self.assertEqual(list(stream), [1, 2, 3])
+
+        failed = ChunkStream()
+        failed.put([1])
+        failed.abort(ValueError("boom"))
+        with self.assertRaises(Exception):
+            list(failed)
+
+
+class TestMapSteps(unittest.TestCase):
+
+    def test_map_over_key(self):
+        builder = PipelineBuilder()
+        builder.add_step(
+            "tag", "ner", handler=lambda chunk, **kw: [d.upper() for d in chunk],
+            map_over="documents", chunk_size=3,
+        )
+        engine = ExecutionEngine()
+        documents = [f"doc{i}" for i in range(10)]
+        result = engine.execute_pipeline(builder.build("map"), data={"documents": documents})
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.output, [d.upper() for d in documents])
+
+    def test_map_over_process_executor(self):
+        builder = PipelineBuilder()
+        builder.add_step("double", "embedding", handler=double_chunk, map_over=True, chunk_size=4)
+        engine = ExecutionEngine(step_executors={"embedding": "process"}, max_workers=2)
+        result = engine.execute_pipeline(builder.build("proc_map"), data=list(range(25)))
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.output, [x * 2 for x in range(25)])
+
+    def test_results_stream_to_next_map_step(self):
+        produced = []
+        consumed = []
+
+        def produce(chunk, **kwargs):
+            time.sleep(0.05)
+            produced.append(time.time())
+            return chunk
+
+        def consume(chunk, **kwargs):
+            consumed.append(time.time())
+            return [x + 1 for x in chunk]
+
+        builder = PipelineBuilder()
+        builder.add_step(
+            "produce", "op", handler=produce, map_over=True, chunk_size=2, max_in_flight=1
+        )
+        builder.add_step(
+            "consume", "op", handler=consume, map_over=True, chunk_size=2, dependencies=["produce"]
+        )
+        result = ExecutionEngine().execute_pipeline(builder.build("stream"), data=list(range(10)))
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.output, list(range(1, 11)))
+        # The consumer started before the producer's last chunk was done
+        self.assertLess(consumed[0], produced[-1])
+
+    def test_streamed_consumer_reruns_after_upstream_retry(self):
+        attempts = []
+        lock = threading.Lock()
+
+        def flaky(chunk, **kwargs):
+            with lock:
+                if chunk[0] == 4 and not attempts:
+                    attempts.append(1)
+                    raise ValueError("transient")
+            return chunk
+
+        builder = PipelineBuilder()
+        builder.add_step("produce", "flaky", handler=flaky, map_over=True, chunk_size=2)
+        builder.add_step(
+            "consume", "op", handler=double_chunk, map_over=True, dependencies=["produce"]
+        )
+        pipeline = builder.build("stream_retry")
+
+        engine = ExecutionEngine()
+        engine.failure_handler.set_retry_policy(
+            "flaky", RetryPolicy(max_retries=1, strategy=RetryStrategy.FIXED, initial_delay=0.01)
+        )
+        result = engine.execute_pipeline(pipeline, data=list(range(8)))
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.output, [x * 2 for x in range(8)])
+        self.assertTrue(all(step.status == StepStatus.COMPLETED for step in pipeline.steps))
+
+    def test_slow_streamed_consumer_requeued_after_upstream_retry(self):
+        attempts = []
+        consumed = []
+        lock = threading.Lock()
+
+        def flaky(chunk, **kwargs):
+            with lock:
+                if chunk[0] == 2 and not attempts:
+                    attempts.append(1)
+                    raise ValueError("transient")
+            return chunk
+
+        def slow_double(chunk, **kwargs):
+            with lock:
+                consumed.append(chunk)
+                first = len(consumed) == 1
+            if first:
+                # Still busy when the retried producer completes
+                time.sleep(0.3)
+            return [x * 2 for x in chunk]
+
+        builder = PipelineBuilder()
+        builder.add_step(
+            "produce", "flaky", handler=flaky, map_over=True, chunk_size=2, max_in_flight=1
+        )
+        builder.add_step(
+            "consume", "op", handler=slow_double, map_over=True, chunk_size=2,
+            max_in_flight=1, dependencies=["produce"],
+        )
+        pipeline = builder.build("stream_retry_race")
+
+        engine = ExecutionEngine()
+        engine.failure_handler.set_retry_policy(
+            "flaky", RetryPolicy(max_retries=1, strategy=RetryStrategy.FIXED, initial_delay=0.01)
+        )
+        result = engine.execute_pipeline(pipeline, data=list(range(8)))
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.output, [x * 2 for x in range(8)])
+        self.assertTrue(all(step.status == StepStatus.COMPLETED for step in pipeline.steps))
+
+    def test_stop_interrupts_map_step(self):
+        engine = ExecutionEngine()
+        seen = []
+
+        def work(chunk, **kwargs):
+            seen.append(chunk)
+            if len(seen) == 2:
+                engine.stop_pipeline("stop_map")
+            return chunk
+
+        builder = PipelineBuilder()
+        builder.add_step("work", "op", handler=work, map_over=True, chunk_size=1, max_in_flight=1)
+        pipeline = builder.build("stop_map")
+        engine.execute_pipeline(pipeline, data=list(range(100)))
+
+        self.assertLess(len(seen), 10)
+        self.assertEqual(pipeline.steps[0].status, StepStatus.FAILED)
+
+
+if __name__ == "__main__":
+    unittest.main()
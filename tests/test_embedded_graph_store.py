@@ -0,0 +1,146 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from semantica.graph_store import EmbeddedGraphStore, GraphStore
+from semantica.utils.exceptions import ProcessingError
+
+
+class TestEmbeddedGraphStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = EmbeddedGraphStore()
+        self.store.progress_tracker.enabled = False
+        people = self.store.create_nodes(
+            [
+                {"labels": ["Person"], "properties": {"id": "alice", "age": 30}},
+                {"labels": ["Person"], "properties": {"id": "bob", "age": 25}},
+                {"labels": ["Person"], "properties": {"id": "carol", "age": 30}},
+                {"labels": ["City"], "properties": {"id": "paris"}},
+                {"labels": ["City"], "properties": {"id": "oslo"}},
+            ]
+        )
+        self.ids = {n["properties"]["id"]: n["id"] for n in people}
+        self.store.create_relationships(
+            [
+                {"start_id": "alice", "end_id": "bob", "type": "KNOWS"},
+                {"start_id": "bob", "end_id": "carol", "type": "KNOWS"},
+                {"start_id": "carol", "end_id": "paris", "type": "LIVES_IN"},
+                {"start_id": "alice", "end_id": "paris", "type": "VISITED"},
+            ],
+            match_on="id",
+        )
+
+    def test_nodes_and_indexes(self):
+        self.assertEqual(self.ids, {"alice": 0, "bob": 1, "carol": 2, "paris": 3, "oslo": 4})
+        found = self.store.get_nodes(labels=["Person"], properties={"age": 30})
+        self.assertEqual([n["id"] for n in found], [0, 2])
+
+        self.store.create_index("Person", "age")
+        self.store.update_node(self.ids["bob"], {"age": 30})
+        found = self.store.get_nodes(properties={"age": 30})
+        self.assertEqual([n["id"] for n in found], [0, 1, 2])
+
+        merged = self.store.create_nodes(
+            [{"labels": ["City"], "properties": {"id": "oslo", "country": "NO"}}], merge=True
+        )
+        self.assertEqual(merged[0]["id"], self.ids["oslo"])
+        self.assertEqual(self.store.get_stats()["node_count"], 5)
+
+    def test_relationships_by_type_and_direction(self):
+        alice = self.ids["alice"]
+        out = self.store.get_relationships(alice, direction="out")
+        self.assertEqual(sorted(r["type"] for r in out), ["KNOWS", "VISITED"])
+        self.assertEqual(self.store.get_relationships(alice, direction="in"), [])
+        knows = self.store.get_relationships(rel_type="KNOWS")
+        self.assertEqual([(r["start_node_id"], r["end_node_id"]) for r in knows], [(0, 1), (1, 2)])
+
+        rel = self.store.create_relationship(alice, self.ids["bob"], "KNOWS", {"since": 2020}, merge=True)
+        self.assertEqual((rel["id"], rel["properties"]), (0, {"since": 2020}))
+
+    def test_neighbors_and_shortest_path(self):
+        alice = self.ids["alice"]
+        neighbors = self.store.get_neighbors(alice, rel_type="KNOWS", direction="out", depth=2)
+        self.assertEqual([n["properties"]["id"] for n in neighbors], ["bob", "carol"])
+
+        path = self.store.shortest_path(self.ids["bob"], self.ids["paris"])
+        self.assertEqual(path["length"], 2)
+        self.assertEqual([n["id"] for n in path["nodes"]][::2], [self.ids["bob"], self.ids["paris"]])
+        self.assertIsNone(self.store.shortest_path(alice, self.ids["oslo"]))
+        self.assertIsNone(self.store.shortest_path(alice, self.ids["paris"], rel_type="KNOWS"))
+
+    def test_analytics(self):
+        degrees = self.store.degree_centrality(labels=["Person"])
+        self.assertEqual([(n["id"], n["degree"]) for n in degrees], [(0, 2), (1, 2), (2, 2)])
+        out_degrees = self.store.degree_centrality(direction="out", rel_type="KNOWS")
+        self.assertEqual(out_degrees[0]["degree"], 1)
+
+        components = self.store.connected_components()
+        self.assertEqual([c["nodes"] for c in components], [[0, 1, 2, 3], [4]])
+        people = self.store.connected_components(labels=["Person"], rel_type="KNOWS")
+        self.assertEqual([c["nodes"] for c in people], [[0, 1, 2]])
+
+    def test_delete(self):
+        with self.assertRaises(ProcessingError):
+            self.store.delete_node(self.ids["bob"], detach=False)
+        self.assertTrue(self.store.delete_node(self.ids["bob"]))
+        self.assertIsNone(self.store.get_node(self.ids["bob"]))
+        stats = self.store.get_stats()
+        self.assertEqual((stats["node_count"], stats["relationship_count"]), (4, 2))
+        self.assertEqual([c["nodes"] for c in self.store.connected_components()], [[0, 2, 3], [4]])
+
+    def test_components_match_networkx(self):
+        import networkx as nx
+
+        rng = np.random.default_rng(3)
+        store = EmbeddedGraphStore()
+        store.progress_tracker.enabled = False
+        store.create_nodes([{"labels": ["N"], "properties": {}} for _ in range(300)])
+        edges = rng.integers(0, 300, size=(250, 2))
+        store.create_relationships(
+            [{"start_node_id": int(a), "end_node_id": int(b), "type": "E"} for a, b in edges]
+        )
+        graph = nx.Graph()
+        graph.add_nodes_from(range(300))
+        graph.add_edges_from(edges.tolist())
+
+        expected = sorted(sorted(c) for c in nx.connected_components(graph))
+        actual = sorted(c["nodes"] for c in store.connected_components())
+        self.assertEqual(actual, expected)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.store.create_index("Person", "age")
+            self.store.save(tmp)
+
+            loaded = GraphStore(backend="embedded", path=tmp)
+            loaded.connect()
+            backend = loaded._store_backend
+            self.assertIsInstance(backend._src_base, np.memmap)
+            self.assertEqual(loaded.get_stats(), self.store.get_stats())
+            self.assertEqual(loaded.shortest_path(0, 3)["length"], 1)
+
+            # Writes after a memory-mapped load, then save over the same files
+            loaded.create_relationship(3, 4, "NEAR")
+            loaded.delete_node(1)
+            loaded.close()
+
+            reloaded = EmbeddedGraphStore(path=tmp)
+            reloaded.connect()
+            self.assertEqual(reloaded.get_stats()["relationship_count"], 3)
+            self.assertEqual([c["nodes"] for c in reloaded.connected_components()], [[0, 2, 3, 4]])
+            self.assertEqual(len(reloaded.get_nodes(properties={"age": 30})), 2)
+
+    def test_graph_store_integration(self):
+        graph = GraphStore(backend="embedded")
+        graph.add_nodes([{"id": "a", "type": "Entity"}, {"id": "b", "type": "Entity"}])
+        self.assertEqual(graph.add_edges([{"source_id": "a", "target_id": "b", "type": "REL"}]), 1)
+        self.assertEqual(graph.analytics.connected_components()[0]["nodes"], [0, 1])
+        self.assertEqual(graph.analytics.degree_centrality()[0]["degree"], 1)
+        with self.assertRaises(ProcessingError):
+            graph.execute_query("MATCH (n) RETURN n")
+
+
+if __name__ == "__main__":
+    unittest.main()
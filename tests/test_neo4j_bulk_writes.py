@@ -0,0 +1,179 @@
+import itertools
+import threading
+import unittest
+from unittest.mock import patch
+
+from semantica.graph_store.neo4j_store import Neo4jDriver, Neo4jStore
+from semantica.utils.exceptions import ProcessingError
+
+
+class RecordingSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, parameters=None):
+        rows = (parameters or {}).get("rows", [])
+        records = []
+        with self.driver.lock:
+            self.driver.calls.append((query, rows))
+            self.driver.threads.add(threading.get_ident())
+            if len(self.driver.calls) in self.driver.failing_calls:
+                raise RuntimeError("write failed")
+            for row in rows:
+                if row.get("start") in self.driver.missing:
+                    continue
+                props = dict(row.get("props", {}))
+                if "MERGE (n" in query:
+                    # Upsert: keep stored properties not in the row
+                    stored = self.driver.merged.setdefault(props["id"], {})
+                    stored.update(props)
+                    props = dict(stored)
+                records.append({"idx": row["idx"], "id": next(self.driver.ids), "props": props})
+        return records
+
+    def execute_write(self, func, **kwargs):
+        return func(self, **kwargs)
+
+    def close(self):
+        pass
+
+
+class RecordingDriver:
+    """Neo4j driver stand-in that records UNWIND queries."""
+
+    def __init__(self, missing=()):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(100)
+        self.calls = []
+        self.threads = set()
+        self.missing = set(missing)
+        self.merged = {}
+        self.failing_calls = set()
+
+    def session(self, database=None):
+        return RecordingSession(self)
+
+    def close(self):
+        pass
+
+
+class TestNeo4jBulkWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.patcher = patch("semantica.graph_store.neo4j_store.NEO4J_AVAILABLE", True)
+        self.patcher.start()
+        self.driver = RecordingDriver()
+        self.store = Neo4jStore(batch_size=2)
+        self.store._driver = Neo4jDriver(self.driver)
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_nodes_batched_per_label_set(self):
+        nodes = [
+            {"labels": ["Person"], "properties": {"name": "a"}},
+            {"labels": ["Place"], "properties": {"name": "b"}},
+            {"labels": ["Person"], "properties": {"name": "c"}},
+            {"labels": ["Person"], "properties": {"name": "d"}},
+        ]
+        created = self.store.create_nodes(nodes)
+
+        self.assertEqual([n["properties"]["name"] for n in created], ["a", "b", "c", "d"])
+        queries = [query for query, _ in self.driver.calls]
+        self.assertEqual(len(queries), 3)  # Person x2 batches, Place x1
+        self.assertTrue(all(q.startswith("UNWIND $rows AS row CREATE") for q in queries))
+        self.assertIn("(n:`Person`)", queries[0])
+        self.assertEqual([len(rows) for _, rows in self.driver.calls], [2, 1, 1])
+
+    def test_merge_upserts_on_id(self):
+        self.store.create_nodes(
+            [
+                {"labels": ["Entity"], "properties": {"id": "e1", "name": "x"}},
+                {"labels": ["Entity"], "properties": {"name": "no id"}},
+            ],
+            merge=True,
+            batch_size=10,
+        )
+        queries = sorted(query for query, _ in self.driver.calls)
+        self.assertEqual(len(queries), 2)
+        self.assertIn("CREATE (n:`Entity`) SET n = row.props", queries[0])
+        self.assertIn("MERGE (n:`Entity` {id: row.props.id}) SET n += row.props", queries[1])
+
+    def test_merge_returns_stored_properties(self):
+        self.driver.merged["e1"] = {"id": "e1", "name": "x", "age": 3}
+        created = self.store.create_nodes(
+            [{"labels": ["Entity"], "properties": {"id": "e1", "name": "y"}}], merge=True
+        )
+        self.assertIn("properties(n) AS props", self.driver.calls[0][0])
+        self.assertEqual(created[0]["properties"], {"id": "e1", "name": "y", "age": 3})
+
+    def test_relationships_batched_per_type(self):
+        self.driver.missing = {"ghost"}
+        rels = [
+            {"source_id": "a", "target_id": "b", "type": "KNOWS"},
+            {"source_id": "ghost", "target_id": "b", "type": "KNOWS"},
+            {"start_node_id": "b", "end_node_id": "c", "type": "LIVES IN", "properties": {"w": 1}},
+        ]
+        created = self.store.create_relationships(rels, match_on="id", node_label="Entity", merge=True)
+
+        self.assertEqual([(r["start_node_id"], r["type"]) for r in created], [("a", "KNOWS"), ("b", "LIVES IN")])
+        query = self.driver.calls[0][0]
+        self.assertIn("MATCH (a:`Entity` {`id`: row.start})", query)
+        self.assertIn("MERGE (a)-[r:`KNOWS`]->(b) SET r += row.props", query)
+        self.assertIn("[r:`LIVES IN`]", self.driver.calls[1][0])
+
+    def test_parallel_sessions(self):
+        nodes = [{"labels": ["N"], "properties": {"i": i}} for i in range(40)]
+        created = self.store.create_nodes(nodes, parallel_sessions=4)
+
+        self.assertEqual([n["properties"]["i"] for n in created], list(range(40)))
+        self.assertEqual(len(self.driver.calls), 20)
+        self.assertEqual(len({n["id"] for n in created}), 40)
+
+    def test_graph_store_add_edges_uses_bulk_path(self):
+        from semantica.graph_store.graph_store import GraphStore
+
+        with patch("semantica.graph_store.neo4j_store.Neo4jStore", return_value=self.store):
+            graph = GraphStore(backend="neo4j")
+        count = graph.add_edges(
+            [
+                {"source_id": "a", "target_id": "b", "type": "KNOWS", "weight": 0.5},
+                {"source_id": "b", "target_id": "c"},
+            ]
+        )
+
+        self.assertEqual(count, 2)
+        query, rows = self.driver.calls[0]
+        self.assertIn("{`id`: row.start}", query)
+        self.assertEqual(rows[0]["props"], {"weight": 0.5})
+
+    def graph_store(self):
+        from semantica.graph_store.graph_store import GraphStore
+
+        with patch("semantica.graph_store.neo4j_store.Neo4jStore", return_value=self.store):
+            return GraphStore(backend="neo4j")
+
+    def test_add_edges_with_internal_ids(self):
+        count = self.graph_store().add_edges([{"source_id": 1, "target_id": 2}])
+
+        self.assertEqual(count, 1)
+        self.assertIn("WHERE id(a) = row.start", self.driver.calls[0][0])
+
+    def test_add_edges_counts_batches_written_before_a_failure(self):
+        self.driver.failing_calls = {2}
+        edges = [{"source_id": f"n{i}", "target_id": f"n{i + 1}"} for i in range(5)]
+
+        self.assertEqual(self.graph_store().add_edges(edges), 2)
+
+    def test_parallel_failure_keeps_written_rows(self):
+        self.driver.failing_calls = {1}
+        nodes = [{"labels": ["N"], "properties": {"i": i}} for i in range(6)]
+        with self.assertRaises(ProcessingError) as ctx:
+            self.store.create_nodes(nodes, parallel_sessions=3)
+
+        self.assertEqual(len(self.driver.calls), 3)
+        self.assertEqual(len(ctx.exception.output_data), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -98,3 +98,39 @@ class TestTripletStore(unittest.TestCase):
         
         self.assertTrue(result["success"])
         mock_backend_instance.delete_triplet.assert_called_once_with(triplet)
+
+    @patch('semantica.triplet_store.blazegraph_store.BlazegraphStore')
+    def test_query_cache_invalidated_by_writes(self, mock_blazegraph_store):
+        mock_backend_instance = MagicMock()
+        mock_blazegraph_store.return_value = mock_backend_instance
+        mock_backend_instance.execute_sparql.return_value = {
+            "bindings": [{"s": "urn:a"}],
+            "variables": ["s"],
+        }
+
+        store = TripletStore(backend="blazegraph")
+        query = "SELECT ?s WHERE { ?s ?p ?o }"
+        first = store.execute_query(query)
+        second = store.execute_query(query)
+        self.assertFalse(first.metadata["cached"])
+        self.assertTrue(second.metadata["cached"])
+        self.assertEqual(mock_backend_instance.execute_sparql.call_count, 1)
+
+        store.add_triplet(Triplet(subject="s", predicate="p", object="o"))
+        self.assertFalse(store.execute_query(query).metadata["cached"])
+
+        store.execute_query("PREFIX ex: <http://ex.org/> INSERT DATA { ex:a ex:b ex:c }")
+        self.assertFalse(store.execute_query(query).metadata["cached"])
+        self.assertEqual(mock_backend_instance.execute_sparql.call_count, 4)
+        self.assertEqual(store.query_engine.get_query_statistics()["cache"]["invalidations"], 2)
+
+    def test_query_engine_lru(self):
+        engine = QueryEngine(cache_size=2)
+        backend = MagicMock()
+        backend.execute_sparql.return_value = {"bindings": [], "variables": []}
+        for query in ["SELECT ?a WHERE {}", "SELECT ?b WHERE {}", "SELECT ?a WHERE {}", "SELECT ?c WHERE {}"]:
+            engine.execute_query(query, backend)
+
+        self.assertTrue(engine.execute_query("SELECT ?a WHERE {}", backend).metadata["cached"])
+        self.assertFalse(engine.execute_query("SELECT ?b WHERE {}", backend).metadata["cached"])
+        self.assertEqual(engine.query_cache.stats()["evictions"], 2)
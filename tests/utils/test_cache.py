@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from semantica.graph_store.graph_store import GraphManager
+from semantica.utils.cache import QueryCache, WriteGeneration, make_cache_key
+
+
+class TestQueryCache(unittest.TestCase):
+
+    def test_canonical_key(self):
+        self.assertEqual(
+            make_cache_key("MATCH (n)\n  RETURN n", {"a": 1, "b": [1, 2]}),
+            make_cache_key("MATCH (n) RETURN n", {"b": [1, 2], "a": 1}),
+        )
+        self.assertNotEqual(
+            make_cache_key("MATCH (n) RETURN n", {"a": 1}),
+            make_cache_key("MATCH (n) RETURN n", {"a": "1"}),
+        )
+        self.assertEqual(make_cache_key("q"), make_cache_key("q", {}))
+
+    def test_lru_eviction(self):
+        cache = QueryCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now least recently used
+        cache.put("c", 3)
+
+        self.assertNotIn("b", cache)
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["evictions"], stats["hits"]), (2, 1, 3))
+
+    def test_byte_bound(self):
+        cache = QueryCache(max_entries=100, max_bytes=1000, size_of=len)
+        cache.put("a", "x" * 400)
+        cache.put("b", "x" * 400)
+        cache.put("c", "x" * 400)
+        self.assertEqual(sorted(k for k in "abc" if k in cache), ["b", "c"])
+        self.assertEqual(cache.stats()["bytes"], 800)
+        self.assertFalse(cache.put("huge", "x" * 2000))
+
+    def test_ttl(self):
+        cache = QueryCache(ttl=0.05)
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=None)
+        time.sleep(0.08)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_generation_invalidation(self):
+        generation = WriteGeneration()
+        cache = QueryCache()
+        cache.put("a", [1], generation=int(generation))
+        self.assertEqual(cache.get("a", generation=int(generation)), [1])
+
+        generation.bump()
+        self.assertIsNone(cache.get("a", generation=int(generation)))
+        stats = cache.stats()
+        self.assertEqual((stats["invalidations"], stats["hits"], stats["misses"]), (1, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 0.5)
+
+    def test_concurrent_access(self):
+        cache = QueryCache(max_entries=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.put(f"k{(i + offset) % 80}", i)
+                cache.get(f"k{i % 80}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(len(cache), 50)
+
+
+class TestGraphQueryEngineCache(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = MagicMock()
+        self.backend.execute_query.side_effect = lambda query, params=None, **kw: {
+            "records": [{"calls": self.backend.execute_query.call_count}]
+        }
+        self.manager = GraphManager(self.backend, cache_size=10)
+        self.engine = self.manager.query_engine
+
+    def test_cached_until_write(self):
+        query = "MATCH (n:Person) RETURN count(n) AS c"
+        first = self.engine.execute(query, {"x": 1}, use_cache=True)
+        self.assertIs(self.engine.execute(query, {"x": 1}, use_cache=True), first)
+        self.assertEqual(self.backend.execute_query.call_count, 1)
+
+        self.manager.nodes.create(["Person"], {"name": "Alice"})
+        self.engine.execute(query, {"x": 1}, use_cache=True)
+        self.assertEqual(self.backend.execute_query.call_count, 2)
+
+        self.engine.execute("MATCH (n) DETACH DELETE n", use_cache=True)
+        self.engine.execute(query, {"x": 1}, use_cache=True)
+        self.assertEqual(self.backend.execute_query.call_count, 4)
+
+        stats = self.engine.cache_stats()
+        self.assertEqual((stats["hits"], stats["invalidations"]), (1, 2))
+
+    def test_failed_write_still_invalidates(self):
+        query = "MATCH (n) RETURN n"
+        self.engine.execute(query, use_cache=True)
+        self.backend.delete_node.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            self.manager.nodes.delete(1)
+        self.engine.execute(query, use_cache=True)
+        self.assertEqual(self.backend.execute_query.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from semantica.utils.metrics import (
+    SPAN_COUNT,
+    SPAN_DURATION,
+    SPANS_IN_FLIGHT,
+    Histogram,
+    InMemorySpanExporter,
+    JSONLinesSpanExporter,
+    MetricsRegistry,
+    render_prometheus,
+)
+from semantica.utils.progress_tracker import ProgressTracker
+
+
+def make_tracker(enabled=False):
+    tracker = ProgressTracker(enabled=enabled)
+    tracker.displays = []
+    exporter = InMemorySpanExporter()
+    tracker.metrics = MetricsRegistry(exporters=[exporter])
+    return tracker, exporter
+
+
+class TestMetricFamilies(unittest.TestCase):
+
+    def test_histogram_quantiles(self):
+        histogram = Histogram("latency", labelnames=("op",))
+        for i in range(1, 1001):
+            histogram.observe(i / 1000.0, op="a")
+        summary = histogram.summary(("a",))
+        self.assertEqual(summary["count"], 1000)
+        self.assertAlmostEqual(summary["sum"], 500.5)
+        for name, expected in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            self.assertLess(abs(summary[name] - expected) / expected, 0.1)
+        self.assertLessEqual(summary["p99"], summary["max"])
+
+    def test_registry_reuses_and_checks_families(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", labelnames=("kind",))
+        self.assertIs(registry.counter("jobs_total"), counter)
+        with self.assertRaises(ValueError):
+            registry.gauge("jobs_total")
+
+    def test_prometheus_exposition(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs", ("kind",)).inc(2, kind='a"b')
+        registry.histogram("job_seconds", "Job latency").observe(0.25)
+        text = render_prometheus(registry)
+
+        self.assertIn("# TYPE jobs_total counter", text)
+        self.assertIn('jobs_total{kind="a\\"b"} 2.0', text)
+        self.assertIn("# TYPE job_seconds summary", text)
+        self.assertIn('job_seconds{quantile="0.95"} 0.25', text)
+        self.assertIn("job_seconds_count 1", text)
+        self.assertIn("# TYPE semantica_spans_in_flight gauge", text)
+
+
+class TestTrackerSpans(unittest.TestCase):
+
+    def test_spans_recorded_with_display_disabled(self):
+        tracker, exporter = make_tracker(enabled=False)
+        outer = tracker.start_tracking(module="kg", submodule="GraphBuilder", file="a.txt")
+        self.assertTrue(outer)
+        inner = tracker.start_tracking(module="embeddings", submodule="TextEmbedder")
+
+        snapshot = tracker.metrics.snapshot()
+        in_flight = {e["labels"]["module"]: e["value"] for e in snapshot["gauges"][SPANS_IN_FLIGHT]}
+        self.assertEqual(in_flight, {"kg": 1.0, "embeddings": 1.0})
+
+        tracker.stop_tracking(inner)
+        tracker.stop_tracking(outer, status="failed", message=lambda: "boom")
+
+        child, parent = exporter.spans
+        self.assertEqual(child.parent_id, parent.span_id)
+        self.assertEqual(child.trace_id, parent.trace_id)
+        self.assertEqual((parent.status, parent.message), ("failed", "boom"))
+        self.assertEqual(parent.attributes["file"], "a.txt")
+
+        counts = {
+            (e["labels"]["module"], e["labels"]["status"]): e["value"]
+            for e in tracker.metrics.snapshot()["counters"][SPAN_COUNT]
+        }
+        self.assertEqual(counts, {("embeddings", "completed"): 1.0, ("kg", "failed"): 1.0})
+        durations = tracker.metrics.snapshot()["histograms"][SPAN_DURATION]
+        self.assertTrue(all(e["count"] == 1 and e["p99"] >= 0 for e in durations))
+
+    def test_pipeline_spans_share_trace(self):
+        tracker, exporter = make_tracker(enabled=True)
+        tracker.register_pipeline_modules("run-1", ["ingest", "kg"])
+
+        def worker(module):
+            tracker.stop_tracking(tracker.start_tracking(module=module, submodule="Step"))
+
+        threads = [threading.Thread(target=worker, args=(m,)) for m in ("ingest", "kg")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        tracker.clear_pipeline_context("run-1")
+
+        spans = {span.name: span for span in exporter.spans}
+        root = spans["pipeline run-1"]
+        for name in ("ingest.Step", "kg.Step"):
+            self.assertEqual(spans[name].parent_id, root.span_id)
+            self.assertEqual(spans[name].trace_id, root.trace_id)
+            self.assertEqual(spans[name].pipeline_id, "run-1")
+
+    def test_jsonl_exporter_writes_otlp(self):
+        with tempfile.TemporaryDirectory() as path:
+            target = os.path.join(path, "spans.jsonl")
+            tracker, _ = make_tracker()
+            tracker.metrics.add_exporter(JSONLinesSpanExporter(target, batch_size=2))
+            for _ in range(3):
+                tracker.stop_tracking(tracker.start_tracking(module="kg", submodule="Builder"))
+            tracker.metrics.flush()
+
+            with open(target, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual(len(lines), 2)
+        spans = [
+            span
+            for line in lines
+            for resource in line["resourceSpans"]
+            for scope in resource["scopeSpans"]
+            for span in scope["spans"]
+        ]
+        self.assertEqual(len(spans), 3)
+        span = spans[0]
+        self.assertEqual(len(span["traceId"]), 32)
+        self.assertEqual(len(span["spanId"]), 16)
+        self.assertGreaterEqual(int(span["endTimeUnixNano"]), int(span["startTimeUnixNano"]))
+        self.assertIn(
+            {"key": "semantica.module", "value": {"stringValue": "kg"}}, span["attributes"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from semantica.utils.progress_tracker import ProgressDisplay, ProgressTracker, track_progress
+
+
+class RecordingDisplay(ProgressDisplay):
+
+    def __init__(self):
+        self.updates = []
+
+    def update(self, item):
+        self.updates.append((item.status, item.message, item.processed_items))
+
+    def show_summary(self, items):
+        pass
+
+    def clear(self):
+        pass
+
+
+def make_tracker(**kwargs):
+    tracker = ProgressTracker(**kwargs)
+    display = RecordingDisplay()
+    tracker.displays = [display]
+    return tracker, display
+
+
+class TestProgressTracker(unittest.TestCase):
+
+    def test_disabled_tracker_is_a_noop(self):
+        tracker, display = make_tracker(enabled=False)
+        calls = []
+        tracking_id = tracker.start_tracking(module="m", submodule="s", message=lambda: calls.append(1))
+        self.assertEqual(tracking_id, "")
+        tracker.update_progress(tracking_id, 1, 2, message=lambda: calls.append(1))
+        tracker.stop_tracking(tracking_id, metadata={"x": 1})
+        self.assertEqual(display.updates, [])
+        self.assertEqual(calls, [])
+
+        tracker.enable()
+        self.assertTrue(tracker.start_tracking(module="m", submodule="s"))
+
+    def test_environment_variable_disables(self):
+        with patch.dict(os.environ, {"SEMANTICA_PROGRESS": "off"}):
+            self.assertFalse(ProgressTracker().enabled)
+        with patch.dict(os.environ, {"SEMANTICA_PROGRESS": "1"}):
+            self.assertTrue(ProgressTracker().enabled)
+
+    def test_tracking_ids_are_unique(self):
+        tracker, _ = make_tracker()
+        ids = []
+
+        def worker():
+            for _ in range(50):
+                ids.append(tracker.start_tracking(module="m", submodule="s", file="f"))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(ids)), 200)
+        self.assertEqual(len(tracker.active_items), 200)
+
+    def test_updates_are_coalesced_and_messages_lazy(self):
+        tracker, display = make_tracker(update_interval=3600)
+        formatted = []
+
+        def message(i):
+            def build():
+                formatted.append(i)
+                return f"item {i}"
+            return build
+
+        tracking_id = tracker.start_tracking(module="m", submodule="s", message="start")
+        for i in range(1, 100):
+            tracker.update_progress(tracking_id, i, 100, message=message(i))
+        tracker.update_progress(tracking_id, 100, 100, message=message(100))
+        tracker.stop_tracking(tracking_id, message=lambda: "done")
+
+        self.assertEqual(
+            display.updates,
+            [("running", "start", None), ("running", "item 100", 100), ("completed", "done", 100)],
+        )
+        self.assertEqual(formatted, [100])
+
+    def test_no_coalescing_with_zero_interval(self):
+        tracker, display = make_tracker(update_interval=0)
+        tracking_id = tracker.start_tracking(module="m", submodule="s")
+        for i in range(5):
+            tracker.update_tracking(tracking_id, message=f"step {i}")
+        self.assertEqual(len(display.updates), 6)
+        self.assertEqual(display.updates[-1][1], "step 4")
+
+    def test_pipeline_lookup(self):
+        tracker, _ = make_tracker()
+        tracker.register_pipeline_modules("p1", ["ingest", "kg"])
+        tracking_id = tracker.start_tracking(module="kg", submodule="Builder")
+        item = tracker.active_items[tracking_id]
+        self.assertEqual((item.pipeline_id, item.pipeline_order), ("p1", 1))
+
+        tracker.clear_pipeline_context("p1")
+        tracking_id = tracker.start_tracking(module="kg", submodule="Builder")
+        self.assertIsNone(tracker.active_items[tracking_id].pipeline_id)
+
+    def test_decorator_bypasses_disabled_tracker(self):
+        tracker, display = make_tracker(enabled=False)
+
+        @track_progress(module="m", submodule="s")
+        def work(x):
+            return x * 2
+
+        with patch("semantica.utils.progress_tracker.get_progress_tracker", return_value=tracker):
+            self.assertEqual(work(2), 4)
+        self.assertEqual(display.updates, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+import numpy as np
+
+from semantica.vector_store.ivf_index import IVFIndex, recall_at_k
+from semantica.vector_store.vector_matrix import VectorMatrix
+from semantica.vector_store.vector_store import VectorStore
+
+
+def _clustered(n, dim, clusters, seed):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)) * 4
+    labels = rng.integers(0, clusters, size=n)
+    return centers[labels] + rng.normal(size=(n, dim))
+
+
+class TestIVFIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.data = _clustered(2000, 16, 20, seed=0)
+        self.matrix = VectorMatrix()
+        self.matrix.add_batch([f"v{i}" for i in range(len(self.data))], self.data)
+        self.queries = _clustered(20, 16, 20, seed=1)
+
+    def test_full_probe_equals_exact(self):
+        index = IVFIndex(nlist=16).build(self.matrix)
+        approx, _ = index.search(self.matrix, self.queries, k=10, nprobe=16)
+        exact, _ = self.matrix.search(self.queries, k=10)
+        self.assertEqual(recall_at_k(approx, exact), 1.0)
+
+    def test_partial_probe_recall(self):
+        index = IVFIndex(nlist=32, nprobe=4).build(self.matrix)
+        approx, _ = index.search(self.matrix, self.queries, k=10)
+        exact, _ = self.matrix.search(self.queries, k=10)
+        self.assertGreater(recall_at_k(approx, exact), 0.8)
+
+    def test_incremental_appends_and_deletes(self):
+        index = IVFIndex(nlist=16).build(self.matrix)
+        self.matrix.add("new", self.queries[0])
+        rows, _ = index.search(self.matrix, self.queries[0], k=1, nprobe=16)
+        self.assertEqual(self.matrix.row_ids[rows[0]], "new")
+
+        self.matrix.remove("new")
+        rows, _ = index.search(self.matrix, self.queries[0], k=1, nprobe=16)
+        self.assertNotEqual(self.matrix.row_ids[rows[0]], "new")
+
+    def test_rebuilds_after_compaction(self):
+        index = IVFIndex(nlist=16).build(self.matrix)
+        for i in range(1000):
+            self.matrix.remove(f"v{i}")
+        self.assertGreater(self.matrix.layout_version, 0)
+        approx, _ = index.search(self.matrix, self.queries, k=5, nprobe=16)
+        exact, _ = self.matrix.search(self.queries, k=5)
+        self.assertEqual(recall_at_k(approx, exact), 1.0)
+
+
+class TestVectorStoreANN(unittest.TestCase):
+
+    def test_optimize_index_and_nprobe(self):
+        data = _clustered(1000, 8, 10, seed=2)
+        store = VectorStore(backend="inmemory", dimension=8)
+        ids = store.store_vectors(list(data))
+        store.indexer.optimize_index(store.vectors, nlist=10, nprobe=2)
+        self.assertIsNotNone(store.indexer.ann_index)
+
+        results = store.search_vectors(data[5], k=1, nprobe=10)
+        self.assertEqual(results[0]["id"], ids[5])
+
+        store.update_vectors([ids[5]], [-data[5]])
+        results = store.search_vectors(-data[5], k=1, nprobe=10)
+        self.assertEqual(results[0]["id"], ids[5])
+
+        exact = store.search_vectors(data[7], k=3, exact=True)
+        approx = store.search_vectors(data[7], k=3, nprobe=10)
+        self.assertEqual([r["id"] for r in exact], [r["id"] for r in approx])
+
+    def test_auto_build_from_config(self):
+        store = VectorStore(
+            backend="inmemory", dimension=4, index_type="ivf", ann_min_vectors=100
+        )
+        store.store_vectors(list(np.random.default_rng(3).normal(size=(50, 4))))
+        store.search_vectors(np.ones(4), k=1)
+        self.assertIsNone(store.indexer.ann_index)
+
+        store.store_vectors(list(np.random.default_rng(4).normal(size=(60, 4))))
+        store.search_vectors(np.ones(4), k=1)
+        self.assertIsNotNone(store.indexer.ann_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+
+import numpy as np
+
+from semantica.vector_store.hybrid_search import HybridSearch, MetadataFilter
+from semantica.vector_store.metadata_store import MetadataIndex
+from semantica.vector_store.vector_store import VectorStore
+
+
+class TestMetadataIndexCandidates(unittest.TestCase):
+
+    def setUp(self):
+        self.index = MetadataIndex()
+        self.index.index_metadata("a", {"category": "science", "year": 2019, "tags": ["ml"]})
+        self.index.index_metadata("b", {"category": "science", "year": 2022, "tags": ["kg"]})
+        self.index.index_metadata("c", {"category": "art", "year": 2023})
+
+    def test_range_query(self):
+        self.assertEqual(self.index.range_query("year", "gt", 2019), {"b", "c"})
+        self.assertEqual(self.index.range_query("year", "gte", 2019), {"a", "b", "c"})
+        self.assertEqual(self.index.range_query("year", "lt", 2022), {"a"})
+        self.assertEqual(self.index.range_query("year", "lte", 2022), {"a", "b"})
+
+    def test_range_column_follows_updates(self):
+        self.index.index_metadata("a", {"category": "science", "year": 2030})
+        self.assertEqual(self.index.range_query("year", "gt", 2025), {"a"})
+        self.index.remove_metadata("a")
+        self.assertEqual(self.index.range_query("year", "gt", 2000), {"b", "c"})
+
+    def test_candidates_intersect_conditions(self):
+        conditions = MetadataFilter().eq("category", "science").gt("year", 2020).conditions
+        self.assertEqual(self.index.candidates(conditions), {"b"})
+
+        conditions = MetadataFilter().in_list("category", ["art", "music"]).conditions
+        self.assertEqual(self.index.candidates(conditions), {"c"})
+
+    def test_unindexable_conditions_return_none(self):
+        conditions = MetadataFilter().contains("category", "sci").ne("year", 1).conditions
+        self.assertIsNone(self.index.candidates(conditions))
+
+
+class TestIndexedHybridSearch(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.store = VectorStore(backend="inmemory", dimension=8)
+        self.vectors = rng.normal(size=(50, 8))
+        self.metadata = [
+            {"shard": i % 5, "tags": ["even"] if i % 2 == 0 else ["odd"], "name": f"doc{i}"}
+            for i in range(50)
+        ]
+        self.ids = self.store.store_vectors(list(self.vectors), self.metadata)
+        self.search = HybridSearch(vector_store=self.store)
+
+    def _expected(self, query, metadata_filter, k):
+        candidates = [
+            (vid, vec)
+            for vid, vec, meta in zip(self.ids, self.vectors, self.metadata)
+            if metadata_filter.matches(meta)
+        ]
+        scores = [
+            float(np.dot(vec, query) / (np.linalg.norm(vec) * np.linalg.norm(query)))
+            for _, vec in candidates
+        ]
+        order = np.argsort(scores)[::-1][:k]
+        return [candidates[i][0] for i in order]
+
+    def test_filtered_search_matches_scan(self):
+        query = self.vectors[7]
+        filters = [
+            MetadataFilter().eq("shard", 2),
+            MetadataFilter().gte("shard", 3).contains("tags", "odd"),
+            MetadataFilter().in_list("shard", [0, 4]),
+            MetadataFilter().contains("name", "doc1"),
+        ]
+        for metadata_filter in filters:
+            results = self.search.search(query, k=4, metadata_filter=metadata_filter)
+            self.assertEqual(
+                [r["id"] for r in results], self._expected(query, metadata_filter, 4)
+            )
+            for result in results:
+                self.assertTrue(metadata_filter.matches(result["metadata"]))
+
+    def test_deleted_vectors_are_not_returned(self):
+        self.store.delete_vectors(self.ids[:10])
+        results = self.search.search(
+            self.vectors[0], k=50, metadata_filter=MetadataFilter().eq("shard", 0)
+        )
+        self.assertTrue(all(r["id"] not in self.ids[:10] for r in results))
+        self.assertEqual(len(results), 8)
+
+    def test_metadata_updates_are_reindexed(self):
+        shard_two = MetadataFilter().eq("shard", 2)
+        with self.assertRaises(TypeError):
+            self.store.metadata[self.ids[0]]["shard"] = 2
+        with self.assertRaises(TypeError):
+            self.store.metadata["new"] = {"shard": 2}
+        # Metadata passed to store_vectors is copied, not aliased
+        self.metadata[1]["shard"] = 2
+        self.assertNotIn(
+            self.ids[1],
+            [r["id"] for r in self.search.search(self.vectors[1], k=50, metadata_filter=shard_two)],
+        )
+
+        self.store.update_metadata(self.ids[0], {"shard": 2})
+        self.assertEqual(self.store.metadata[self.ids[0]]["name"], "doc0")
+        results = self.search.search(self.vectors[0], k=1, metadata_filter=shard_two)
+        self.assertEqual([r["id"] for r in results], [self.ids[0]])
+        results = self.search.search(
+            self.vectors[0], k=50, metadata_filter=MetadataFilter().eq("shard", 0)
+        )
+        self.assertNotIn(self.ids[0], [r["id"] for r in results])
+        self.assertEqual(len(results), 9)
+
+        self.store.update_metadata(self.ids[3], {"topic": "kg"}, replace=True)
+        self.assertEqual(dict(self.store.metadata[self.ids[3]]), {"topic": "kg"})
+        results = self.search.search(
+            self.vectors[3], k=5, metadata_filter=MetadataFilter().eq("topic", "kg")
+        )
+        self.assertEqual([r["id"] for r in results], [self.ids[3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
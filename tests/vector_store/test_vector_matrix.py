@@ -0,0 +1,264 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from semantica.utils.exceptions import ValidationError
+from semantica.vector_store.hybrid_search import HybridSearch, MetadataFilter
+from semantica.vector_store.vector_matrix import VectorMatrix, select_top_k
+from semantica.vector_store.vector_store import VectorRetriever, VectorStore
+
+
+class TestVectorMatrix(unittest.TestCase):
+
+    def test_append_grows_contiguously(self):
+        matrix = VectorMatrix(initial_capacity=2)
+        matrix.add_batch(["a", "b", "c"], np.eye(3))
+        self.assertEqual(len(matrix), 3)
+        self.assertEqual(matrix.dimension, 3)
+        self.assertEqual(matrix.data.dtype, np.float32)
+        self.assertTrue(matrix.data.flags["C_CONTIGUOUS"])
+        np.testing.assert_array_equal(matrix["b"], [0, 1, 0])
+        self.assertEqual(matrix.row_of("c"), 2)
+
+    def test_update_in_place(self):
+        matrix = VectorMatrix()
+        matrix.add("a", [1.0, 0.0])
+        row = matrix.add("a", [0.0, 1.0])
+        self.assertEqual(row, 0)
+        self.assertEqual(len(matrix), 1)
+        np.testing.assert_array_equal(matrix["a"], [0.0, 1.0])
+
+    def test_tombstones_and_compaction(self):
+        matrix = VectorMatrix(compaction_threshold=0.5)
+        matrix.add_batch(["a", "b", "c", "d"], np.eye(4))
+        matrix.remove("a")
+        self.assertEqual(matrix.tombstone_count, 1)
+        self.assertFalse(matrix.valid_mask[0])
+        self.assertNotIn("a", matrix)
+
+        layout = matrix.layout_version
+        matrix.remove("b")
+        matrix.remove("c")
+        self.assertEqual(matrix.tombstone_count, 0)
+        self.assertGreater(matrix.layout_version, layout)
+        self.assertEqual(list(matrix), ["d"])
+        self.assertEqual(matrix.row_of("d"), 0)
+        np.testing.assert_array_equal(matrix["d"], [0, 0, 0, 1])
+
+    def test_dimension_mismatch(self):
+        matrix = VectorMatrix(dimension=2)
+        with self.assertRaises(ValidationError):
+            matrix.add("a", [1.0, 2.0, 3.0])
+
+    def test_cached_norms_follow_updates(self):
+        matrix = VectorMatrix()
+        matrix.add_batch(["a", "b"], [[3.0, 4.0], [1.0, 0.0]])
+        np.testing.assert_allclose(matrix.norms, [5.0, 1.0])
+        matrix.add("a", [0.0, 2.0])
+        np.testing.assert_allclose(matrix.norms, [2.0, 1.0])
+
+    def test_search_matches_exact_cosine(self):
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(200, 16))
+        matrix = VectorMatrix()
+        matrix.add_batch([f"v{i}" for i in range(200)], data)
+        queries = rng.normal(size=(5, 16))
+
+        rows, scores = matrix.search(queries, k=7)
+        self.assertEqual(rows.shape, (5, 7))
+
+        normed = data / np.linalg.norm(data, axis=1, keepdims=True)
+        for q, query in enumerate(queries):
+            expected = normed @ (query / np.linalg.norm(query))
+            np.testing.assert_array_equal(rows[q], np.argsort(-expected)[:7])
+            np.testing.assert_allclose(scores[q], np.sort(expected)[::-1][:7], rtol=1e-5)
+
+    def test_select_top_k(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.7])
+        np.testing.assert_array_equal(select_top_k(scores, 2), [1, 3])
+        np.testing.assert_array_equal(select_top_k(scores, 10), [1, 3, 2, 0])
+
+
+class TestVectorStoreMatrixBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.store = VectorStore(backend="inmemory", dimension=2)
+        self.ids = self.store.store_vectors(
+            [np.array([1.0, 0.0]), np.array([0.0, 1.0]), np.array([0.7, 0.7])],
+            [{"type": "a"}, {"type": "b"}, {"type": "a"}],
+        )
+
+    def test_incremental_insert_keeps_index_bound(self):
+        self.assertIs(self.store.indexer.index, self.store.vectors)
+        more = self.store.store_vectors([np.array([0.5, 0.5])])
+        self.assertIs(self.store.indexer.index, self.store.vectors)
+        self.assertEqual(more, ["vec_3"])
+
+    def test_ids_not_reused_after_delete(self):
+        self.store.delete_vectors([self.ids[0]])
+        new_ids = self.store.store_vectors([np.array([1.0, 1.0])])
+        self.assertNotIn(new_ids[0], self.ids)
+        self.assertEqual(len(self.store.vectors), 3)
+
+    def test_update_index_never_reuses_live_ids(self):
+        indexer = self.store.indexer
+        matrix = VectorMatrix()
+        indexer.update_index(matrix, [np.array([1.0, 0.0]), np.array([0.0, 1.0])])
+        matrix.remove("new_0")
+        indexer.update_index(matrix, [np.array([0.5, 0.5])])
+        self.assertEqual(sorted(matrix.row_ids[row] for row in matrix.live_rows()), ["new_1", "new_2"])
+        np.testing.assert_allclose(matrix["new_1"], [0.0, 1.0])
+
+        with self.assertRaises(ValidationError):
+            indexer.update_index(matrix, [np.array([1.0, 1.0])], ids=["new_1"])
+        index = indexer.update_index(
+            {"vectors": [np.array([1.0, 0.0])], "ids": ["new_3"]}, [np.array([0.0, 1.0])]
+        )
+        self.assertEqual(index["ids"], ["new_3", "new_4"])
+
+    def test_rejected_batch_leaves_no_metadata(self):
+        with self.assertRaises(ValidationError):
+            self.store.store_vectors([np.array([1.0, 0.0, 0.0])], [{"type": "a"}])
+        self.assertEqual(list(self.store.metadata), self.ids)
+        results = HybridSearch(vector_store=self.store).search(
+            np.array([1.0, 0.0]), k=5, metadata_filter=MetadataFilter().eq("type", "a")
+        )
+        self.assertEqual(sorted(r["id"] for r in results), sorted([self.ids[0], self.ids[2]]))
+
+    def test_search_skips_deleted(self):
+        self.store.delete_vectors([self.ids[0]])
+        results = self.store.search_vectors(np.array([1.0, 0.0]), k=5)
+        self.assertEqual([r["id"] for r in results], [self.ids[2], self.ids[1]])
+
+    def test_search_vectors_batch(self):
+        queries = np.array([[1.0, 0.0], [0.0, 1.0]])
+        batch = self.store.search_vectors_batch(queries, k=1)
+        self.assertEqual([r[0]["id"] for r in batch], [self.ids[0], self.ids[1]])
+        self.assertEqual(batch[1][0]["metadata"], {"type": "b"})
+
+    def test_batch_results_do_not_alias_the_store(self):
+        result = self.store.retriever.search_similar_batch(
+            np.array([[1.0, 0.0]]), self.store.vectors, self.store.vectors.row_ids, k=1
+        )[0][0]
+        result["vector"][:] = 9.0
+        self.store.vectors[self.ids[0]] = np.array([0.0, 5.0])
+        np.testing.assert_allclose(result["vector"], [9.0, 9.0])
+        np.testing.assert_allclose(self.store.vectors[self.ids[0]], [0.0, 5.0])
+        self.assertEqual(self.store.search_vectors(np.array([1.0, 0.0]), k=1)[0]["id"], self.ids[2])
+
+    def test_retriever_batch_on_lists(self):
+        retriever = VectorRetriever(backend="inmemory")
+        vectors = [np.array([1.0, 0.0]), np.array([0.0, 1.0])]
+        batch = retriever.search_similar_batch(
+            np.array([[0.0, 2.0], [3.0, 0.1]]), vectors, ["x", "y"], k=2
+        )
+        self.assertEqual([r["id"] for r in batch[0]], ["y", "x"])
+        self.assertEqual([r["id"] for r in batch[1]], ["x", "y"])
+
+    def test_hybrid_search_reads_store(self):
+        search = HybridSearch(vector_store=self.store)
+        results = search.search(
+            np.array([1.0, 0.0]), k=2, metadata_filter=MetadataFilter().eq("type", "a")
+        )
+        self.assertEqual([r["id"] for r in results], [self.ids[0], self.ids[2]])
+        self.assertEqual(results[0]["metadata"], {"type": "a"})
+
+
+class TestVectorStorePersistence(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = self.tmpdir.name
+        self.store = VectorStore(backend="inmemory", dimension=3)
+        self.ids = self.store.store_vectors(
+            [np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]), np.array([0.0, 0.0, 2.0])],
+            [{"type": "a"}, {"type": "b", "year": 2020}, {"type": "c"}],
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_save_writes_pickle_free_layout(self):
+        self.store.delete_vectors([self.ids[1]])
+        self.store.save(self.path)
+
+        self.assertFalse(os.path.exists(os.path.join(self.path, "store_data.pkl")))
+        with open(os.path.join(self.path, "manifest.json")) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["version"], VectorStore.STORAGE_VERSION)
+        self.assertEqual(manifest["count"], 2)
+        with open(os.path.join(self.path, "ids.json")) as f:
+            self.assertEqual(json.load(f), [self.ids[0], self.ids[2]])
+        self.assertEqual(np.load(os.path.join(self.path, "vectors.npy")).shape, (2, 3))
+
+    def test_load_memory_maps_vectors(self):
+        self.store.save(self.path)
+        loaded = VectorStore(backend="inmemory")
+        loaded.load(self.path)
+
+        self.assertIsInstance(loaded.vectors.data, np.memmap)
+        self.assertEqual(list(loaded.vectors), self.ids)
+        self.assertEqual(loaded.get_metadata(self.ids[1]), {"type": "b", "year": 2020})
+        results = loaded.search_vectors(np.array([0.0, 0.0, 1.0]), k=1)
+        self.assertEqual(results[0]["id"], self.ids[2])
+        self.assertAlmostEqual(results[0]["score"], 1.0, places=5)
+
+        # Writes stay private to this process and new ids continue the sequence
+        new_ids = loaded.store_vectors([np.array([1.0, 1.0, 0.0])])
+        self.assertNotIn(new_ids[0], self.ids)
+        loaded.update_vectors([self.ids[0]], [np.array([0.0, 3.0, 0.0])])
+        np.testing.assert_array_equal(
+            np.load(os.path.join(self.path, "vectors.npy"))[0], [1.0, 0.0, 0.0]
+        )
+
+    def test_load_defers_metadata(self):
+        self.store.save(self.path)
+        loaded = VectorStore(backend="inmemory")
+        loaded.load(self.path)
+        self.assertIsNotNone(loaded._saved_metadata)
+
+        # Results and single lookups read only their own rows
+        results = loaded.search_vectors(np.array([0.0, 1.0, 0.0]), k=1)
+        self.assertEqual(results[0]["metadata"], {"type": "b", "year": 2020})
+        self.assertEqual(loaded.get_metadata(self.ids[2]), {"type": "c"})
+        self.assertIsNotNone(loaded._saved_metadata)
+
+        # The first filtered search reads and indexes everything
+        results = HybridSearch(vector_store=loaded).search(
+            np.array([1.0, 0.0, 0.0]), k=3, metadata_filter=MetadataFilter().eq("type", "b")
+        )
+        self.assertIsNone(loaded._saved_metadata)
+        self.assertEqual([r["id"] for r in results], [self.ids[1]])
+        self.assertEqual(dict(loaded.metadata), {
+            self.ids[0]: {"type": "a"},
+            self.ids[1]: {"type": "b", "year": 2020},
+            self.ids[2]: {"type": "c"},
+        })
+
+    def test_load_without_metadata_offsets(self):
+        self.store.save(self.path)
+        os.remove(os.path.join(self.path, "metadata_offsets.npy"))
+        loaded = VectorStore(backend="inmemory")
+        loaded.load(self.path)
+        self.assertEqual(loaded.get_metadata(self.ids[1]), {"type": "b", "year": 2020})
+        loaded.delete_vectors([self.ids[0]])
+        self.assertEqual(list(loaded.metadata), self.ids[1:])
+
+    def test_load_legacy_pickle(self):
+        with open(os.path.join(self.path, "store_data.pkl"), "wb") as f:
+            pickle.dump(
+                {"vectors": {"v1": np.array([1.0, 0.0])}, "metadata": {"v1": {"k": 1}}},
+                f,
+            )
+        loaded = VectorStore(backend="inmemory")
+        loaded.load(self.path)
+        self.assertEqual(list(loaded.vectors), ["v1"])
+        self.assertEqual(loaded.get_metadata("v1"), {"k": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
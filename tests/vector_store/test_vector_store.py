@@ -64,7 +64,8 @@ class TestVectorStore(unittest.TestCase):
         new_vector = np.array([0.9])
         store.update_vectors(["v1"], [new_vector])
         
-        np.testing.assert_array_equal(store.vectors["v1"], new_vector)
+        # Vectors are stored as float32
+        np.testing.assert_allclose(store.vectors["v1"], new_vector, rtol=1e-6)
         store.indexer.create_index.assert_called()
 
     def test_delete_vectors(self):
@@ -85,7 +86,7 @@ class TestVectorStore(unittest.TestCase):
         store.vectors = {"v1": vec}
         store.metadata = {"v1": meta}
         
-        self.assertTrue(np.array_equal(store.get_vector("v1"), vec))
+        self.assertTrue(np.allclose(store.get_vector("v1"), vec))
         self.assertEqual(store.get_metadata("v1"), meta)
         self.assertIsNone(store.get_vector("nonexistent"))
 